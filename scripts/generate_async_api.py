@@ -0,0 +1,514 @@
+#!/usr/bin/env python3
+"""
+Generate the awaitable twins of the ``vastai.api`` modules and ``VastAI``.
+
+The sync API layer (``vastai/api/*.py``) is the single source of truth.  This
+script rewrites each module so that every function which performs I/O --
+directly through ``client.get/post/put/delete/_request/fetch``, through
+``time.sleep``, or transitively by calling another such function -- becomes an
+``async def`` and every one of those calls is awaited.  Loops and
+comprehensions over paginated iterators (``vastai.api.paging`` helpers, or
+generator functions that use them) become ``async for``.  Pure helpers (query
+parsing, row formatting) are copied unchanged.  The AST only decides what
+changes: the edits are made to the source text, so comments and formatting
+carry over to the generated modules.  The results are written to:
+
+    vastai/api/aio/<module>.py   one per vastai/api module with I/O functions
+    vastai/async_/sdk.py         AsyncVastAI, mirroring vastai.sdk.VastAI
+
+The generated files are checked in so they can be read, debugged and packaged
+like any other module.  Re-run this script after changing ``vastai/api`` or
+``vastai/sdk.py``; CI runs it with ``--check`` to catch stale output.
+
+Usage:
+
+    python scripts/generate_async_api.py          # rewrite generated files
+    python scripts/generate_async_api.py --check  # exit 1 if any are stale
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import io
+import sys
+import tokenize
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+API_DIR = REPO_ROOT / "vastai" / "api"
+AIO_DIR = API_DIR / "aio"
+SDK_PATH = REPO_ROOT / "vastai" / "sdk.py"
+ASYNC_SDK_PATH = REPO_ROOT / "vastai" / "async_" / "sdk.py"
+
+# Modules in vastai/api that are infrastructure rather than API surface.
+SKIP_MODULES = {"__init__", "client", "async_client", "paging", "async_paging"}
+
+# Sync infrastructure modules and their async twins, with renamed exports.
+MODULE_TWINS = {
+    "vastai.api.client": ("vastai.api.async_client", {"VastClient": "AsyncVastClient"}),
+    "vastai.api.paging": ("vastai.api.async_paging", {}),
+}
+
+# Helpers (imported from vastai.api.paging) that return iterators which the
+# async twin exposes as async iterators.
+PAGING_ITERATORS = {"iter_cursor_pages"}
+
+# Client methods that hit the network.
+CLIENT_IO_METHODS = {"get", "post", "put", "delete", "_request", "fetch"}
+
+# Methods of VastAI that the handwritten AsyncVastAI prologue replaces.
+SDK_PROLOGUE_METHODS = {"__init__", "close", "__enter__", "__exit__"}
+
+
+def _header(source: Path) -> str:
+    rel = source.relative_to(REPO_ROOT).as_posix()
+    return (
+        f"# Generated by scripts/generate_async_api.py from {rel}. Do not edit;\n"
+        f"# change the source module and re-run the generator.\n"
+    )
+
+
+SDK_PROLOGUE = '''
+class AsyncVastAI:
+    """Asyncio counterpart of :class:`vastai.sdk.VastAI`.
+
+    Every public method mirrors the ``VastAI`` method of the same name and
+    is a coroutine.  Calls go through an :class:`AsyncVastClient`, so many
+    control-plane operations can be awaited concurrently from one event loop::
+
+        async with AsyncVastAI(api_key=...) as vast:
+            rows = await asyncio.gather(*(vast.show_instance(i) for i in ids))
+
+    Args:
+        api_key: Vast.ai API key, resolved exactly as for ``VastAI``.
+        server_url: Base URL of the Vast.ai API server.
+        retry: Number of retries on transient HTTP errors.
+        raw: If *True*, return raw JSON dicts instead of formatted output.
+        explain: If *True*, print request details for debugging.
+        quiet: If *True*, suppress informational output.
+        curl: If *True*, print equivalent curl commands instead of executing.
+        connection_limit: Maximum number of concurrent connections.
+        cache: Optional :class:`~vastai.api.cache.ResponseCache` for read-only
+            catalog routes.  Off by default.
+    """
+
+    def __init__(self, api_key: Optional[str] = None, server_url: Optional[str] = None, retry: int = 3, raw: bool = False, explain: bool = False, quiet: bool = False, curl: bool = False, connection_limit: int = _DEFAULT_CONNECTION_LIMIT, cache: Optional[ResponseCache] = None):
+        resolved_key = _resolve_api_key(_APIKEY_SENTINEL if api_key is None else api_key)
+        self.client = AsyncVastClient(resolved_key, server_url, retry, explain, curl, connection_limit=connection_limit, cache=cache)
+        self.raw = raw
+        self.quiet = quiet
+
+    async def close(self) -> None:
+        """Release the pooled HTTP connections held by the underlying client."""
+        await self.client.close()
+
+    async def __aenter__(self) -> 'AsyncVastAI':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+'''
+
+
+# ---------------------------------------------------------------------------
+# Analysis
+# ---------------------------------------------------------------------------
+
+def _api_sources() -> dict[str, str]:
+    return {
+        path.stem: path.read_text()
+        for path in sorted(API_DIR.glob("*.py"))
+        if path.stem not in SKIP_MODULES
+    }
+
+
+def _api_modules() -> dict[str, ast.Module]:
+    return {
+        name: ast.parse(text, filename=str(API_DIR / f"{name}.py"))
+        for name, text in _api_sources().items()
+    }
+
+
+def _module_aliases(tree: ast.AST, api_names: set[str]) -> dict[str, str]:
+    """Map local names bound by ``from vastai.api import X [as Y]`` to module names."""
+    aliases = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module == "vastai.api":
+            for alias in node.names:
+                if alias.name in api_names:
+                    aliases[alias.asname or alias.name] = alias.name
+    return aliases
+
+
+def _is_sleep(call: ast.Call) -> bool:
+    func = call.func
+    return (
+        isinstance(func, ast.Attribute) and func.attr == "sleep"
+        and isinstance(func.value, ast.Name) and func.value.id == "time"
+    )
+
+
+class _IOCallFinder:
+    """Decides whether a call expression performs I/O."""
+
+    def __init__(self, io_funcs: dict[str, set[str]], module: str | None,
+                 aliases: dict[str, str], io_methods: set[str] = frozenset(),
+                 aiter_funcs: dict[str, set[str]] | None = None,
+                 aiter_methods: set[str] = frozenset()):
+        self.io_funcs = io_funcs
+        self.module = module
+        self.aliases = aliases
+        self.io_methods = io_methods
+        self.aiter_funcs = aiter_funcs or {}
+        self.aiter_methods = aiter_methods
+
+    def _resolve(self, call: ast.Call, funcs: dict[str, set[str]], methods: set[str]) -> bool:
+        """True if ``call`` targets a function in ``funcs``/``methods`` or a client I/O method."""
+        func = call.func
+        if isinstance(func, ast.Name):
+            return self.module is not None and func.id in funcs.get(self.module, ())
+        if not isinstance(func, ast.Attribute):
+            return False
+        value = func.value
+        if isinstance(value, ast.Name):
+            if value.id == "client":
+                return funcs is self.io_funcs and func.attr in CLIENT_IO_METHODS
+            if value.id == "self":
+                return func.attr in methods
+            target = self.aliases.get(value.id)
+            return target is not None and func.attr in funcs.get(target, ())
+        if (isinstance(value, ast.Attribute) and value.attr == "client"
+                and isinstance(value.value, ast.Name) and value.value.id == "self"):
+            return funcs is self.io_funcs and func.attr in CLIENT_IO_METHODS
+        return False
+
+    def is_aiter(self, node: ast.AST) -> bool:
+        """True if ``node`` is a call producing an iterator that becomes async."""
+        if not isinstance(node, ast.Call):
+            return False
+        if isinstance(node.func, ast.Name) and node.func.id in PAGING_ITERATORS:
+            return True
+        return self._resolve(node, self.aiter_funcs, self.aiter_methods)
+
+    def is_io(self, call: ast.Call) -> bool:
+        """True if ``call`` must be awaited in the async twin."""
+        if _is_sleep(call):
+            return True
+        if self.is_aiter(call):
+            return False
+        return self._resolve(call, self.io_funcs, self.io_methods)
+
+
+def _has_io(func: ast.FunctionDef, finder: _IOCallFinder) -> bool:
+    for node in ast.walk(func):
+        if isinstance(node, ast.Call) and finder.is_io(node):
+            return True
+        if isinstance(node, (ast.For, ast.comprehension)) and finder.is_aiter(node.iter):
+            return True
+    return False
+
+
+def _is_generator(func: ast.FunctionDef) -> bool:
+    return any(isinstance(n, (ast.Yield, ast.YieldFrom)) for n in ast.walk(func))
+
+
+def _io_functions(modules: dict[str, ast.Module]) -> tuple[dict[str, set[str]], dict[str, set[str]]]:
+    """Fixpoint over every module.
+
+    Returns ``(io_funcs, aiter_funcs)``: per module, the top-level functions
+    that perform I/O (and so become coroutines or async generators), and the
+    subset that are generators (and so become async generators).
+    """
+    io_funcs: dict[str, set[str]] = {name: set() for name in modules}
+    aiter_funcs: dict[str, set[str]] = {name: set() for name in modules}
+    api_names = set(modules)
+    changed = True
+    while changed:
+        changed = False
+        for name, tree in modules.items():
+            finder = _IOCallFinder(io_funcs, name, _module_aliases(tree, api_names),
+                                   aiter_funcs=aiter_funcs)
+            for node in tree.body:
+                if (isinstance(node, ast.FunctionDef) and node.name not in io_funcs[name]
+                        and _has_io(node, finder)):
+                    io_funcs[name].add(node.name)
+                    if _is_generator(node):
+                        aiter_funcs[name].add(node.name)
+                    changed = True
+    return io_funcs, aiter_funcs
+
+
+# ---------------------------------------------------------------------------
+# Rewriting
+# ---------------------------------------------------------------------------
+
+class _Source:
+    """A module's source text and the edits that turn it into its async twin.
+
+    Edits are insertions and replacements at node positions, applied to the
+    original text, so everything the AST doesn't keep -- comments, blank
+    lines, formatting -- carries over to the generated module.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.lines = text.splitlines(keepends=True)
+        self.line_starts = [0]
+        for line in self.lines:
+            self.line_starts.append(self.line_starts[-1] + len(line))
+        self._edits: list[tuple[int, tuple[int, int], int, str]] = []
+        self._for_keywords = [
+            self.pos(tok.start[0], tok.start[1], chars=True)
+            for tok in tokenize.generate_tokens(io.StringIO(text).readline)
+            if tok.type == tokenize.NAME and tok.string == "for"
+        ]
+
+    def pos(self, lineno: int, col: int, chars: bool = False) -> int:
+        """Offset of a line/column; ast columns count UTF-8 bytes, tokenize's characters."""
+        if not chars:
+            col = len(self.lines[lineno - 1].encode()[:col].decode())
+        return self.line_starts[lineno - 1] + col
+
+    def start(self, node: ast.AST) -> int:
+        return self.pos(node.lineno, node.col_offset)
+
+    def end(self, node: ast.AST) -> int:
+        return self.pos(node.end_lineno, node.end_col_offset)
+
+    def line_start(self, lineno: int) -> int:
+        return self.line_starts[lineno - 1]
+
+    def insert(self, pos: int, text: str, closing: bool = False) -> None:
+        # At one position, closing text goes innermost first and opening text
+        # outermost first; nodes are visited outside in.
+        n = len(self._edits)
+        self._edits.append((pos, (0, -n) if closing else (1, n), pos, text))
+
+    def replace(self, node: ast.AST, text: str) -> None:
+        self._edits.append((self.start(node), (2, len(self._edits)), self.end(node), text))
+
+    def for_keyword(self, comp: ast.comprehension) -> int:
+        """Offset of the ``for`` that starts a comprehension clause."""
+        target = self.start(comp.target)
+        return max(p for p in self._for_keywords if p < target)
+
+    def render(self, start: int = 0, end: int | None = None) -> str:
+        end = len(self.text) if end is None else end
+        out, cursor = [], start
+        for pos, _, stop, text in sorted(e for e in self._edits if start <= e[0] < end):
+            out.append(self.text[cursor:pos])
+            out.append(text)
+            cursor = stop
+        out.append(self.text[cursor:end])
+        return "".join(out)
+
+
+class _AsyncRewriter(ast.NodeVisitor):
+    """Await I/O calls and redirect sync imports to their async twins."""
+
+    def __init__(self, finder: _IOCallFinder, aio_modules: set[str], source: _Source):
+        self.finder = finder
+        self.aio_modules = aio_modules
+        self.source = source
+        self.used_asyncio = False
+        # calls whose result is called, indexed or has an attribute taken, so an
+        # ``await`` in front of them needs parentheses
+        self._primaries: set[int] = set()
+
+    def make_async(self, func: ast.FunctionDef) -> None:
+        self.source.insert(self.source.start(func), "async ")
+
+    def visit_For(self, node: ast.For):
+        if self.finder.is_aiter(node.iter):
+            self.source.insert(self.source.start(node), "async ")
+        self.generic_visit(node)
+
+    def visit_comprehension(self, node: ast.comprehension):
+        if self.finder.is_aiter(node.iter):
+            self.source.insert(self.source.for_keyword(node), "async ")
+        self.generic_visit(node)
+
+    def visit_Attribute(self, node: ast.Attribute):
+        self._primaries.add(id(node.value))
+        self.generic_visit(node)
+
+    def visit_Subscript(self, node: ast.Subscript):
+        self._primaries.add(id(node.value))
+        self.generic_visit(node)
+
+    def visit_Call(self, node: ast.Call):
+        if self.finder.is_io(node):
+            primary = id(node) in self._primaries
+            self.source.insert(self.source.start(node), "(await " if primary else "await ")
+            if primary:
+                self.source.insert(self.source.end(node), ")", closing=True)
+            if _is_sleep(node):
+                self.used_asyncio = True
+                self.source.replace(node.func, "asyncio.sleep")
+                self._primaries.add(id(node.func))
+                for child in node.args + node.keywords:
+                    self.visit(child)
+                return
+        self._primaries.add(id(node.func))
+        self.generic_visit(node)
+
+    def visit_ImportFrom(self, node: ast.ImportFrom):
+        nodes = None
+        if node.module in MODULE_TWINS:
+            twin_module, renames = MODULE_TWINS[node.module]
+            if node.module == "vastai.api.client":
+                # Only the client class has a twin; other names (e.g.
+                # server_url_default) keep coming from the sync module.
+                twins = [a for a in node.names if a.name in renames]
+                rest = [a for a in node.names if a.name not in renames]
+            else:
+                twins, rest = list(node.names), []
+            nodes = []
+            if twins:
+                nodes.append(ast.ImportFrom(
+                    module=twin_module,
+                    names=[ast.alias(name=renames.get(a.name, a.name), asname=a.asname) for a in twins],
+                    level=0,
+                ))
+            if rest:
+                nodes.append(ast.ImportFrom(module=node.module, names=rest, level=0))
+        elif node.module == "vastai.api":
+            twins = [a for a in node.names if a.name in self.aio_modules]
+            rest = [a for a in node.names if a.name not in self.aio_modules]
+            if twins:
+                nodes = [ast.ImportFrom(module="vastai.api.aio", names=twins, level=0)]
+                if rest:
+                    nodes.append(ast.ImportFrom(module=node.module, names=rest, level=0))
+        if nodes is not None:
+            indent = "\n" + " " * node.col_offset
+            self.source.replace(node, indent.join(ast.unparse(n) for n in nodes))
+
+    def visit_Name(self, node: ast.Name):
+        if node.id == "VastClient":
+            self.source.replace(node, "AsyncVastClient")
+
+
+def _add_asyncio_import(tree: ast.Module, source: _Source) -> None:
+    index = 1 if ast.get_docstring(tree) is not None else 0
+    while (index < len(tree.body) and isinstance(tree.body[index], ast.ImportFrom)
+           and tree.body[index].module == "__future__"):
+        index += 1
+    source.insert(source.line_start(tree.body[index].lineno), "import asyncio\n")
+
+
+def generate_module(name: str, text: str, io_funcs: dict[str, set[str]],
+                    aiter_funcs: dict[str, set[str]]) -> str:
+    tree = ast.parse(text)
+    source = _Source(text)
+    aio_modules = {m for m, funcs in io_funcs.items() if funcs}
+    finder = _IOCallFinder(io_funcs, name, _module_aliases(tree, set(io_funcs)),
+                           aiter_funcs=aiter_funcs)
+    rewriter = _AsyncRewriter(finder, aio_modules, source)
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name in io_funcs[name]:
+            rewriter.make_async(node)
+        rewriter.visit(node)
+    if rewriter.used_asyncio:
+        _add_asyncio_import(tree, source)
+    return _header(API_DIR / f"{name}.py") + source.render()
+
+
+def generate_aio_init(aio_modules: list[str]) -> str:
+    names = ", ".join(aio_modules)
+    return (
+        "# Generated by scripts/generate_async_api.py. Do not edit.\n"
+        '"""Awaitable twins of the ``vastai.api`` modules.\n\n'
+        "Each module here mirrors the sync module of the same name, taking an\n"
+        ":class:`vastai.api.async_client.AsyncVastClient` instead of a\n"
+        "``VastClient``; every function that performs I/O is a coroutine.\n"
+        '"""\n'
+        f"from vastai.api.aio import {names}\n"
+    )
+
+
+def generate_sdk(io_funcs: dict[str, set[str]], aiter_funcs: dict[str, set[str]]) -> str:
+    text = SDK_PATH.read_text()
+    tree = ast.parse(text, filename=str(SDK_PATH))
+    source = _Source(text)
+    aio_modules = {m for m, funcs in io_funcs.items() if funcs}
+    aliases = _module_aliases(tree, set(io_funcs))
+    cls = next(n for n in tree.body if isinstance(n, ast.ClassDef) and n.name == "VastAI")
+
+    methods = [n for n in cls.body
+               if isinstance(n, ast.FunctionDef) and n.name not in SDK_PROLOGUE_METHODS]
+    # Every facade method becomes async; the generator ones become async generators.
+    aiter_methods = {m.name for m in methods if _is_generator(m)}
+    io_methods = {m.name for m in methods} - aiter_methods
+    finder = _IOCallFinder(io_funcs, None, aliases, io_methods,
+                           aiter_funcs=aiter_funcs, aiter_methods=aiter_methods)
+    rewriter = _AsyncRewriter(finder, aio_modules, source)
+
+    for node in tree.body:
+        if node is cls:
+            break
+        if isinstance(node, ast.ImportFrom) and node.module == "vastai.api.client":
+            source.replace(node, "from vastai.api.async_client import AsyncVastClient, "
+                                 "_DEFAULT_CONNECTION_LIMIT")
+            continue
+        rewriter.visit(node)
+    source.replace(tree.body[0], '"""Asyncio facade mirroring vastai.sdk.VastAI over the '
+                                 'vastai.api.aio modules."""')
+
+    # Each kept class member is copied with the lines above it, back to the end
+    # of the previous member, so the section comments between methods stay.
+    body = []
+    previous = cls.body[0]
+    for node in cls.body[1:]:
+        keep = (isinstance(node, ast.FunctionDef) and node.name not in SDK_PROLOGUE_METHODS
+                or isinstance(node, ast.Assign))
+        if keep:
+            if isinstance(node, ast.FunctionDef):
+                rewriter.make_async(node)
+            rewriter.visit(node)
+            body.append((source.line_start(previous.end_lineno + 1),
+                         source.line_start(node.end_lineno + 1)))
+        previous = node
+
+    if rewriter.used_asyncio:
+        _add_asyncio_import(tree, source)
+    header = source.render(0, source.line_start(cls.lineno)).rstrip("\n")
+    members = "".join(source.render(start, end) for start, end in body)
+    return _header(SDK_PATH) + header + "\n\n\n" + SDK_PROLOGUE.strip("\n") + "\n" + members
+
+
+def render() -> dict[Path, str]:
+    """Return ``{output path: generated source}`` for every generated file."""
+    sources = _api_sources()
+    io_funcs, aiter_funcs = _io_functions(_api_modules())
+    aio_modules = sorted(m for m, funcs in io_funcs.items() if funcs)
+    outputs = {AIO_DIR / "__init__.py": generate_aio_init(aio_modules)}
+    for name in aio_modules:
+        outputs[AIO_DIR / f"{name}.py"] = generate_module(name, sources[name], io_funcs, aiter_funcs)
+    outputs[ASYNC_SDK_PATH] = generate_sdk(io_funcs, aiter_funcs)
+    return outputs
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--check", action="store_true",
+                        help="report stale generated files instead of writing them")
+    args = parser.parse_args(argv)
+
+    outputs = render()
+    stale = [path for path, text in outputs.items()
+             if not path.exists() or path.read_text() != text]
+    if args.check:
+        for path in stale:
+            print(f"stale: {path.relative_to(REPO_ROOT)}", file=sys.stderr)
+        return 1 if stale else 0
+
+    AIO_DIR.mkdir(exist_ok=True)
+    for path in stale:
+        path.write_text(outputs[path])
+        print(f"wrote {path.relative_to(REPO_ROOT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
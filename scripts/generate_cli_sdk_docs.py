@@ -45,7 +45,7 @@ from typing import Any, Optional
 # than repeating them inside every command's Options list.
 GLOBAL_CLI_OPTIONS = {
     "url", "retry", "explain", "raw", "full", "curl", "api_key",
-    "version", "no_color", "help",
+    "version", "no_color", "no_http_cache", "help",
 }
 
 # Commands/methods we never publish to public docs, regardless of scope.
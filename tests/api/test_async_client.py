@@ -0,0 +1,149 @@
+"""Tests for vastai/api/async_client.py — AsyncVastClient retry, timeouts, response shape."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+import pytest
+import requests
+
+from vastai.api.async_client import AsyncVastClient
+from vastai.api.aio import instances
+from vastai.utils import VERSION
+
+
+def _response(status, body=b"{}"):
+    r = requests.Response()
+    r.status_code = status
+    r._content = body
+    return r
+
+
+class TestAsyncHttpMethods:
+    @pytest.mark.parametrize("method, json_data, expected_body", [
+        ("get", None, None),
+        ("post", None, {}),
+        ("put", {"b": 2}, {"b": 2}),
+        ("delete", None, {}),
+    ])
+    async def test_methods_call_request(self, method, json_data, expected_body):
+        c = AsyncVastClient(api_key="k")
+        with patch.object(AsyncVastClient, "_request", new=AsyncMock()) as mock_req:
+            await getattr(c, method)("/test", json_data=json_data)
+        mock_req.assert_awaited_once_with(
+            method.upper(), "https://console.vast.ai/api/v0/test",
+            {"User-Agent": f"vastai-sdk/{VERSION}", "Authorization": "Bearer k"},
+            expected_body, timeout=None,
+        )
+
+
+class TestAsyncRetryLogic:
+    @patch("vastai.api.async_client.asyncio.sleep", new_callable=AsyncMock)
+    async def test_retries_on_retryable_status(self, mock_sleep):
+        c = AsyncVastClient(api_key=None, retry=3)
+        send = AsyncMock(side_effect=[_response(429), _response(503), _response(200)])
+        with patch.object(c, "_send", send):
+            result = await c._request("GET", "https://example.com", {})
+        assert result.status_code == 200
+        assert send.await_count == 3
+        assert mock_sleep.await_count == 2
+
+    @patch("vastai.api.async_client.asyncio.sleep", new_callable=AsyncMock)
+    async def test_exhausted_retries_return_last_response(self, mock_sleep):
+        c = AsyncVastClient(api_key=None, retry=2)
+        with patch.object(c, "_send", AsyncMock(return_value=_response(429))) as send:
+            result = await c._request("GET", "https://example.com", {})
+        assert result.status_code == 429
+        assert send.await_count == 2
+
+    @patch("vastai.api.async_client.asyncio.sleep", new_callable=AsyncMock)
+    async def test_stops_on_non_retryable_status(self, mock_sleep):
+        c = AsyncVastClient(api_key=None, retry=3)
+        with patch.object(c, "_send", AsyncMock(return_value=_response(500))) as send:
+            result = await c._request("GET", "https://example.com", {})
+        assert result.status_code == 500
+        assert send.await_count == 1
+        mock_sleep.assert_not_awaited()
+
+    @patch("vastai.api.async_client.asyncio.sleep", new_callable=AsyncMock)
+    async def test_transport_error_retried_then_raised(self, mock_sleep):
+        c = AsyncVastClient(api_key=None, retry=3)
+        err = requests.exceptions.Timeout("timed out")
+        with patch.object(c, "_send", AsyncMock(side_effect=err)) as send:
+            with pytest.raises(requests.exceptions.Timeout):
+                await c._request("GET", "https://example.com", {})
+        assert send.await_count == 3
+
+    async def test_timeout_passed_to_send(self):
+        c = AsyncVastClient(api_key=None, retry=1, timeout=45)
+        with patch.object(c, "_send", AsyncMock(return_value=_response(200))) as send:
+            await c._request("GET", "https://example.com", {})
+            await c._request("GET", "https://example.com", {}, timeout=5)
+        assert [call.args[1] for call in send.await_args_list] == [45, 5]
+
+
+class TestAsyncTransport:
+    async def test_round_trip_returns_requests_response(self, stub_http_server):
+        url, connections = stub_http_server
+        async with AsyncVastClient(api_key="k", server_url=url, retry=1) as c:
+            results = await asyncio.gather(*(c.get("/instances") for _ in range(5)))
+            for _ in range(3):
+                await c.post("/instances", json_data={"a": 1})
+        assert all(isinstance(r, requests.Response) for r in results)
+        assert results[0].status_code == 200
+        assert results[0].json() == {}
+        assert results[0].headers["content-type"] == "application/json"
+        assert c._session is None
+
+    async def test_connection_error_maps_to_requests_exception(self):
+        c = AsyncVastClient(api_key=None, server_url="http://127.0.0.1:9", retry=1)
+        try:
+            with pytest.raises(requests.exceptions.ConnectionError):
+                await c.get("/instances")
+        finally:
+            await c.close()
+
+    @pytest.mark.parametrize("error, expected", [
+        (aiohttp.ClientPayloadError("truncated"), requests.exceptions.ChunkedEncodingError),
+        (aiohttp.ClientResponseError(MagicMock(), (), message="bad"),
+         requests.exceptions.RequestException),
+        (aiohttp.TooManyRedirects(MagicMock(), ()), requests.exceptions.TooManyRedirects),
+        (aiohttp.ServerDisconnectedError(), requests.exceptions.ConnectionError),
+    ])
+    async def test_client_errors_map_to_requests_exceptions(self, error, expected):
+        c = AsyncVastClient(api_key=None, retry=1)
+        session = MagicMock()
+        session.request.side_effect = error
+        with patch.object(c, "_get_session", return_value=session):
+            with pytest.raises(expected) as info:
+                await c.get("/instances")
+        assert info.value.__cause__ is error
+
+    async def test_http_error_raises_requests_http_error(self):
+        c = AsyncVastClient(api_key=None)
+        with patch.object(c, "_send", AsyncMock(return_value=_response(404))):
+            r = await c.get("/instances/1/")
+        with pytest.raises(requests.exceptions.HTTPError):
+            r.raise_for_status()
+
+
+class TestAioModules:
+    async def test_api_function_awaits_client(self):
+        client = AsyncVastClient(api_key=None)
+        body = b'{"instances": [], "next_token": null}'
+        with patch.object(client, "get", AsyncMock(return_value=_response(200, body))) as get:
+            result = await instances.show_instances_v1(client, {"limit": 5})
+        get.assert_awaited_once_with("/api/v1/instances/", query_args={"limit": 5})
+        assert result == {"instances": [], "next_token": None}
+
+    async def test_helpers_calling_helpers_are_awaited(self):
+        """show_instances pages through show_instances_v1; both are coroutines in the twin."""
+        client = AsyncVastClient(api_key=None)
+        row = b'{"id": %d, "start_date": 0, "extra_env": []}'
+        pages = [
+            _response(200, b'{"instances": [' + row % 1 + b'], "next_token": "t"}'),
+            _response(200, b'{"instances": [' + row % 2 + b'], "next_token": null}'),
+        ]
+        with patch.object(client, "get", AsyncMock(side_effect=pages)):
+            rows = await instances.show_instances(client)
+        assert [r["id"] for r in rows] == [1, 2]
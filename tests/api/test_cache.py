@@ -0,0 +1,247 @@
+"""Tests for vastai/api/cache.py — ResponseCache and its VastClient integration."""
+
+import json
+import os
+import threading
+import time
+
+import pytest
+import requests
+from unittest.mock import patch
+
+from vastai.api import cache as cache_mod
+from vastai.api.cache import ResponseCache
+from vastai.api.client import VastClient
+
+
+def _response(body, status=200, headers=None, url="https://console.vast.ai/api/v0/gpu_types/"):
+    r = requests.Response()
+    r.status_code = status
+    r.url = url
+    r.headers.update(headers or {})
+    r._content = json.dumps(body).encode() if body is not None else b""
+    return r
+
+
+ROUTES = ((r"^/api/v0/gpu_types/$", 3600), (r"^/api/v0/template/$", 0))
+
+
+@pytest.fixture
+def cached_client():
+    return VastClient(api_key="k", cache=ResponseCache(routes=ROUTES))
+
+
+class TestRoutePolicy:
+    def test_default_routes_cover_catalog_endpoints(self):
+        c = ResponseCache()
+        assert c.ttl_for("https://x/api/v0/gpu_names/unique/") == 24 * 3600
+        assert c.ttl_for("https://x/api/v0/gpu_types/") == 24 * 3600
+        assert c.ttl_for("https://x/api/v0/template/?select_filters=%7B%7D") is not None
+
+    def test_unlisted_routes_are_not_cached(self):
+        assert ResponseCache().ttl_for("https://x/api/v0/instances/") is None
+
+    def test_key_depends_on_credentials(self):
+        a = ResponseCache.key_for("https://x/a", {"Authorization": "Bearer 1"})
+        b = ResponseCache.key_for("https://x/a", {"Authorization": "Bearer 2"})
+        assert a != b
+
+
+class TestClientCaching:
+    def test_fresh_entry_skips_network(self, cached_client):
+        with patch.object(VastClient, "_request", return_value=_response({"gpu_types": [1]})) as req:
+            first = cached_client.get("/gpu_types/")
+            second = cached_client.get("/gpu_types/")
+        assert req.call_count == 1
+        assert first.json() == second.json() == {"gpu_types": [1]}
+        stats = cached_client.cache.stats
+        assert (stats.hits, stats.misses, stats.stores) == (1, 1, 1)
+
+    def test_uncached_route_always_hits_network(self, cached_client):
+        with patch.object(VastClient, "_request", return_value=_response({})) as req:
+            cached_client.get("/instances/")
+            cached_client.get("/instances/")
+        assert req.call_count == 2
+        assert cached_client.cache.stats.misses == 0
+
+    def test_stale_entry_revalidates_with_etag(self, cached_client):
+        ok = _response({"gpu_types": [1]}, headers={"ETag": '"v1"'})
+        not_modified = _response(None, status=304, headers={"ETag": '"v1"'})
+        with patch.object(VastClient, "_request", side_effect=[ok, not_modified]) as req:
+            cached_client.get("/gpu_types/")
+            for entry in cached_client.cache._memory.values():
+                entry.expires_at = time.time() - 1
+            r = cached_client.get("/gpu_types/")
+        sent_headers = req.call_args_list[1].args[2]
+        assert sent_headers["If-None-Match"] == '"v1"'
+        assert r.status_code == 200
+        assert r.json() == {"gpu_types": [1]}
+        assert cached_client.cache.stats.revalidated == 1
+
+    def test_zero_ttl_route_is_stored_only_with_validators(self, cached_client):
+        url = "https://console.vast.ai/api/v0/template/"
+        with patch.object(VastClient, "_request", return_value=_response([], url=url)):
+            cached_client.get("/template/")
+        assert cached_client.cache.stats.stores == 0
+        with patch.object(VastClient, "_request",
+                          return_value=_response([], url=url, headers={"ETag": '"t"'})):
+            cached_client.get("/template/")
+        assert cached_client.cache.stats.stores == 1
+
+    def test_errors_and_no_store_are_not_cached(self, cached_client):
+        responses = [_response({}, status=500),
+                     _response({}, headers={"Cache-Control": "no-store"})]
+        with patch.object(VastClient, "_request", side_effect=responses):
+            cached_client.get("/gpu_types/")
+            cached_client.get("/gpu_types/")
+        assert cached_client.cache.stats.stores == 0
+
+    def test_private_is_cached(self, cached_client):
+        with patch.object(VastClient, "_request",
+                          return_value=_response({}, headers={"Cache-Control": "private"})) as req:
+            cached_client.get("/gpu_types/")
+            cached_client.get("/gpu_types/")
+        assert req.call_count == 1
+
+    @pytest.mark.parametrize("cache_control", ["max-age=0", "private, max-age=0", "no-cache"])
+    def test_max_age_zero_is_stored_only_for_revalidation(self, cached_client, cache_control):
+        plain = _response({}, headers={"Cache-Control": cache_control})
+        with patch.object(VastClient, "_request", return_value=plain):
+            cached_client.get("/gpu_types/")
+        assert cached_client.cache.stats.stores == 0
+        tagged = _response({}, headers={"Cache-Control": cache_control, "ETag": '"v1"'})
+        not_modified = _response(None, status=304, headers={"ETag": '"v1"'})
+        with patch.object(VastClient, "_request", side_effect=[tagged, not_modified]) as req:
+            cached_client.get("/gpu_types/")
+            cached_client.get("/gpu_types/")
+        assert req.call_args_list[1].args[2]["If-None-Match"] == '"v1"'
+        assert cached_client.cache.stats.revalidated == 1
+
+    def test_explain_reports_counters(self, capsys):
+        client = VastClient(api_key="k", explain=True, cache=ResponseCache(routes=ROUTES))
+        with patch.object(VastClient, "_request", return_value=_response({"gpu_types": []})):
+            client.get("/gpu_types/")
+            client.get("/gpu_types/")
+        out = capsys.readouterr().out
+        assert "cache miss" in out
+        assert "cache hit" in out
+        assert "hits=1 misses=1" in out
+
+
+class TestInvalidation:
+    TEMPLATE = "https://console.vast.ai/api/v0/template/"
+    ROUTES = ((r"^/api/v0/gpu_types/$", 3600), (r"^/api/v0/template/$", 60))
+
+    def test_write_drops_cached_reads_of_its_route(self, tmp_path):
+        client = VastClient(api_key="k", cache=ResponseCache(routes=self.ROUTES,
+                                                              cache_dir=str(tmp_path)))
+        search_url = self.TEMPLATE + "?select_filters=%7B%7D"
+        responses = [_response({"templates": [1]}, url=search_url), _response({"gpu_types": []})]
+        with patch.object(VastClient, "_request", side_effect=responses):
+            client.get("/template/", query_args={"select_filters": {}})
+            client.get("/gpu_types/")
+        assert len(list(tmp_path.iterdir())) == 2
+
+        with patch.object(VastClient, "_request", return_value=_response({"success": True})):
+            client.post("/template/", json_data={"name": "t"})
+
+        # the template search is gone for this process and for others sharing the disk
+        key = ResponseCache.key_for(search_url, client._build_headers())
+        assert client.cache.lookup(key) is None
+        assert ResponseCache(routes=self.ROUTES, cache_dir=str(tmp_path)).lookup(key) is None
+        with patch.object(VastClient, "_request", return_value=_response({})) as req:
+            client.get("/gpu_types/")
+        assert req.call_count == 0
+
+    def test_failed_write_still_invalidates(self):
+        client = VastClient(api_key="k", cache=ResponseCache(routes=self.ROUTES))
+        with patch.object(VastClient, "_request", return_value=_response({}, url=self.TEMPLATE)):
+            client.get("/template/")
+        with patch.object(VastClient, "_request", side_effect=requests.exceptions.ConnectionError):
+            with pytest.raises(requests.exceptions.ConnectionError):
+                client.delete("/template/", json_data={"hash_id": "h"})
+        assert client.cache._memory == {}
+
+    def test_writes_to_other_routes_keep_entries(self):
+        client = VastClient(api_key="k", cache=ResponseCache(routes=self.ROUTES))
+        with patch.object(VastClient, "_request", return_value=_response({}, url=self.TEMPLATE)):
+            client.get("/template/")
+            client.put("/instances/1/", json_data={})
+        assert len(client.cache._memory) == 1
+
+
+class TestStorage:
+    def test_memory_lru_bound(self):
+        c = ResponseCache(routes=ROUTES, max_entries=2)
+        for i in range(3):
+            c.store(f"k{i}", _response({"i": i}), 60)
+        assert list(c._memory) == ["k1", "k2"]
+        assert c.stats.evictions == 1
+
+    def test_disk_store_shared_between_instances(self, tmp_path):
+        writer = ResponseCache(routes=ROUTES, cache_dir=str(tmp_path))
+        writer.store("k", _response({"gpu_types": [7]}), 60)
+        reader = ResponseCache(routes=ROUTES, cache_dir=str(tmp_path))
+        entry = reader.lookup("k")
+        assert entry is not None and entry.fresh
+        assert entry.to_response().json() == {"gpu_types": [7]}
+
+    def test_disk_lru_bound(self, tmp_path):
+        c = ResponseCache(routes=ROUTES, cache_dir=str(tmp_path), max_disk_entries=2)
+        for i in range(3):
+            c.store(f"k{i}", _response({}), 60)
+            os.utime(tmp_path / f"k{i}.json", (i, i))
+        c.store("k3", _response({}), 60)
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["k2.json", "k3.json"]
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX permissions")
+    def test_disk_store_is_private(self, tmp_path):
+        store = tmp_path / "http"
+        store.mkdir(mode=0o755)
+        c = ResponseCache(routes=ROUTES, cache_dir=str(store))
+        c.store("k", _response({}), 60)
+        assert store.stat().st_mode & 0o777 == 0o700
+        assert (store / "k.json").stat().st_mode & 0o777 == 0o600
+
+    def test_concurrent_disk_writes_of_one_key(self, tmp_path):
+        c = ResponseCache(routes=ROUTES, cache_dir=str(tmp_path))
+        threads = [threading.Thread(target=c.store, args=("k", _response({"i": i}), 60))
+                   for i in range(8)]
+        with patch.object(cache_mod.os, "replace", wraps=os.replace) as replace:
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        assert len({call.args[0] for call in replace.call_args_list}) == 8
+        assert [p.name for p in tmp_path.iterdir()] == ["k.json"]
+        assert ResponseCache(cache_dir=str(tmp_path)).lookup("k") is not None
+
+    def test_corrupt_disk_entry_is_ignored(self, tmp_path):
+        (tmp_path / "k.json").write_text("not json")
+        assert ResponseCache(cache_dir=str(tmp_path)).lookup("k") is None
+
+    def test_clear(self, tmp_path):
+        c = ResponseCache(routes=ROUTES, cache_dir=str(tmp_path))
+        c.store("k", _response({}), 60)
+        c.clear()
+        assert c.lookup("k") is None
+
+
+class TestDefaultCache:
+    def test_env_var_disables(self, monkeypatch):
+        monkeypatch.setenv("VAST_NO_CACHE", "1")
+        assert cache_mod.get_default_cache() is None
+
+    def test_singleton(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("VAST_NO_CACHE", raising=False)
+        monkeypatch.setattr(cache_mod, "_default_cache", None)
+        monkeypatch.setattr(cache_mod, "default_cache_dir", lambda: str(tmp_path))
+        assert cache_mod.get_default_cache() is cache_mod.get_default_cache()
+
+
+class TestCliFlag:
+    def test_no_cache_flag_disables_cache(self):
+        from types import SimpleNamespace
+        from vastai.cli.utils import get_client
+        args = SimpleNamespace(api_key="k", url="https://x", retry=1, no_http_cache=True)
+        assert get_client(args).cache is None
@@ -316,3 +316,106 @@ class TestClientInit:
         assert c.retry == 5
         assert c.explain is True
         assert c.curl is True
+
+
+class TestConnectionPooling:
+    @patch("vastai.api.client.requests.Session")
+    def test_session_reused_across_calls(self, mock_session_cls):
+        mock_session = MagicMock()
+        mock_session_cls.return_value = mock_session
+        mock_session.send.return_value = MagicMock(status_code=200)
+
+        c = VastClient(api_key=None, retry=1)
+        c.get("/a")
+        c.post("/b")
+        c.put("/c")
+        c.delete("/d")
+
+        assert mock_session_cls.call_count == 1
+        assert mock_session.send.call_count == 4
+
+    @patch("vastai.api.client.time.sleep")
+    @patch("vastai.api.client.requests.Session")
+    def test_retries_share_session(self, mock_session_cls, mock_sleep):
+        mock_session = MagicMock()
+        mock_session_cls.return_value = mock_session
+        mock_session.send.side_effect = [MagicMock(status_code=503), MagicMock(status_code=200)]
+
+        c = VastClient(api_key=None, retry=3)
+        c._request("GET", "https://example.com", {})
+
+        assert mock_session_cls.call_count == 1
+
+    @patch("vastai.api.client.requests.Session")
+    def test_pool_size_configures_adapter(self, mock_session_cls):
+        mock_session = MagicMock()
+        mock_session_cls.return_value = mock_session
+
+        c = VastClient(api_key=None, pool_size=4)
+        c._get_session()
+
+        adapter = mock_session.mount.call_args_list[0].args[1]
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 4
+        mounted = {call.args[0] for call in mock_session.mount.call_args_list}
+        assert mounted == {"http://", "https://"}
+
+    @patch("vastai.api.client.requests.Session")
+    def test_close_releases_session_and_reopens_lazily(self, mock_session_cls):
+        first, second = MagicMock(), MagicMock()
+        mock_session_cls.side_effect = [first, second]
+
+        c = VastClient(api_key=None)
+        assert c._get_session() is first
+        c.close()
+        first.close.assert_called_once()
+        assert c._get_session() is second
+
+    @patch("vastai.api.client.requests.Session")
+    def test_context_manager_closes(self, mock_session_cls):
+        mock_session = MagicMock()
+        mock_session_cls.return_value = mock_session
+
+        with VastClient(api_key=None) as c:
+            c._get_session()
+        mock_session.close.assert_called_once()
+        assert c._session is None
+
+    def test_concurrent_first_calls_share_one_session(self):
+        """Threads racing to make the first request must not each create a session."""
+        import threading
+        import time
+
+        created = []
+
+        def make_session():
+            time.sleep(0.01)  # widen the window between the check and the store
+            session = MagicMock()
+            created.append(session)
+            return session
+
+        c = VastClient(api_key=None)
+        sessions = []
+        with patch("vastai.api.client.requests.Session", side_effect=make_session):
+            threads = [threading.Thread(target=lambda: sessions.append(c._get_session()))
+                       for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        assert len(created) == 1
+        assert all(s is created[0] for s in sessions)
+
+    def test_close_without_session_is_noop(self):
+        c = VastClient(api_key=None)
+        c.close()
+        assert c._session is None
+
+    def test_keep_alive_against_local_server(self, stub_http_server):
+        """Real sockets: many calls through one client reuse one connection."""
+        url, connections = stub_http_server
+        with VastClient(api_key=None, server_url=url, retry=1) as c:
+            for _ in range(5):
+                assert c.get("/instances").status_code == 200
+        assert len(connections) == 1
+
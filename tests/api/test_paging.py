@@ -0,0 +1,126 @@
+"""Tests for vastai/api/paging.py and vastai/api/async_paging.py — cursor pagers."""
+
+import asyncio
+import threading
+
+import pytest
+
+from vastai.api import async_paging, paging
+from vastai.api.instances import iter_instances, show_instances
+
+
+def _pages(n):
+    """Return a fetch_page fake serving ``n`` pages and the list of params it saw."""
+    seen = []
+
+    def fetch_page(params):
+        seen.append(dict(params))
+        idx = int(params.get("after_token") or 0)
+        return {"rows": [idx], "next_token": str(idx + 1) if idx + 1 < n else None}
+    return fetch_page, seen
+
+
+class TestIterCursorPages:
+    @pytest.mark.parametrize("prefetch", [0, 1, 3])
+    def test_yields_every_page_in_order(self, prefetch):
+        fetch_page, seen = _pages(5)
+        pages = list(paging.iter_cursor_pages(fetch_page, {"limit": 2}, prefetch=prefetch))
+        assert [p["rows"] for p in pages] == [[0], [1], [2], [3], [4]]
+        assert [s.get("after_token") for s in seen] == [None, "1", "2", "3", "4"]
+        assert all(s["limit"] == 2 for s in seen)
+
+    def test_does_not_mutate_params(self):
+        fetch_page, _ = _pages(3)
+        params = {"limit": 2}
+        list(paging.iter_cursor_pages(fetch_page, params))
+        assert params == {"limit": 2}
+
+    def test_next_page_fetched_while_current_is_consumed(self):
+        second_requested = threading.Event()
+
+        def fetch_page(params):
+            if params.get("after_token"):
+                second_requested.set()
+                return {"next_token": None}
+            return {"next_token": "t"}
+
+        it = paging.iter_cursor_pages(fetch_page, {})
+        next(it)
+        # The consumer has not asked for page 2 yet, but its request is out.
+        assert second_requested.wait(timeout=2)
+        assert list(it) == [{"next_token": None}]
+
+    def test_fetch_error_surfaces_in_consumer(self):
+        def fetch_page(params):
+            if params.get("after_token"):
+                raise RuntimeError("boom")
+            return {"next_token": "t"}
+
+        it = paging.iter_cursor_pages(fetch_page, {})
+        assert next(it) == {"next_token": "t"}
+        with pytest.raises(RuntimeError, match="boom"):
+            next(it)
+
+    def test_abandoned_iterator_stops_fetcher(self):
+        fetch_page, seen = _pages(1000)
+        it = paging.iter_cursor_pages(fetch_page, {}, prefetch=1)
+        next(it)
+        it.close()
+        for t in threading.enumerate():
+            if t.name == "vastai-pager":
+                t.join(timeout=2)
+        assert len(seen) < 10
+
+
+class TestAsyncIterCursorPages:
+    @pytest.mark.parametrize("prefetch", [0, 1])
+    async def test_yields_every_page_in_order(self, prefetch):
+        sync_fetch, seen = _pages(4)
+
+        async def fetch_page(params):
+            return sync_fetch(params)
+
+        pages = [p async for p in async_paging.iter_cursor_pages(fetch_page, {}, prefetch=prefetch)]
+        assert [p["rows"] for p in pages] == [[0], [1], [2], [3]]
+        assert [s.get("after_token") for s in seen] == [None, "1", "2", "3"]
+
+    async def test_next_page_requested_before_consumer_asks(self):
+        requested = []
+
+        async def fetch_page(params):
+            requested.append(params.get("after_token"))
+            return {"next_token": None if params.get("after_token") else "t"}
+
+        it = async_paging.iter_cursor_pages(fetch_page, {})
+        await it.__anext__()
+        await asyncio.sleep(0)
+        assert requested == [None, "t"]
+        await it.aclose()
+
+
+class TestIterInstances:
+    def _client(self, mock_client, mock_response, pages):
+        mock_client.get.side_effect = [mock_response(200, p) for p in pages]
+        return mock_client
+
+    def test_streams_formatted_rows_with_page_size(self, mock_client, mock_response):
+        row = {"start_date": 0, "extra_env": [["A", "1"]], "label": " x "}
+        client = self._client(mock_client, mock_response, [
+            {"instances": [dict(row, id=1)], "next_token": "t"},
+            {"instances": [dict(row, id=2)], "next_token": None},
+        ])
+        rows = list(iter_instances(client, page_size=7))
+        assert [r["id"] for r in rows] == [1, 2]
+        assert rows[0]["extra_env"] == {"A": "1"}
+        assert rows[0]["label"] == "x"
+        first, second = mock_client.get.call_args_list
+        assert first.kwargs["query_args"]["limit"] == 7
+        assert second.kwargs["query_args"]["after_token"] == "t"
+
+    def test_show_instances_collects_every_page(self, mock_client, mock_response):
+        row = {"start_date": 0, "extra_env": []}
+        client = self._client(mock_client, mock_response, [
+            {"instances": [dict(row, id=1), dict(row, id=2)], "next_token": "t"},
+            {"instances": None, "next_token": None},
+        ])
+        assert [r["id"] for r in show_instances(client)] == [1, 2]
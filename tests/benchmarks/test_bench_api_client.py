@@ -0,0 +1,42 @@
+"""Per-call latency of VastClient against a local stub: fresh session vs pooled."""
+
+import time
+
+import pytest
+import requests
+
+from vastai.api.client import VastClient
+
+pytestmark = pytest.mark.benchmark
+
+CALLS = 200
+
+
+def _per_call_ms(fn, calls=CALLS):
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) * 1000 / calls
+
+
+def test_pooled_session_vs_session_per_call(stub_http_server):
+    url, connections = stub_http_server
+    target = url + "/api/v0/instances"
+
+    def fresh_session():
+        # Previous behaviour: a new requests.Session for every attempt.
+        with requests.Session() as s:
+            s.get(target).raise_for_status()
+
+    before_ms = _per_call_ms(fresh_session)
+    fresh_connections = len(connections)
+    connections.clear()
+
+    with VastClient(api_key=None, server_url=url, retry=1) as client:
+        after_ms = _per_call_ms(lambda: client.get("/instances").raise_for_status())
+
+    print(f"\nVastClient per-call latency: session-per-call {before_ms:.3f} ms "
+          f"({fresh_connections} connections), pooled {after_ms:.3f} ms "
+          f"({len(connections)} connections)")
+    assert fresh_connections == CALLS
+    assert len(connections) == 1
@@ -0,0 +1,108 @@
+"""Build and extract a synthetic deployment (1GiB by default; VAST_BENCH_DEPLOYMENT_MB
+overrides) with single-threaded gzip, the parallel gzip codec and zstd, extracting from a
+file read in download-sized chunks as the worker does."""
+
+import gzip
+import io
+import os
+import random
+import tarfile
+import time
+
+import pytest
+
+from vastai.serverless.archive import ZstdCodec
+from vastai.serverless.remote.base import Config
+from vastai.serverless.remote.serve_deployment import extract_tarball
+from vastai.serverless.remote.utils import build_deployment_tarball
+
+pytestmark = pytest.mark.benchmark
+
+SIZE_MB = int(os.environ.get("VAST_BENCH_DEPLOYMENT_MB", 1024))
+CONFIG = Config(name="bench", pip_installs=[], apt_gets=[], envs=[], runs=[])
+
+
+@pytest.fixture(scope="module")
+def deployment(tmp_path_factory):
+    """A package of model-like files: half incompressible weights, half text and code."""
+    root = tmp_path_factory.mktemp("src") / "deployment"
+    (root / "weights").mkdir(parents=True)
+    (root / "deployment.py").write_text("def handler(x):\n    return x\n")
+    rng = random.Random(0)
+    chunk = 16 * 2**20
+    for i in range(max(SIZE_MB // 32, 1)):
+        (root / "weights" / f"shard{i}.bin").write_bytes(rng.randbytes(chunk))
+        lines = "".join(f"token_{rng.randrange(50_000)} {j}\n" for j in range(chunk // 16))
+        (root / f"vocab{i}.txt").write_text(lines[:chunk])
+    (root / "__init__.py").write_text("")
+    return str(root)
+
+
+def _build_single_threaded_gzip(out, deployment):
+    # what build_deployment_tarball did before the codecs: GzipFile + tarfile
+    with open(out, "wb") as raw, gzip.GzipFile(
+        filename="", fileobj=raw, mode="wb", mtime=0, compresslevel=6
+    ) as gz, tarfile.open(fileobj=gz, mode="w") as tf:
+        tf.add(deployment, arcname="./deployment")
+
+
+class _Download(io.RawIOBase):
+    """Read a file in 64KiB pieces, like an HTTP response body."""
+
+    def __init__(self, path):
+        self._f = open(path, "rb")
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        data = self._f.read(min(len(b), 64 * 1024))
+        b[: len(data)] = data
+        return len(data)
+
+    def close(self):
+        self._f.close()
+        super().close()
+
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def test_build_and_extract(deployment, tmp_path, monkeypatch):
+    codecs = ["gzip (1 thread)", "gzip (parallel)"]
+    try:
+        ZstdCodec._zstandard()
+        codecs.append("zstd")
+    except RuntimeError:
+        pass
+    print(f"\nsynthetic deployment: {SIZE_MB}MiB, {os.cpu_count()} CPUs")
+    results = {}
+    for name in codecs:
+        out = str(tmp_path / f"out-{len(results)}")
+        if name == "gzip (1 thread)":
+            build = _timed(_build_single_threaded_gzip, out, deployment)
+        else:
+            build = _timed(
+                build_deployment_tarball, out, CONFIG, deployment, None, True, name.split()[0]
+            )
+        dest = tmp_path / f"extract-{len(results)}"
+        dest.mkdir()
+        monkeypatch.chdir(dest)
+        source = _Download(out)
+        extract = _timed(extract_tarball, source)
+        source.close()
+        size = os.path.getsize(out)
+        results[name] = (build, extract, size)
+        print(
+            f"{name:16} build {build:6.2f}s ({SIZE_MB / build:6.1f}MiB/s)  "
+            f"extract {extract:6.2f}s  size {size / 2**20:8.1f}MiB"
+        )
+        assert (dest / "deployment" / "deployment.py").is_file()
+        os.unlink(out)
+    # parallel gzip costs at most a little ratio; the speedup needs more than one CPU
+    assert results["gzip (parallel)"][2] < results["gzip (1 thread)"][2] * 1.02
+    if (os.cpu_count() or 1) >= 4:
+        assert results["gzip (parallel)"][0] < results["gzip (1 thread)"][0]
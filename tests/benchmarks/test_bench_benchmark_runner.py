@@ -0,0 +1,97 @@
+"""Benchmarking a simulated model server that saturates at 8 concurrent requests: the
+fixed benchmark (guessed concurrency) vs the adaptive one, and resuming after a restart."""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from vastai.serverless.server.lib.benchmark import BenchmarkRunner
+
+pytestmark = pytest.mark.benchmark
+
+SLOTS = 8  # requests the simulated GPU batches at once
+LATENCY = 0.05  # per batch
+CAPACITY = SLOTS / LATENCY  # workload/s
+
+
+class _Payload:
+    def count_workload(self) -> float:
+        return 1.0
+
+
+class _Response:
+    status = 200
+
+    async def read(self) -> bytes:
+        return b"{}"
+
+
+class SaturatingModel:
+    def __init__(self):
+        self.slots = asyncio.Semaphore(SLOTS)
+        self.calls = 0
+
+    async def __call__(self, payload) -> _Response:
+        self.calls += 1
+        async with self.slots:
+            await asyncio.sleep(LATENCY)
+        return _Response()
+
+
+async def _bench(path, **kwargs):
+    model = SaturatingModel()
+    runner = BenchmarkRunner(
+        call=model, make_payload=_Payload, key={"endpoint": "/generate"}, path=str(path),
+        **kwargs,
+    )
+    start = time.perf_counter()
+    summary = await runner.run()
+    return summary, model.calls, time.perf_counter() - start
+
+
+async def test_adaptive_finds_the_saturation_point(tmp_path):
+    rows = []
+    for name, kwargs in [
+        ("fixed, concurrency 4", dict(concurrency=4, runs=8)),
+        ("fixed, concurrency 10", dict(concurrency=10, runs=8)),
+        ("fixed, concurrency 32", dict(concurrency=32, runs=8)),
+        ("adaptive", dict(concurrency=10, runs=8, adaptive=True)),
+        (
+            "adaptive, p99 <= 80ms",
+            dict(concurrency=10, runs=8, adaptive=True, max_latency=0.08),
+        ),
+    ]:
+        summary, calls, elapsed = await _bench(tmp_path / f"{len(rows)}.json", **kwargs)
+        rows.append((name, summary, calls, elapsed))
+    print(f"\nsimulated capacity {CAPACITY:.0f}/s at {SLOTS} concurrent requests")
+    for name, summary, calls, elapsed in rows:
+        print(
+            f"{name:>24}: max_throughput {summary.max_throughput:6.1f}/s "
+            f"({summary.max_throughput / CAPACITY:4.0%}), "
+            f"saturation_concurrency {summary.saturation_concurrency:2d}, "
+            f"{calls:3d} requests in {elapsed:.2f}s"
+        )
+    adaptive = rows[3][1]
+    assert adaptive.saturation_concurrency == SLOTS
+    assert adaptive.max_throughput > 0.85 * CAPACITY
+    assert adaptive.max_throughput > 1.5 * rows[0][1].max_throughput
+    assert rows[4][1].saturation_concurrency == SLOTS
+
+
+async def test_resume_skips_recorded_runs(tmp_path):
+    path = tmp_path / "bench.json"
+    kwargs = dict(concurrency=10, runs=8, adaptive=True)
+    _, full_calls, full = await _bench(path, **kwargs)
+    # a restart mid-benchmark: keep the first half of the recorded runs
+    data = json.loads(path.read_text())
+    data["runs"] = data["runs"][: len(data["runs"]) // 2]
+    data["result"] = None
+    path.write_text(json.dumps(data))
+    _, resumed_calls, resumed = await _bench(path, **kwargs)
+    print(
+        f"\nfull benchmark {full_calls} requests in {full:.2f}s, "
+        f"resumed halfway {resumed_calls} requests in {resumed:.2f}s"
+    )
+    assert resumed_calls < full_calls
@@ -0,0 +1,100 @@
+"""Latency of forwarding small requests from the pyworker Backend to a local model server:
+a new connection per request (force_close, the old behaviour) vs the keep-alive pool.
+
+The stub model server runs in its own process, like a real one would."""
+
+import asyncio
+import statistics
+import subprocess
+import sys
+import time
+
+import pytest
+
+pytestmark = pytest.mark.benchmark
+
+REQUESTS = 1000
+CONCURRENCY = 16
+
+STUB_SERVER = """
+import asyncio
+from aiohttp import web
+
+async def predict(request):
+    return web.json_response({"echo": await request.json()})
+
+async def main():
+    app = web.Application()
+    app.router.add_post("/predict", predict)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    print(site._server.sockets[0].getsockname()[1], flush=True)
+    await asyncio.Event().wait()
+
+asyncio.run(main())
+"""
+
+
+@pytest.fixture(scope="module")
+def model_server_url():
+    proc = subprocess.Popen(
+        [sys.executable, "-c", STUB_SERVER], stdout=subprocess.PIPE, text=True
+    )
+    try:
+        port = int(proc.stdout.readline())
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+def _percentiles(latencies):
+    cuts = statistics.quantiles(latencies, n=100)
+    return cuts[49] * 1e3, cuts[98] * 1e3
+
+
+def _measure(backend, handler, concurrency: int):
+    call_api = backend._Backend__call_api
+    payload = handler.make_benchmark_payload()
+
+    async def one(latencies):
+        start = time.perf_counter()
+        resp = await call_api(handler=handler, payload=payload)
+        await resp.read()
+        latencies.append(time.perf_counter() - start)
+
+    async def worker(latencies, count):
+        for _ in range(count):
+            await one(latencies)
+
+    async def run():
+        latencies = []
+        try:
+            await worker([], 20)  # warm up (and fill the pool)
+            await asyncio.gather(
+                *(worker(latencies, REQUESTS // concurrency) for _ in range(concurrency))
+            )
+        finally:
+            await backend.session.close()
+        return latencies
+
+    return _percentiles(asyncio.run(run()))
+
+
+@pytest.mark.parametrize("concurrency", [1, CONCURRENCY])
+def test_model_server_keepalive(serverless_backend_testkit, model_server_url, concurrency):
+    results = {}
+    for keepalive in (False, True):
+        backend, handler = serverless_backend_testkit.make_backend()
+        backend.model_server_url = model_server_url
+        backend.model_keepalive = keepalive
+        results[keepalive] = _measure(backend, handler, concurrency)
+    (old_p50, old_p99), (new_p50, new_p99) = results[False], results[True]
+    print(
+        f"\n{REQUESTS} requests, concurrency {concurrency}: "
+        f"force_close p50 {old_p50:.2f}ms p99 {old_p99:.2f}ms, "
+        f"keep-alive p50 {new_p50:.2f}ms p99 {new_p99:.2f}ms"
+    )
+    assert new_p50 < old_p50
@@ -0,0 +1,124 @@
+"""Matching a multi-MB vLLM log against a worker's log actions: the per-pattern substring
+loop vs the compiled LogMatcher."""
+
+import random
+import re
+import time
+
+import pytest
+
+from vastai.serverless.server.lib.data_types import LogAction
+from vastai.serverless.server.lib.logmatch import LogMatcher
+
+pytestmark = pytest.mark.benchmark
+
+LINES = 100_000
+TEMPLATES = [
+    "INFO 05-14 10:21:{s:02d} metrics.py:351] Avg prompt throughput: {a}.2 tokens/s, "
+    "Avg generation throughput: {b}.1 tokens/s, Running: 12 reqs, Swapped: 0 reqs, "
+    "Pending: 0 reqs, GPU KV cache usage: 4.{a}%, CPU KV cache usage: 0.0%.",
+    'INFO:     127.0.0.1:{p} - "POST /v1/completions HTTP/1.1" 200 OK',
+    "DEBUG 05-14 10:21:{s:02d} scheduler.py:{a}] Scheduled {b} sequences, preempted 0",
+    "INFO 05-14 10:21:{s:02d} async_llm_engine.py:{a}] Finished request cmpl-{p}.",
+    "Loading safetensors checkpoint shards: {a}% Completed | {b}/40 [00:{s:02d}<00:10]",
+]
+ERRORS = [
+    "Traceback (most recent call last):",
+    "CUDA out of memory",
+    "torch.OutOfMemoryError",
+    "RuntimeError: CUDA error",
+    "AsyncEngineDeadError",
+    "Engine loop has died",
+    "ValueError: The model's max seq len",
+    "NCCL error",
+    "Segmentation fault",
+    "Killed",
+    "ERROR 0",
+    "ERROR 1",
+    "[rank0]: Error",
+    "ModuleNotFoundError",
+    "ImportError",
+    "OSError: ",
+    "No available memory for the cache blocks",
+    "Address already in use",
+]
+INFOS = [
+    "Starting vLLM API server",
+    "Downloading shards",
+    "Loading model weights took",
+    "Memory profiling takes",
+    "# GPU blocks:",
+    "Capturing cudagraphs for decoding",
+    "Graph capturing finished",
+    "init engine (profile, create kv cache, warmup model) took",
+    "Available routes are:",
+    "Started server process",
+    "Waiting for application startup",
+    "Using FlashAttention backend",
+    "Using XFormers backend",
+    "Chunked prefill is enabled",
+    "Prefix caching is enabled",
+    "Automatically detected platform cuda",
+    "Initializing a V0 LLM engine",
+    "Maximum concurrency for",
+]
+ACTIONS = (
+    [(LogAction.ModelLoaded, "Application startup complete.")]
+    + [(LogAction.ModelError, e) for e in ERRORS]
+    + [(LogAction.Info, i) for i in INFOS]
+)
+
+
+def _log() -> list:
+    rng = random.Random(0)
+    return [
+        rng.choice(TEMPLATES).format(
+            a=rng.randint(1, 99), b=rng.randint(1, 999), s=rng.randint(0, 59),
+            p=rng.randint(1000, 65000),
+        )
+        for _ in range(LINES)
+    ]
+
+
+def _loop(actions, lines) -> int:
+    found = 0
+    for line in lines:
+        for action, msg in actions:
+            if msg in line:
+                found += 1
+    return found
+
+
+def _matcher(actions, lines) -> int:
+    match = LogMatcher(actions).match
+    return sum(len(match(line)) for line in lines)
+
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+@pytest.mark.parametrize("copies", [1, 4])
+def test_log_matching_throughput(copies):
+    # more markers: every pattern again with a suffix, so none of them match either
+    actions = ACTIONS + [
+        (action, f"{msg} (variant {k})") for k in range(copies - 1) for action, msg in ACTIONS
+    ]
+    lines = _log()
+    size_mb = sum(len(line) + 1 for line in lines) / 1e6
+    loop, loop_found = _timed(_loop, actions, lines)
+    compiled, found = _timed(_matcher, actions, lines)
+    assert found == loop_found
+    progress = actions + [
+        (LogAction.Info, re.compile(r"checkpoint shards:\s+(?P<percent>\d+)%"))
+    ]
+    with_regex, _ = _timed(_matcher, progress, lines)
+    print(
+        f"\n{size_mb:.1f} MB, {len(actions)} patterns: substring loop {loop:.3f}s "
+        f"({size_mb / loop:.0f} MB/s), LogMatcher {compiled:.3f}s "
+        f"({size_mb / compiled:.0f} MB/s, {loop / compiled:.1f}x), "
+        f"plus a progress regex {with_regex:.3f}s"
+    )
+    assert compiled < loop
@@ -0,0 +1,64 @@
+"""Time to read a chatty model log: the old tailer (os.stat and an anyio readline, i.e. a
+thread hop, per line) vs LogTailer's block reads split into batches of lines."""
+
+import asyncio
+import os
+import time
+
+import pytest
+from anyio import open_file
+
+from vastai.serverless.server.lib.logtail import LogTailer
+
+pytestmark = pytest.mark.benchmark
+
+LINES = 50_000
+LINE = (
+    "INFO 05-14 10:21:07 metrics.py:351] Avg prompt throughput: 1830.2 tokens/s, "
+    "Avg generation throughput: 95.1 tokens/s, Running: 12 reqs, Pending: 0 reqs\n"
+)
+
+
+async def _readline_reference(path: str, count: int) -> None:
+    """The previous tail loop, minus the sleep when idle."""
+    f = await open_file(path, encoding="utf-8", errors="ignore")
+    seen = 0
+    try:
+        while seen < count:
+            os.stat(path)
+            line = await f.readline()
+            if line:
+                line.rstrip()
+                seen += 1
+    finally:
+        await f.aclose()
+
+
+async def _tailer(path: str, count: int) -> None:
+    seen = 0
+    async for lines in LogTailer(path):
+        seen += len(lines)
+        if seen >= count:
+            return
+
+
+def test_log_tail_throughput(tmp_path):
+    path = str(tmp_path / "model.log")
+    with open(path, "w") as f:
+        f.write(LINE * LINES)
+    size_mb = os.path.getsize(path) / 1e6
+
+    start = time.perf_counter()
+    asyncio.run(_readline_reference(path, LINES))
+    reference = time.perf_counter() - start
+
+    start = time.perf_counter()
+    asyncio.run(_tailer(path, LINES))
+    current = time.perf_counter() - start
+
+    print(
+        f"\n{LINES} lines ({size_mb:.0f} MB): readline per line {reference:.2f}s "
+        f"({LINES / reference:,.0f} lines/s), LogTailer {current:.3f}s "
+        f"({LINES / current:,.0f} lines/s, {reference / current:.0f}x)"
+    )
+    assert current < reference
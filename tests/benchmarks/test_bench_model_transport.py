@@ -0,0 +1,116 @@
+"""Forwarding requests from the pyworker Backend to a local model server over loopback TCP
+vs a unix domain socket, for small JSON responses and for streamed responses.
+
+The stub model server runs in its own process and listens on both."""
+
+import asyncio
+import statistics
+import subprocess
+import sys
+import time
+
+import pytest
+
+pytestmark = pytest.mark.benchmark
+
+REQUESTS = 1000
+STREAM_REQUESTS = 100
+STREAM_EVENTS = 500
+
+STUB_SERVER = """
+import asyncio
+import json
+import sys
+from aiohttp import web
+
+EVENT = b"data: " + json.dumps({"choices": [{"delta": {"content": "token"}}]}).encode() + b"\\n\\n"
+
+async def predict(request):
+    return web.json_response({"echo": await request.json()})
+
+async def stream(request):
+    await request.read()
+    resp = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+    await resp.prepare(request)
+    for _ in range(int(sys.argv[2])):
+        await resp.write(EVENT)
+    await resp.write_eof()
+    return resp
+
+async def main():
+    app = web.Application()
+    app.router.add_post("/predict", predict)
+    app.router.add_post("/stream", stream)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    tcp = web.TCPSite(runner, "127.0.0.1", 0)
+    await tcp.start()
+    await web.UnixSite(runner, sys.argv[1]).start()
+    print(tcp._server.sockets[0].getsockname()[1], flush=True)
+    await asyncio.Event().wait()
+
+asyncio.run(main())
+"""
+
+
+@pytest.fixture(scope="module")
+def model_server_urls(tmp_path_factory):
+    path = tmp_path_factory.mktemp("model") / "model.sock"
+    proc = subprocess.Popen(
+        [sys.executable, "-c", STUB_SERVER, str(path), str(STREAM_EVENTS)],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        port = int(proc.stdout.readline())
+        yield {"tcp": f"http://127.0.0.1:{port}", "uds": f"unix://{path}"}
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+def _measure(backend, handler, requests: int, stream: bool):
+    call_api = backend._Backend__call_api
+    payload = handler.make_benchmark_payload()
+
+    async def one():
+        start = time.perf_counter()
+        resp = await call_api(handler=handler, payload=payload)
+        if stream:
+            async for _ in resp.content.iter_any():
+                pass
+        else:
+            await resp.read()
+        return time.perf_counter() - start
+
+    async def run():
+        try:
+            for _ in range(10):  # warm up
+                await one()
+            return [await one() for _ in range(requests)]
+        finally:
+            await backend.session.close()
+
+    latencies = asyncio.run(run())
+    cuts = statistics.quantiles(latencies, n=100)
+    return cuts[49] * 1e3, cuts[98] * 1e3
+
+
+@pytest.mark.parametrize(
+    "route, requests", [("/predict", REQUESTS), ("/stream", STREAM_REQUESTS)]
+)
+def test_tcp_vs_unix_socket(serverless_backend_testkit, model_server_urls, route, requests):
+    results = {}
+    for transport, url in model_server_urls.items():
+        backend, handler = serverless_backend_testkit.make_backend()
+        backend.model_server_url = url
+        handler._route = route
+        results[transport] = _measure(backend, handler, requests, route == "/stream")
+    (tcp_p50, tcp_p99), (uds_p50, uds_p99) = results["tcp"], results["uds"]
+    what = f"{STREAM_EVENTS}-event streams" if route == "/stream" else "small responses"
+    print(
+        f"\n{requests} {what}: tcp p50 {tcp_p50:.2f}ms p99 {tcp_p99:.2f}ms, "
+        f"uds p50 {uds_p50:.2f}ms p99 {uds_p99:.2f}ms"
+    )
+    # the socket skips the loopback TCP stack; allow for noise on small machines
+    assert uds_p50 < 1.2 * tcp_p50
@@ -0,0 +1,65 @@
+"""Event-loop lag while the pyworker decodes, scores and encodes a large remote call,
+inline on the loop vs through the Offloader's thread pool."""
+
+import asyncio
+import json
+import os
+import time
+
+import pytest
+
+from vastai.serverless import wire
+from vastai.serverless.remote.serialization import deserialize, serialize
+from vastai.serverless.server.lib.offload import LoopLag, Offloader, payload_nbytes
+
+pytestmark = pytest.mark.benchmark
+
+ROOT = __name__
+
+
+def _handle(offloader: Offloader, body: bytes):
+    async def handle():
+        data = await offloader.run(json.loads, body, nbytes=len(body))
+        image = await offloader.run(
+            deserialize, data["payload"]["image"], ROOT, {}, nbytes=len(body), thread_only=True
+        )
+        result = serialize(image[: len(image) // 2], ROOT, binary=True)
+        return await offloader.run(
+            wire.dumps_json,
+            {"result": result},
+            nbytes=payload_nbytes(result, offloader.min_bytes),
+            thread_only=True,
+        )
+
+    return handle
+
+
+async def _measure(executor: str, body: bytes, requests: int):
+    offloader = Offloader(executor=executor)
+    lag = LoopLag(interval=0.001, warn_after=10.0)
+    monitor = asyncio.create_task(lag.monitor())
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    await asyncio.gather(*(_handle(offloader, body)() for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+    await asyncio.sleep(0.01)  # let the monitor record its last, late wake-up
+    monitor.cancel()
+    await asyncio.gather(monitor, return_exceptions=True)
+    offloader.shutdown()
+    return elapsed, lag
+
+
+@pytest.mark.parametrize("mib", [1, 16])
+def test_loop_lag(mib):
+    body = json.dumps(
+        {"auth_data": {}, "payload": {"image": serialize(os.urandom(mib * 2**20), ROOT)}}
+    ).encode()
+    results = {}
+    for executor in ("none", "thread", "process"):
+        elapsed, lag = asyncio.run(_measure(executor, body, requests=4))
+        results[executor] = lag
+        print(
+            f"\n{mib}MiB x4 {executor}: total {elapsed * 1e3:.0f}ms, "
+            f"loop lag peak {lag.peak * 1e3:.1f}ms mean {lag.mean * 1e3:.2f}ms"
+        )
+    assert results["thread"].peak < results["none"].peak
@@ -0,0 +1,34 @@
+"""Wall time of walking a paginated listing: serial pager vs prefetching pager."""
+
+import time
+
+import pytest
+
+from vastai.api.paging import iter_cursor_pages
+
+pytestmark = pytest.mark.benchmark
+
+PAGES = 40
+FETCH_SECONDS = 0.01     # simulated round-trip per page
+PROCESS_SECONDS = 0.008  # simulated per-page work in the consumer
+
+
+def _fetch_page(params):
+    time.sleep(FETCH_SECONDS)
+    idx = int(params.get("after_token") or 0)
+    return {"instances": [idx], "next_token": str(idx + 1) if idx + 1 < PAGES else None}
+
+
+def _walk(prefetch):
+    start = time.perf_counter()
+    for _ in iter_cursor_pages(_fetch_page, {"limit": 25}, prefetch=prefetch):
+        time.sleep(PROCESS_SECONDS)
+    return time.perf_counter() - start
+
+
+def test_prefetch_overlaps_fetch_with_processing():
+    serial = _walk(prefetch=0)
+    pipelined = _walk(prefetch=1)
+    print(f"\n{PAGES} pages: serial {serial * 1000:.0f} ms, prefetch {pipelined * 1000:.0f} ms "
+          f"({serial / pipelined:.2f}x)")
+    assert pipelined < serial
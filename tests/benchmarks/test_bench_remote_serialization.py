@@ -0,0 +1,61 @@
+"""Round trip of remote-function arguments through the JSON format (base64 bytes)
+vs the binary wire format (buffers as out-of-band frames)."""
+
+import json
+import time
+
+import pytest
+
+from vastai.serverless import wire
+from vastai.serverless.remote.serialization import deserialize, serialize
+
+pytestmark = pytest.mark.benchmark
+
+ROOT = __name__
+
+
+def _json_round_trip(obj):
+    body = json.dumps(serialize(obj, ROOT)).encode()
+    return len(body), deserialize(json.loads(body), ROOT, {})
+
+
+def _wire_round_trip(obj):
+    body = wire.encode(serialize(obj, ROOT, binary=True))
+    return len(body), deserialize(wire.decode(body), ROOT, {})
+
+
+def _time(fn, obj, runs):
+    fn(obj)  # warm up
+    start = time.perf_counter()
+    for _ in range(runs):
+        size, _ = fn(obj)
+    return (time.perf_counter() - start) / runs, size
+
+
+PAYLOADS = {
+    "image 8MiB": ({"image": bytes(8 * 2**20), "prompt": "a cat"}, 5),
+    "array 1024x1024 float32": ("ndarray", 5),
+    "16 tiles x 256KiB": ({"tiles": [bytes(2**18) for _ in range(16)]}, 10),
+    "small dict (no bytes)": ({"ids": list(range(200)), "opts": {"k": "v"}}, 500),
+}
+
+
+@pytest.mark.parametrize("name", list(PAYLOADS))
+def test_round_trip(name):
+    obj, runs = PAYLOADS[name]
+    if obj == "ndarray":
+        np = pytest.importorskip("numpy")
+        obj = {"array": np.random.default_rng(0).random((1024, 1024), dtype=np.float32)}
+    json_time, json_size = _time(_json_round_trip, obj, runs)
+    wire_time, wire_size = _time(_wire_round_trip, obj, runs)
+    print(
+        f"\n{name}: json {json_time * 1e3:.2f}ms {json_size:,}B, "
+        f"wire {wire_time * 1e3:.2f}ms {wire_size:,}B ({json_time / wire_time:.1f}x)"
+    )
+    if "array" in name:
+        assert (_wire_round_trip(obj)[1]["array"] == obj["array"]).all()
+    else:
+        assert _wire_round_trip(obj)[1] == obj
+    if "bytes" not in name:
+        assert wire_size < json_size
+        assert wire_time < json_time
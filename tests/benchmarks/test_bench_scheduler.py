@@ -0,0 +1,104 @@
+"""Enqueue/cancel throughput of the pyworker request scheduler vs the old
+lock-guarded deque of Events."""
+
+import asyncio
+import time
+from collections import deque
+
+import pytest
+
+from vastai.serverless.server.lib.scheduler import RequestScheduler
+
+pytestmark = pytest.mark.benchmark
+
+WAITERS = 5000
+
+
+class _EventDequeReference:
+    """The previous Backend queue: deque of Events under an asyncio.Lock."""
+
+    def __init__(self):
+        self.queue = deque()
+        self.lock = asyncio.Lock()
+
+    async def wait_turn(self):
+        event = asyncio.Event()
+        async with self.lock:
+            self.queue.append(event)
+            if self.queue[0] is event:
+                event.set()
+        try:
+            await event.wait()
+        finally:
+            async with self.lock:
+                if self.queue and self.queue[0] is event:
+                    self.queue.popleft()
+                    if self.queue:
+                        self.queue[0].set()
+                else:
+                    try:
+                        self.queue.remove(event)
+                    except ValueError:
+                        pass
+
+
+async def _enqueue_then_cancel_all(wait_turn):
+    """Queue WAITERS requests behind a held head, then disconnect all of them."""
+    tasks = [asyncio.create_task(wait_turn()) for _ in range(WAITERS + 1)]
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    for task in reversed(tasks[1:]):  # newest first: worst case for deque.remove
+        task.cancel()
+    await asyncio.gather(*tasks[1:], return_exceptions=True)
+    elapsed = time.perf_counter() - start
+    tasks[0].cancel()
+    await asyncio.gather(tasks[0], return_exceptions=True)
+    return elapsed
+
+
+def _scheduler_wait_turn():
+    scheduler = RequestScheduler()
+
+    async def wait_turn():
+        await scheduler.acquire()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            scheduler.release()
+
+    return wait_turn
+
+
+def _reference_wait_turn():
+    reference = _EventDequeReference()
+
+    async def wait_turn():
+        await reference.wait_turn()
+        await asyncio.Event().wait()
+
+    return wait_turn
+
+
+def test_cancel_throughput():
+    reference = asyncio.run(_enqueue_then_cancel_all(_reference_wait_turn()))
+    scheduler = asyncio.run(_enqueue_then_cancel_all(_scheduler_wait_turn()))
+    print(f"\ncancel {WAITERS} queued requests: deque+lock {WAITERS / reference:,.0f}/s, "
+          f"scheduler {WAITERS / scheduler:,.0f}/s ({reference / scheduler:.1f}x)")
+    # a report, not a race: only fail if the scheduler is clearly slower than the old queue
+    assert scheduler < 2 * reference
+
+
+def test_enqueue_release_throughput():
+    async def drain():
+        scheduler = RequestScheduler()
+
+        async def one():
+            await scheduler.acquire()
+            scheduler.release()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(WAITERS)))
+        return time.perf_counter() - start
+
+    elapsed = asyncio.run(drain())
+    print(f"\nenqueue+release {WAITERS} requests: {WAITERS / elapsed:,.0f}/s")
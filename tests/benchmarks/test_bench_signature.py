@@ -0,0 +1,67 @@
+"""Per-request cost of the pyworker's auth signature check: a fresh pkcs1_15 verifier
+and full RSA verify per request (the old path) vs the Backend's precomputed verifier
+and (url, signature) cache."""
+
+import asyncio
+import base64
+import json
+import time
+
+import pytest
+from Crypto.Hash import SHA256
+from Crypto.PublicKey import RSA
+from Crypto.Signature import pkcs1_15
+
+from vastai.serverless.server.lib.data_types import AuthData
+
+pytestmark = pytest.mark.benchmark
+
+RUNS = 2000
+URL = "https://tenant.example/v1/predict"
+
+
+def _old_check(pubkey, auth_data):
+    message = json.dumps({"url": auth_data.url}, indent=4, sort_keys=True)
+    h = SHA256.new(message.encode())
+    try:
+        pkcs1_15.new(pubkey).verify(h, base64.b64decode(auth_data.signature))
+        return True
+    except (ValueError, TypeError):
+        return False
+
+
+def test_signature_check(serverless_backend_testkit):
+    key = RSA.generate(2048)
+    message = json.dumps({"url": URL}, indent=4, sort_keys=True)
+    signature = base64.b64encode(pkcs1_15.new(key).sign(SHA256.new(message.encode())))
+    auth_data = AuthData(
+        cost="1", endpoint="e", reqnum=1, request_idx=1, signature=signature.decode(), url=URL
+    )
+
+    backend, _ = serverless_backend_testkit.make_backend(unsecured=False)
+    backend._pubkey = key.publickey()
+    check = backend._Backend__check_signature
+
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        assert _old_check(backend._pubkey, auth_data)
+    old = (time.perf_counter() - start) / RUNS
+
+    async def run(cached: bool):
+        start = time.perf_counter()
+        for _ in range(RUNS):
+            if not cached:
+                backend._signature_cache.maxsize = 0
+            assert await check(auth_data)
+        return (time.perf_counter() - start) / RUNS
+
+    uncached = asyncio.run(run(cached=False))
+    backend._pubkey = key.publickey()  # fresh, enabled cache
+    cached = asyncio.run(run(cached=True))
+
+    print(
+        f"\nper request: fresh verifier {old * 1e6:.0f}us, precomputed verifier "
+        f"{uncached * 1e6:.0f}us, cached {cached * 1e6:.1f}us ({old / cached:.0f}x)"
+    )
+    assert backend._signature_cache.hits == RUNS - 1
+    assert cached < uncached
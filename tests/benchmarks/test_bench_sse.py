@@ -0,0 +1,73 @@
+"""Throughput of the worker stream parser, in MB/s of SSE input."""
+
+import asyncio
+import json
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from vastai.serverless.client.connection import _iter_sse_json
+
+pytestmark = pytest.mark.benchmark
+
+EVENTS = 20000
+CHUNK_BYTES = 256 * 1024  # large reads, many events per chunk
+
+
+async def _concat_split_reference(resp):
+    """The previous parser: ``buffer += chunk`` and ``split`` per line."""
+    buffer = b""
+    async for chunk in resp.content.iter_any():
+        buffer += chunk
+        while b"\n" in buffer:
+            line, buffer = buffer.split(b"\n", 1)
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith(b"data:"):
+                line = line[5:].strip()
+            try:
+                yield json.loads(line.decode("utf-8"))
+            except Exception:
+                continue
+
+
+def _stream() -> bytes:
+    token = {"choices": [{"index": 0, "delta": {"content": "token"}, "finish_reason": None}]}
+    event = b"data: " + json.dumps(token).encode() + b"\n\n"
+    return event * EVENTS + b"data: [DONE]\n\n"
+
+
+def _response(payload: bytes):
+    async def iter_any():
+        for i in range(0, len(payload), CHUNK_BYTES):
+            yield payload[i:i + CHUNK_BYTES]
+
+    resp = MagicMock()
+    resp.content.iter_any = iter_any
+    return resp
+
+
+def _throughput(parser, payload: bytes) -> float:
+    async def consume():
+        count = 0
+        async for _ in parser(_response(payload)):
+            count += 1
+        return count
+
+    start = time.perf_counter()
+    count = asyncio.run(consume())
+    elapsed = time.perf_counter() - start
+    assert count == EVENTS
+    return len(payload) / elapsed / 1e6
+
+
+def test_sse_parser_throughput():
+    payload = _stream()
+    reference = _throughput(_concat_split_reference, payload)
+    current = _throughput(_iter_sse_json, payload)
+    print(f"\n{len(payload) / 1e6:.1f} MB, {CHUNK_BYTES // 1024} KiB chunks: "
+          f"concat+split {reference:.1f} MB/s, bytearray parser {current:.1f} MB/s "
+          f"({current / reference:.1f}x)")
+    assert current > reference
@@ -3,7 +3,7 @@
 import argparse
 import pytest
 from datetime import datetime, timedelta
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock
 
 
 class TestParseEnv:
@@ -99,8 +99,9 @@ class TestGetGpuNames:
         response = Mock()
         response.raise_for_status.side_effect = HTTPError("403 Client Error")
 
-        monkeypatch.setattr(util, "CACHE_FILE", str(tmp_path / "missing-cache.json"))
-        monkeypatch.setattr(util.requests, "get", Mock(return_value=response))
+        client = MagicMock()
+        client.__enter__.return_value.get.return_value = response
+        monkeypatch.setattr(util, "_catalog_client", Mock(return_value=client))
 
         assert util._get_gpu_names() is None
 
@@ -111,12 +112,40 @@ class TestGetGpuNames:
         response.raise_for_status.return_value = None
         response.json.return_value = {"gpu_names": ["RTX 4090", "H100-SXM"]}
 
-        monkeypatch.setattr(util, "CACHE_FILE", str(tmp_path / "gpu-cache.json"))
-        monkeypatch.setattr(util.requests, "get", Mock(return_value=response))
+        client = MagicMock()
+        client.__enter__.return_value.get.return_value = response
+        monkeypatch.setattr(util, "_catalog_client", Mock(return_value=client))
 
         assert util._get_gpu_names() == ["RTX_4090", "H100_SXM"]
 
 
+class TestCatalogClient:
+    def test_honors_no_cache_and_explain(self, monkeypatch):
+        from vastai.api import cache
+        from vastai.cli import util
+
+        shared = Mock()
+        monkeypatch.setattr(cache, "get_default_cache", lambda: shared)
+
+        client = util._catalog_client(argparse.Namespace(no_http_cache=False, explain=True))
+        assert client.cache is shared
+        assert client.explain is True
+        client = util._catalog_client(argparse.Namespace(no_http_cache=True, explain=False))
+        assert client.cache is None
+        assert client.explain is False
+
+    def test_defaults_to_args_set_by_main(self, monkeypatch):
+        from vastai.api import cache
+        from vastai.cli import util
+
+        monkeypatch.setattr(cache, "get_default_cache", lambda: Mock())
+        monkeypatch.setattr(util, "_catalog_args", None)
+        assert util._catalog_client().cache is not None
+        util.set_catalog_args(argparse.Namespace(no_http_cache=True, explain=True))
+        client = util._catalog_client()
+        assert (client.cache, client.explain) == (None, True)
+
+
 class TestSmartSplit:
     def test_simple(self):
         from vastai.cli.util import smart_split
@@ -41,7 +41,9 @@ import inspect
 import json
 import logging
 import os
+import threading
 from contextlib import ExitStack, contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from types import SimpleNamespace
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -115,6 +117,12 @@ def _disable_self_test_support_bundle_by_default(monkeypatch):
     monkeypatch.setenv("VAST_SELF_TEST_SUPPORT_BUNDLE", "0")
 
 
+@pytest.fixture(autouse=True)
+def _disable_http_response_cache_by_default(monkeypatch):
+    """Keep the on-disk catalog response cache from leaking between tests."""
+    monkeypatch.setenv("VAST_NO_CACHE", "1")
+
+
 # ---------------------------------------------------------------------------
 # Server Worker test helpers (mocks for generate_client_response etc.)
 # ---------------------------------------------------------------------------
@@ -485,8 +493,10 @@ def make_serverless_json_http_request():
         req = MagicMock(spec=web.Request)
         if isinstance(data, str):
             req.json = AsyncMock(side_effect=json.JSONDecodeError("err", data, 0))
+            req.read = AsyncMock(return_value=data.encode())
         else:
             req.json = AsyncMock(return_value=data)
+            req.read = AsyncMock(return_value=json.dumps(data).encode())
         return req
 
     return _make
@@ -1959,6 +1969,47 @@ def patch_get_client(mock_client):
         p.stop()
 
 
+# ---------------------------------------------------------------------------
+# Local HTTP stub server (VastClient connection reuse)
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def stub_http_server():
+    """HTTP/1.1 keep-alive stub; yields (base_url, set of client ports seen)."""
+    connections = set()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def _reply(self):
+            connections.add(self.client_address[1])
+            length = int(self.headers.get("Content-Length") or 0)
+            if length:
+                self.rfile.read(length)
+            body = b"{}"
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        do_GET = do_POST = do_PUT = do_DELETE = _reply
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}", connections
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
 # ---------------------------------------------------------------------------
 # Live test fixtures
 # ---------------------------------------------------------------------------
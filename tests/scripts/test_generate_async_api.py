@@ -0,0 +1,106 @@
+"""
+Tests for scripts/generate_async_api.py and the files it generates.
+
+The async API layer is generated from vastai/api and vastai/sdk.py; these tests
+fail when the checked-in output drifts from the sync source.
+"""
+
+import importlib.util
+import inspect
+import sys
+from pathlib import Path
+
+from vastai.sdk import VastAI
+from vastai.async_.sdk import AsyncVastAI
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / "scripts"
+
+
+def _load_generator():
+    path = SCRIPTS_DIR / "generate_async_api.py"
+    spec = importlib.util.spec_from_file_location("generate_async_api", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+generator = _load_generator()
+
+
+def test_generated_files_are_up_to_date():
+    assert generator.main(["--check"]) == 0, "re-run scripts/generate_async_api.py"
+
+
+def test_every_client_calling_function_has_an_async_twin():
+    modules = generator._api_modules()
+    io_funcs, aiter_funcs = generator._io_functions(modules)
+    for name, funcs in io_funcs.items():
+        if not funcs:
+            continue
+        sync_mod = __import__(f"vastai.api.{name}", fromlist=[name])
+        aio_mod = __import__(f"vastai.api.aio.{name}", fromlist=[name])
+        for func in funcs:
+            assert callable(getattr(sync_mod, func))
+            twin = getattr(aio_mod, func)
+            if func in aiter_funcs[name]:
+                assert inspect.isasyncgenfunction(twin), f"{name}.{func}"
+            else:
+                assert inspect.iscoroutinefunction(twin), f"{name}.{func}"
+
+
+def test_pure_helpers_stay_sync():
+    from vastai.api.aio import instances, price_increase
+    assert not inspect.iscoroutinefunction(instances._strip_strings)
+    assert not inspect.iscoroutinefunction(price_increase.pending_rows)
+
+
+def test_async_facade_mirrors_vastai():
+    sync_methods = {n for n, _ in inspect.getmembers(VastAI, inspect.isfunction) if not n.startswith("_")}
+    async_methods = {n for n, _ in inspect.getmembers(AsyncVastAI, inspect.isfunction) if not n.startswith("_")}
+    assert sync_methods == async_methods
+    for name in async_methods:
+        method = getattr(AsyncVastAI, name)
+        if inspect.isgeneratorfunction(getattr(VastAI, name)):
+            assert inspect.isasyncgenfunction(method), name
+        else:
+            assert inspect.iscoroutinefunction(method), name
+
+
+def test_async_facade_keeps_signatures():
+    for name, func in inspect.getmembers(VastAI, inspect.isfunction):
+        if name.startswith("_") or name == "close":
+            continue
+        assert (inspect.signature(func).parameters.keys()
+                == inspect.signature(getattr(AsyncVastAI, name)).parameters.keys()), name
+
+
+def test_generated_modules_keep_comments():
+    from vastai.api.aio import instances
+    source = Path(instances.__file__).read_text()
+    assert "# Rows per request when walking /api/v1/instances/" in source
+
+
+def test_rewrite_edits_the_source_text():
+    source = (
+        '"""Doc."""\n'
+        "import time\n"
+        "\n"
+        "\n"
+        "def fetch(client):\n"
+        "    # wait for the server\n"
+        "    time.sleep(1)\n"
+        '    return client.get("/x").json()["a"]  # first row\n'
+    )
+    out = generator.generate_module("m", source, {"m": {"fetch"}}, {"m": set()})
+    assert out.endswith(
+        '"""Doc."""\n'
+        "import asyncio\n"
+        "import time\n"
+        "\n"
+        "\n"
+        "async def fetch(client):\n"
+        "    # wait for the server\n"
+        "    await asyncio.sleep(1)\n"
+        '    return (await client.get("/x")).json()["a"]  # first row\n'
+    )
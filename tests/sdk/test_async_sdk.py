@@ -0,0 +1,35 @@
+"""Tests for vastai/async_/sdk.py — the AsyncVastAI facade."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from vastai.async_.sdk import AsyncVastAI
+from vastai.api.async_client import AsyncVastClient
+
+
+class TestAsyncVastAI:
+    def test_builds_async_client(self):
+        v = AsyncVastAI(api_key="k", server_url="http://test", retry=5, connection_limit=7)
+        assert isinstance(v.client, AsyncVastClient)
+        assert v.client.api_key == "k"
+        assert v.client.server_url == "http://test"
+        assert v.client.retry == 5
+        assert v.client.connection_limit == 7
+
+    async def test_methods_delegate_to_aio_modules(self):
+        v = AsyncVastAI(api_key="k")
+        with patch("vastai.api.aio.instances.show_instance", new=AsyncMock(return_value={"id": 1})) as m:
+            results = await asyncio.gather(v.show_instance(1), v.show_instance(2))
+        assert results == [{"id": 1}, {"id": 1}]
+        assert [c.args[1] for c in m.await_args_list] == [1, 2]
+
+    async def test_show_machine_unwraps_single_row(self):
+        v = AsyncVastAI(api_key="k")
+        with patch("vastai.api.aio.machines.show_machine", new=AsyncMock(return_value=[{"id": 9}])):
+            assert await v.show_machine(9) == {"id": 9}
+
+    async def test_context_manager_closes_client(self):
+        async with AsyncVastAI(api_key="k") as v:
+            v.client._get_session()
+            assert v.client._session is not None
+        assert v.client._session is None
@@ -10,6 +10,11 @@ class TestPackageImports:
         from vastai import VastAI
         assert VastAI is not None
 
+    def test_import_async_vastai(self) -> None:
+        """AsyncVastAI can be imported from vastai."""
+        from vastai import AsyncVastAI
+        assert AsyncVastAI is not None
+
     def test_import_serverless(self) -> None:
         """Serverless can be imported from vastai."""
         from vastai import Serverless, ServerlessRequest
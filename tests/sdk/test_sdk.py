@@ -101,11 +101,20 @@ class TestInit:
 
     def test_options_passed_through(self):
         with patch("vastai.sdk.VastClient") as MockClient:
-            v = VastAI(api_key="k", server_url="http://test", retry=5, explain=True, curl=True, raw=True, quiet=True)
-            MockClient.assert_called_once_with("k", "http://test", 5, True, True)
+            v = VastAI(api_key="k", server_url="http://test", retry=5, explain=True, curl=True, raw=True, quiet=True,
+                       pool_size=3)
+            MockClient.assert_called_once_with("k", "http://test", 5, True, True, pool_size=3,
+                                               cache=None)
             assert v.raw is True
             assert v.quiet is True
 
+    def test_context_manager_closes_client(self):
+        with patch("vastai.sdk.VastClient") as MockClient:
+            with VastAI(api_key="k") as v:
+                pass
+            MockClient.return_value.close.assert_called_once()
+            assert isinstance(v, VastAI)
+
 
 # ---------------------------------------------------------------------------
 # show_instances — un-deprecated (CLN-3581)
@@ -62,3 +62,22 @@ class TestShowInstancesV1:
         with patch("vastai.sync.client.requests.get") as mock_get:
             mock_get.return_value = _resp({"instances": None})
             assert client.show_instances() == []
+
+    def test_page_size_sets_limit(self):
+        client = SyncClient(api_key="test-key")
+        with patch("vastai.sync.client.requests.get") as mock_get:
+            mock_get.return_value = _resp({"instances": []})
+            client.show_instances(page_size=10)
+
+        assert mock_get.call_args.kwargs["params"]["limit"] == 10
+
+    def test_iter_instances_streams_rows(self):
+        client = SyncClient(api_key="test-key")
+        pages = [
+            _resp({"instances": [{"id": 1}], "next_token": "tok"}),
+            _resp({"instances": [{"id": 2}], "next_token": None}),
+        ]
+        with patch("vastai.sync.client.requests.get", side_effect=pages):
+            it = client.iter_instances()
+            assert next(it).id == 1
+            assert [inst.id for inst in it] == [2]
@@ -0,0 +1,276 @@
+"""Unit tests for vastai.serverless.archive (deployment tarball compression codecs)."""
+from __future__ import annotations
+
+import gzip
+import io
+import os
+import random
+import shutil
+import subprocess
+import tarfile
+
+import pytest
+
+from vastai.serverless import archive
+from vastai.serverless.remote.serve_deployment import extract_tarball
+
+
+def _payload(size: int) -> bytes:
+    """Half-compressible data: random bytes interleaved with runs of text."""
+    rng = random.Random(0)
+    out = bytearray()
+    while len(out) < size:
+        out += rng.randbytes(512) + b"deployment line\n" * 32
+    return bytes(out[:size])
+
+
+def _compress(codec, data: bytes) -> bytes:
+    buf = io.BytesIO()
+    writer = codec.writer(buf)
+    for i in range(0, len(data), 100_000):
+        writer.write(data[i : i + 100_000])
+    writer.close()
+    return buf.getvalue()
+
+
+class _Unseekable(io.RawIOBase):
+    """A read-only stream that can't seek or tell, like an HTTP response."""
+
+    def __init__(self, data: bytes):
+        self._data = io.BytesIO(data)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        chunk = self._data.read(min(len(b), 7000))  # short reads, as over a socket
+        b[: len(chunk)] = chunk
+        return len(chunk)
+
+
+# ---------------------------------------------------------------------------
+# Parallel gzip
+# ---------------------------------------------------------------------------
+
+
+class TestParallelGzip:
+    """Verify the parallel gzip writer produces standard, reproducible gzip."""
+
+    @pytest.mark.parametrize("size", [0, 1, 64 * 1024, 3 * 1024 * 1024 + 17])
+    def test_any_gzip_reader_decompresses_it(self, size) -> None:
+        """
+        Verifies the output is a single ordinary gzip member whatever the input size.
+
+        This test verifies by:
+        1. Compressing empty, tiny, sub-block and multi-block inputs with small blocks
+        2. Decompressing with gzip.decompress and the codec's own reader
+
+        Assumptions:
+        - Block boundaries must be invisible to readers (sync flush, one trailer)
+        """
+        data = _payload(size)
+        codec = archive.GzipCodec(threads=3, block_size=256 * 1024)
+        compressed = _compress(codec, data)
+        assert gzip.decompress(compressed) == data
+        assert codec.reader(io.BytesIO(compressed)).read() == data
+
+    def test_output_does_not_depend_on_thread_count(self) -> None:
+        """
+        Verifies archives are byte-for-byte reproducible.
+
+        This test verifies by:
+        1. Compressing the same data with 1 and 4 threads
+        2. Comparing the outputs
+
+        Assumptions:
+        - Reproducible output keeps deployment sizes stable for the hash cache
+        """
+        data = _payload(2 * 1024 * 1024)
+        one = _compress(archive.GzipCodec(threads=1, block_size=128 * 1024), data)
+        four = _compress(archive.GzipCodec(threads=4, block_size=128 * 1024), data)
+        assert one == four
+
+    def test_ratio_close_to_single_threaded_gzip(self) -> None:
+        """
+        Verifies priming each block with its predecessor keeps the ratio near gzip's.
+
+        This test verifies by:
+        1. Compressing with gzip.compress and with the parallel codec
+        2. Checking the parallel output is within 2% of it
+
+        Assumptions:
+        - Same level; only block boundaries differ
+        """
+        data = _payload(4 * 1024 * 1024)
+        single = gzip.compress(data, compresslevel=archive.GZIP_LEVEL)
+        parallel = _compress(archive.GzipCodec(block_size=256 * 1024), data)
+        assert len(parallel) < len(single) * 1.02
+
+    @pytest.mark.skipif(shutil.which("gzip") is None, reason="gzip CLI not installed")
+    def test_gzip_cli_accepts_it(self, tmp_path) -> None:
+        """
+        Verifies the gzip tool itself (what older workers' tarfile "r:gz" mirrors) reads it.
+
+        This test verifies by:
+        1. Writing a parallel-gzip file and running gzip -t and gzip -dc on it
+
+        Assumptions:
+        - gzip -t checks the CRC and length trailer
+        """
+        data = _payload(1024 * 1024)
+        path = tmp_path / "out.gz"
+        path.write_bytes(_compress(archive.GzipCodec(block_size=100_000), data))
+        subprocess.run(["gzip", "-t", str(path)], check=True)
+        out = subprocess.run(["gzip", "-dc", str(path)], check=True, capture_output=True)
+        assert out.stdout == data
+
+
+# ---------------------------------------------------------------------------
+# Codec selection and detection
+# ---------------------------------------------------------------------------
+
+
+class TestCodecSelection:
+    """Verify codec lookup by name/env and detection by magic bytes."""
+
+    def test_get_codec_defaults_to_gzip_and_honours_env(self, monkeypatch) -> None:
+        """
+        Verifies get_codec's default and the VAST_DEPLOYMENT_CODEC override.
+
+        This test verifies by:
+        1. Calling get_codec() without the env var, with it set, and with a bad name
+
+        Assumptions:
+        - Unknown names raise ValueError
+        """
+        monkeypatch.delenv(archive.CODEC_ENV, raising=False)
+        assert archive.get_codec().name == "gzip"
+        monkeypatch.setenv(archive.CODEC_ENV, "zstd")
+        assert archive.get_codec().name == "zstd"
+        assert archive.get_codec("gzip").content_type == "application/gzip"
+        with pytest.raises(ValueError, match="Unknown deployment codec"):
+            archive.get_codec("brotli")
+
+    def test_open_decompressed_detects_gzip_and_plain_tar(self) -> None:
+        """
+        Verifies readers pick the codec from the stream itself.
+
+        This test verifies by:
+        1. Passing a gzip stream and an uncompressed stream through open_decompressed
+        2. Reading both back from unseekable sources
+
+        Assumptions:
+        - Plain data is passed through unchanged, including its first bytes
+        """
+        data = _payload(300_000)
+        compressed = _compress(archive.GzipCodec(block_size=64 * 1024), data)
+        assert archive.open_decompressed(_Unseekable(compressed)).read() == data
+        assert archive.open_decompressed(_Unseekable(data)).read() == data
+        assert archive.open_decompressed(_Unseekable(b"ab")).read() == b"ab"
+
+    def test_zstd_round_trip(self) -> None:
+        """
+        Verifies the zstd codec when the optional zstandard package is installed.
+
+        This test verifies by:
+        1. Compressing with ZstdCodec and reading back through open_decompressed
+
+        Assumptions:
+        - Skipped without zstandard
+        """
+        pytest.importorskip("zstandard")
+        data = _payload(500_000)
+        compressed = _compress(archive.ZstdCodec(), data)
+        assert compressed.startswith(archive.ZstdCodec.magic)
+        assert archive.open_decompressed(_Unseekable(compressed)).read() == data
+
+    def test_zstd_without_zstandard_explains_itself(self, monkeypatch) -> None:
+        """
+        Verifies a missing zstandard package gives an actionable error.
+
+        This test verifies by:
+        1. Hiding zstandard from imports and asking for a zstd writer
+
+        Assumptions:
+        - A None entry in sys.modules makes the import fail
+        """
+        monkeypatch.setitem(__import__("sys").modules, "zstandard", None)
+        with pytest.raises(RuntimeError, match="zstandard"):
+            archive.ZstdCodec().writer(io.BytesIO())
+
+    def test_zstd_needs_the_server_to_advertise_it(self, monkeypatch) -> None:
+        """
+        Verifies a requested zstd codec is only used once the server advertises it.
+
+        This test verifies by:
+        1. Requesting zstd through the env var
+        2. Negotiating without an advertisement, with one, and with zstandard hidden
+
+        Assumptions:
+        - Gzip needs no advertisement; every worker can extract it
+        """
+        monkeypatch.setenv(archive.CODEC_ENV, "zstd")
+        monkeypatch.setattr(archive.ZstdCodec, "available", staticmethod(lambda: True))
+        assert archive.negotiate_codec().name == "gzip"
+        assert archive.negotiate_codec(accepted=[]).name == "gzip"
+        assert archive.negotiate_codec(accepted=["zstd"]).name == "zstd"
+        assert archive.negotiate_codec(archive.GzipCodec(), ["zstd"]).name == "gzip"
+
+        monkeypatch.undo()
+        monkeypatch.setenv(archive.CODEC_ENV, "zstd")
+        monkeypatch.setitem(__import__("sys").modules, "zstandard", None)
+        assert archive.negotiate_codec(accepted=["zstd"]).name == "gzip"
+
+
+# ---------------------------------------------------------------------------
+# Streaming extraction
+# ---------------------------------------------------------------------------
+
+
+class TestStreamingExtract:
+    """Verify the worker extracts deployment tarballs straight from a stream."""
+
+    def _tarball(self, codec) -> bytes:
+        raw = io.BytesIO()
+        writer = codec.writer(raw)
+        with tarfile.open(fileobj=writer, mode="w|") as tf:
+            for name, data in [("./config.json", b"{}"), ("./deployment/big.bin", _payload(2**20))]:
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                tf.addfile(info, io.BytesIO(data))
+        writer.close()
+        return raw.getvalue()
+
+    def test_extracts_from_unseekable_stream(self, tmp_path, monkeypatch) -> None:
+        """
+        Verifies extract_tarball needs neither a file on disk nor seeking.
+
+        This test verifies by:
+        1. Building a parallel-gzip tarball in memory
+        2. Extracting it from a stream that returns short reads and can't seek
+
+        Assumptions:
+        - Members are relative, so they land in the working directory
+        """
+        monkeypatch.chdir(tmp_path)
+        extract_tarball(_Unseekable(self._tarball(archive.GzipCodec(block_size=100_000))))
+        assert (tmp_path / "config.json").read_bytes() == b"{}"
+        assert (tmp_path / "deployment" / "big.bin").read_bytes() == _payload(2**20)
+
+    def test_extracts_from_path(self, tmp_path, monkeypatch) -> None:
+        """
+        Verifies the DEBUG_DEPLOYMENT_TAR path form still works.
+
+        This test verifies by:
+        1. Writing a tarball to disk and extracting it by path
+
+        Assumptions:
+        - None
+        """
+        path = tmp_path / "deployment.tar.gz"
+        path.write_bytes(self._tarball(archive.GzipCodec()))
+        out = tmp_path / "out"
+        out.mkdir()
+        monkeypatch.chdir(out)
+        extract_tarball(str(path))
+        assert os.path.isfile(out / "deployment" / "big.bin")
@@ -13,6 +13,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from aiohttp import ClientTimeout, web
 
+from vastai.serverless import wire
 from vastai.serverless.server.lib.data_types import (
     JsonDataException,
     RequestMetrics,
@@ -1135,7 +1136,7 @@ class TestBackendHandleRequest:
         3. Asserting 200 response
 
         Assumptions:
-        - A sole queued request is head-of-line and its Event is set before wait
+        - A sole queued request is admitted by the scheduler without waiting
         """
         backend, handler = serverless_backend_testkit.make_backend(allow_parallel=False)
         fn = backend.create_handler(handler)
@@ -1170,7 +1171,7 @@ class TestBackendHandleRequest:
         3. Asserting both return 200 in some order
 
         Assumptions:
-        - advance_queue_after_completion wakes the next waiter when the head finishes
+        - The scheduler admits the next waiter when the head releases its turn
         """
         backend, handler = serverless_backend_testkit.make_backend(allow_parallel=False)
         fn = backend.create_handler(handler)
@@ -1210,6 +1211,55 @@ class TestBackendHandleRequest:
         assert r1.status == 200
         assert r2.status == 200
 
+    @pytest.mark.asyncio
+    async def test_handle_request_max_concurrent_requests_overlaps_work(
+        self, serverless_backend_testkit
+    ) -> None:
+        """
+        Verifies a non-parallel handler with max_concurrent_requests=2 runs two requests at once.
+
+        This test verifies by:
+        1. Setting max_concurrent_requests=2 on a queued handler
+        2. Holding both requests inside the model call until both have arrived
+        3. Asserting both return 200 (a limit of 1 would deadlock and time out)
+
+        Assumptions:
+        - The limit is taken from the handler on each request
+        """
+        backend, handler = serverless_backend_testkit.make_backend(allow_parallel=False)
+        handler.max_concurrent_requests = 2
+        fn = backend.create_handler(handler)
+        both_in = asyncio.Event()
+        inside = {"n": 0}
+
+        async def _gated_backend(*args, **kwargs):
+            inside["n"] += 1
+            if inside["n"] == 2:
+                both_in.set()
+            await both_in.wait()
+            return MagicMock()
+
+        reqs = [
+            serverless_backend_testkit.json_request(
+                serverless_backend_testkit.auth_payload(reqnum=n)
+            )
+            for n in (1, 2)
+        ]
+        with patch.object(
+            backend, "_Backend__call_backend", side_effect=_gated_backend
+        ):
+            with patch.object(
+                handler,
+                "generate_client_response",
+                new_callable=AsyncMock,
+                return_value=web.json_response({"ok": True}),
+            ):
+                r1, r2 = await asyncio.wait_for(
+                    asyncio.gather(fn(reqs[0]), fn(reqs[1])), 2
+                )
+        assert (r1.status, r2.status) == (200, 200)
+        assert len(backend.scheduler) == 0
+
     @pytest.mark.asyncio
     async def test_handle_request_invalid_signature_returns_401(
         self, serverless_backend_testkit, make_serverless_test_rsa_key
@@ -1292,6 +1342,237 @@ class TestBackendHandleRequest:
         mock_cb.assert_awaited_once()
 
 
+    @pytest.mark.asyncio
+    async def test_remote_request_in_wire_format_gets_wire_response(
+        self, serverless_backend_testkit
+    ) -> None:
+        """
+        Verifies a binary wire-format request is decoded and answered in the same format.
+
+        This test verifies by:
+        1. Sending a request with Content-Type and Accept set to wire.CONTENT_TYPE
+        2. Asserting the remote function saw the decoded payload buffer
+        3. Asserting the response is a wire message carrying the raw result buffer
+
+        Assumptions:
+        - Remote results hold raw buffers (serialize_ok(binary=True))
+        """
+        seen = {}
+
+        async def remote(**params):
+            seen.update(params)
+            return {"ok": {"type": "bytes", "contents": b"\x00\xff"}}
+
+        backend, handler = serverless_backend_testkit.make_backend(remote_function=remote)
+        fn = backend.create_handler(handler)
+        data = serverless_backend_testkit.auth_payload()
+        data["payload"] = {"blob": b"input"}
+        req = MagicMock(spec=web.Request)
+        req.content_type = wire.CONTENT_TYPE
+        req.headers = {"Accept": wire.CONTENT_TYPE}
+        req.read = AsyncMock(return_value=wire.encode(data))
+
+        resp = await fn(req)
+
+        assert resp.status == 200
+        assert resp.content_type == wire.CONTENT_TYPE
+        assert bytes(seen["blob"]) == b"input"
+        result = wire.decode(resp.body)["result"]
+        assert bytes(result["ok"]["contents"]) == b"\x00\xff"
+        req.json.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_remote_result_falls_back_to_base64_json(
+        self, serverless_backend_testkit
+    ) -> None:
+        """
+        Verifies raw result buffers are base64-encoded for clients without the wire format.
+
+        This test verifies by:
+        1. Sending a plain JSON request without the wire Accept header
+        2. Asserting the JSON response holds the base64 form of the buffer
+
+        Assumptions:
+        - This is the format older clients already decode
+        """
+
+        async def remote(**params):
+            return {"ok": {"type": "bytes", "contents": b"\x00\xff"}}
+
+        backend, handler = serverless_backend_testkit.make_backend(remote_function=remote)
+        fn = backend.create_handler(handler)
+        req = serverless_backend_testkit.json_request(
+            serverless_backend_testkit.auth_payload()
+        )
+        req.headers = {}
+
+        resp = await fn(req)
+
+        assert resp.status == 200
+        body = serverless_backend_testkit.response_json(resp)
+        assert body == {"result": {"ok": {"type": "bytes", "contents": "AP8="}}}
+
+    @pytest.mark.asyncio
+    async def test_benchmark_of_remote_function_returning_bytes(
+        self, serverless_backend_testkit, tmp_path, monkeypatch
+    ) -> None:
+        """
+        Verifies the benchmark runs against a remote function whose result holds raw bytes.
+
+        This test verifies by:
+        1. Benchmarking a backend whose remote function returns a bytes result
+        2. Asserting the benchmark succeeds and every request reached the function
+
+        Assumptions:
+        - Benchmark responses are JSON, with buffers base64-encoded as for older clients
+        """
+        monkeypatch.chdir(tmp_path)
+        calls = []
+
+        async def remote(**params):
+            calls.append(params)
+            return {"ok": {"type": "bytes", "contents": b"\x00\xff"}}
+
+        backend, _ = serverless_backend_testkit.make_backend(remote_function=remote)
+
+        summary = await backend._Backend__run_benchmark()
+
+        assert summary.max_throughput > 0
+        handler = backend.benchmark_handler
+        assert len(calls) == 1 + handler.benchmark_runs * handler.concurrency
+
+    @pytest.mark.asyncio
+    async def test_large_request_is_decoded_and_encoded_off_the_loop(
+        self, serverless_backend_testkit
+    ) -> None:
+        """
+        Verifies decode and result encoding go through the offloader.
+
+        This test verifies by:
+        1. Giving the backend a thread Offloader with a tiny threshold
+        2. Sending a wire request to a remote function and checking the response
+        3. Asserting both steps were offloaded to a thread other than the loop's
+
+        Assumptions:
+        - Sizes under min_bytes would run inline instead
+        - The workload calculator stays on the loop; the handler didn't opt in
+        """
+        import threading
+
+        from vastai.serverless.server.lib.offload import Offloader
+
+        loop_thread = threading.get_ident()
+        threads = set()
+
+        async def remote(**params):
+            return {"ok": {"type": "bytes", "contents": bytes(params["blob"]) * 2}}
+
+        backend, handler = serverless_backend_testkit.make_backend(remote_function=remote)
+        backend.offloader = Offloader(executor="thread", min_bytes=16)
+        real_decode = wire.decode
+
+        def decode(data):
+            threads.add(threading.get_ident())
+            return real_decode(data)
+
+        fn = backend.create_handler(handler)
+        data = serverless_backend_testkit.auth_payload()
+        data["payload"] = {"blob": b"x" * 64}
+        req = MagicMock(spec=web.Request)
+        req.content_type = wire.CONTENT_TYPE
+        req.headers = {"Accept": wire.CONTENT_TYPE}
+        req.read = AsyncMock(return_value=wire.encode(data))
+
+        try:
+            with patch.object(wire, "decode", decode):
+                resp = await fn(req)
+        finally:
+            backend.offloader.shutdown()
+
+        assert resp.status == 200
+        assert bytes(real_decode(resp.body)["result"]["ok"]["contents"]) == b"x" * 128
+        assert backend.offloader.offloaded == 2
+        assert threads and loop_thread not in threads
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("opt_in", [False, True])
+    async def test_workload_calculator_is_offloaded_only_when_opted_in(
+        self, serverless_backend_testkit, opt_in
+    ) -> None:
+        """
+        Verifies count_workload runs on the event loop unless the handler opts in.
+
+        This test verifies by:
+        1. Giving the backend a thread Offloader with a tiny threshold
+        2. Recording the thread count_workload runs on for a large request
+        3. Asserting it's the loop's thread, or another one with the opt-in set
+
+        Assumptions:
+        - The JSON decode is offloaded either way; it isn't user code
+        """
+        import threading
+
+        from vastai.serverless.server.lib.offload import Offloader
+
+        loop_thread = threading.get_ident()
+        threads = []
+        backend, handler = serverless_backend_testkit.make_backend()
+        backend.offloader = Offloader(executor="thread", min_bytes=16)
+        handler.offload_workload_calculator = opt_in
+        get_data_from_request = handler.get_data_from_request
+
+        def get_data(data):
+            auth_data, payload, session_id = get_data_from_request(data)
+            payload.count_workload = lambda: threads.append(threading.get_ident()) or 1.0
+            return auth_data, payload, session_id
+
+        handler.get_data_from_request = get_data
+        fn = backend.create_handler(handler)
+        data = serverless_backend_testkit.auth_payload()
+        data["payload"] = {"input": {"text": "x" * 64}}
+
+        try:
+            with patch.object(
+                backend, "_Backend__call_backend", new=AsyncMock()
+            ), patch.object(
+                handler, "generate_client_response",
+                new=AsyncMock(return_value=web.Response()),
+            ):
+                resp = await fn(serverless_backend_testkit.json_request(data))
+        finally:
+            backend.offloader.shutdown()
+
+        assert resp.status == 200
+        assert len(threads) == 1
+        assert (threads[0] != loop_thread) == opt_in
+        assert backend.offloader.offloaded == (2 if opt_in else 1)
+
+    @pytest.mark.asyncio
+    async def test_malformed_wire_request_returns_422(
+        self, serverless_backend_testkit
+    ) -> None:
+        """
+        Verifies a wire-format request that fails to decode is rejected with 422.
+
+        This test verifies by:
+        1. Sending garbage with Content-Type wire.CONTENT_TYPE
+        2. Asserting 422 and no request metrics were started
+
+        Assumptions:
+        - wire.decode raises ValueError for malformed input
+        """
+        backend, handler = serverless_backend_testkit.make_backend()
+        fn = backend.create_handler(handler)
+        req = MagicMock(spec=web.Request)
+        req.content_type = wire.CONTENT_TYPE
+        req.read = AsyncMock(return_value=b"not a wire message")
+
+        resp = await fn(req)
+
+        assert resp.status == 422
+        assert len(backend.metrics.model_metrics.requests_working) == 0
+
+
 # ---------------------------------------------------------------------------
 # Session garbage collection
 # ---------------------------------------------------------------------------
@@ -1621,3 +1902,176 @@ class TestBackendHelpers:
         mock_log.debug.assert_called_once()
         assert "on_close POST exception" in mock_log.debug.call_args[0][0]
         mock_sess.post.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# Signature cache
+# ---------------------------------------------------------------------------
+
+
+class TestSignatureCache:
+    """Tests for SignatureCache and its use in __check_signature."""
+
+    def test_lru_eviction_and_ttl_expiry(self) -> None:
+        """
+        Verifies the cache is bounded by size and entries expire after ttl.
+
+        This test verifies by:
+        1. Adding three pairs to a size-2 cache and checking the oldest was evicted
+        2. Advancing time.monotonic past the ttl and checking the rest expired
+
+        Assumptions:
+        - check() refreshes an entry's LRU position, not its expiry
+        """
+        from vastai.serverless.server.lib.backend import SignatureCache
+
+        cache = SignatureCache(maxsize=2, ttl=10.0)
+        with patch("vastai.serverless.server.lib.backend.time.monotonic", return_value=100.0):
+            cache.add("u1", "s1")
+            cache.add("u2", "s2")
+            assert cache.check("u1", "s1")  # u2 is now least recently used
+            cache.add("u3", "s3")
+            assert len(cache) == 2
+            assert not cache.check("u2", "s2")
+            assert not cache.check("u1", "other-signature")
+        with patch("vastai.serverless.server.lib.backend.time.monotonic", return_value=110.0):
+            assert not cache.check("u1", "s1")
+            assert not cache.check("u3", "s3")
+        assert len(cache) == 0
+        assert (cache.hits, cache.misses) == (1, 4)
+
+    @pytest.mark.asyncio
+    async def test_repeat_signature_skips_rsa_but_advances_reqnum(
+        self, serverless_backend_testkit, make_serverless_test_rsa_key
+    ) -> None:
+        """
+        Verifies a signature that already verified is accepted from the cache.
+
+        This test verifies by:
+        1. Sending two requests with the same signed url and increasing reqnum
+        2. Counting RSA verifications and checking backend.reqnum after each
+
+        Assumptions:
+        - The verifier is built once per key, when _pubkey is set
+        """
+        key = make_serverless_test_rsa_key()
+        url = "https://tenant.example/v1/predict"
+        backend, handler = serverless_backend_testkit.make_backend(unsecured=False)
+        backend._pubkey = key.publickey()
+        verifier = backend._Backend__verifier
+        fn = backend.create_handler(handler)
+
+        statuses = []
+        with patch.object(verifier, "verify", wraps=verifier.verify) as verify, patch.object(
+            backend, "_Backend__call_backend", new_callable=AsyncMock
+        ), patch.object(
+            handler,
+            "generate_client_response",
+            new_callable=AsyncMock,
+            return_value=web.json_response({"ok": 1}),
+        ):
+            for reqnum in (7, 12):
+                data = serverless_backend_testkit.signed_auth(url, key)
+                data["auth_data"]["reqnum"] = reqnum
+                statuses.append((await fn(serverless_backend_testkit.json_request(data))).status)
+                assert backend.reqnum == reqnum
+
+        assert statuses == [200, 200]
+        assert verify.call_count == 1
+        assert backend._signature_cache.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached_and_key_change_clears_cache(
+        self, serverless_backend_testkit, make_serverless_test_rsa_key
+    ) -> None:
+        """
+        Verifies bad signatures are re-checked and a new key forgets old successes.
+
+        This test verifies by:
+        1. Sending a request signed by the wrong key twice (401 both times, nothing cached)
+        2. Caching a good signature, rotating the pubkey, and asserting the same request is 401
+
+        Assumptions:
+        - _fetch_pubkey assigns _pubkey, which resets the cache
+        """
+        key, other = make_serverless_test_rsa_key(), make_serverless_test_rsa_key()
+        url = "https://tenant.example/v1/predict"
+        backend, handler = serverless_backend_testkit.make_backend(unsecured=False)
+        backend._pubkey = key.publickey()
+        fn = backend.create_handler(handler)
+        forged = serverless_backend_testkit.signed_auth(url, other)
+        good = serverless_backend_testkit.signed_auth(url, key)
+
+        with patch.object(
+            backend, "_Backend__call_backend", new_callable=AsyncMock
+        ), patch.object(
+            handler,
+            "generate_client_response",
+            new_callable=AsyncMock,
+            return_value=web.json_response({"ok": 1}),
+        ):
+            for _ in range(2):
+                resp = await fn(serverless_backend_testkit.json_request(forged))
+                assert resp.status == 401
+            assert len(backend._signature_cache) == 0
+
+            assert (await fn(serverless_backend_testkit.json_request(good))).status == 200
+            assert len(backend._signature_cache) == 1
+
+            backend._pubkey = other.publickey()
+            resp = await fn(serverless_backend_testkit.json_request(good))
+            assert resp.status == 401
+
+
+# ---------------------------------------------------------------------------
+# Background tracking
+# ---------------------------------------------------------------------------
+
+
+class TestBackendTracking:
+    """Tests for the loop-lag monitor opt-in and _start_tracking shutdown."""
+
+    def test_loop_lag_monitor_is_opt_in(self, make_serverless_backend_and_handler) -> None:
+        """
+        Verifies the loop-lag monitor only exists, and is reported, with LOOP_LAG_MONITOR.
+
+        This test verifies by:
+        1. Building a backend without the env var and asserting no LoopLag
+        2. Building one with LOOP_LAG_MONITOR=true
+        3. Asserting it has a LoopLag shared with its Metrics
+
+        Assumptions:
+        - make_backend reads the env while constructing the Backend
+        """
+        backend, _ = make_serverless_backend_and_handler()
+        assert backend.loop_lag is None
+        assert backend.metrics.loop_lag is None
+
+        with patch.dict("os.environ", {"LOOP_LAG_MONITOR": "true"}):
+            backend, _ = make_serverless_backend_and_handler()
+        assert backend.loop_lag is not None
+        assert backend.metrics.loop_lag is backend.loop_lag
+
+    @pytest.mark.asyncio
+    async def test_start_tracking_shuts_down_the_offloader(
+        self, serverless_backend_and_handler_default, serverless_gather_raise_bind_failed
+    ) -> None:
+        """
+        Verifies the offload pools are shut down when the tracking tasks end.
+
+        This test verifies by:
+        1. Patching gather in the backend module to close its coroutines and raise
+        2. Awaiting _start_tracking
+        3. Asserting Offloader.shutdown was called
+
+        Assumptions:
+        - gather raising stands in for any way the tracking tasks stop
+        """
+        backend, _ = serverless_backend_and_handler_default
+        with patch(
+            "vastai.serverless.server.lib.backend.gather",
+            serverless_gather_raise_bind_failed,
+        ), patch.object(backend.offloader, "shutdown") as mock_shutdown:
+            with pytest.raises(RuntimeError):
+                await backend._start_tracking()
+        mock_shutdown.assert_called_once_with()
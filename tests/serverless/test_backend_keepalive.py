@@ -0,0 +1,301 @@
+"""Tests for the connections from Backend to the model server, against a local stub."""
+from __future__ import annotations
+
+import asyncio
+import collections
+
+import pytest
+from aiohttp import ServerDisconnectedError, web
+
+
+class StubModelServer:
+    """Answers ``POST /predict``, counting the requests served on each connection.
+
+    ``drop_after`` makes it drop a connection, unanswered, once that many requests have
+    been served on it: what a model server closing an idle keep-alive connection looks
+    like to a client that wrote to it at the same moment.
+    """
+
+    def __init__(self):
+        self.served: collections.Counter = collections.Counter()
+        self.drop_after: int | None = None
+        app = web.Application()
+        app.router.add_post("/predict", self.predict)
+        app.router.add_get("/health", self.health)
+        self.app = app
+
+    @property
+    def connections(self) -> int:
+        return len(self.served)
+
+    async def predict(self, request: web.Request) -> web.Response:
+        transport = request.transport
+        body = await request.json()
+        if self.drop_after is not None and self.served[transport] >= self.drop_after:
+            transport.close()
+            raise ConnectionResetError
+        self.served[transport] += 1
+        return web.json_response({"echo": body})
+
+    async def health(self, request: web.Request) -> web.Response:
+        return web.Response(text="ok")
+
+
+@pytest.fixture
+async def model_server():
+    stub = StubModelServer()
+    runner = web.AppRunner(stub.app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    stub.url = f"http://127.0.0.1:{port}"
+    yield stub
+    await runner.cleanup()
+
+
+@pytest.fixture
+async def unix_model_server(tmp_path):
+    stub = StubModelServer()
+    runner = web.AppRunner(stub.app)
+    await runner.setup()
+    path = tmp_path / "model.sock"
+    site = web.UnixSite(runner, str(path))
+    await site.start()
+    stub.url = f"unix://{path}"
+    yield stub
+    await runner.cleanup()
+
+
+async def _close_sessions(backend) -> None:
+    for name in ("session", "oneshot_session"):
+        if name in backend.__dict__:
+            await backend.__dict__[name].close()
+
+
+@pytest.fixture
+async def backend_and_handler(serverless_backend_testkit, model_server):
+    backend, handler = serverless_backend_testkit.make_backend()
+    backend.model_server_url = model_server.url
+    yield backend, handler
+    await _close_sessions(backend)
+
+
+@pytest.fixture
+async def unix_backend_and_handler(serverless_backend_testkit, unix_model_server):
+    backend, handler = serverless_backend_testkit.make_backend()
+    backend.model_server_url = unix_model_server.url
+    yield backend, handler
+    await _close_sessions(backend)
+
+
+async def _forward(serverless_backend_testkit, backend, handler) -> web.Response:
+    fn = backend.create_handler(handler)
+    req = serverless_backend_testkit.json_request(
+        serverless_backend_testkit.auth_payload()
+    )
+    return await fn(req)
+
+
+# ---------------------------------------------------------------------------
+# Connection reuse
+# ---------------------------------------------------------------------------
+
+
+class TestModelServerKeepalive:
+    """Verify requests reuse pooled connections unless the handler opts out."""
+
+    async def test_requests_share_one_connection(
+        self, serverless_backend_testkit, backend_and_handler, model_server
+    ) -> None:
+        """
+        Verifies sequential requests are forwarded over a single kept-alive connection.
+
+        This test verifies by:
+        1. Forwarding five requests one after another
+        2. Checking the stub served all five on one connection
+
+        Assumptions:
+        - Keep-alive is on by default (MODEL_KEEPALIVE unset)
+        """
+        backend, handler = backend_and_handler
+        for _ in range(5):
+            resp = await _forward(serverless_backend_testkit, backend, handler)
+            assert resp.status == 200
+            assert serverless_backend_testkit.response_json(resp) == {
+                "echo": {"input": {}}
+            }
+        assert model_server.connections == 1
+        assert sum(model_server.served.values()) == 5
+
+    async def test_handler_can_opt_out(
+        self, serverless_backend_testkit, backend_and_handler, model_server
+    ) -> None:
+        """
+        Verifies a handler with keepalive=False gets a new connection per request.
+
+        This test verifies by:
+        1. Turning keepalive off on the handler and forwarding three requests
+        2. Checking the stub saw three connections
+
+        Assumptions:
+        - Long running jobs set keepalive=False on their HandlerConfig
+        """
+        backend, handler = backend_and_handler
+        handler.keepalive = False
+        for _ in range(3):
+            resp = await _forward(serverless_backend_testkit, backend, handler)
+            assert resp.status == 200
+        assert model_server.connections == 3
+
+    async def test_keepalive_can_be_disabled(
+        self, serverless_backend_testkit, backend_and_handler, model_server
+    ) -> None:
+        backend, handler = backend_and_handler
+        backend.model_keepalive = False
+        for _ in range(3):
+            await _forward(serverless_backend_testkit, backend, handler)
+        assert model_server.connections == 3
+
+
+# ---------------------------------------------------------------------------
+# Stale connections
+# ---------------------------------------------------------------------------
+
+
+class TestStalePooledConnection:
+    """Verify a request on a pooled connection the model server dropped is resent once,
+    for handlers that opted in."""
+
+    async def test_request_on_dropped_connection_is_resent(
+        self, serverless_backend_testkit, backend_and_handler, model_server
+    ) -> None:
+        """
+        Verifies a reused connection closed by the model server is retried on a new one.
+
+        This test verifies by:
+        1. Letting the stub drop every connection after one request
+        2. Forwarding two requests, the second on the pooled (now dropped) connection
+        3. Checking both succeed and the second went out on a fresh connection
+
+        Assumptions:
+        - The handler set retry_on_disconnect, so its requests are safe to repeat
+        - The retry uses a connection of its own, not another pooled one
+        """
+        backend, handler = backend_and_handler
+        handler.retry_on_disconnect = True
+        model_server.drop_after = 1
+        for _ in range(2):
+            resp = await _forward(serverless_backend_testkit, backend, handler)
+            assert resp.status == 200
+        assert model_server.connections == 2
+        assert sorted(model_server.served.values()) == [1, 1]
+
+    async def test_request_is_not_resent_without_opting_in(
+        self, serverless_backend_testkit, backend_and_handler, model_server
+    ) -> None:
+        """
+        Verifies a dropped pooled connection surfaces the error by default.
+
+        This test verifies by:
+        1. Letting the stub drop every connection after one request
+        2. Sending a request, then a second one on the pooled (now dropped) connection
+        3. Expecting ServerDisconnectedError and no second connection
+
+        Assumptions:
+        - The stub read the second request before dropping it, so resending it could
+          run it twice
+        """
+        backend, handler = backend_and_handler
+        model_server.drop_after = 1
+        resp = await _forward(serverless_backend_testkit, backend, handler)
+        assert resp.status == 200
+        payload = handler.make_benchmark_payload()
+        with pytest.raises(ServerDisconnectedError):
+            await backend._Backend__call_api(handler=handler, payload=payload)
+        assert model_server.connections == 1
+
+    async def test_new_connection_failure_is_not_retried(
+        self, serverless_backend_testkit, backend_and_handler, model_server
+    ) -> None:
+        """
+        Verifies a connection dropped on its first request surfaces the error.
+
+        This test verifies by:
+        1. Letting the stub drop every connection before answering
+        2. Calling __call_api directly and expecting ServerDisconnectedError
+
+        Assumptions:
+        - Only reused connections can be stale, so anything else is a real failure
+        """
+        backend, handler = backend_and_handler
+        handler.retry_on_disconnect = True
+        model_server.drop_after = 0
+        payload = handler.make_benchmark_payload()
+        with pytest.raises(ServerDisconnectedError):
+            await backend._Backend__call_api(handler=handler, payload=payload)
+        assert model_server.connections == 0
+
+
+# ---------------------------------------------------------------------------
+# Unix domain sockets
+# ---------------------------------------------------------------------------
+
+
+class TestUnixSocketModelServer:
+    """Verify unix:// model urls are reached over the socket for requests and healthchecks."""
+
+    async def test_requests_are_forwarded_over_the_socket(
+        self, serverless_backend_testkit, unix_backend_and_handler, unix_model_server
+    ) -> None:
+        """
+        Verifies requests reach a model server listening only on a unix socket.
+
+        This test verifies by:
+        1. Pointing the backend at unix://<tmp>/model.sock
+        2. Forwarding three requests and checking the responses
+
+        Assumptions:
+        - Pooling works the same as over TCP: one connection for sequential requests
+        """
+        backend, handler = unix_backend_and_handler
+        assert backend.model_socket_path == unix_model_server.url[len("unix://") :]
+        for _ in range(3):
+            resp = await _forward(serverless_backend_testkit, backend, handler)
+            assert resp.status == 200
+            assert serverless_backend_testkit.response_json(resp) == {
+                "echo": {"input": {}}
+            }
+        assert unix_model_server.connections == 1
+
+    async def test_opted_out_handler_uses_the_socket(
+        self, serverless_backend_testkit, unix_backend_and_handler, unix_model_server
+    ) -> None:
+        backend, handler = unix_backend_and_handler
+        handler.keepalive = False
+        for _ in range(2):
+            resp = await _forward(serverless_backend_testkit, backend, handler)
+            assert resp.status == 200
+        assert unix_model_server.connections == 2
+
+    async def test_healthcheck_over_the_socket(self, unix_backend_and_handler) -> None:
+        """
+        Verifies the healthcheck loop reaches the model server through the socket.
+
+        This test verifies by:
+        1. Setting healthcheck_url to /health and starting the healthcheck loop
+        2. Waiting for the first successful healthcheck
+
+        Assumptions:
+        - The healthcheck url is a path on the model server, as in the examples
+        """
+        backend, _ = unix_backend_and_handler
+        backend.healthcheck_url = "/health"
+        task = asyncio.create_task(backend._Backend__healthcheck())
+        backend._Backend__start_healthcheck.set()
+        try:
+            await asyncio.wait_for(backend._Backend__healthcheck_ready.wait(), 5)
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        assert backend._Backend__healthcheck_succeeded
@@ -0,0 +1,320 @@
+"""Tests for the pyworker's BenchmarkRunner: fixed and adaptive modes, and resuming."""
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from vastai.serverless.server.lib.benchmark import (
+    BenchmarkFailed,
+    BenchmarkRunner,
+    BenchmarkSummary,
+)
+
+
+class _Payload:
+    def count_workload(self) -> float:
+        return 1.0
+
+
+class _Response:
+    def __init__(self, status: int = 200):
+        self.status = status
+        self.read_called = False
+
+    async def read(self) -> bytes:
+        self.read_called = True
+        return b"{}"
+
+
+class StubModel:
+    """Answers after ``latency`` seconds, ``slots`` requests at a time; with ``reject``
+    set, requests beyond ``slots`` get a 503 instead of waiting."""
+
+    def __init__(self, latency: float = 0.02, slots: int = 1000, reject: bool = False):
+        self.latency = latency
+        self.slots = asyncio.Semaphore(slots)
+        self.reject = reject
+        self.calls = 0
+
+    async def __call__(self, payload) -> _Response:
+        self.calls += 1
+        if self.reject and self.slots.locked():
+            return _Response(503)
+        async with self.slots:
+            await asyncio.sleep(self.latency)
+        return _Response()
+
+
+def _runner(model, path, **kwargs) -> BenchmarkRunner:
+    kwargs.setdefault("concurrency", 4)
+    kwargs.setdefault("runs", 3)
+    return BenchmarkRunner(
+        call=model,
+        make_payload=_Payload,
+        key={"endpoint": "/predict"},
+        path=str(path),
+        **kwargs,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Fixed mode
+# ---------------------------------------------------------------------------
+
+
+class TestFixedBenchmark:
+    """Verify the fixed mode runs `runs` rounds at `concurrency`, like it always did."""
+
+    async def test_runs_are_recorded(self, tmp_path) -> None:
+        """
+        Verifies every run's results are written to the benchmark file.
+
+        This test verifies by:
+        1. Running 3 rounds of 4 requests against a 20ms stub (plus a warmup request)
+        2. Reading the benchmark file back
+
+        Assumptions:
+        - Throughput is workload per second of a round; 4 requests in ~20ms is ~200/s
+        """
+        model = StubModel()
+        path = tmp_path / "bench.json"
+        summary = await _runner(model, path).run()
+        assert model.calls == 1 + 3 * 4
+        assert summary.saturation_concurrency == 4
+        assert 100 < summary.max_throughput < 220
+
+        data = json.loads(path.read_text())
+        assert data["key"] == {
+            "endpoint": "/predict", "mode": "fixed", "concurrency": 4, "runs": 3
+        }
+        assert [run["successes"] for run in data["runs"]] == [4, 4, 4]
+        assert all(0.015 < run["latency_p50"] <= run["latency_p99"] for run in data["runs"])
+        assert data["result"]["max_throughput"] == summary.max_throughput
+
+    async def test_failed_requests_count_as_errors(self, tmp_path) -> None:
+        model = StubModel(slots=2, reject=True)
+        summary = await _runner(model, tmp_path / "bench.json", runs=1).run(warmup=False)
+        run = json.loads((tmp_path / "bench.json").read_text())["runs"][0]
+        assert (run["successes"], run["errors"]) == (2, 2)
+        assert summary.max_throughput > 0
+
+    async def test_no_successes_fails(self, tmp_path) -> None:
+        async def broken(payload):
+            raise ConnectionResetError
+
+        with pytest.raises(BenchmarkFailed):
+            await _runner(broken, tmp_path / "bench.json").run(warmup=False)
+
+
+# ---------------------------------------------------------------------------
+# Resuming
+# ---------------------------------------------------------------------------
+
+
+class TestResume:
+    """Verify a benchmark interrupted by a restart resumes from its recorded runs."""
+
+    async def test_resumes_after_the_last_recorded_run(self, tmp_path) -> None:
+        """
+        Verifies runs recorded before a crash are reused, and only the rest are run.
+
+        This test verifies by:
+        1. Cancelling the benchmark during its third run (a worker restart)
+        2. Running a new runner on the same file and counting requests
+
+        Assumptions:
+        - A run is recorded only once all of its requests finished
+        """
+        path = tmp_path / "bench.json"
+        model = StubModel()
+        task = asyncio.create_task(_runner(model, path, runs=4).run(warmup=False))
+        while model.calls < 9:
+            await asyncio.sleep(0.001)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        assert len(json.loads(path.read_text())["runs"]) == 2
+
+        resumed = StubModel()
+        await _runner(resumed, path, runs=4).run(warmup=False)
+        assert resumed.calls == 2 * 4
+        assert len(json.loads(path.read_text())["runs"]) == 4
+
+    async def test_finished_benchmark_is_not_rerun(self, tmp_path) -> None:
+        path = tmp_path / "bench.json"
+        first = await _runner(StubModel(), path).run()
+        model = StubModel()
+        assert await _runner(model, path).run() == first
+        assert model.calls == 0
+
+    async def test_changed_benchmark_starts_over(self, tmp_path) -> None:
+        path = tmp_path / "bench.json"
+        await _runner(StubModel(), path).run()
+        model = StubModel()
+        await _runner(model, path, concurrency=2).run(warmup=False)
+        assert model.calls == 3 * 2
+
+
+# ---------------------------------------------------------------------------
+# Adaptive mode
+# ---------------------------------------------------------------------------
+
+
+class TestAdaptiveBenchmark:
+    """Verify the adaptive mode finds where throughput stops growing with concurrency."""
+
+    async def test_stops_at_the_plateau(self, tmp_path) -> None:
+        """
+        Verifies concurrency doubles until throughput stops growing.
+
+        This test verifies by:
+        1. Benchmarking a stub that serves 4 requests at a time
+        2. Checking levels 1, 2, 4 and 8 ran and 4 is the saturation point
+
+        Assumptions:
+        - Level 8 takes two 20ms waves, so it's no faster than level 4
+        """
+        path = tmp_path / "bench.json"
+        summary = await _runner(
+            StubModel(slots=4), path, adaptive=True, runs_per_level=2
+        ).run(warmup=False)
+        runs = json.loads(path.read_text())["runs"]
+        assert [run["concurrency"] for run in runs] == [1, 1, 2, 2, 4, 4, 8, 8]
+        assert summary.saturation_concurrency == 4
+        assert 150 < summary.max_throughput < 220
+
+    async def test_errors_end_the_ramp(self, tmp_path) -> None:
+        path = tmp_path / "bench.json"
+        summary = await _runner(
+            StubModel(slots=4, reject=True), path, adaptive=True, runs_per_level=1
+        ).run(warmup=False)
+        runs = json.loads(path.read_text())["runs"]
+        assert [run["concurrency"] for run in runs] == [1, 2, 4, 8]
+        assert runs[-1]["errors"] == 4
+        assert summary.saturation_concurrency == 4
+
+    async def test_latency_bound(self, tmp_path) -> None:
+        """
+        Verifies levels over max_latency end the ramp and aren't counted.
+
+        This test verifies by:
+        1. Allowing 30ms p99 against a stub serving 2 requests at a time in 20ms
+        2. Checking level 4 (two waves, 40ms) ended it and level 2 is the result
+
+        Assumptions:
+        - If even level 1 were over the bound, it would still be the result
+        """
+        summary = await _runner(
+            StubModel(slots=2),
+            tmp_path / "bench.json",
+            adaptive=True,
+            max_latency=0.03,
+            runs_per_level=1,
+        ).run(warmup=False)
+        assert summary.saturation_concurrency == 2
+        assert summary.max_throughput < 110
+
+    async def test_max_concurrency(self, tmp_path) -> None:
+        path = tmp_path / "bench.json"
+        summary = await _runner(
+            StubModel(), path, adaptive=True, max_concurrency=6, runs_per_level=1
+        ).run(warmup=False)
+        runs = json.loads(path.read_text())["runs"]
+        assert [run["concurrency"] for run in runs] == [1, 2, 4, 6]
+        assert summary.saturation_concurrency == 6
+
+
+# ---------------------------------------------------------------------------
+# Backend
+# ---------------------------------------------------------------------------
+
+
+class TestBackendBenchmark:
+    """Verify the Backend runs the benchmark file-backed and reports the saturation point."""
+
+    async def test_adaptive_benchmark_through_backend(
+        self, serverless_backend_testkit, tmp_path, monkeypatch
+    ) -> None:
+        """
+        Verifies __run_benchmark uses the handler's adaptive settings and keeps both
+        the structured file and the legacy indicator.
+
+        This test verifies by:
+        1. Running the benchmark of an adaptive handler against a 4-slot stub
+        2. Checking the summary, .benchmark.json and .has_benchmark
+
+        Assumptions:
+        - Files are written to the working directory, as .has_benchmark always was
+        """
+        monkeypatch.chdir(tmp_path)
+        backend, _ = serverless_backend_testkit.make_backend()
+        handler = backend.benchmark_handler
+        handler.benchmark_adaptive = True
+        handler.do_warmup_benchmark = False
+        model = StubModel(slots=4)
+
+        async def call_backend(handler, payload):
+            return await model(payload)
+
+        with patch.object(backend, "_Backend__call_backend", new=call_backend):
+            summary = await backend._Backend__run_benchmark()
+        assert summary.saturation_concurrency == 4
+        assert json.loads((tmp_path / ".benchmark.json").read_text())["key"]["mode"] == (
+            "adaptive"
+        )
+        assert float((tmp_path / ".has_benchmark").read_text()) == summary.max_throughput
+
+        backend.metrics._model_loaded(
+            max_throughput=summary.max_throughput,
+            saturation_concurrency=summary.saturation_concurrency,
+        )
+        assert backend.metrics.model_metrics.saturation_concurrency == 4
+
+    async def test_changed_benchmark_reruns_despite_legacy_indicator(
+        self, serverless_backend_testkit, tmp_path, monkeypatch
+    ) -> None:
+        """
+        Verifies switching a benchmarked handler from fixed to adaptive benchmarks again.
+
+        This test verifies by:
+        1. Running the fixed benchmark, which writes .benchmark.json and .has_benchmark
+        2. Switching the handler to adaptive and running the benchmark again
+        3. Asserting the second run called the model and found a saturation point
+
+        Assumptions:
+        - .has_benchmark only stands in for a benchmark when .benchmark.json is absent
+        """
+        monkeypatch.chdir(tmp_path)
+        backend, _ = serverless_backend_testkit.make_backend()
+        handler = backend.benchmark_handler
+        handler.do_warmup_benchmark = False
+        model = StubModel(slots=4)
+
+        async def call_backend(handler, payload):
+            return await model(payload)
+
+        with patch.object(backend, "_Backend__call_backend", new=call_backend):
+            await backend._Backend__run_benchmark()
+            assert (tmp_path / ".has_benchmark").exists()
+            calls = model.calls
+            handler.benchmark_adaptive = True
+            summary = await backend._Backend__run_benchmark()
+        assert model.calls > calls
+        assert summary.saturation_concurrency == 4
+        assert json.loads((tmp_path / ".benchmark.json").read_text())["key"]["mode"] == (
+            "adaptive"
+        )
+
+    async def test_legacy_indicator_is_reused(
+        self, serverless_backend_testkit, tmp_path, monkeypatch
+    ) -> None:
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / ".has_benchmark").write_text("123.5")
+        backend, _ = serverless_backend_testkit.make_backend()
+        call = AsyncMock()
+        with patch.object(backend, "_Backend__call_backend", new=call):
+            summary = await backend._Backend__run_benchmark()
+        assert summary == BenchmarkSummary(123.5, saturation_concurrency=0)
+        call.assert_not_called()
@@ -14,8 +14,10 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import aiohttp
 import pytest
 
-from vastai.serverless.client.client import Serverless, ServerlessRequest
+from vastai.serverless.client.client import CoroutineServerless, Serverless, ServerlessRequest
 from vastai.serverless.client.endpoint import Endpoint
+from vastai.serverless.client.route_coalescer import RouteCoalescer
+from vastai.serverless.client.route_lease import RouteLeaseTable
 from vastai.serverless.client.worker import Worker
 from vastai.serverless.client.session import Session
 
@@ -1738,6 +1740,417 @@ class TestQueueEndpointRequestResilience:
             assert req.status == "Cancelled"
 
 
+# ---------------------------------------------------------------------------
+# Route leasing
+# ---------------------------------------------------------------------------
+
+
+def _ready_route(url="https://w.vast.ai", request_idx=7):
+    return MagicMock(
+        status="READY",
+        request_idx=request_idx,
+        get_url=MagicMock(return_value=url),
+        body={"url": url, "signature": "sig"},
+    )
+
+
+_OK = {"ok": True, "json": {"result": "ok"}, "status": 200, "text": ""}
+
+
+class TestRouteLeasing:
+    """Verify opt-in route leases skip /route/ and are dropped on worker failure."""
+
+    def _client(self, **kwargs):
+        client = CoroutineServerless(api_key="test-key", max_poll_interval=0.001, **kwargs)
+        client._get_session = AsyncMock()
+        client.get_ssl_context = AsyncMock(return_value=None)
+        return client
+
+    async def test_default_routes_every_request(self) -> None:
+        """
+        Verifies that without route_lease_ttl every request routes.
+
+        This test verifies by:
+        1. Sending three requests on a client without leasing
+        2. Asserting _route ran three times and no lease hits were counted
+
+        Assumptions:
+        - Leasing is opt-in; the default behavior is unchanged
+        """
+        client = self._client()
+        ep = Endpoint(client=client, name="ep", id=1, api_key="k")
+        with patch.object(ep, "_route", new_callable=AsyncMock, return_value=_ready_route()) as mock_route:
+            with patch("vastai.serverless.client.client._make_request", new_callable=AsyncMock, return_value=_OK):
+                for _ in range(3):
+                    await client.queue_endpoint_request(endpoint=ep, worker_route="/predict", worker_payload={})
+        assert mock_route.call_count == 3
+        assert client.route_stats.route_calls == 3
+        assert client.route_stats.lease_hits == 0
+
+    async def test_lease_reuses_route_result(self) -> None:
+        """
+        Verifies that a READY route is reused by later requests while leased.
+
+        This test verifies by:
+        1. Enabling route_lease_ttl and sending three requests
+        2. Asserting _route ran once and all requests carried the leased auth_data
+        3. Asserting only the routed request carried the route's request_idx
+
+        Assumptions:
+        - The lease keeps the worker URL and auth_data of the route
+        - Reuses have no autoscaler request record, so they send request_idx 0
+        """
+        client = self._client(route_lease_ttl=30)
+        ep = Endpoint(client=client, name="ep", id=1, api_key="k")
+        route = _ready_route()
+        route.body = {"url": "https://w.vast.ai", "signature": "sig", "request_idx": 7}
+        results = []
+        with patch.object(ep, "_route", new_callable=AsyncMock, return_value=route) as mock_route:
+            with patch("vastai.serverless.client.client._make_request", new_callable=AsyncMock, return_value=_OK) as mock_req:
+                for _ in range(3):
+                    result = await client.queue_endpoint_request(endpoint=ep, worker_route="/predict", worker_payload={})
+                    assert result["url"] == "https://w.vast.ai"
+                    results.append(result["request_idx"])
+        assert mock_route.call_count == 1
+        assert results == [7, 0, 0]
+        sent = [c.kwargs["body"]["auth_data"] for c in mock_req.call_args_list]
+        assert all(auth["signature"] == "sig" for auth in sent)
+        assert [auth["request_idx"] for auth in sent] == [7, 0, 0]
+        assert route.body["request_idx"] == 7
+        stats = client.route_stats
+        assert (stats.route_calls, stats.lease_hits, stats.always_route_calls) == (1, 2, 3)
+        assert stats.saved_fraction == pytest.approx(2 / 3)
+
+    async def test_lease_is_per_cost(self) -> None:
+        """
+        Verifies that a lease granted for one cost is not used for another.
+
+        This test verifies by:
+        1. Sending requests with cost 100 then cost 500
+        2. Asserting each cost routed once
+
+        Assumptions:
+        - The autoscaler's route decision depends on the request cost
+        """
+        client = self._client(route_lease_ttl=30)
+        ep = Endpoint(client=client, name="ep", id=1, api_key="k")
+        with patch.object(ep, "_route", new_callable=AsyncMock, return_value=_ready_route()) as mock_route:
+            with patch("vastai.serverless.client.client._make_request", new_callable=AsyncMock, return_value=_OK):
+                await client.queue_endpoint_request(endpoint=ep, worker_route="/p", worker_payload={}, cost=100)
+                await client.queue_endpoint_request(endpoint=ep, worker_route="/p", worker_payload={}, cost=500)
+                await client.queue_endpoint_request(endpoint=ep, worker_route="/p", worker_payload={}, cost=100)
+        assert mock_route.call_count == 2
+
+    async def test_max_uses_bounds_lease(self) -> None:
+        """
+        Verifies that route_lease_max_uses forces a fresh route once spent.
+
+        This test verifies by:
+        1. Enabling a lease with max_uses=1 and sending three requests
+        2. Asserting _route ran for the first and third requests
+
+        Assumptions:
+        - A lease is granted on every fresh READY route
+        """
+        client = self._client(route_lease_ttl=30, route_lease_max_uses=1)
+        ep = Endpoint(client=client, name="ep", id=1, api_key="k")
+        with patch.object(ep, "_route", new_callable=AsyncMock, return_value=_ready_route()) as mock_route:
+            with patch("vastai.serverless.client.client._make_request", new_callable=AsyncMock, return_value=_OK):
+                for _ in range(3):
+                    await client.queue_endpoint_request(endpoint=ep, worker_route="/p", worker_payload={})
+        assert mock_route.call_count == 2
+
+    async def test_transport_error_invalidates_lease_and_reroutes(self) -> None:
+        """
+        Verifies that a worker transport failure drops the lease and re-routes.
+
+        This test verifies by:
+        1. Leasing worker A, then failing the leased request with ServerDisconnectedError
+        2. Asserting the retry routed fresh (req_idx=0) to worker B and leased B
+
+        Assumptions:
+        - The existing re-route path handles the retry
+        """
+        client = self._client(route_lease_ttl=30)
+        ep = Endpoint(client=client, name="ep", id=1, api_key="k")
+        routes = [_ready_route("https://a.vast.ai", 1), _ready_route("https://b.vast.ai", 2)]
+        with patch.object(ep, "_route", new_callable=AsyncMock, side_effect=routes) as mock_route:
+            with patch("vastai.serverless.client.client._make_request", new_callable=AsyncMock) as mock_req:
+                mock_req.side_effect = [_OK, aiohttp.ServerDisconnectedError(), _OK, _OK]
+                await client.queue_endpoint_request(endpoint=ep, worker_route="/p", worker_payload={})
+                result = await client.queue_endpoint_request(endpoint=ep, worker_route="/p", worker_payload={})
+                assert result["url"] == "https://b.vast.ai"
+                await client.queue_endpoint_request(endpoint=ep, worker_route="/p", worker_payload={})
+        assert mock_route.call_count == 2
+        assert mock_route.call_args_list[1].kwargs["req_idx"] == 0
+        assert [c.kwargs["url"] for c in mock_req.call_args_list] == [
+            "https://a.vast.ai", "https://a.vast.ai", "https://b.vast.ai", "https://b.vast.ai",
+        ]
+        assert client.route_stats.leases_invalidated == 1
+
+    async def test_5xx_invalidates_lease(self) -> None:
+        """
+        Verifies that a 5xx from a leased worker drops the lease.
+
+        This test verifies by:
+        1. Leasing a worker, then returning a retryable 503 on the leased request
+        2. Asserting the retry went back through _route
+
+        Assumptions:
+        - Retryable HTTP errors reuse the outer retry loop
+        """
+        client = self._client(route_lease_ttl=30)
+        ep = Endpoint(client=client, name="ep", id=1, api_key="k")
+        error = {"ok": False, "retryable": True, "status": 503, "text": "", "json": None}
+        with patch.object(ep, "_route", new_callable=AsyncMock, return_value=_ready_route()) as mock_route:
+            with patch("vastai.serverless.client.client._make_request", new_callable=AsyncMock) as mock_req:
+                mock_req.side_effect = [_OK, error, _OK]
+                await client.queue_endpoint_request(endpoint=ep, worker_route="/p", worker_payload={})
+                result = await client.queue_endpoint_request(endpoint=ep, worker_route="/p", worker_payload={})
+        assert result["ok"] is True
+        assert mock_route.call_count == 2
+
+    async def test_expired_lease_is_not_used(self) -> None:
+        """
+        Verifies that a lease past its TTL is discarded.
+
+        This test verifies by:
+        1. Granting a lease and moving its expiry into the past
+        2. Asserting take() returns None and the lease is removed
+
+        Assumptions:
+        - Expiry is checked lazily on take()
+        """
+        table = RouteLeaseTable(ttl=30)
+        lease = table.grant(100, "https://w.vast.ai", {}, 1)
+        table.release(lease)
+        lease.expires_at = 0
+        assert table.take(100) is None
+        assert table._leases == {}
+
+    async def test_lease_is_held_by_one_request_at_a_time(self) -> None:
+        """
+        Verifies that concurrent requests never share a leased reqnum on a worker.
+
+        This test verifies by:
+        1. Leasing a route, then sending two requests at once to the same worker
+        2. Asserting the second routed for its own reqnum while the lease was in use
+        3. Sending two more at once and asserting both reused the two leases
+
+        Assumptions:
+        - The worker keys in-flight requests by reqnum, so sharing one would
+          overwrite its entry
+        """
+        client = self._client(route_lease_ttl=30)
+        ep = Endpoint(client=client, name="ep", id=1, api_key="k")
+        routes = []
+        for reqnum in (1, 2, 3):
+            route = _ready_route(request_idx=reqnum)
+            route.body = {"url": "https://w.vast.ai", "signature": "sig", "reqnum": reqnum}
+            routes.append(route)
+        in_flight, seen = set(), []
+
+        async def worker(**kwargs):
+            reqnum = kwargs["body"]["auth_data"]["reqnum"]
+            assert reqnum not in in_flight
+            in_flight.add(reqnum)
+            seen.append(reqnum)
+            await asyncio.sleep(0.01)
+            in_flight.discard(reqnum)
+            return _OK
+
+        def send():
+            return client.queue_endpoint_request(endpoint=ep, worker_route="/p", worker_payload={})
+
+        with patch.object(ep, "_route", new_callable=AsyncMock, side_effect=routes) as mock_route:
+            with patch("vastai.serverless.client.client._make_request", side_effect=worker):
+                await send()
+                await asyncio.gather(send(), send())
+                assert mock_route.call_count == 2
+                await asyncio.gather(send(), send())
+        assert mock_route.call_count == 2
+        assert sorted(seen) == [1, 1, 1, 2, 2]
+        assert client.route_stats.lease_hits == 3
+
+    async def test_streams_do_not_lease(self) -> None:
+        client = self._client(route_lease_ttl=30)
+        ep = Endpoint(client=client, name="ep", id=1, api_key="k")
+        with patch.object(ep, "_route", new_callable=AsyncMock, return_value=_ready_route()) as mock_route:
+            with patch("vastai.serverless.client.client._make_request", new_callable=AsyncMock, return_value=_OK):
+                for _ in range(2):
+                    await client.queue_endpoint_request(
+                        endpoint=ep, worker_route="/p", worker_payload={}, stream=True
+                    )
+        assert mock_route.call_count == 2
+
+
+# ---------------------------------------------------------------------------
+# Route coalescing
+# ---------------------------------------------------------------------------
+
+
+class TestRouteCoalescing:
+    """Verify coalesce_routes shares one poll loop among waiting requests."""
+
+    async def _burst(self, coalesce: bool, n: int = 30, cold_for: float = 1.3):
+        client = CoroutineServerless(
+            api_key="test-key", max_poll_interval=0.01, coalesce_routes=coalesce
+        )
+        client._get_session = AsyncMock()
+        client.get_ssl_context = AsyncMock(return_value=None)
+        ep = Endpoint(client=client, name="ep", id=1, api_key="k")
+        loop = asyncio.get_running_loop()
+        ready_at = loop.time() + cold_for
+
+        async def fake_route(cost=0.0, req_idx=0, timeout=60.0):
+            if loop.time() < ready_at:
+                return MagicMock(status="WAITING", request_idx=req_idx or 1, body={})
+            return _ready_route(request_idx=req_idx or 1)
+
+        with patch.object(ep, "_route", side_effect=fake_route):
+            with patch("vastai.serverless.client.client._make_request", new_callable=AsyncMock, return_value=_OK):
+                results = await asyncio.gather(*(
+                    client.queue_endpoint_request(endpoint=ep, worker_route="/p", worker_payload={})
+                    for _ in range(n)
+                ))
+        assert all(r["ok"] for r in results)
+        return client
+
+    async def test_coalescing_bounds_route_calls_during_cold_start(self) -> None:
+        """
+        Verifies that parked requests stop polling while the endpoint is cold.
+
+        This test verifies by:
+        1. Sending a burst of 30 requests at an endpoint that is WAITING for ~1.3s
+        2. Running it once with and once without coalesce_routes
+        3. Asserting the coalesced run made about one route per request plus
+           the leader's polls, far fewer than the independent poll loops
+
+        Assumptions:
+        - Each request still makes its own initial route call
+        """
+        baseline = await self._burst(coalesce=False)
+        coalesced = await self._burst(coalesce=True)
+        n = 30
+        assert coalesced.route_stats.route_calls <= 2 * n + 20
+        assert baseline.route_stats.route_calls > coalesced.route_stats.route_calls
+
+    async def test_ready_poll_wakes_parked_requests(self) -> None:
+        """
+        Verifies the leader/follower hand-off of RouteCoalescer.
+
+        This test verifies by:
+        1. Making one task leader and parking two followers
+        2. Reporting READY from the leader
+        3. Asserting a follower was woken and the wake batch doubled
+
+        Assumptions:
+        - A READY report releases leadership
+        """
+        coalescer = RouteCoalescer(keepalive=5.0)
+        order = []
+
+        async def leader():
+            await coalescer.wait_turn(0.01)
+            await asyncio.sleep(0.05)
+            order.append("leader-ready")
+            coalescer.report(True)
+
+        async def follower(tag):
+            await asyncio.sleep(0.005)
+            await coalescer.wait_turn(0.01)
+            order.append(tag)
+            coalescer.report(True)
+
+        await asyncio.wait_for(asyncio.gather(leader(), follower("a"), follower("b")), 2)
+        assert order[0] == "leader-ready"
+        assert sorted(order[1:]) == ["a", "b"]
+        assert coalescer.keepalives == 0
+        assert coalescer.wakeups == 2
+
+    async def test_parked_request_keepalive(self) -> None:
+        """
+        Verifies that a parked request re-polls after keepalive without a wake.
+
+        This test verifies by:
+        1. Holding leadership in another task and parking a follower
+        2. Asserting the follower returns after keepalive and counts it
+
+        Assumptions:
+        - keepalive keeps the follower's request_idx alive at the autoscaler
+        """
+        coalescer = RouteCoalescer(keepalive=0.05)
+
+        async def hold():
+            await coalescer.wait_turn(0.0)
+            await asyncio.sleep(0.5)
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0.01)
+        await asyncio.wait_for(coalescer.wait_turn(0.0), 1)
+        assert coalescer.keepalives == 1
+        holder.cancel()
+
+
+# ---------------------------------------------------------------------------
+# Binary wire format negotiation
+# ---------------------------------------------------------------------------
+
+
+class TestBinaryNegotiation:
+    """Verify binary payloads go out as JSON until the worker answers in the wire format."""
+
+    def _client(self):
+        client = CoroutineServerless(api_key="test-key", max_poll_interval=0.001)
+        client._get_session = AsyncMock()
+        client.get_ssl_context = AsyncMock(return_value=None)
+        return client
+
+    async def test_switches_to_binary_after_worker_answers_binary(self) -> None:
+        """
+        Verifies the first binary-capable request is JSON and later ones are binary.
+
+        This test verifies by:
+        1. Having the worker answer the first request with a wire-format response
+        2. Asserting _make_request got binary=False, then binary=True for the same worker
+
+        Assumptions:
+        - _make_request flags wire-format responses with "binary": True
+        """
+        client = self._client()
+        ep = Endpoint(client=client, name="ep", id=1, api_key="k")
+        ok = {**_OK, "binary": True}
+        with patch.object(ep, "_route", new_callable=AsyncMock, return_value=_ready_route()):
+            with patch("vastai.serverless.client.client._make_request", new_callable=AsyncMock, return_value=ok) as mock_req:
+                for _ in range(2):
+                    await client.queue_endpoint_request(
+                        endpoint=ep, worker_route="/remote/f", worker_payload={}, binary=True
+                    )
+                await client.queue_endpoint_request(endpoint=ep, worker_route="/p", worker_payload={})
+        assert [c.kwargs["binary"] for c in mock_req.call_args_list] == [False, True, None]
+
+    async def test_worker_answering_json_stays_json(self) -> None:
+        """
+        Verifies a worker that never answers in the wire format is not sent binary bodies.
+
+        This test verifies by:
+        1. Returning plain JSON results ("binary": False) for two requests
+        2. Asserting both were sent with binary=False
+
+        Assumptions:
+        - Older workers ignore the Accept header and answer JSON
+        """
+        client = self._client()
+        ep = Endpoint(client=client, name="ep", id=1, api_key="k")
+        ok = {**_OK, "binary": False}
+        with patch.object(ep, "_route", new_callable=AsyncMock, return_value=_ready_route()):
+            with patch("vastai.serverless.client.client._make_request", new_callable=AsyncMock, return_value=ok) as mock_req:
+                for _ in range(2):
+                    await ep.request("/remote/f", {}, binary=True)
+        assert [c.kwargs["binary"] for c in mock_req.call_args_list] == [False, False]
+        assert client._binary_workers == set()
+
+
 # ---------------------------------------------------------------------------
 # get_ssl_context – hermetic SSL certificate loading
 # ---------------------------------------------------------------------------
@@ -13,11 +13,13 @@ import pytest
 from vastai.serverless.client.connection import (
     _backoff_delay,
     _build_kwargs,
+    _iter_sse_events,
     _iter_sse_json,
     _make_request,
     _open_once,
     _retryable,
 )
+from vastai.serverless import wire
 
 
 class TestRetryable:
@@ -272,6 +274,60 @@ class TestBuildKwargs:
         assert "json" not in result
 
 
+    def test_build_kwargs_binary_false_sends_json_with_base64_buffers(
+        self, build_kwargs_defaults
+    ) -> None:
+        """
+        Verifies binary=False sends JSON text, base64-encodes buffers and advertises the wire format.
+
+        This test verifies by:
+        1. Calling _build_kwargs with a body holding raw bytes and binary=False
+        2. Asserting data is the JSON fallback and Accept names wire.CONTENT_TYPE
+
+        Assumptions:
+        - The caller's headers dict is not mutated
+        """
+        headers = {"Authorization": "Bearer x"}
+        result = _build_kwargs(
+            **{
+                **build_kwargs_defaults,
+                "headers": headers,
+                "method": "POST",
+                "body": {"b": b"\x00\x01"},
+                "binary": False,
+            },
+        )
+        assert result["data"] == '{"b": "AAE="}'
+        assert "json" not in result
+        assert result["headers"]["Content-Type"] == "application/json"
+        assert wire.CONTENT_TYPE in result["headers"]["Accept"]
+        assert headers == {"Authorization": "Bearer x"}
+
+    def test_build_kwargs_binary_true_sends_wire_message(
+        self, build_kwargs_defaults
+    ) -> None:
+        """
+        Verifies binary=True encodes the body in the binary wire format.
+
+        This test verifies by:
+        1. Calling _build_kwargs with binary=True
+        2. Asserting Content-Type and that the data decodes back to the body
+
+        Assumptions:
+        - Buffers decode as memoryviews over the message
+        """
+        result = _build_kwargs(
+            **{
+                **build_kwargs_defaults,
+                "method": "POST",
+                "body": {"b": b"\x00\x01"},
+                "binary": True,
+            },
+        )
+        assert result["headers"]["Content-Type"] == wire.CONTENT_TYPE
+        assert bytes(wire.decode(result["data"])["b"]) == b"\x00\x01"
+
+
 class TestIterSseJson:
     """Verify _iter_sse_json parses SSE stream into JSON objects."""
 
@@ -477,6 +533,178 @@ class TestIterSseJson:
         assert collected == [{"ok": 1}]
 
 
+    async def test_iter_sse_json_joins_multiline_data(
+        self, make_sse_response
+    ) -> None:
+        """
+        Verifies that consecutive data: lines form one event, joined by newlines.
+
+        This test verifies by:
+        1. Splitting one JSON object over two data: lines ended by a blank line
+        2. Asserting a single decoded object is yielded
+
+        Assumptions:
+        - Per SSE, data lines of one event are joined with "\\n"
+        """
+        mock_resp = make_sse_response([
+            b'data: {"a":\n',
+            b'data: [1, 2]}\n\n',
+            b'data: {"b": 3}\n\n',
+        ])
+
+        collected = [obj async for obj in _iter_sse_json(mock_resp)]
+
+        assert collected == [{"a": [1, 2]}, {"b": 3}]
+
+    async def test_iter_sse_json_stops_at_done_sentinel(
+        self, make_sse_response
+    ) -> None:
+        """
+        Verifies that data: [DONE] ends the stream.
+
+        This test verifies by:
+        1. Sending an event, [DONE], then another event
+        2. Asserting only the first event is yielded
+
+        Assumptions:
+        - OpenAI-style streams terminate with data: [DONE]
+        """
+        mock_resp = make_sse_response([
+            b'data: {"a": 1}\n\ndata: [DONE]\n\ndata: {"late": true}\n\n',
+        ])
+
+        collected = [obj async for obj in _iter_sse_json(mock_resp)]
+
+        assert collected == [{"a": 1}]
+
+    async def test_iter_sse_events_tracks_event_and_id(
+        self, make_sse_response
+    ) -> None:
+        """
+        Verifies that event:, id:, retry: and comment lines are parsed as fields.
+
+        This test verifies by:
+        1. Sending a keepalive comment, retry:, event:, id: and CRLF-terminated data
+        2. Asserting the event carries the name and id and no field line leaks as data
+
+        Assumptions:
+        - Field lines are never decoded as JSON payloads
+        """
+        mock_resp = make_sse_response([
+            b': keepalive\r\nretry: 100\r\nevent: token\r\nid: 7\r\n',
+            b'data: {"t": "hi"}\r\n\r\n',
+        ])
+
+        events = [e async for e in _iter_sse_events(mock_resp)]
+
+        assert len(events) == 1
+        assert events[0].data == {"t": "hi"}
+        assert events[0].event == "token"
+        assert events[0].id == "7"
+
+    async def test_iter_sse_events_event_name_applies_to_one_event(
+        self, make_sse_response
+    ) -> None:
+        """
+        Verifies that an event: name is not carried over to the events after it.
+
+        This test verifies by:
+        1. Sending a named event followed by an unnamed one
+        2. Asserting only the first carries the name, while the id persists
+
+        Assumptions:
+        - Per SSE, the event type is reset after each dispatch; the last event id is not
+        """
+        mock_resp = make_sse_response([
+            b'event: error\nid: 1\ndata: {"a": 1}\n\n',
+            b'data: {"b": 2}\n\n',
+        ])
+
+        events = [e async for e in _iter_sse_events(mock_resp)]
+
+        assert [(e.data, e.event, e.id) for e in events] == [
+            ({"a": 1}, "error", "1"),
+            ({"b": 2}, None, "1"),
+        ]
+
+    async def test_iter_sse_json_decodes_multiline_data_once(
+        self, make_sse_response
+    ) -> None:
+        """
+        Verifies that a multi-line event is joined and decoded once, at its end.
+
+        This test verifies by:
+        1. Splitting one JSON array over 200 data: lines
+        2. Counting the loads calls made for it
+
+        Assumptions:
+        - Only the first line is tried on its own, in case it is a whole event
+        """
+        import json
+
+        calls = []
+
+        def loads(payload):
+            calls.append(payload)
+            return json.loads(payload)
+
+        lines = [b"data: ["] + [b"data: %d," % i for i in range(198)] + [b"data: 198]"]
+        mock_resp = make_sse_response([b"\n".join(lines) + b"\n\n"])
+
+        collected = [obj async for obj in _iter_sse_json(mock_resp, loads=loads)]
+
+        assert collected == [list(range(199))]
+        assert len(calls) == 2
+
+    async def test_iter_sse_json_many_lines_in_one_chunk(
+        self, make_sse_response
+    ) -> None:
+        """
+        Verifies that a large chunk carrying many events split mid-line parses fully.
+
+        This test verifies by:
+        1. Building 1000 events and splitting the bytes at an odd chunk size
+        2. Asserting every event is yielded in order
+
+        Assumptions:
+        - Partial lines are carried across chunks
+        """
+        payload = b"".join(b'data: {"i": %d}\n\n' % i for i in range(1000))
+        chunks = [payload[i:i + 4093] for i in range(0, len(payload), 4093)]
+        mock_resp = make_sse_response(chunks)
+
+        collected = [obj async for obj in _iter_sse_json(mock_resp)]
+
+        assert collected == [{"i": i} for i in range(1000)]
+
+    async def test_iter_sse_json_uses_custom_loads(
+        self, make_sse_response
+    ) -> None:
+        """
+        Verifies that the loads hook replaces the JSON decoder.
+
+        This test verifies by:
+        1. Passing a loads callable that wraps json.loads
+        2. Asserting it received each payload
+
+        Assumptions:
+        - The hook is called with bytes-like payloads
+        """
+        import json
+
+        seen = []
+
+        def loads(payload):
+            seen.append(bytes(payload))
+            return json.loads(payload)
+
+        mock_resp = make_sse_response([b'data: {"a": 1}\n\n{"b": 2}\n'])
+
+        collected = [obj async for obj in _iter_sse_json(mock_resp, loads=loads)]
+
+        assert collected == [{"a": 1}, {"b": 2}]
+        assert seen == [b'{"a": 1}', b'{"b": 2}']
+
 class TestOpenOnce:
     """Verify _open_once executes single HTTP request."""
 
@@ -616,6 +844,78 @@ class TestMakeRequest:
         assert result["status"] == 404
         assert result["retryable"] is False
 
+    async def test_make_request_decodes_binary_response(
+        self,
+        make_mock_http_response,
+        make_request_http_mocks,
+        patch_build_kwargs,
+    ) -> None:
+        """
+        Verifies that a wire-format response is decoded into result["json"] and flagged.
+
+        This test verifies by:
+        1. Returning a 200 with Content-Type wire.CONTENT_TYPE and an encoded body
+        2. Asserting json holds the decoded document, binary is True and text() was not read
+
+        Assumptions:
+        - Binary bodies are read with resp.read(), never decoded as text
+        """
+        mock_resp = make_mock_http_response(status=200)
+        mock_resp.headers = {"Content-Type": wire.CONTENT_TYPE}
+        mock_resp.read = AsyncMock(return_value=wire.encode({"result": {"b": b"xyz"}}))
+        _, mock_client = make_request_http_mocks(post_return=mock_resp)
+
+        result = await _make_request(
+            client=mock_client,
+            route="/remote/f",
+            api_key="sk-test",
+            url="https://w.example.com",
+            body={"payload": {}},
+            method="POST",
+            retries=1,
+            binary=True,
+        )
+
+        assert result["binary"] is True
+        assert bytes(result["json"]["result"]["b"]) == b"xyz"
+        mock_resp.text.assert_not_awaited()
+
+    async def test_make_request_resends_json_when_binary_rejected(
+        self,
+        make_mock_http_response,
+        make_request_http_mocks,
+        patch_build_kwargs,
+    ) -> None:
+        """
+        Verifies a 415 for a binary body is retried once as JSON, even with retries=1.
+
+        This test verifies by:
+        1. Returning 415 then a JSON 200 from session.post
+        2. Asserting _build_kwargs saw binary=True then binary=False and the result is ok
+
+        Assumptions:
+        - The JSON resend is not counted against retries
+        """
+        rejected = make_mock_http_response(status=415, text="unsupported")
+        ok = make_mock_http_response(status=200, text='{"result": 1}', json_data={"result": 1})
+        mock_session, mock_client = make_request_http_mocks()
+        mock_session.post = AsyncMock(side_effect=[rejected, ok])
+
+        result = await _make_request(
+            client=mock_client,
+            route="/remote/f",
+            api_key="sk-test",
+            url="https://w.example.com",
+            body={"payload": {}},
+            method="POST",
+            retries=1,
+            binary=True,
+        )
+
+        assert [c.kwargs["binary"] for c in patch_build_kwargs.call_args_list] == [True, False]
+        assert result["ok"] is True
+        assert result["binary"] is False
+
     async def test_make_request_successful_json_parse_failure_raises(
         self,
         make_mock_http_response,
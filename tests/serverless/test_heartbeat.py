@@ -0,0 +1,219 @@
+"""Tests for the shared deployment HeartbeatScheduler against a local stand-in API."""
+from __future__ import annotations
+
+import asyncio
+import collections
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from vastai.serverless.client.heartbeat import HeartbeatScheduler
+from vastai.serverless.client.managed import ManagedDeployment
+
+
+class FakeApi:
+    """Counts heartbeats per deployment; ``failing`` deployments get HTTP 500."""
+
+    def __init__(self):
+        self.beats: collections.Counter = collections.Counter()
+        self.failing: set[int] = set()
+        self.auth: set[str] = set()
+        app = web.Application()
+        app.router.add_post("/api/v0/deployment/{id}/heartbeat/", self.heartbeat)
+        self.app = app
+
+    async def heartbeat(self, request: web.Request) -> web.Response:
+        deployment_id = int(request.match_info["id"])
+        self.auth.add(request.headers["Authorization"])
+        if deployment_id in self.failing:
+            return web.Response(status=500)
+        self.beats[deployment_id] += 1
+        return web.json_response({"success": True})
+
+
+class _Client:
+    """The parts of a serverless client the scheduler uses."""
+
+    api_key = "key"
+
+    def __init__(self, url: str, session: aiohttp.ClientSession):
+        self.vast_web_url = url
+        self.session = session
+        self.sessions_requested = 0
+        self.heartbeats = HeartbeatScheduler(self)
+
+    async def _get_session(self):
+        self.sessions_requested += 1
+        return self.session
+
+
+@pytest.fixture
+async def api():
+    fake = FakeApi()
+    runner = web.AppRunner(fake.app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    async with aiohttp.ClientSession() as session:
+        fake.client = _Client(f"http://127.0.0.1:{port}/", session)
+        yield fake
+        await fake.client.heartbeats.stop()
+    await runner.cleanup()
+
+
+# ---------------------------------------------------------------------------
+# Scheduling
+# ---------------------------------------------------------------------------
+
+
+class TestHeartbeatScheduler:
+    """Verify one task heartbeats every registered deployment on its interval."""
+
+    async def test_one_task_for_all_deployments(self, api) -> None:
+        """
+        Verifies deployments share one task and the client's session.
+
+        This test verifies by:
+        1. Registering three deployments with a 0.2s TTL (0.1s interval)
+        2. Checking each was heartbeated repeatedly by a single task
+
+        Assumptions:
+        - The first heartbeat goes out immediately on registration
+        """
+        scheduler = api.client.heartbeats
+        for deployment_id in (1, 2, 3):
+            scheduler.register(deployment_id, ttl=0.2)
+        task = scheduler._task
+        await asyncio.sleep(0.45)
+        assert scheduler._task is task and not task.done()
+        assert all(api.beats[d] >= 3 for d in (1, 2, 3))
+        assert api.auth == {"Bearer key"}
+        assert scheduler.sent == sum(api.beats.values())
+        assert scheduler.missed == 0
+        assert api.client.sessions_requested >= 1
+
+    async def test_unregister_stops_heartbeats(self, api) -> None:
+        """
+        Verifies unregistering a deployment stops its heartbeats and, with nothing
+        left, ends the task.
+
+        This test verifies by:
+        1. Registering one deployment, unregistering it after its first heartbeat
+        2. Checking no more heartbeats arrive and the task finished
+
+        Assumptions:
+        - Registering again later starts a new task
+        """
+        scheduler = api.client.heartbeats
+        scheduler.register(7, ttl=0.2)
+        await asyncio.sleep(0.05)
+        scheduler.unregister(7)
+        await asyncio.sleep(0.05)
+        count = api.beats[7]
+        await asyncio.sleep(0.25)
+        assert api.beats[7] == count
+        assert not scheduler.running
+
+        scheduler.register(7, ttl=0.2)
+        await asyncio.sleep(0.05)
+        assert api.beats[7] == count + 1
+
+    async def test_failures_are_retried_and_missed_ttls_counted(self, api) -> None:
+        """
+        Verifies failed heartbeats are counted, retried, and a lapsed TTL is a miss.
+
+        This test verifies by:
+        1. Failing every heartbeat of deployment 5 for longer than its TTL
+        2. Checking failed and missed, then that it recovers once the API does
+
+        Assumptions:
+        - Failed heartbeats are retried after min(interval, HEARTBEAT_RETRY)
+        """
+        api.failing.add(5)
+        scheduler = api.client.heartbeats
+        scheduler.register(5, ttl=0.2)
+        await asyncio.sleep(0.5)
+        stats = scheduler.stats[5]
+        assert stats.failed >= 3
+        assert stats.missed >= 1 and scheduler.missed == stats.missed
+        assert stats.last_success is None
+
+        api.failing.clear()
+        await asyncio.sleep(0.15)
+        assert stats.sent >= 1 and stats.last_latency is not None
+
+    def test_intervals_are_jittered(self) -> None:
+        scheduler = HeartbeatScheduler(client=None, jitter=0.1)
+        intervals = {scheduler._next_interval(30.0) for _ in range(50)}
+        assert all(13.5 <= i <= 15.0 for i in intervals)
+        assert len(intervals) > 1
+        assert scheduler.interval(600.0) == 60.0
+
+    async def test_run_in_background_outlives_the_loop(self, api) -> None:
+        """
+        Verifies the sync Deployment.ensure_ready path: heartbeats registered without a
+        loop are sent from one background thread.
+
+        This test verifies by:
+        1. Registering two deployments from a thread with no event loop
+        2. Calling run_in_background and waiting for heartbeats to arrive
+
+        Assumptions:
+        - The background thread uses its own session (the client's belongs to a loop
+          that has ended)
+        """
+        scheduler = api.client.heartbeats
+
+        def sync_deploy():
+            scheduler.register(11, ttl=0.2)
+            scheduler.register(12, ttl=0.2)
+            scheduler.run_in_background()
+            scheduler.run_in_background()  # idempotent
+
+        await asyncio.to_thread(sync_deploy)
+        thread = scheduler._thread
+        await asyncio.sleep(0.35)
+        assert api.beats[11] >= 2 and api.beats[12] >= 2
+        assert api.client.sessions_requested == 0
+        scheduler.unregister(11)
+        scheduler.unregister(12)
+        await asyncio.to_thread(thread.join, 2)
+        assert not thread.is_alive()
+
+
+async def test_managed_deployment_start_and_stop_heartbeat(api) -> None:
+    deployment = ManagedDeployment(9, 1, api.client)
+    deployment.start_heartbeat(ttl=0.2)
+    await asyncio.sleep(0.05)
+    assert api.beats[9] == 1
+    deployment.stop_heartbeat()
+    assert 9 not in api.client.heartbeats._due
+
+
+async def test_managed_deployment_starts_heartbeat_without_a_loop(api) -> None:
+    """
+    Verifies start_heartbeat outside any event loop heartbeats from the background
+    thread, and stop() ends that thread.
+
+    This test verifies by:
+    1. Starting a deployment's heartbeat from a thread with no event loop
+    2. Waiting for heartbeats, then stopping the scheduler as client.close() does
+    3. Checking the thread ended and no heartbeat is sent after it
+
+    Assumptions:
+    - A TTL of 0.2s means a heartbeat every ~0.1s while running
+    """
+    deployment = ManagedDeployment(21, 1, api.client)
+    await asyncio.to_thread(deployment.start_heartbeat, 0.2)
+    thread = api.client.heartbeats._thread
+    assert thread is not None
+    await asyncio.sleep(0.25)
+    assert api.beats[21] >= 2
+    await api.client.heartbeats.stop()
+    assert not thread.is_alive()
+    assert not api.client.heartbeats.running
+    sent = api.beats[21]
+    await asyncio.sleep(0.25)
+    assert api.beats[21] == sent
@@ -0,0 +1,150 @@
+"""Tests for LogMatcher and the Backend's handling of matched model log lines."""
+from __future__ import annotations
+
+import asyncio
+import random
+import re
+from unittest.mock import MagicMock
+
+from vastai.serverless.server.lib.data_types import LogAction
+from vastai.serverless.server.lib.logmatch import LogMatcher, _trie_regex
+from vastai.serverless.server.worker import LogActionConfig
+
+VLLM_ACTIONS = LogActionConfig(
+    on_load=["Application startup complete."],
+    on_error=["Traceback (most recent call last):", "CUDA out of memory", "Error"],
+    on_info=[
+        "Error: retrying",
+        re.compile(r"Loading safetensors checkpoint shards:\s+(?P<percent>\d+)%"),
+    ],
+).log_actions
+
+
+def _naive(log_actions, line):
+    """The substring loop the matcher replaces."""
+    return [
+        (action, pattern)
+        for action, pattern in log_actions
+        if isinstance(pattern, str) and pattern in line
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Matching
+# ---------------------------------------------------------------------------
+
+
+class TestLogMatcher:
+    """Verify the compiled matcher finds what the per-pattern substring loop found."""
+
+    def test_substrings_in_configured_order(self) -> None:
+        """
+        Verifies every matching pattern is reported, overlapping ones included, in the
+        order the actions were configured.
+
+        This test verifies by:
+        1. Matching a line containing "Error" and "Error: retrying" (one a prefix of the other)
+        2. Matching lines with one pattern and with none
+
+        Assumptions:
+        - Matches keep the (action, pattern) order of LogActionConfig.log_actions
+        """
+        matcher = LogMatcher(VLLM_ACTIONS)
+        found = matcher.match("worker 3: Error: retrying in 5s")
+        assert [(m.action, m.pattern) for m in found] == [
+            (LogAction.ModelError, "Error"),
+            (LogAction.Info, "Error: retrying"),
+        ]
+        assert [m.text for m in matcher.match("INFO: Application startup complete.")] == [
+            "Application startup complete."
+        ]
+        assert matcher.match("INFO 05-14 metrics.py:351] Avg prompt throughput: 0.0") == []
+
+    def test_regex_captures_named_fields(self) -> None:
+        matcher = LogMatcher(VLLM_ACTIONS)
+        (found,) = matcher.match(
+            "Loading safetensors checkpoint shards:  42% Completed | 17/40 [00:12<00:10]"
+        )
+        assert found.action == LogAction.Info
+        assert found.fields == {"percent": "42"}
+        assert found.text.endswith("42%")
+
+    def test_matches_like_the_substring_loop(self) -> None:
+        """
+        Verifies the matcher agrees with the naive loop on random lines and patterns.
+
+        This test verifies by:
+        1. Drawing patterns that share prefixes and contain regex metacharacters
+        2. Comparing matches on 2,000 random lines built from their pieces
+
+        Assumptions:
+        - Regex patterns aside, the matcher is a drop-in for ``msg in line``
+        """
+        rng = random.Random(7)
+        pieces = ["err", "error", "Error:", "(x)", "a.b", "[rank0]", "load", "loaded", " ", "%"]
+        patterns = {rng.choice(pieces) + rng.choice(pieces) for _ in range(15)} | {"err"}
+        actions = [(rng.choice(list(LogAction)), p) for p in sorted(patterns)]
+        matcher = LogMatcher(actions)
+        for _ in range(2000):
+            line = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 8)))
+            found = [(m.action, m.pattern) for m in matcher.match(line)]
+            assert found == _naive(actions, line), line
+
+    def test_empty_pattern_matches_every_line(self) -> None:
+        matcher = LogMatcher([(LogAction.Info, ""), (LogAction.ModelError, "boom")])
+        assert [m.action for m in matcher.match("anything")] == [LogAction.Info]
+        assert len(matcher.match("boom")) == 2
+
+    def test_no_actions(self) -> None:
+        assert LogMatcher([]).match("anything") == []
+
+    def test_trie_regex_factors_common_prefixes(self) -> None:
+        rx = re.compile(_trie_regex(["load", "loaded", "loading", "lo.d"]))
+        assert [rx.search(w) is not None for w in ("load", "lo.d", "lxad", "lo")] == [
+            True,
+            True,
+            False,
+            False,
+        ]
+
+
+# ---------------------------------------------------------------------------
+# Backend
+# ---------------------------------------------------------------------------
+
+
+class TestBackendLogActions:
+    """Verify the Backend acts on matched lines of the model log."""
+
+    async def test_errors_and_captured_fields(
+        self, serverless_backend_testkit, tmp_path
+    ) -> None:
+        """
+        Verifies regex fields are recorded and an error is reported once per line.
+
+        This test verifies by:
+        1. Tailing a log with a load-progress line and a line matching two error patterns
+        2. Checking log_fields and the backend_errored calls
+
+        Assumptions:
+        - As before, handling of a line stops at its first ModelError action
+        """
+        backend, _ = serverless_backend_testkit.make_backend()
+        backend.log_actions = VLLM_ACTIONS
+        backend.model_log_file = str(tmp_path / "model.log")
+        backend.backend_errored = MagicMock()
+        (tmp_path / "model.log").write_text(
+            "Loading safetensors checkpoint shards: 35% Completed\n"
+            "Error: CUDA out of memory\n"
+        )
+        task = asyncio.create_task(backend._Backend__read_logs())
+        try:
+            for _ in range(300):
+                if backend.backend_errored.called:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        assert backend.log_fields == {"percent": "35"}
+        backend.backend_errored.assert_called_once_with("CUDA out of memory")
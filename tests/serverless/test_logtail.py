@@ -0,0 +1,174 @@
+"""Tests for LogTailer: following the model log across appends, rotation and truncation."""
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+from vastai.serverless.server.lib import logtail
+from vastai.serverless.server.lib.logtail import LogTailer
+
+
+class Tail:
+    """Runs a LogTailer in a task, collecting its lines and batches."""
+
+    def __init__(self, tailer: LogTailer):
+        self.tailer = tailer
+        self.batches: list[list[str]] = []
+        self.task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        async for lines in self.tailer:
+            self.batches.append(lines)
+
+    @property
+    def lines(self) -> list[str]:
+        return [line for batch in self.batches for line in batch]
+
+    async def until(self, count: int, timeout: float = 3.0) -> list[str]:
+        deadline = asyncio.get_running_loop().time() + timeout
+        while len(self.lines) < count:
+            assert asyncio.get_running_loop().time() < deadline, self.lines
+            await asyncio.sleep(0.01)
+        return self.lines
+
+    async def stop(self) -> None:
+        self.task.cancel()
+        await asyncio.gather(self.task, return_exceptions=True)
+
+
+@pytest.fixture(params=["inotify", "polling"])
+async def tail(request, tmp_path, monkeypatch):
+    if request.param == "inotify" and not sys.platform.startswith("linux"):
+        pytest.skip("inotify is Linux only")
+    monkeypatch.setattr(logtail, "LOG_MISSING_INTERVAL", 0.05)
+    path = tmp_path / "model.log"
+    tailer = LogTailer(
+        str(path), poll_interval=0.01, use_inotify=request.param == "inotify"
+    )
+    started = Tail(tailer)
+    started.path = path
+    yield started
+    await started.stop()
+
+
+def _append(path, text: str) -> None:
+    with open(path, "a") as f:
+        f.write(text)
+
+
+# ---------------------------------------------------------------------------
+# Following the file
+# ---------------------------------------------------------------------------
+
+
+class TestLogTailer:
+    """Verify lines are delivered as they're written, with inotify and with polling."""
+
+    async def test_waits_for_the_file_then_follows_it(self, tail) -> None:
+        """
+        Verifies the tailer waits for a missing log, reads it from the start and
+        picks up appended lines.
+
+        This test verifies by:
+        1. Creating the log after the tailer started, with two lines
+        2. Appending a third line later
+
+        Assumptions:
+        - Trailing whitespace is stripped, as the substring matchers expect
+        """
+        await asyncio.sleep(0.05)
+        _append(tail.path, "starting\nloading weights  \n")
+        assert await tail.until(2) == ["starting", "loading weights"]
+        _append(tail.path, "model loaded\n")
+        assert await tail.until(3) == ["starting", "loading weights", "model loaded"]
+
+    async def test_partial_lines_wait_for_their_newline(self, tail) -> None:
+        _append(tail.path, "first\nsec")
+        await tail.until(1)
+        await asyncio.sleep(0.1)
+        assert tail.lines == ["first"]
+        _append(tail.path, "ond\n")
+        assert await tail.until(2) == ["first", "second"]
+
+    async def test_lines_are_batched(self, tail) -> None:
+        """
+        Verifies lines already in the file are handed over in blocks, not one by one.
+
+        This test verifies by:
+        1. Writing 10,000 lines before the tailer opens the file
+        2. Checking they arrive complete and in far fewer batches than lines
+
+        Assumptions:
+        - A batch is every complete line of one read (up to LOG_READ_SIZE bytes)
+        """
+        _append(tail.path, "".join(f"line {i}\n" for i in range(10_000)))
+        lines = await tail.until(10_000)
+        assert lines == [f"line {i}" for i in range(10_000)]
+        assert len(tail.batches) <= 5
+
+    async def test_follows_rotation(self, tail) -> None:
+        """
+        Verifies a rotated log (renamed, then recreated) is followed to the new file,
+        after reading what was left in the old one.
+
+        This test verifies by:
+        1. Writing a line, then another one just before renaming the file away
+        2. Creating a new file at the same path and writing to it
+
+        Assumptions:
+        - The writer reopens the path after rotation, like logrotate's create mode
+        """
+        _append(tail.path, "old 1\n")
+        await tail.until(1)
+        _append(tail.path, "old 2\n")
+        os.rename(tail.path, str(tail.path) + ".1")
+        _append(tail.path, "new 1\n")
+        assert await tail.until(3) == ["old 1", "old 2", "new 1"]
+        _append(tail.path, "new 2\n")
+        assert await tail.until(4) == ["old 1", "old 2", "new 1", "new 2"]
+
+    async def test_follows_truncation(self, tail) -> None:
+        _append(tail.path, "before truncate\n")
+        await tail.until(1)
+        with open(tail.path, "w") as f:
+            f.write("after\n")
+        assert await tail.until(2) == ["before truncate", "after"]
+
+
+async def test_inotify_tailer_sleeps_while_idle(tmp_path) -> None:
+    """
+    Verifies the inotify tailer doesn't wake up while nothing is written.
+
+    This test verifies by:
+    1. Counting reads of an idle log for 0.3s (polling would do ~30 at 0.01s)
+    2. Writing a line and checking it's read promptly
+
+    Assumptions:
+    - Running on Linux with inotify available
+    """
+    if not sys.platform.startswith("linux"):
+        pytest.skip("inotify is Linux only")
+    path = tmp_path / "model.log"
+    path.write_text("")
+    tailer = LogTailer(str(path), poll_interval=0.01)
+    reads = 0
+    read = tailer._read
+
+    def counting_read():
+        nonlocal reads
+        reads += 1
+        return read()
+
+    tailer._read = counting_read
+    tail = Tail(tailer)
+    try:
+        await asyncio.sleep(0.3)
+        assert tailer.uses_inotify
+        assert reads <= 2
+        _append(path, "model loaded\n")
+        assert await tail.until(1, timeout=1.0) == ["model loaded"]
+    finally:
+        await tail.stop()
@@ -0,0 +1,203 @@
+"""Unit tests for vastai.serverless.server.lib.offload (executor stage and loop lag)."""
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from vastai.serverless.server.lib.offload import (
+    LoopLag,
+    Offloader,
+    payload_nbytes,
+)
+
+
+# ---------------------------------------------------------------------------
+# Offloader
+# ---------------------------------------------------------------------------
+
+
+class TestOffloader:
+    """Verify Offloader runs work inline or in an executor by size."""
+
+    @pytest.mark.asyncio
+    async def test_small_work_runs_inline_and_large_work_in_a_thread(self) -> None:
+        """
+        Verifies the min_bytes threshold picks inline vs thread pool.
+
+        This test verifies by:
+        1. Running a function that reports its thread with nbytes below and above min_bytes
+        2. Asserting the small call ran on the loop's thread and the large one elsewhere
+
+        Assumptions:
+        - executor="thread" uses a ThreadPoolExecutor
+        """
+        offloader = Offloader(executor="thread", min_bytes=1000)
+        try:
+            small = await offloader.run(threading.get_ident, nbytes=999)
+            large = await offloader.run(threading.get_ident, nbytes=1000)
+        finally:
+            offloader.shutdown()
+        assert small == threading.get_ident()
+        assert large != threading.get_ident()
+        assert (offloader.inline, offloader.offloaded) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_executor_none_always_runs_inline(self) -> None:
+        """
+        Verifies executor="none" never leaves the event loop thread.
+
+        This test verifies by:
+        1. Running a huge nbytes call with executor="none"
+        2. Asserting it ran on the current thread
+
+        Assumptions:
+        - "none" is the off switch
+        """
+        offloader = Offloader(executor="none", min_bytes=0)
+        assert await offloader.run(threading.get_ident, nbytes=10**9) == threading.get_ident()
+        assert offloader.offloaded == 0
+
+    def test_unknown_executor_falls_back_to_inline(self) -> None:
+        """
+        Verifies a misspelled OFFLOAD_EXECUTOR runs inline rather than failing startup.
+
+        This test verifies by:
+        1. Setting OFFLOAD_EXECUTOR=threads
+        2. Asserting the Offloader's executor is "none"
+
+        Assumptions:
+        - Configuration comes from the environment by default
+        """
+        with patch.dict("os.environ", {"OFFLOAD_EXECUTOR": "threads"}):
+            assert Offloader().executor == "none"
+
+    @pytest.mark.asyncio
+    async def test_process_pool_runs_picklable_work_and_threads_the_rest(self) -> None:
+        """
+        Verifies executor="process" sends picklable work to processes only.
+
+        This test verifies by:
+        1. Running json.loads through a process-pool Offloader
+        2. Running a closure with thread_only=True
+        3. Asserting the first result is right and the closure ran on a thread
+
+        Assumptions:
+        - thread_only work goes to the thread pool
+        """
+        offloader = Offloader(executor="process", min_bytes=0, max_workers=1)
+        loop_thread = threading.get_ident()
+        try:
+            assert await offloader.run(json.loads, '{"a": [1]}', nbytes=1) == {"a": [1]}
+            ran_on = await offloader.run(
+                lambda: threading.get_ident(), nbytes=1, thread_only=True
+            )
+        finally:
+            offloader.shutdown()
+        assert ran_on != loop_thread
+
+    @pytest.mark.asyncio
+    async def test_verify_offloads_only_when_enabled(self) -> None:
+        """
+        Verifies signature checks stay inline unless offload_verify is set.
+
+        This test verifies by:
+        1. Running verify() with offload_verify False and True
+        2. Comparing the thread each ran on
+
+        Assumptions:
+        - Signature checks have no size to compare against min_bytes
+        """
+        inline = Offloader(executor="thread", min_bytes=1, offload_verify=False)
+        offloaded = Offloader(executor="thread", min_bytes=1, offload_verify=True)
+        try:
+            assert await inline.verify(threading.get_ident) == threading.get_ident()
+            assert await offloaded.verify(threading.get_ident) != threading.get_ident()
+        finally:
+            offloaded.shutdown()
+
+
+class TestPayloadNbytes:
+    """Verify payload_nbytes sizes decoded trees and stops early."""
+
+    def test_counts_strings_and_buffers(self) -> None:
+        """
+        Verifies string and buffer lengths dominate the estimate.
+
+        This test verifies by:
+        1. Sizing a tree holding a 1000-char string and a 500-byte memoryview
+        2. Asserting the total is at least 1500 and not much more
+
+        Assumptions:
+        - Each node adds a few bytes of overhead
+        """
+        tree = {"a": ["x" * 1000, {"b": memoryview(bytes(500))}], "n": 1}
+        assert 1500 <= payload_nbytes(tree, 10**9) < 1600
+
+    def test_stops_at_limit(self) -> None:
+        """
+        Verifies counting stops once the limit is reached.
+
+        This test verifies by:
+        1. Sizing a list of 1000 1KiB strings with limit 4KiB
+        2. Asserting the result is just past the limit, not the full size
+
+        Assumptions:
+        - The caller only compares the result against the limit
+        """
+        total = payload_nbytes(["x" * 1024] * 1000, 4096)
+        assert 4096 <= total < 8 * 1024 + 8000
+
+
+# ---------------------------------------------------------------------------
+# LoopLag
+# ---------------------------------------------------------------------------
+
+
+class TestLoopLag:
+    """Verify LoopLag records how late the loop runs its timer."""
+
+    def test_record_tracks_last_peak_and_mean(self) -> None:
+        """
+        Verifies record() updates last, peak and the weighted mean.
+
+        This test verifies by:
+        1. Recording 0.0, 0.05 and 0.01
+        2. Asserting last, peak and a mean between the samples, and reset_peak()
+
+        Assumptions:
+        - Negative lag (timer resolution) counts as 0
+        """
+        lag = LoopLag(warn_after=1.0)
+        for sample in (-0.001, 0.05, 0.01):
+            lag.record(sample)
+        assert lag.last == 0.01
+        assert lag.peak == 0.05
+        assert 0.0 < lag.mean < 0.05
+        assert lag.reset_peak() == 0.05 and lag.peak == 0.0
+
+    @pytest.mark.asyncio
+    async def test_monitor_sees_a_blocked_loop(self) -> None:
+        """
+        Verifies the monitor task measures a synchronous block of the loop.
+
+        This test verifies by:
+        1. Starting monitor() with a 10ms interval
+        2. Blocking the loop with time.sleep(0.1)
+        3. Asserting the recorded peak lag is most of that block
+
+        Assumptions:
+        - The block happens while the monitor is sleeping
+        """
+        lag = LoopLag(interval=0.01, warn_after=10.0)
+        task = asyncio.create_task(lag.monitor())
+        await asyncio.sleep(0.02)
+        time.sleep(0.1)
+        await asyncio.sleep(0.03)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        assert lag.peak >= 0.07
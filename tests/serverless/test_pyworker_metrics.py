@@ -129,6 +129,32 @@ class TestMetricsRequestLifecycle:
         assert m.model_metrics.requests_deleting == [req]
         assert m.last_request_served == 12345.0
 
+    def test_request_end_keeps_a_later_request_with_the_same_reqnum(
+        self, make_pyworker_metrics, make_pyworker_request_metrics
+    ) -> None:
+        """
+        Verifies ending a request doesn't drop a newer one sharing its reqnum.
+
+        This test verifies by:
+        1. Starting two requests with the same reqnum, the second before the first ends
+        2. Ending the first
+        3. Asserting the second is still working and counted in the workload
+
+        Assumptions:
+        - Requests on one client route lease share the route's reqnum
+        """
+        m = make_pyworker_metrics()
+        first = make_pyworker_request_metrics(request_idx=2, reqnum=3, workload=1.0, status="")
+        second = make_pyworker_request_metrics(request_idx=0, reqnum=3, workload=4.0, status="")
+        m._request_start(first)
+        m._request_start(second)
+        m._request_end(first)
+        assert m.model_metrics.requests_working[3] is second
+        assert m.model_metrics.requests_working.workload == 4.0
+        assert m.model_metrics.requests_deleting == [first]
+        m._request_end(second)
+        assert 3 not in m.model_metrics.requests_working
+
     def test_request_success_increments_served_and_marks_status(
         self, make_pyworker_metrics, make_pyworker_request_metrics
     ) -> None:
@@ -298,6 +324,62 @@ class TestMetricsRequestLifecycle:
         assert req.status == "Rejected"
 
 
+    def test_request_lifecycle_keeps_load_sums_in_step(
+        self, make_pyworker_metrics, make_pyworker_request_metrics
+    ) -> None:
+        """
+        Verifies cur_load / wait_time follow _request_start and _request_end.
+
+        This test verifies by:
+        1. Starting a plain request and a session-opening request
+        2. Asserting cur_load includes both and wait_time only the plain one
+        3. Ending both and asserting the sums return to zero
+
+        Assumptions:
+        - is_session requests count towards cur_load but not wait_time
+        """
+        m = make_pyworker_metrics()
+        m.model_metrics.max_throughput = 2.0
+        plain = make_pyworker_request_metrics(request_idx=1, reqnum=1, workload=4.0, status="")
+        opener = make_pyworker_request_metrics(
+            request_idx=2, reqnum=2, workload=6.0, status="", is_session=True
+        )
+        m._request_start(plain)
+        m._request_start(opener)
+        assert m.model_metrics.cur_load == 10.0
+        assert m.model_metrics.wait_time == 2.0
+        m._request_end(plain)
+        assert m.model_metrics.cur_load == 6.0
+        assert m.model_metrics.wait_time == 0.0
+        m._request_end(opener)
+        assert m.model_metrics.cur_load == 0.0
+
+    def test_debug_metrics_runs_consistency_check(
+        self, make_pyworker_metrics, make_pyworker_request_metrics
+    ) -> None:
+        """
+        Verifies the O(n) consistency check runs only when debug_metrics is on.
+
+        This test verifies by:
+        1. Running a request lifecycle with debug_metrics off and on
+        2. Asserting check_consistency is called only in the second case
+
+        Assumptions:
+        - debug_metrics defaults from DEBUG_METRICS env (unset in tests)
+        """
+        from vastai.serverless.server.lib.data_types import WorkingRequests
+
+        for debug, calls in ((False, 0), (True, 2)):
+            m = make_pyworker_metrics(debug_metrics=debug)
+            req = make_pyworker_request_metrics(request_idx=1, reqnum=1, workload=1.0, status="")
+            with patch.object(
+                WorkingRequests, "check_consistency", autospec=True, return_value=True
+            ) as mock_check:
+                m._request_start(req)
+                m._request_end(req)
+            assert mock_check.call_count == calls
+
+
 class TestMetricsRequestIdFormatting:
     """Verify _request_id string formatting for logs."""
 
@@ -468,6 +550,37 @@ class TestSendMetricsAndReset:
         assert body["url"] == "http://worker.test:9000"
         assert m.update_pending is False
         assert m.model_metrics.workload_served == 0.0
+        assert body["loop_lag"] == 0.0
+
+    async def test_send_metrics_reports_and_resets_loop_lag_peak(
+        self, make_pyworker_metrics, make_metrics_aiohttp_post, metrics_worker_status_context
+    ) -> None:
+        """
+        Verifies the loop-lag peak goes out with the worker status and starts over after.
+
+        This test verifies by:
+        1. Attaching a LoopLag with a recorded 50ms stall to Metrics
+        2. Sending two updates
+        3. Asserting the first reports the peak and the second reports 0
+
+        Assumptions:
+        - The Backend attaches its LoopLag only when LOOP_LAG_MONITOR is set
+        """
+        from vastai.serverless.server.lib.offload import LoopLag
+
+        m = make_pyworker_metrics()
+        m.loop_lag = LoopLag(warn_after=10.0)
+        m.loop_lag.record(0.05)
+        mock_session, _ = make_metrics_aiohttp_post.session_ok()
+
+        with metrics_worker_status_context(m, mock_session, disk_gb=1.0):
+            await m._Metrics__send_metrics_and_reset()
+            await m._Metrics__send_metrics_and_reset()
+
+        first, second = (call[1]["json"] for call in mock_session.post.call_args_list)
+        assert first["loop_lag"] == 0.05
+        assert second["loop_lag"] == 0.0
+        assert m.loop_lag.peak == 0.0
 
     async def test_send_metrics_does_not_reset_when_all_posts_fail(
         self, make_pyworker_metrics, make_metrics_aiohttp_post, metrics_worker_status_context
@@ -886,6 +999,237 @@ class TestSendDeleteRequestsAndReset:
         assert m.model_metrics.requests_deleting == [req]
 
 
+    async def test_delete_requests_posts_in_batches_and_counts_sent(
+        self, make_pyworker_metrics, make_metrics_aiohttp_post, metrics_delete_send_context, make_pyworker_request_metrics
+    ) -> None:
+        """
+        Verifies a backlog larger than a batch is split across POSTs of bounded size.
+
+        This test verifies by:
+        1. Patching DELETE_REQUESTS_BATCH_SIZE to 2 and queuing five requests
+        2. Asserting two full batches are sent and the partial one waits for the next tick
+
+        Assumptions:
+        - A partial batch is left for the next timer tick
+        """
+        m = make_pyworker_metrics()
+        m.model_metrics.requests_deleting = [
+            make_pyworker_request_metrics(request_idx=i, reqnum=i, status="Success")
+            for i in range(5)
+        ]
+        mock_session, _ = make_metrics_aiohttp_post.session_ok()
+
+        with patch("vastai.serverless.server.lib.metrics.DELETE_REQUESTS_BATCH_SIZE", 2):
+            with metrics_delete_send_context(m, mock_session):
+                await m._Metrics__send_delete_requests_and_reset()
+
+        sizes = [len(c[1]["json"]["requests"]) for c in mock_session.post.call_args_list]
+        assert sizes == [2, 2]
+        assert [r.request_idx for r in m.model_metrics.requests_deleting] == [4]
+        assert m.delete_stats.sent == 4
+
+    async def test_delete_requests_counts_retried_records(
+        self, make_pyworker_metrics, make_metrics_aiohttp_post, metrics_delete_send_context, make_pyworker_request_metrics
+    ) -> None:
+        """
+        Verifies retried POSTs are counted per record and backoff grows.
+
+        This test verifies by:
+        1. Failing every attempt for a two-record batch
+        2. Asserting retried == 4 (two retries of two records) and doubling sleeps
+
+        Assumptions:
+        - No retry is scheduled after the final attempt
+        """
+        m = make_pyworker_metrics()
+        m.model_metrics.requests_deleting = [
+            make_pyworker_request_metrics(request_idx=i, reqnum=i) for i in range(2)
+        ]
+        ctx_fail = make_metrics_aiohttp_post.context_enter_raises(ValueError("down"))
+        mock_session = MagicMock()
+        mock_session.post = MagicMock(return_value=ctx_fail)
+
+        with patch.object(m, "http", new_callable=AsyncMock, return_value=mock_session):
+            with patch(
+                "vastai.serverless.server.lib.metrics.asyncio.sleep", new_callable=AsyncMock
+            ) as mock_sleep:
+                await m._Metrics__send_delete_requests_and_reset()
+
+        assert m.delete_stats.retried == 4
+        assert m.delete_stats.sent == 0
+        assert [c[0][0] for c in mock_sleep.call_args_list] == [0.25, 0.5]
+
+    async def test_delete_requests_gzips_large_bodies(
+        self, make_pyworker_metrics, make_metrics_aiohttp_post, metrics_delete_send_context, make_pyworker_request_metrics
+    ) -> None:
+        """
+        Verifies bodies over the gzip threshold are sent compressed.
+
+        This test verifies by:
+        1. Lowering DELETE_REQUESTS_GZIP_MIN_BYTES to 1
+        2. Asserting the POST carries gzip data and Content-Encoding header
+
+        Assumptions:
+        - Decompressed body is the same JSON document as the json= form
+        """
+        import gzip
+        import json
+
+        m = make_pyworker_metrics()
+        m.delete_requests_gzip = True
+        m.model_metrics.requests_deleting = [make_pyworker_request_metrics(request_idx=3)]
+        mock_session, _ = make_metrics_aiohttp_post.session_ok()
+
+        with patch("vastai.serverless.server.lib.metrics.DELETE_REQUESTS_GZIP_MIN_BYTES", 1):
+            with metrics_delete_send_context(m, mock_session):
+                await m._Metrics__send_delete_requests_and_reset()
+
+        kwargs = mock_session.post.call_args[1]
+        assert kwargs["headers"]["Content-Encoding"] == "gzip"
+        body = json.loads(gzip.decompress(kwargs["data"]))
+        assert body["requests"][0]["request_idx"] == 3
+        assert m.model_metrics.requests_deleting == []
+
+    async def test_delete_requests_falls_back_to_json_when_gzip_rejected(
+        self, make_pyworker_metrics, make_metrics_aiohttp_post, metrics_delete_send_context, make_pyworker_request_metrics
+    ) -> None:
+        """
+        Verifies an error for a gzipped body resends plain JSON, then disables gzip.
+
+        This test verifies by:
+        1. First POST failing with 422 (an autoscaler that can't parse the body), second
+           succeeding
+        2. Asserting the second POST used json= and gzip stays disabled
+
+        Assumptions:
+        - The fallback resend does not consume a retry attempt or count as retried
+        """
+        m = make_pyworker_metrics()
+        m.delete_requests_gzip = True
+        m.model_metrics.requests_deleting = [make_pyworker_request_metrics(request_idx=4)]
+        aio = make_metrics_aiohttp_post
+        ctx_ok, _ = aio.context_ok()
+        mock_session = MagicMock()
+        mock_session.post = MagicMock(
+            side_effect=[aio.context_client_error(status=422), ctx_ok]
+        )
+
+        with patch("vastai.serverless.server.lib.metrics.DELETE_REQUESTS_GZIP_MIN_BYTES", 1):
+            with metrics_delete_send_context(m, mock_session):
+                await m._Metrics__send_delete_requests_and_reset()
+
+        assert "data" in mock_session.post.call_args_list[0][1]
+        assert "json" in mock_session.post.call_args_list[1][1]
+        assert m.delete_requests_gzip is False
+        assert m.delete_stats.retried == 0
+        assert m.model_metrics.requests_deleting == []
+
+    async def test_delete_requests_gzip_is_opt_in(
+        self, make_pyworker_metrics, make_metrics_aiohttp_post, metrics_delete_send_context, make_pyworker_request_metrics
+    ) -> None:
+        m = make_pyworker_metrics()
+        assert m.delete_requests_gzip is False
+        m.model_metrics.requests_deleting = [make_pyworker_request_metrics(request_idx=6)]
+        mock_session, _ = make_metrics_aiohttp_post.session_ok()
+
+        with patch("vastai.serverless.server.lib.metrics.DELETE_REQUESTS_GZIP_MIN_BYTES", 1):
+            with metrics_delete_send_context(m, mock_session):
+                await m._Metrics__send_delete_requests_and_reset()
+
+        assert "json" in mock_session.post.call_args[1]
+
+    async def test_delete_requests_gzip_stays_on_when_plain_json_fails_too(
+        self,
+        make_pyworker_metrics,
+        make_metrics_aiohttp_post,
+        metrics_delete_send_context,
+        make_pyworker_request_metrics,
+    ) -> None:
+        """
+        Verifies gzip is only turned off once a plain JSON resend succeeds.
+
+        This test verifies by:
+        1. Failing every POST with a 500
+        2. Asserting the batch went gzipped once, then as JSON for each attempt,
+           and gzip is still enabled afterwards
+
+        Assumptions:
+        - An error for both encodings says nothing about gzip support
+        """
+        m = make_pyworker_metrics()
+        m.delete_requests_gzip = True
+        m.model_metrics.requests_deleting = [make_pyworker_request_metrics(request_idx=5)]
+        aio = make_metrics_aiohttp_post
+        mock_session = MagicMock()
+        mock_session.post = MagicMock(
+            side_effect=[aio.context_client_error(status=500) for _ in range(4)]
+        )
+
+        with patch("vastai.serverless.server.lib.metrics.DELETE_REQUESTS_GZIP_MIN_BYTES", 1), patch(
+            "vastai.serverless.server.lib.metrics.asyncio.sleep", new=AsyncMock()
+        ):
+            with metrics_delete_send_context(m, mock_session):
+                await m._Metrics__send_delete_requests_and_reset()
+
+        sent = [call[1] for call in mock_session.post.call_args_list]
+        assert ["data" in kwargs for kwargs in sent] == [True, False, False, False]
+        assert m.delete_requests_gzip is True
+
+
+class TestDeleteRequestsBuffering:
+    """Verify requests_deleting backpressure and size-triggered flushes."""
+
+    def test_full_buffer_drops_and_counts(
+        self, make_pyworker_metrics, make_pyworker_request_metrics
+    ) -> None:
+        """
+        Verifies ending requests past the buffer bound drops the oldest and counts them.
+
+        This test verifies by:
+        1. Shrinking requests_deleting to maxlen 2 and ending three requests
+        2. Asserting dropped == 1 and the two newest remain
+
+        Assumptions:
+        - No event loop is running, so no flush task is started
+        """
+        from vastai.serverless.server.lib.data_types import CompletedRequests
+
+        m = make_pyworker_metrics()
+        m.model_metrics.requests_deleting = CompletedRequests(maxlen=2)
+        for i in range(3):
+            req = make_pyworker_request_metrics(request_idx=i, reqnum=i)
+            m._request_start(req)
+            m._request_end(req)
+        assert m.delete_stats.dropped == 1
+        assert [r.request_idx for r in m.model_metrics.requests_deleting] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_before_next_tick(
+        self, make_pyworker_metrics, make_pyworker_request_metrics
+    ) -> None:
+        """
+        Verifies reaching DELETE_REQUESTS_BATCH_SIZE starts a send without waiting for the loop.
+
+        This test verifies by:
+        1. Patching the batch size to 2 and the private send method
+        2. Ending two requests inside a running loop
+        3. Asserting the send was scheduled once
+
+        Assumptions:
+        - A flush task is only started when none is running
+        """
+        m = make_pyworker_metrics()
+        mock_send = AsyncMock()
+        with patch("vastai.serverless.server.lib.metrics.DELETE_REQUESTS_BATCH_SIZE", 2):
+            with patch.object(m, "_Metrics__send_delete_requests_and_reset", mock_send):
+                for i in range(3):
+                    req = make_pyworker_request_metrics(request_idx=i, reqnum=i)
+                    m._request_start(req)
+                    m._request_end(req)
+                await m._delete_flush_task
+        mock_send.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 class TestSendDeleteRequestsLoop:
     """Verify _send_delete_requests_loop scheduling."""
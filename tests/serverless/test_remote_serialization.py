@@ -0,0 +1,162 @@
+"""Tests for vastai.serverless.remote.serialization over the JSON and binary wire formats."""
+
+import json
+
+import pytest
+
+from vastai.serverless import wire
+from vastai.serverless.remote.serialization import (
+    ArrayInfo,
+    BufferInfo,
+    describe,
+    deserialize,
+    deserialize_unwrap_error,
+    serialize,
+    serialize_ok,
+)
+
+
+class Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+ROOT = __name__
+
+
+def _json_round_trip(obj):
+    return deserialize(json.loads(json.dumps(serialize(obj, ROOT))), ROOT, globals())
+
+
+def _wire_round_trip(obj):
+    encoded = wire.encode(serialize(obj, ROOT, binary=True))
+    return deserialize(wire.decode(encoded), ROOT, globals())
+
+
+@pytest.mark.parametrize("round_trip", [_json_round_trip, _wire_round_trip], ids=["json", "wire"])
+def test_round_trip_preserves_values_and_types(round_trip) -> None:
+    value = {
+        "n": [1, 2.5, None, "s"],
+        "t": (b"\x00\x01", bytearray(b"ba")),
+        b"key": Point(1, b"raw"),
+    }
+    out = round_trip(value)
+    assert out["n"] == [1, 2.5, None, "s"]
+    assert out["t"] == (b"\x00\x01", bytearray(b"ba"))
+    assert type(out["t"][0]) is bytes and type(out["t"][1]) is bytearray
+    assert isinstance(out[b"key"], Point)
+    assert (out[b"key"].x, out[b"key"].y) == (1, b"raw")
+
+
+@pytest.mark.parametrize("round_trip", [_json_round_trip, _wire_round_trip], ids=["json", "wire"])
+def test_memoryview_round_trips_as_memoryview(round_trip) -> None:
+    out = round_trip(memoryview(b"view"))
+    assert isinstance(out, memoryview)
+    assert bytes(out) == b"view"
+
+
+def test_binary_tree_falls_back_to_the_legacy_json_format() -> None:
+    """A binary=True tree dumped with wire.json_default is exactly the binary=False JSON."""
+    value = [b"\xff" * 5, {"k": bytearray(b"v")}]
+    assert json.loads(wire.dumps_json(serialize(value, ROOT, binary=True))) == serialize(
+        value, ROOT
+    )
+
+
+def test_wire_bytes_are_not_base64_encoded() -> None:
+    blob = bytes(range(256)) * 64
+    encoded = wire.encode(serialize_ok(blob, ROOT, binary=True))
+    assert len(encoded) < len(blob) + 200
+    assert deserialize_unwrap_error(wire.decode(encoded), ROOT, globals()) == blob
+
+
+def test_unsupported_type_still_raises() -> None:
+    with pytest.raises(TypeError):
+        serialize({1, 2}, ROOT, binary=True)
+
+
+def test_buffer_protocol_objects_round_trip_as_memoryviews() -> None:
+    import array
+
+    values = array.array("d", [1.5, -2.0, 3.25])
+    for round_trip in (_json_round_trip, _wire_round_trip):
+        out = round_trip({"values": values})["values"]
+        assert isinstance(out, memoryview)
+        assert out.format == "d"
+        assert out.tolist() == values.tolist()
+
+
+@pytest.mark.parametrize("binary", [False, True], ids=["json", "wire"])
+def test_describe_gives_sizes_without_decoding(binary) -> None:
+    value = {"blobs": [b"ab", bytearray(b"abc"), memoryview(b"abcd")], "p": Point(1, b"x" * 9)}
+    tree = serialize(value, ROOT, binary=binary)
+    if binary:
+        tree = wire.decode(wire.encode(tree))
+    out = describe(tree, ROOT, globals())
+    assert out["blobs"] == [
+        BufferInfo("bytes", 2),
+        BufferInfo("bytearray", 3),
+        BufferInfo("memoryview", 4),
+    ]
+    assert [len(b) for b in out["blobs"]] == [2, 3, 4]
+    assert out["p"].x == 1 and len(out["p"].y) == 9
+
+
+class TestNumpy:
+    """NumPy arrays travel as raw data plus dtype/shape/strides."""
+
+    @pytest.fixture(autouse=True)
+    def np(self):
+        return pytest.importorskip("numpy")
+
+    @pytest.mark.parametrize("round_trip", [_json_round_trip, _wire_round_trip], ids=["json", "wire"])
+    def test_arrays_round_trip_with_dtype_shape_and_layout(self, np, round_trip) -> None:
+        base = np.arange(24, dtype="<f4").reshape(4, 6)
+        arrays = [
+            base,
+            np.asfortranarray(base),
+            base[:, ::2],
+            base[::-1],
+            np.zeros((0, 3), dtype=np.int64),
+            np.array(7, dtype=np.uint16),
+            np.array([(1, 2.5)], dtype=[("a", "<i4"), ("b", ">f8")]),
+            np.array(["2024-01-01"], dtype="datetime64[D]"),
+        ]
+        for arr in arrays:
+            out = round_trip(arr)
+            assert type(out) is np.ndarray
+            assert out.dtype == arr.dtype and out.shape == arr.shape
+            assert np.array_equal(out, arr)
+        assert round_trip(np.asfortranarray(base)).flags.f_contiguous
+
+    @pytest.mark.parametrize("round_trip", [_json_round_trip, _wire_round_trip], ids=["json", "wire"])
+    def test_arrays_inside_containers_and_objects(self, np, round_trip) -> None:
+        image = np.ones((2, 3, 3), dtype=np.uint8)
+        out = round_trip({"batch": [image, (image,)], b"p": Point(np.float32(0.5), image)})
+        assert np.array_equal(out["batch"][0], image)
+        assert np.array_equal(out["batch"][1][0], image)
+        assert type(out[b"p"].x) is np.float32 and out[b"p"].x == np.float32(0.5)
+        assert np.array_equal(out[b"p"].y, image)
+
+    def test_wire_decode_is_zero_copy(self, np) -> None:
+        arr = np.arange(1000, dtype=np.float64)
+        data = wire.encode(serialize(arr, ROOT, binary=True))
+        out = deserialize(wire.decode(data), ROOT, globals())
+        assert np.shares_memory(out, np.frombuffer(data, dtype=np.uint8))
+        assert not out.flags.writeable
+        assert out.flags.aligned
+
+    def test_wire_carries_arrays_without_base64(self, np) -> None:
+        arr = np.zeros(2**16, dtype=np.float32)
+        assert len(wire.encode(serialize(arr, ROOT, binary=True))) < arr.nbytes + 400
+
+    def test_object_arrays_are_rejected(self, np) -> None:
+        with pytest.raises(TypeError):
+            serialize(np.array([object()]), ROOT)
+
+    def test_describe_gives_dtype_and_shape(self, np) -> None:
+        arr = np.zeros((4, 3), dtype=np.float32)
+        info = describe(serialize(arr, ROOT), ROOT, globals())
+        assert info == ArrayInfo("<f4", (4, 3), 48)
+        assert (len(info), info.ndim, info.size) == (4, 2, 12)
@@ -1,7 +1,11 @@
 """Tests for the per-remote-function ``workload_calculator`` argument."""
 
+import asyncio
+
+import pytest
+
 from vastai.serverless.remote.serve import Deployment
-from vastai.serverless.remote.serialization import serialize
+from vastai.serverless.remote.serialization import BufferInfo, serialize
 from vastai.serverless.server.worker import (
     WorkerConfig,
     HandlerConfig,
@@ -136,3 +140,84 @@ def test_into_worker_wires_workload_calculator(monkeypatch) -> None:
     assert handler_config.workload_calculator(
         _client_payload(d, a=[1, 2, 3], b=[4, 5])
     ) == 6.0
+
+
+def test_payload_is_decoded_once_for_calculator_and_function(monkeypatch) -> None:
+    d = Deployment(name="wl-decode-once")
+    seen = {}
+
+    async def mul(a, b):
+        seen["a"] = a
+        return len(a) * len(b)
+
+    def calc(a, b):
+        seen["calc_a"] = a
+        return float(len(a) * len(b))
+
+    d.remote(workload_calculator=calc)(mul)
+    entry = d.remote_funcs[next(iter(d.remote_funcs))]
+
+    import vastai.serverless.remote.serve as serve
+
+    calls = []
+    real_deserialize = serve.deserialize
+    monkeypatch.setattr(
+        serve,
+        "deserialize",
+        lambda *a: calls.append(a) or real_deserialize(*a),
+    )
+
+    calculator = d._wrap_workload_calculator(d.root_module, calc, entry.globals)
+    wrapped = d._wrap_remote_func(d.root_module, mul, entry.globals)
+    payload = _client_payload(d, a=[1, 2, 3], b=[4, 5])
+
+    assert calculator(payload) == 6.0
+    result = asyncio.run(wrapped(**payload))
+
+    assert result == {"ok": 6}
+    assert len(calls) == 2  # one per kwarg, not two
+    assert seen["a"] is seen["calc_a"]
+
+
+def test_function_still_decodes_without_calculator() -> None:
+    d = Deployment(name="wl-no-calc")
+
+    async def mul(a, b):
+        return len(a) * len(b)
+
+    d.remote()(mul)
+    entry = d.remote_funcs[next(iter(d.remote_funcs))]
+    wrapped = d._wrap_remote_func(d.root_module, mul, entry.globals)
+    assert asyncio.run(wrapped(**_client_payload(d, a=[1, 2], b=[3]))) == {"ok": 2}
+
+
+def test_workload_from_metadata_sees_sizes_not_data(monkeypatch) -> None:
+    d = Deployment(name="wl-metadata")
+    seen = {}
+
+    def calc(image, tiles, prompt):
+        seen.update(image=image, tiles=tiles, prompt=prompt)
+        return float(len(image) + sum(len(t) for t in tiles))
+
+    @d.remote(workload_calculator=calc, workload_from_metadata=True)
+    async def render(image, tiles, prompt):
+        return prompt
+
+    import vastai.serverless.remote.serve as serve
+
+    monkeypatch.setattr(
+        serve, "deserialize", lambda *a: pytest.fail("calculator decoded the payload")
+    )
+
+    entry = d.remote_funcs[next(iter(d.remote_funcs))]
+    calculator = d._wrap_workload_calculator(
+        d.root_module, calc, entry.globals, from_metadata=entry.workload_from_metadata
+    )
+    payload = _client_payload(
+        d, image=bytes(1000), tiles=[bytearray(10), bytes(7)], prompt="a cat"
+    )
+
+    assert calculator(payload) == 1017.0
+    assert isinstance(seen["image"], BufferInfo)
+    assert seen["image"] == BufferInfo("bytes", 1000)
+    assert seen["prompt"] == "a cat"
@@ -0,0 +1,145 @@
+"""Unit tests for the pipelined cold start in vastai.serverless.remote.serve_deployment."""
+from __future__ import annotations
+
+import io
+import json
+import tarfile
+
+import pytest
+
+from vastai.serverless.archive import GzipCodec
+from vastai.serverless.remote import serve_deployment
+from vastai.serverless.remote.serve_deployment import (
+    PhaseTimings,
+    extract_tarball,
+    prepare_deployment,
+)
+
+CONFIG = {
+    "name": "demo",
+    "apt_gets": ["curl"],
+    "pip_installs": ["./deployment/wheel.whl"],
+    "envs": [["MODE", "test"]],
+    "runs": [],
+}
+
+
+def _tarball(members) -> bytes:
+    raw = io.BytesIO()
+    writer = GzipCodec().writer(raw)
+    with tarfile.open(fileobj=writer, mode="w|") as tf:
+        for name, data in members:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tf.addfile(info, io.BytesIO(data))
+    writer.close()
+    return raw.getvalue()
+
+
+@pytest.fixture
+def installs(monkeypatch, tmp_path):
+    """Record what was on disk when each setup step ran, instead of running it."""
+    monkeypatch.chdir(tmp_path)
+    seen = {}
+
+    def record(step):
+        def run(arg):
+            seen[step] = (arg, (tmp_path / "deployment" / "late.bin").exists())
+
+        return run
+
+    monkeypatch.setattr(serve_deployment, "export_envs", record("envs"))
+    monkeypatch.setattr(serve_deployment, "run_apt_gets", record("apt"))
+    monkeypatch.setattr(serve_deployment, "run_pip_installs", record("pip"))
+    monkeypatch.setattr(serve_deployment, "run_scripts", record("scripts"))
+    return seen
+
+
+# ---------------------------------------------------------------------------
+# prepare_deployment
+# ---------------------------------------------------------------------------
+
+
+class TestPrepareDeployment:
+    """Verify config.json is applied while the rest of the tarball is still extracting."""
+
+    def test_apt_starts_before_extraction_finishes(self, installs) -> None:
+        """
+        Verifies env vars and apt packages don't wait for the whole download.
+
+        This test verifies by:
+        1. Extracting a tarball with config.json first and a late file last
+        2. Checking envs/apt ran before the late file existed, and pip after
+
+        Assumptions:
+        - Apt runs on a background thread, but the late member can't be extracted
+          before on_extracted(config.json) has returned and submitted it
+        """
+        data = _tarball(
+            [("./config.json", json.dumps(CONFIG).encode()), ("./deployment/late.bin", b"x")]
+        )
+        timings = PhaseTimings()
+        config = prepare_deployment(
+            lambda on_extracted: extract_tarball(io.BytesIO(data), on_extracted), timings
+        )
+        assert config.name == "demo"
+        assert installs["envs"] == ([["MODE", "test"]], False)
+        assert installs["apt"][0] == ["curl"]
+        assert installs["pip"] == (["./deployment/wheel.whl"], True)
+        assert "scripts" not in installs
+        assert {"download+extract", "apt", "apt wait", "pip"} <= set(timings.phases)
+
+    def test_config_json_anywhere_in_the_tarball(self, installs) -> None:
+        """
+        Verifies tarballs without config.json first still get fully set up.
+
+        This test verifies by:
+        1. Extracting a tarball with config.json as the last member
+
+        Assumptions:
+        - Setup then simply runs after extraction
+        """
+        data = _tarball(
+            [("./deployment/late.bin", b"x"), ("./config.json", json.dumps(CONFIG).encode())]
+        )
+        config = prepare_deployment(
+            lambda on_extracted: extract_tarball(io.BytesIO(data), on_extracted),
+            PhaseTimings(),
+        )
+        assert config.name == "demo"
+        assert installs["apt"] == (["curl"], True)
+
+    def test_apt_failure_is_raised(self, installs, monkeypatch) -> None:
+        """
+        Verifies an apt failure on the background thread fails the cold start.
+
+        This test verifies by:
+        1. Making run_apt_gets raise and running prepare_deployment
+
+        Assumptions:
+        - The error surfaces once extraction is done, before pip runs
+        """
+
+        def fail(packages):
+            raise RuntimeError("apt failed")
+
+        monkeypatch.setattr(serve_deployment, "run_apt_gets", fail)
+        data = _tarball([("./config.json", json.dumps(CONFIG).encode())])
+        with pytest.raises(RuntimeError, match="apt failed"):
+            prepare_deployment(
+                lambda on_extracted: extract_tarball(io.BytesIO(data), on_extracted),
+                PhaseTimings(),
+            )
+        assert "pip" not in installs
+
+
+def test_phase_timings_report() -> None:
+    timings = PhaseTimings()
+    with timings.phase("download+extract"):
+        pass
+    with pytest.raises(ValueError):
+        with timings.phase("pip"):
+            raise ValueError
+    report = timings.report()
+    assert report.startswith("Cold start took ")
+    assert "download+extract 0.00s" in report and "pip " in report
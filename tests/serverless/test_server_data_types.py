@@ -11,6 +11,7 @@ from vastai.serverless.server.lib.data_types import (
     ApiPayload,
     AuthData,
     BenchmarkResult,
+    CompletedRequests,
     EndpointHandler,
     JsonDataException,
     LogAction,
@@ -19,6 +20,7 @@ from vastai.serverless.server.lib.data_types import (
     Session,
     SystemMetrics,
     WorkerStatusData,
+    WorkingRequests,
 )
 
 
@@ -830,6 +832,195 @@ class TestModelMetrics:
         assert mm.error_msg == "boom"
 
 
+class TestWorkingRequests:
+    """Incrementally maintained workload sums behind wait_time / cur_load."""
+
+    @staticmethod
+    def _request(reqnum: int, workload: float, is_session: bool = False) -> RequestMetrics:
+        return RequestMetrics(
+            request_idx=reqnum,
+            reqnum=reqnum,
+            workload=workload,
+            status="Started",
+            is_session=is_session,
+        )
+
+    def test_sums_follow_inserts_replacements_and_removals(self) -> None:
+        """
+        Verifies workload and session_workload track every dict mutation.
+
+        This test verifies by:
+        1. Inserting plain and session requests, replacing one key, then pop/del/popitem
+        2. Asserting both sums after each step match a from-scratch recomputation
+
+        Assumptions:
+        - Replacing a key subtracts the old request before adding the new one
+        """
+        wr = WorkingRequests()
+        wr[1] = self._request(1, 2.0)
+        wr[2] = self._request(2, 5.0, is_session=True)
+        wr[3] = self._request(3, 1.5)
+        assert (wr.workload, wr.session_workload) == (8.5, 5.0)
+        wr[3] = self._request(3, 0.5)
+        assert (wr.workload, wr.session_workload) == (7.5, 5.0)
+        assert wr.pop(2).workload == 5.0
+        assert wr.pop(99, None) is None
+        assert (wr.workload, wr.session_workload) == (2.5, 0.0)
+        del wr[1]
+        assert wr.workload == 0.5
+        wr.popitem()
+        assert (wr.workload, wr.session_workload) == (0.0, 0.0)
+        assert wr.check_consistency()
+
+    def test_sums_reset_to_exact_zero_when_emptied(self) -> None:
+        """
+        Verifies float error does not survive the dict becoming empty.
+
+        This test verifies by:
+        1. Adding and removing workloads that don't cancel exactly in floating point
+        2. Asserting workload is exactly 0.0 afterwards
+
+        Assumptions:
+        - 0.1 + 0.2 - 0.1 - 0.2 != 0.0 in IEEE doubles
+        """
+        wr = WorkingRequests()
+        wr[1] = self._request(1, 0.1)
+        wr[2] = self._request(2, 0.2)
+        wr.pop(1)
+        wr.pop(2)
+        assert wr.workload == 0.0
+        assert wr.session_workload == 0.0
+
+    def test_check_consistency_logs_and_repairs_drift(self) -> None:
+        """
+        Verifies check_consistency detects and corrects sums that diverged.
+
+        This test verifies by:
+        1. Mutating a tracked request's workload behind the dict's back
+        2. Asserting check_consistency returns False, logs an error and resyncs the sums
+
+        Assumptions:
+        - Only used in debug mode; recomputation is O(n)
+        """
+        wr = WorkingRequests({1: self._request(1, 1.0), 2: self._request(2, 3.0, True)})
+        wr[2].workload = 4.0
+        with patch("vastai.serverless.server.lib.data_types.log") as mock_log:
+            assert wr.check_consistency() is False
+            mock_log.error.assert_called_once()
+        assert (wr.workload, wr.session_workload) == (5.0, 4.0)
+        assert wr.check_consistency() is True
+
+    def test_model_metrics_wraps_plain_dict_and_exposes_split_loads(self) -> None:
+        """
+        Verifies ModelMetrics accepts a plain dict and reports session / non-session load.
+
+        This test verifies by:
+        1. Constructing ModelMetrics with requests_working as a plain dict
+        2. Asserting it was converted and session_load / non_session_load / cur_load agree
+
+        Assumptions:
+        - __post_init__ converts the dict so the sums are seeded
+        """
+        mm = ModelMetrics(
+            workload_served=0.0,
+            workload_received=0.0,
+            workload_cancelled=0.0,
+            workload_errored=0.0,
+            workload_rejected=0.0,
+            workload_pending=0.0,
+            error_msg=None,
+            max_throughput=2.0,
+            requests_working={1: self._request(1, 6.0), 2: self._request(2, 4.0, True)},
+        )
+        assert isinstance(mm.requests_working, WorkingRequests)
+        assert mm.cur_load == 10.0
+        assert mm.session_load == 4.0
+        assert mm.non_session_load == 6.0
+        assert mm.wait_time == 3.0
+
+
+class TestCompletedRequests:
+    """Bounded ring buffer behind ModelMetrics.requests_deleting."""
+
+    @staticmethod
+    def _request(idx: int) -> RequestMetrics:
+        return RequestMetrics(request_idx=idx, reqnum=idx, workload=1.0, status="Success")
+
+    def test_append_drops_oldest_when_full(self) -> None:
+        """
+        Verifies a full buffer evicts its oldest record and returns it.
+
+        This test verifies by:
+        1. Appending maxlen + 2 records to a small buffer
+        2. Asserting the two oldest were returned as dropped and the rest kept in order
+
+        Assumptions:
+        - append returns None while there is room
+        """
+        buf = CompletedRequests(maxlen=3)
+        reqs = [self._request(i) for i in range(5)]
+        dropped = [buf.append(r) for r in reqs]
+        assert dropped == [None, None, None, reqs[0], reqs[1]]
+        assert buf == reqs[2:]
+
+    def test_consume_removes_only_the_batch_taken(self) -> None:
+        """
+        Verifies consume keeps records appended after batch() was taken.
+
+        This test verifies by:
+        1. Taking a batch of two, appending one more, consuming the batch
+        2. Asserting only the late record remains
+
+        Assumptions:
+        - batch() returns the head position used by consume()
+        """
+        reqs = [self._request(i) for i in range(3)]
+        buf = CompletedRequests(reqs[:2])
+        position, batch = buf.batch(10)
+        assert batch == reqs[:2]
+        buf.append(reqs[2])
+        buf.consume(position, len(batch))
+        assert buf == [reqs[2]]
+
+    def test_consume_accounts_for_records_dropped_meanwhile(self) -> None:
+        """
+        Verifies consume does not remove newer records when batch members were evicted.
+
+        This test verifies by:
+        1. Taking a batch of two from a full buffer of three
+        2. Appending two more (evicting both batch members)
+        3. Asserting consume leaves the three newest records untouched
+
+        Assumptions:
+        - Evictions advance the head position just like consume
+        """
+        reqs = [self._request(i) for i in range(5)]
+        buf = CompletedRequests(reqs[:3], maxlen=3)
+        position, batch = buf.batch(2)
+        assert batch == reqs[:2]
+        buf.append(reqs[3])
+        buf.append(reqs[4])
+        buf.consume(position, len(batch))
+        assert buf == reqs[2:]
+
+    def test_model_metrics_coerces_assigned_list(self) -> None:
+        """
+        Verifies assigning a plain list to requests_deleting yields a CompletedRequests.
+
+        This test verifies by:
+        1. Assigning a list on an existing ModelMetrics
+        2. Asserting the type and that it still compares equal to the list
+
+        Assumptions:
+        - ModelMetrics.__setattr__ wraps plain containers
+        """
+        mm = ModelMetrics.empty()
+        req = self._request(1)
+        mm.requests_deleting = [req]
+        assert isinstance(mm.requests_deleting, CompletedRequests)
+        assert mm.requests_deleting == [req]
+
+
 class TestDummyPayloadBehavior:
     """Concrete ApiPayload used by tests implements JSON and workload helpers."""
 
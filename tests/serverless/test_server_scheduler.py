@@ -0,0 +1,177 @@
+"""Unit tests for vastai.serverless.server.lib.scheduler (pyworker request scheduler)."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from vastai.serverless.server.lib.scheduler import (
+    PRIORITY_DEFAULT,
+    PRIORITY_SESSION,
+    RequestScheduler,
+)
+
+
+async def _run(scheduler, order, tag, hold=0.0, **kwargs):
+    await scheduler.acquire(**kwargs)
+    try:
+        order.append(tag)
+        await asyncio.sleep(hold)
+    finally:
+        scheduler.release()
+
+
+class TestRequestScheduler:
+    async def test_first_request_is_admitted_immediately(self) -> None:
+        """
+        Verifies that an idle scheduler admits without queueing.
+
+        This test verifies by:
+        1. Acquiring on an idle scheduler
+        2. Asserting running == 1 and nothing waits
+
+        Assumptions:
+        - The fast path does not allocate a ticket
+        """
+        scheduler = RequestScheduler()
+        await scheduler.acquire()
+        assert (scheduler.running, scheduler.waiting) == (1, 0)
+        scheduler.release()
+        assert len(scheduler) == 0
+
+    async def test_fifo_within_a_class(self) -> None:
+        """
+        Verifies that same-priority requests run one at a time in arrival order.
+
+        This test verifies by:
+        1. Starting five requests with limit=1
+        2. Asserting they ran in order
+
+        Assumptions:
+        - Tasks reach acquire() in creation order
+        """
+        scheduler = RequestScheduler()
+        order = []
+        await asyncio.gather(*(_run(scheduler, order, i, hold=0.001) for i in range(5)))
+        assert order == [0, 1, 2, 3, 4]
+
+    async def test_session_class_runs_first(self) -> None:
+        """
+        Verifies that a higher-priority class overtakes queued default requests.
+
+        This test verifies by:
+        1. Holding the scheduler, queueing two default requests then one session request
+        2. Asserting the session request runs before the queued defaults
+
+        Assumptions:
+        - Lower priority numbers run first
+        """
+        scheduler = RequestScheduler()
+        order = []
+        await scheduler.acquire()
+        tasks = [
+            asyncio.create_task(_run(scheduler, order, "a", priority=PRIORITY_DEFAULT)),
+            asyncio.create_task(_run(scheduler, order, "b", priority=PRIORITY_DEFAULT)),
+            asyncio.create_task(_run(scheduler, order, "s", priority=PRIORITY_SESSION)),
+        ]
+        await asyncio.sleep(0)
+        scheduler.release()
+        await asyncio.gather(*tasks)
+        assert order == ["s", "a", "b"]
+
+    async def test_cancelled_waiter_is_skipped(self) -> None:
+        """
+        Verifies that cancelling a queued request leaves a tombstone that is skipped.
+
+        This test verifies by:
+        1. Queueing three requests behind a held turn and cancelling the middle one
+        2. Asserting the remaining two run and the counters return to zero
+
+        Assumptions:
+        - Cancellation does not search the deque
+        """
+        scheduler = RequestScheduler()
+        order = []
+        await scheduler.acquire()
+        tasks = [asyncio.create_task(_run(scheduler, order, i)) for i in range(3)]
+        await asyncio.sleep(0)
+        assert scheduler.waiting == 3
+        tasks[1].cancel()
+        await asyncio.sleep(0)
+        assert scheduler.waiting == 2
+        scheduler.release()
+        await asyncio.gather(tasks[0], tasks[2])
+        assert order == [0, 2]
+        assert len(scheduler) == 0
+
+    async def test_cancel_after_grant_passes_turn_on(self) -> None:
+        """
+        Verifies that a request cancelled right after being granted releases its turn.
+
+        This test verifies by:
+        1. Granting a queued request and cancelling it before it resumes
+        2. Asserting the next waiter still runs
+
+        Assumptions:
+        - The grant is visible as a completed future
+        """
+        scheduler = RequestScheduler()
+        order = []
+        await scheduler.acquire()
+        first = asyncio.create_task(_run(scheduler, order, "first"))
+        second = asyncio.create_task(_run(scheduler, order, "second"))
+        await asyncio.sleep(0)
+        scheduler.release()  # grants "first"
+        first.cancel()
+        await asyncio.gather(first, return_exceptions=True)
+        await second
+        assert order == ["second"]
+        assert len(scheduler) == 0
+
+    async def test_limit_bounds_concurrency(self) -> None:
+        """
+        Verifies that limit=N lets N requests run at once.
+
+        This test verifies by:
+        1. Running ten requests with limit=3 that record peak concurrency
+        2. Asserting the peak is exactly three
+
+        Assumptions:
+        - Requests hold their turn across an await
+        """
+        scheduler = RequestScheduler()
+        peak = 0
+
+        async def work():
+            nonlocal peak
+            await scheduler.acquire(limit=3)
+            try:
+                peak = max(peak, scheduler.running)
+                await asyncio.sleep(0.005)
+            finally:
+                scheduler.release()
+
+        await asyncio.gather(*(work() for _ in range(10)))
+        assert peak == 3
+
+    async def test_cancelled_head_unblocks_larger_limits(self) -> None:
+        """
+        Verifies that removing a blocked limit=1 head admits batchable waiters.
+
+        This test verifies by:
+        1. Running one limit=4 request, queueing a limit=1 request then a limit=4 request
+        2. Cancelling the limit=1 request
+        3. Asserting the limit=4 waiter is admitted without any release
+
+        Assumptions:
+        - Admission is head-of-line within a class
+        """
+        scheduler = RequestScheduler()
+        await scheduler.acquire(limit=4)
+        blocked = asyncio.create_task(scheduler.acquire(limit=1))
+        batch = asyncio.create_task(scheduler.acquire(limit=4))
+        await asyncio.sleep(0)
+        assert scheduler.waiting == 2
+        blocked.cancel()
+        await asyncio.wait_for(batch, 1)
+        assert scheduler.running == 2
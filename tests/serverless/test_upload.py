@@ -0,0 +1,291 @@
+"""Tests for ManagedDeployment.upload against a local S3-compatible stand-in."""
+from __future__ import annotations
+
+import hashlib
+import re
+import time
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from vastai.data.deployment import DeploymentMultipartUpload, DeploymentPutResponse
+from vastai.serverless.client import upload as upload_module
+from vastai.serverless.client.managed import ManagedDeployment
+
+
+class FakeS3:
+    """Just enough of S3 for presigned POST and presigned multipart uploads.
+
+    ``failures`` maps a part number (0 for the POST) to a list of statuses to answer
+    with before accepting it; status 0 drops the connection instead.
+    """
+
+    def __init__(self):
+        self.objects: dict[str, bytes] = {}
+        self.parts: dict[int, bytes] = {}
+        self.puts: list[int] = []
+        self.failures: dict[int, list[int]] = {}
+        self.content_types: list[str] = []
+        app = web.Application(client_max_size=64 * 2**20)
+        app.router.add_post("/bucket", self.post_object)
+        app.router.add_put("/bucket/part/{number}", self.put_part)
+        app.router.add_post("/bucket/complete", self.complete)
+        self.app = app
+
+    def _fail(self, number: int, request: web.Request):
+        statuses = self.failures.get(number)
+        if not statuses:
+            return None
+        status = statuses.pop(0)
+        if status == 0:
+            request.transport.close()
+            raise ConnectionResetError
+        return web.Response(status=status, text="<Error>injected</Error>")
+
+    async def post_object(self, request: web.Request) -> web.Response:
+        assert request.content_length is not None  # S3 rejects chunked uploads
+        form = await request.post()
+        if (failure := self._fail(0, request)) is not None:
+            return failure
+        self.content_types.append(form["file"].content_type)
+        self.objects[form["key"]] = form["file"].file.read()
+        return web.Response(status=204)
+
+    async def put_part(self, request: web.Request) -> web.Response:
+        assert request.content_length is not None
+        number = int(request.match_info["number"])
+        data = await request.read()
+        if (failure := self._fail(number, request)) is not None:
+            return failure
+        self.puts.append(number)
+        self.parts[number] = data
+        return web.Response(headers={"ETag": f'"{hashlib.md5(data).hexdigest()}"'})
+
+    async def complete(self, request: web.Request) -> web.Response:
+        body = await request.text()
+        listed = re.findall(r"<PartNumber>(\d+)</PartNumber><ETag>([^<]+)</ETag>", body)
+        for number, etag in listed:
+            expected = hashlib.md5(self.parts[int(number)]).hexdigest()
+            if etag != f"&quot;{expected}&quot;" and etag != f'"{expected}"':
+                return web.Response(text="<Error>InvalidPart</Error>")
+        self.objects["multipart"] = b"".join(self.parts[int(n)] for n, _ in listed)
+        return web.Response(text="<CompleteMultipartUploadResult/>")
+
+
+class _Client:
+    def __init__(self, session):
+        self.session = session
+
+    async def _get_session(self):
+        return self.session
+
+
+@pytest.fixture
+async def s3():
+    fake = FakeS3()
+    runner = web.AppRunner(fake.app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    fake.url = f"http://127.0.0.1:{port}/bucket"
+    async with aiohttp.ClientSession() as session:
+        fake.session = session
+        yield fake
+    await runner.cleanup()
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(upload_module, "_backoff_delay", lambda attempt: 0)
+
+
+@pytest.fixture
+def tarball(tmp_path):
+    path = tmp_path / "deployment.tar.gz"
+    path.write_bytes(bytes(range(256)) * 4000 + b"tail")  # 1,024,004 bytes
+    return path
+
+
+def _deployment(s3, *, multipart: bool, part_size: int = 300_000) -> ManagedDeployment:
+    put = DeploymentPutResponse(
+        success=True, action="created", deployment_id=1, endpoint_id=2
+    )
+    if multipart:
+        put.multipart_upload = DeploymentMultipartUpload(
+            part_size=part_size,
+            part_urls=[f"{s3.url}/part/{n}" for n in range(1, 11)],
+            complete_url=f"{s3.url}/complete",
+        )
+    else:
+        put.upload_url = s3.url
+        put.upload_fields = {"key": "deployments/abc"}
+    return ManagedDeployment(1, 2, _Client(s3.session), put_response=put)
+
+
+# ---------------------------------------------------------------------------
+# Presigned POST
+# ---------------------------------------------------------------------------
+
+
+class TestPresignedPost:
+    """Verify the single-POST upload streams the file, retries and reports progress."""
+
+    async def test_uploads_with_progress_and_content_type(self, s3, tarball) -> None:
+        """
+        Verifies the file arrives intact, labelled, with progress up to its size.
+
+        This test verifies by:
+        1. Uploading through a presigned POST with a progress callback
+        2. Comparing the stored object and the reported progress
+
+        Assumptions:
+        - Progress is reported per chunk, so a 1MB file gives several calls
+        """
+        deployment = _deployment(s3, multipart=False)
+        seen = []
+        await deployment.upload(
+            str(tarball), "application/zstd", progress=lambda s, t: seen.append((s, t))
+        )
+        assert s3.objects["deployments/abc"] == tarball.read_bytes()
+        assert s3.content_types == ["application/zstd"]
+        assert len(seen) > 2 and seen[-1] == (tarball.stat().st_size,) * 2
+        assert not deployment.needs_upload
+
+    async def test_transient_failure_restarts_the_post(self, s3, tarball) -> None:
+        """
+        Verifies a 503 is retried and progress rewinds for the resend.
+
+        This test verifies by:
+        1. Failing the first POST with 503
+        2. Checking the upload still succeeds and progress never exceeds the size
+
+        Assumptions:
+        - Backoff is patched to zero
+        """
+        s3.failures[0] = [503]
+        seen = []
+        await _deployment(s3, multipart=False).upload(
+            str(tarball), progress=lambda s, t: seen.append(s)
+        )
+        assert s3.objects["deployments/abc"] == tarball.read_bytes()
+        assert max(seen) == tarball.stat().st_size
+        assert seen[-1] == tarball.stat().st_size
+
+
+# ---------------------------------------------------------------------------
+# Multipart
+# ---------------------------------------------------------------------------
+
+
+class TestMultipart:
+    """Verify concurrent part uploads, per-part retries and resume."""
+
+    async def test_parts_are_assembled_in_order(self, s3, tarball) -> None:
+        """
+        Verifies a multipart upload sends every part and completes in part order.
+
+        This test verifies by:
+        1. Uploading a 1MB file in 300KB parts, two at a time
+        2. Comparing the assembled object with the file
+
+        Assumptions:
+        - 4 parts, the last one short
+        """
+        await _deployment(s3, multipart=True).upload(str(tarball), concurrency=2)
+        assert s3.objects["multipart"] == tarball.read_bytes()
+        assert sorted(s3.puts) == [1, 2, 3, 4]
+        assert len(s3.parts[4]) == tarball.stat().st_size - 3 * 300_000
+
+    async def test_failed_part_is_retried_alone(self, s3, tarball) -> None:
+        """
+        Verifies a transient failure re-sends only the failing part.
+
+        This test verifies by:
+        1. Failing part 2 with a 500 and then a dropped connection
+        2. Checking parts 1, 3 and 4 were sent once
+
+        Assumptions:
+        - Retries happen within one upload() call
+        """
+        s3.failures[2] = [500, 0]
+        await _deployment(s3, multipart=True).upload(str(tarball))
+        assert s3.objects["multipart"] == tarball.read_bytes()
+        assert sorted(s3.puts) == [1, 2, 3, 4]
+
+    async def test_upload_resumes_after_failure(self, s3, tarball) -> None:
+        """
+        Verifies a failed upload resumes from the acknowledged parts.
+
+        This test verifies by:
+        1. Failing part 3 with a non-retryable 403 so upload() raises
+        2. Calling upload() again and checking only part 3 is sent again
+
+        Assumptions:
+        - The deployment object keeps the ETags of acknowledged parts
+        """
+        deployment = _deployment(s3, multipart=True)
+        s3.failures[3] = [403]
+        with pytest.raises(RuntimeError, match="part 3/4 failed: HTTP 403"):
+            await deployment.upload(str(tarball))
+        assert deployment.needs_upload
+        assert sorted(s3.puts) == [1, 2, 4]
+
+        seen = []
+        await deployment.upload(str(tarball), progress=lambda s, t: seen.append(s))
+        assert s3.puts[3:] == [3]
+        assert s3.objects["multipart"] == tarball.read_bytes()
+        assert seen[0] == tarball.stat().st_size - 300_000  # parts 1, 2 and 4 were done
+
+    async def test_changed_file_does_not_resume(self, s3, tarball) -> None:
+        """
+        Verifies parts acknowledged for another version of the file aren't reused.
+
+        This test verifies by:
+        1. Failing an upload, rewriting the file and uploading again
+
+        Assumptions:
+        - Files are identified by path, size and mtime
+        """
+        deployment = _deployment(s3, multipart=True)
+        s3.failures[3] = [403]
+        with pytest.raises(RuntimeError):
+            await deployment.upload(str(tarball))
+        tarball.write_bytes(b"new contents" * 50_000)
+        await deployment.upload(str(tarball))
+        assert s3.objects["multipart"] == tarball.read_bytes()
+
+    async def test_too_few_presigned_parts(self, s3, tmp_path) -> None:
+        """
+        Verifies a file needing more parts than were presigned is rejected up front.
+
+        This test verifies by:
+        1. Uploading a file bigger than 10 parts of 1KB
+
+        Assumptions:
+        - Nothing is sent
+        """
+        path = tmp_path / "big.tar.gz"
+        path.write_bytes(bytes(20_000))
+        with pytest.raises(ValueError, match="needs 20 parts"):
+            await _deployment(s3, multipart=True, part_size=1000).upload(str(path))
+        assert s3.puts == []
+
+    async def test_bandwidth_limit(self, s3, tarball) -> None:
+        """
+        Verifies max_bytes_per_second caps the upload rate across concurrent parts.
+
+        This test verifies by:
+        1. Uploading 1MB at 4MB/s with 4 parts in flight
+        2. Checking it took at least ~0.2s
+
+        Assumptions:
+        - The first chunk goes immediately, so the floor is (size - chunk) / rate
+        """
+        start = time.monotonic()
+        await _deployment(s3, multipart=True).upload(
+            str(tarball), max_bytes_per_second=4 * 2**20
+        )
+        assert time.monotonic() - start >= 0.9 * (2**20 - 256 * 1024) / (4 * 2**20)
+        assert s3.objects["multipart"] == tarball.read_bytes()
@@ -0,0 +1,185 @@
+"""Unit tests for vastai.serverless.wire (binary wire format for remote calls)."""
+from __future__ import annotations
+
+import json
+import struct
+
+import pytest
+
+from vastai.serverless import wire
+
+
+class TestWireRoundTrip:
+    """Verify encode/decode round-trips JSON documents with buffers lifted out."""
+
+    def test_round_trips_nested_document_with_buffers(self) -> None:
+        """
+        Verifies buffers anywhere in the document come back with the same contents.
+
+        This test verifies by:
+        1. Encoding a nested dict/list document holding bytes, bytearray and memoryview
+        2. Decoding it and comparing scalars and buffer contents
+
+        Assumptions:
+        - Buffers decode as memoryviews; other values as plain JSON
+        """
+        doc = {
+            "a": [1, 2.5, None, True, "x"],
+            "b": {"type": "bytes", "contents": b"\x00" * 10},
+            "c": [bytearray(b"ab"), memoryview(b"cd")],
+        }
+        out = wire.decode(wire.encode(doc))
+        assert out["a"] == [1, 2.5, None, True, "x"]
+        assert bytes(out["b"]["contents"]) == b"\x00" * 10
+        assert [bytes(v) for v in out["c"]] == [b"ab", b"cd"]
+
+    def test_document_without_buffers(self) -> None:
+        """
+        Verifies a document with no buffers has no frames and decodes to itself.
+
+        This test verifies by:
+        1. Encoding {"k": [1, 2]}
+        2. Asserting the header frame count is 0 and decode returns the same dict
+
+        Assumptions:
+        - Header layout is magic, document length, frame count
+        """
+        data = wire.encode({"k": [1, 2]})
+        magic, _, frames = struct.unpack_from("<4sII", data)
+        assert (magic, frames) == (wire.MAGIC, 0)
+        assert wire.decode(data) == {"k": [1, 2]}
+
+    def test_frames_are_not_copied(self) -> None:
+        """
+        Verifies buffers are carried as frames, not re-encoded, in both directions.
+
+        This test verifies by:
+        1. Checking encode_frames returns a view over the caller's own buffer
+        2. Checking decode returns a read-only view over the received message
+
+        Assumptions:
+        - The only copy is the final join in encode()
+        """
+        blob = b"\xff" * 1000
+        parts = wire.encode_frames({"blob": blob})
+        assert parts[-1].obj is blob
+        data = bytearray(b"".join(parts))
+        view = wire.decode(data)["blob"]
+        assert view.obj is data
+        assert view.readonly
+
+    def test_non_contiguous_and_typed_buffers_are_flattened(self) -> None:
+        """
+        Verifies typed and strided memoryviews are sent as their raw bytes.
+
+        This test verifies by:
+        1. Encoding an int32 memoryview and a strided byte slice
+        2. Asserting decoded frames match tobytes() of the originals
+
+        Assumptions:
+        - Frames are always byte-formatted
+        """
+        import array
+
+        ints = memoryview(array.array("i", [1, 2, 3]))
+        strided = memoryview(b"abcdef")[::2]
+        out = wire.decode(wire.encode([ints, strided]))
+        assert bytes(out[0]) == ints.tobytes()
+        assert bytes(out[1]) == b"ace"
+
+    def test_frames_are_aligned(self) -> None:
+        """
+        Verifies every frame starts on a FRAME_ALIGNMENT boundary of the message.
+
+        This test verifies by:
+        1. Encoding odd-sized buffers after an odd-sized document
+        2. Asserting each decoded frame's offset into the message is a multiple of the alignment
+
+        Assumptions:
+        - Padding between frames is zero bytes and not part of any frame
+        """
+        blobs = [b"x" * 3, b"y" * 70, b"z"]
+        data = wire.encode({"name": "odd", "frames": blobs})
+        assert [bytes(f) for f in wire.decode(data)["frames"]] == blobs
+        for blob in blobs:
+            assert data.index(blob) % wire.FRAME_ALIGNMENT == 0
+
+
+class TestWireErrors:
+    """Verify malformed messages raise ValueError."""
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b"",
+            b"XXXX" + b"\x00" * 8,
+            wire.encode({"a": b"xy"})[:-1],
+            wire.encode({"a": b"xy"}) + b"!",
+        ],
+        ids=["empty", "bad-magic", "truncated", "trailing"],
+    )
+    def test_malformed_message_raises_value_error(self, data: bytes) -> None:
+        """
+        Verifies decode rejects messages whose framing doesn't add up.
+
+        This test verifies by:
+        1. Decoding empty, wrong-magic, truncated and over-long messages
+        2. Asserting ValueError each time
+
+        Assumptions:
+        - The backend maps ValueError to a 422
+        """
+        with pytest.raises(ValueError):
+            wire.decode(data)
+
+    def test_dangling_frame_reference_raises_value_error(self) -> None:
+        """
+        Verifies a frame reference past the frame table is rejected.
+
+        This test verifies by:
+        1. Hand-building a message whose document references frame 3 of 1
+        2. Asserting ValueError
+
+        Assumptions:
+        - Frame references are {"\\u0000": index}
+        """
+        document = json.dumps([{"\x00": 3}]).encode()
+        data = struct.pack("<4sII", wire.MAGIC, len(document), 1) + struct.pack("<Q", 1)
+        data += document
+        data += bytes(-len(data) % wire.FRAME_ALIGNMENT) + b"x"
+        with pytest.raises(ValueError):
+            wire.decode(data)
+
+
+class TestJsonFallback:
+    """Verify the JSON fallback base64-encodes buffers."""
+
+    def test_dumps_json_base64_encodes_buffers(self) -> None:
+        """
+        Verifies dumps_json turns every buffer type into a base64 string.
+
+        This test verifies by:
+        1. Dumping bytes, bytearray and memoryview values
+        2. Asserting the JSON holds base64 strings
+
+        Assumptions:
+        - Non-buffer values are handled by json as usual
+        """
+        out = json.loads(
+            wire.dumps_json({"a": b"\x00\x01", "b": bytearray(b"hi"), "c": memoryview(b"ok")})
+        )
+        assert out == {"a": "AAE=", "b": "aGk=", "c": "b2s="}
+
+    def test_dumps_json_rejects_unknown_types(self) -> None:
+        """
+        Verifies dumps_json still raises TypeError for values json can't encode.
+
+        This test verifies by:
+        1. Dumping an object()
+        2. Asserting TypeError
+
+        Assumptions:
+        - json_default only knows buffers
+        """
+        with pytest.raises(TypeError):
+            wire.dumps_json({"a": object()})
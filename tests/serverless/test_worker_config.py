@@ -193,6 +193,24 @@ class TestEndpointHandlerFactory:
         factory = EndpointHandlerFactory(server_worker_config("minimal"))
         assert factory.model_server_base_url == "http://localhost:8000"
 
+    def test_model_server_base_url_keeps_unix_socket_url(
+        self, server_worker_config
+    ) -> None:
+        """
+        Verifies that a unix:// model_server_url is used as given, without a port.
+
+        This test verifies by:
+        1. Setting model_server_url to unix:///run/model.sock on a config with a port
+        2. Asserting model_server_base_url is the socket url unchanged
+
+        Assumptions:
+        - The port is ignored for unix socket urls
+        """
+        config = server_worker_config("minimal")
+        config.model_server_url = "unix:///run/model.sock"
+        factory = EndpointHandlerFactory(config)
+        assert factory.model_server_base_url == "unix:///run/model.sock"
+
     def test_get_benchmark_handler_returns_none_when_no_handlers(
         self, server_worker_config
     ) -> None:
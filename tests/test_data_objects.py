@@ -266,6 +266,36 @@ class TestDeploymentPutResponse:
         resp = DeploymentPutResponse.from_dict(raw)
         assert resp.upload_url is None
         assert resp.evicted_versions is None
+        assert resp.multipart_upload is None
+        assert resp.codecs is None
+
+    def test_from_dict_codecs(self):
+        raw = {
+            "success": True,
+            "action": "created",
+            "deployment_id": 5,
+            "endpoint_id": 10,
+            "codecs": ["zstd"],
+        }
+        assert DeploymentPutResponse.from_dict(raw).codecs == ["zstd"]
+
+    def test_from_dict_multipart_upload(self):
+        raw = {
+            "success": True,
+            "action": "created",
+            "deployment_id": 5,
+            "endpoint_id": 10,
+            "multipart_upload": {
+                "upload_id": "u1",
+                "part_size": 8388608,
+                "part_urls": ["https://s3.example.com/p1", "https://s3.example.com/p2"],
+                "complete_url": "https://s3.example.com/complete",
+            },
+        }
+        resp = DeploymentPutResponse.from_dict(raw)
+        assert resp.multipart_upload.part_size == 8388608
+        assert len(resp.multipart_upload.part_urls) == 2
+        assert resp.multipart_upload.upload_id == "u1"
 
 
 # ── Offer ───────────────────────────────────────────────────────────────────
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import dataclasses
 import hashlib
 import io
 import json
@@ -8,6 +9,9 @@ import stat
 import subprocess
 import tarfile
 import tempfile
+import threading
+import time
+from unittest.mock import patch
 
 import pytest
 
@@ -19,9 +23,13 @@ from vastai.serverless.remote.utils import (
     add_folder,
     add_path,
     add_string,
+    build_deployment_tarball,
     compute_deployment_hash,
     create_deployment_tarball,
     deployment_arcname,
+    deployment_manifest,
+    DeploymentHashCache,
+    get_deployment_hash_cache,
     filter_ignored_lines,
     is_python_module,
     is_python_package,
@@ -697,3 +705,185 @@ class TestCreateDeploymentTarball:
         bad_path = str(tmp_path / "nonexistent.py")
         with pytest.raises(ValueError, match="neither a Python package"):
             create_deployment_tarball(tar_path, sample_config, bad_path)
+
+
+# ---------------------------------------------------------------------------
+# build_deployment_tarball (hash + tar in one pass)
+# ---------------------------------------------------------------------------
+
+
+def _age(path, seconds=60):
+    """Backdate a file tree's mtimes so the hash cache doesn't treat it as racy."""
+    then = time.time() - seconds
+    paths = [path]
+    for root, dirs, files in os.walk(path):
+        paths += [os.path.join(root, name) for name in dirs + files]
+    for p in paths:
+        os.utime(p, (then, then))
+
+
+class TestBuildDeploymentTarball:
+    def test_hash_matches_compute_deployment_hash(
+        self, sample_config, package_path, tmp_dir, tmp_path_factory
+    ):
+        with open(os.path.join(package_path, "main.py"), "a") as f:
+            f.write("DEBUG = True  #!VAST_IGNORE_CHANGES\n")
+        extras = [(str(tmp_dir / "script.py"), "./scripts/run.py"), (str(tmp_dir), "/data")]
+        out = str(tmp_path_factory.mktemp("out") / "out.tar.gz")  # tmp_dir is archived
+        assert build_deployment_tarball(
+            out, sample_config, package_path, extras
+        ) == compute_deployment_hash(sample_config, package_path, extras)
+
+    @pytest.mark.skipif(not hasattr(os, "symlink"), reason="needs symlinks")
+    def test_hash_matches_with_symlinks(
+        self, sample_config, package_path, tmp_dir, tmp_path_factory
+    ):
+        os.symlink("main.py", os.path.join(package_path, "alias.py"))
+        os.symlink("missing.txt", os.path.join(package_path, "dangling.txt"))
+        os.symlink("script.py", str(tmp_dir / "script-link.py"))
+        extras = [(str(tmp_dir), "/data")]
+        out_dir = tmp_path_factory.mktemp("out")
+        h = build_deployment_tarball(
+            str(out_dir / "a.tar.gz"), sample_config, package_path, extras
+        )
+        assert h == compute_deployment_hash(sample_config, package_path, extras)
+        with tarfile.open(str(out_dir / "a.tar.gz"), "r:gz") as rtf:
+            alias = rtf.getmember("./deployment/alias.py")
+            assert alias.issym() and alias.linkname == "main.py"
+
+        # pointing a link elsewhere changes the hash, in both paths
+        os.unlink(os.path.join(package_path, "alias.py"))
+        os.symlink(os.path.join("sub", "helper.py"), os.path.join(package_path, "alias.py"))
+        h2 = build_deployment_tarball(
+            str(out_dir / "b.tar.gz"), sample_config, package_path, extras
+        )
+        assert h2 != h
+        assert h2 == compute_deployment_hash(sample_config, package_path, extras)
+
+    def test_archive_has_the_same_members_and_raw_contents(
+        self, sample_config, package_path, tmp_path
+    ):
+        main = os.path.join(package_path, "main.py")
+        with open(main, "a") as f:
+            f.write("DEBUG = True  #!VAST_IGNORE_CHANGES\n")
+        out = str(tmp_path / "out.tar.gz")
+        build_deployment_tarball(out, sample_config, package_path)
+        with tarfile.open(out, "r:gz") as rtf:
+            names = rtf.getnames()
+            assert names[0] == "./config.json"
+            assert "./deployment/sub/helper.py" in names
+            data = rtf.extractfile("./deployment/main.py").read()
+            assert all(m.uid == 0 and m.gid == 0 for m in rtf.getmembers())
+        with open(main, "rb") as f:
+            assert data == f.read()  # ignored lines are only left out of the hash
+
+    def test_builds_are_reproducible(self, sample_config, package_path, tmp_path):
+        a, b = str(tmp_path / "a.tar.gz"), str(tmp_path / "b-other-name.tar.gz")
+        build_deployment_tarball(a, sample_config, package_path)
+        time.sleep(1.1)  # a gzip header mtime would differ now
+        build_deployment_tarball(b, sample_config, package_path)
+        with open(a, "rb") as fa, open(b, "rb") as fb:
+            assert fa.read() == fb.read()
+
+    def test_hash_does_not_depend_on_codec(self, sample_config, module_path, tmp_path):
+        pytest.importorskip("zstandard")
+        a, b = str(tmp_path / "a.tar.gz"), str(tmp_path / "b.tar.zst")
+        assert build_deployment_tarball(
+            a, sample_config, module_path, codec="gzip"
+        ) == build_deployment_tarball(b, sample_config, module_path, codec="zstd")
+
+    def test_uncompressed(self, sample_config, module_path, tmp_path):
+        out = str(tmp_path / "out.tar")
+        build_deployment_tarball(out, sample_config, module_path, compress=False)
+        with tarfile.open(out, "r:") as rtf:
+            assert rtf.getnames() == ["./config.json", "./deployment.py"]
+
+
+# ---------------------------------------------------------------------------
+# DeploymentHashCache
+# ---------------------------------------------------------------------------
+
+
+class TestDeploymentHashCache:
+    def test_hit_after_store_and_miss_after_change(
+        self, sample_config, package_path, tmp_path
+    ):
+        _age(package_path)
+        cache = DeploymentHashCache(cache_dir=str(tmp_path / "cache"))
+        manifest = deployment_manifest(sample_config, package_path)
+        assert cache.lookup(manifest) is None
+        assert cache.store(manifest, "abc", 123)
+        assert cache.lookup(deployment_manifest(sample_config, package_path)) == ("abc", 123)
+
+        with open(os.path.join(package_path, "sub", "helper.py"), "a") as f:
+            f.write("# edit\n")
+        assert cache.lookup(deployment_manifest(sample_config, package_path)) is None
+
+    @pytest.mark.skipif(not hasattr(os, "symlink"), reason="needs symlinks")
+    def test_symlink_retarget_misses(self, sample_config, package_path, tmp_path):
+        link = os.path.join(package_path, "alias.py")
+        os.symlink("main.py", link)
+        before = deployment_manifest(sample_config, package_path)
+        os.unlink(link)
+        os.symlink("__init__.py", link)
+        assert deployment_manifest(sample_config, package_path) != before
+
+    def test_concurrent_stores_use_their_own_temp_files(
+        self, sample_config, module_path, tmp_path
+    ):
+        _age(module_path)
+        cache = DeploymentHashCache(cache_dir=str(tmp_path / "cache"))
+        manifest = deployment_manifest(sample_config, module_path)
+        threads = [
+            threading.Thread(target=cache.store, args=(manifest, str(i), i))
+            for i in range(8)
+        ]
+        with patch("os.replace", wraps=os.replace) as replace:
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        assert len({call.args[0] for call in replace.call_args_list}) == 8
+        assert len(os.listdir(tmp_path / "cache")) == 1
+        assert cache.lookup(manifest) is not None
+
+    def test_config_change_misses(self, sample_config, module_path, tmp_path):
+        _age(module_path)
+        cache = DeploymentHashCache(cache_dir=str(tmp_path / "cache"))
+        cache.store(deployment_manifest(sample_config, module_path), "abc", 1)
+        other = Config(**{**dataclasses.asdict(sample_config), "apt_gets": []})
+        assert cache.lookup(deployment_manifest(other, module_path)) is None
+
+    def test_codec_change_misses(self, sample_config, module_path, tmp_path):
+        _age(module_path)
+        cache = DeploymentHashCache(cache_dir=str(tmp_path / "cache"))
+        cache.store(deployment_manifest(sample_config, module_path, codec="gzip"), "abc", 1)
+        assert cache.lookup(deployment_manifest(sample_config, module_path, codec="zstd")) is None
+
+    def test_recently_modified_files_are_not_cached(
+        self, sample_config, module_path, tmp_path
+    ):
+        cache = DeploymentHashCache(cache_dir=str(tmp_path / "cache"))
+        manifest = deployment_manifest(sample_config, module_path)
+        assert not cache.store(manifest, "abc", 1)
+        assert cache.lookup(manifest) is None
+
+    def test_evicts_least_recently_used(self, sample_config, module_path, tmp_path):
+        cache = DeploymentHashCache(cache_dir=str(tmp_path / "cache"), max_entries=2)
+        manifests = []
+        for i in range(3):
+            with open(module_path, "w") as f:
+                f.write(f"x = {i}\n")
+            _age(module_path, seconds=60 - i)
+            manifests.append(deployment_manifest(sample_config, module_path))
+            cache.store(manifests[-1], str(i), i)
+            time.sleep(0.01)
+        assert len(os.listdir(tmp_path / "cache")) == 2
+        assert cache.lookup(manifests[0]) is None
+        assert cache.lookup(manifests[2]) == ("2", 2)
+
+    def test_disabled_by_vast_no_cache(self, monkeypatch):
+        monkeypatch.setenv("VAST_NO_CACHE", "1")
+        assert get_deployment_hash_cache() is None
+        monkeypatch.delenv("VAST_NO_CACHE")
+        assert isinstance(get_deployment_hash_cache(), DeploymentHashCache)
@@ -35,6 +35,7 @@ try:
     from .serverless.server.worker import WorkerConfig, HandlerConfig, LogActionConfig, BenchmarkConfig
     from .sync.client import SyncClient
     from .async_.client import AsyncClient
+    from .async_.sdk import AsyncVastAI
     from .serverless.remote import Deployment
 except ImportError:
     # Serverless dependencies (aiohttp, etc.) not installed
@@ -51,6 +52,7 @@ except ImportError:
     BenchmarkConfig = None
     SyncClient = None
     AsyncClient = None
+    AsyncVastAI = None
 
 __all__ = [
     "VastAI",
@@ -67,4 +69,5 @@ __all__ = [
     "BenchmarkConfig",
     "SyncClient",
     "AsyncClient",
+    "AsyncVastAI",
 ]
@@ -0,0 +1,8 @@
+# Generated by scripts/generate_async_api.py. Do not edit.
+"""Awaitable twins of the ``vastai.api`` modules.
+
+Each module here mirrors the sync module of the same name, taking an
+:class:`vastai.api.async_client.AsyncVastClient` instead of a
+``VastClient``; every function that performs I/O is a coroutine.
+"""
+from vastai.api.aio import auth, billing, clusters, deployments, endpoints, instances, keys, machines, metrics, offers, price_increase, storage, teams
@@ -0,0 +1,53 @@
+# Generated by scripts/generate_async_api.py from vastai/api/deployments.py. Do not edit;
+# change the source module and re-run the generator.
+"""Deployment CRUD operations."""
+from vastai.api.async_client import AsyncVastClient
+
+
+async def show_deployments(client: AsyncVastClient) -> list:
+    r = await client.get("/deployments")
+    r.raise_for_status()
+    return r.json()["deployments"]
+
+
+async def show_deployment(client: AsyncVastClient, id: int) -> dict:
+    r = await client.get(f"/deployment/{id}/")
+    r.raise_for_status()
+    return r.json()["deployment"]
+
+
+async def show_deployment_versions(client: AsyncVastClient, id: int) -> list:
+    r = await client.get(f"/deployment/{id}/versions/")
+    r.raise_for_status()
+    rj = r.json()
+    if rj.get("success"):
+        return rj["versions"]
+    else:
+        raise RuntimeError(rj.get("msg", "Unknown error"))
+
+
+async def delete_deployment(client: AsyncVastClient, id: int) -> dict:
+    r = await client.delete(f"/deployment/{id}/")
+    r.raise_for_status()
+    return r.json()
+
+
+async def stop_deployment(client: AsyncVastClient, id: int) -> dict:
+    r = await client.post(f"/deployment/{id}/stop/")
+    r.raise_for_status()
+    return r.json()
+
+
+async def start_deployment(client: AsyncVastClient, id: int) -> dict:
+    r = await client.post(f"/deployment/{id}/start/")
+    r.raise_for_status()
+    return r.json()
+
+
+async def delete_deployment_by_name(client: AsyncVastClient, name: str, tag: str = None) -> dict:
+    json_blob = {"name": name}
+    if tag is not None:
+        json_blob["tag"] = tag
+    r = await client.delete("/deployments/", json_data=json_blob)
+    r.raise_for_status()
+    return r.json()
@@ -0,0 +1,184 @@
+# Generated by scripts/generate_async_api.py from vastai/api/teams.py. Do not edit;
+# change the source module and re-run the generator.
+"""Team CRUD operations, members, and roles."""
+from vastai.api.async_client import AsyncVastClient
+
+
+async def create_team(client: AsyncVastClient, team_name: str, transfer_credit: float = 0) -> dict:
+    """Create a new team.
+
+    Args:
+        client: VastClient instance.
+        team_name: Name of the team to create.
+        transfer_credit: Amount of personal credit to transfer to the new team.
+
+    Returns:
+        Response dict with team info.
+    """
+    json_data = {"team_name": team_name, "transfer_credit": transfer_credit}
+    r = await client.post("/team/", json_data=json_data)
+    r.raise_for_status()
+    return r.json()
+
+
+async def destroy_team(client: AsyncVastClient) -> dict:
+    """Destroy the current team.
+
+    Args:
+        client: VastClient instance.
+
+    Returns:
+        Response dict.
+    """
+    r = await client.delete("/team/")
+    r.raise_for_status()
+    return r.json()
+
+
+async def show_members(client: AsyncVastClient) -> dict:
+    """Show members of the current team.
+
+    Args:
+        client: VastClient instance.
+
+    Returns:
+        Response dict with member info.
+    """
+    r = await client.get("/team/members/")
+    r.raise_for_status()
+    return r.json()
+
+
+async def invite_member(client: AsyncVastClient, email: str, role: str) -> dict:
+    """Invite a member to the current team.
+
+    Args:
+        client: VastClient instance.
+        email: Email address of the member to invite.
+        role: Role to assign to the invited member.
+
+    Returns:
+        Response dict.
+    """
+    r = await client.post("/team/invite/", query_args={"email": email, "role": role})
+    r.raise_for_status()
+    return r.json()
+
+
+async def remove_member(client: AsyncVastClient, id: int) -> dict:
+    """Remove a member from the current team.
+
+    Args:
+        client: VastClient instance.
+        id: Member ID to remove.
+
+    Returns:
+        Response dict.
+    """
+    r = await client.delete(f"/team/members/{id}/")
+    r.raise_for_status()
+    return r.json()
+
+
+async def create_team_role(client: AsyncVastClient, name: str, permissions: dict) -> dict:
+    """Add a new role to the current team.
+
+    Args:
+        client: VastClient instance.
+        name: Name of the role.
+        permissions: Dict of permissions for the role.
+
+    Returns:
+        Response dict.
+    """
+    r = await client.post("/team/roles/", json_data={"name": name, "permissions": permissions})
+    r.raise_for_status()
+    return r.json()
+
+
+async def show_team_role(client: AsyncVastClient, name: str) -> dict:
+    """Show details of a specific team role.
+
+    Args:
+        client: VastClient instance.
+        name: Name of the role.
+
+    Returns:
+        Role details dict.
+    """
+    r = await client.get(f"/team/roles/{name}/")
+    r.raise_for_status()
+    return r.json()
+
+
+async def show_team_roles(client: AsyncVastClient) -> dict:
+    """Show all roles for the current team.
+
+    Args:
+        client: VastClient instance.
+
+    Returns:
+        Response dict with roles info.
+    """
+    r = await client.get("/team/roles-full/")
+    r.raise_for_status()
+    return r.json()
+
+
+async def update_team_role(client: AsyncVastClient, id: int, name: str = None,
+                     permissions: dict = None) -> dict:
+    """Update an existing team role.
+
+    Args:
+        client: VastClient instance.
+        id: Role ID.
+        name: New name for the role.
+        permissions: Updated permissions dict.
+
+    Returns:
+        Response dict.
+    """
+    json_blob = {}
+    if name is not None:
+        json_blob["name"] = name
+    if permissions is not None:
+        json_blob["permissions"] = permissions
+    r = await client.put(f"/team/roles/{id}/", json_data=json_blob)
+    r.raise_for_status()
+    return r.json()
+
+
+async def remove_team_role(client: AsyncVastClient, name: str) -> dict:
+    """Remove a role from the current team.
+
+    Args:
+        client: VastClient instance.
+        name: Name of the role to remove.
+
+    Returns:
+        Response dict.
+    """
+    r = await client.delete(f"/team/roles/{name}/")
+    r.raise_for_status()
+    return r.json()
+
+
+async def transfer_credit(client: AsyncVastClient, recipient: str, amount: float) -> dict:
+    """Transfer credit to another account.
+
+    Args:
+        client: VastClient instance.
+        recipient: Recipient identifier (email or user ID).
+        amount: Amount of credit to transfer.
+
+    Returns:
+        Response dict.
+    """
+    json_blob = {
+        "sender": "me",
+        "recipient": recipient,
+        "amount": amount,
+    }
+    r = await client.put("/commands/transfer_credit/", json_data=json_blob)
+    r.raise_for_status()
+    return r.json()
@@ -0,0 +1,186 @@
+"""Asyncio HTTP client for the Vast.ai API.
+
+:class:`AsyncVastClient` is the aiohttp counterpart of
+:class:`vastai.api.client.VastClient`: same constructor, same
+``get/post/put/delete`` surface, same retry/timeout/explain behaviour, but
+every request method is a coroutine.  Responses are fully buffered and handed
+back as ``requests.Response`` objects, and transport failures are raised as
+the matching ``requests`` exceptions, so code written against the sync client
+(``r.raise_for_status()``, ``r.json()``, ``except requests.HTTPError``) works
+unchanged against the async one.  The awaitable twins of the ``vastai.api``
+modules live in :mod:`vastai.api.aio`.
+"""
+
+import asyncio
+from typing import Dict, Optional
+
+import aiohttp
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from vastai.api.client import _BaseVastClient, _RETRYABLE_STATUS
+
+# Concurrent connections held by the aiohttp connector.  Async callers fan out
+# far more requests at once than threaded ones, so this is deliberately larger
+# than the sync client's pool.
+_DEFAULT_CONNECTION_LIMIT = 100
+
+
+class AsyncVastClient(_BaseVastClient):
+    """Async HTTP client for Vast.ai API requests.
+
+    The underlying ``aiohttp.ClientSession`` is created lazily inside the
+    running event loop and reused for every call; close it with
+    :meth:`close` or ``async with AsyncVastClient(...) as client``.
+    """
+
+    def __init__(self, *args, connection_limit=_DEFAULT_CONNECTION_LIMIT, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.connection_limit = connection_limit
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the client-owned session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.connection_limit,
+                    limit_per_host=self.connection_limit,
+                )
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close pooled connections. The client reopens them if used again."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _send(self, prep: requests.PreparedRequest, timeout: float) -> requests.Response:
+        """Send ``prep`` over the aiohttp session and buffer it into a ``requests.Response``.
+
+        aiohttp transport errors are re-raised as the equivalent ``requests``
+        exception so retry classification and caller error handling match
+        :class:`VastClient`.
+        """
+        session = self._get_session()
+        try:
+            async with session.request(
+                prep.method,
+                prep.url,
+                headers=dict(prep.headers),
+                data=prep.body,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+            ) as resp:
+                content = await resp.read()
+                r = requests.Response()
+                r.status_code = resp.status
+                r.reason = resp.reason
+                r.url = str(resp.url)
+                r.headers = CaseInsensitiveDict(resp.headers)
+                r.encoding = get_encoding_from_headers(r.headers)
+                r._content = content
+                r.request = prep
+                return r
+        except asyncio.TimeoutError as exc:
+            raise requests.exceptions.Timeout(str(exc) or "request timed out", request=prep) from exc
+        except aiohttp.InvalidURL as exc:
+            raise requests.exceptions.InvalidURL(str(exc), request=prep) from exc
+        except aiohttp.ClientConnectionError as exc:
+            raise requests.exceptions.ConnectionError(str(exc), request=prep) from exc
+        except aiohttp.TooManyRedirects as exc:
+            raise requests.exceptions.TooManyRedirects(str(exc), request=prep) from exc
+        except aiohttp.ClientPayloadError as exc:
+            # a body cut short; requests reports it while reading the content
+            raise requests.exceptions.ChunkedEncodingError(str(exc), request=prep) from exc
+        except aiohttp.ClientError as exc:
+            raise requests.exceptions.RequestException(str(exc), request=prep) from exc
+
+    async def fetch(self, url: str, timeout: Optional[float] = None) -> requests.Response:
+        """Plain unauthenticated GET of an absolute URL (e.g. a presigned result
+        URL) over the pooled session. No retries; the caller decides."""
+        effective_timeout = timeout if timeout is not None else self.timeout
+        prep = requests.Request(method="GET", url=url).prepare()
+        return await self._send(prep, effective_timeout)
+
+    async def _request(self, method: str, url: str, headers: Dict, json_data=None,
+                       timeout: Optional[float] = None) -> requests.Response:
+        """Execute HTTP request with retry/timeout/exception handling.
+
+        Mirrors :meth:`VastClient._request`: retries ``_RETRYABLE_STATUS``
+        responses and connection/timeout errors with the same backoff, returns
+        the last response once retries are exhausted, and lets every other
+        exception propagate immediately.  Backoff uses ``asyncio.sleep`` so
+        other requests on the loop keep running.
+        """
+        effective_timeout = timeout if timeout is not None else self.timeout
+        t = 0.15
+        r = None
+        for i in range(0, self.retry):
+            prep = requests.Request(method=method, url=url, headers=headers, json=json_data).prepare()
+            self._show_prepared(prep, headers, json_data)
+
+            try:
+                r = await self._send(prep, effective_timeout)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if i == self.retry - 1:
+                    raise
+                await asyncio.sleep(t)
+                t *= 1.5
+                continue
+
+            if r.status_code in _RETRYABLE_STATUS and i < self.retry - 1:
+                await asyncio.sleep(t)
+                t *= 1.5
+                continue
+            break
+        return r
+
+    async def get(self, subpath: str, query_args: Optional[Dict] = None, json_data=None,
+                  timeout: Optional[float] = None) -> requests.Response:
+        url = self._build_url(subpath, query_args)
+        headers = self._build_headers()
+        plan = self._cache_plan(url, headers, json_data)
+        if plan is None:
+            return await self._request('GET', url, headers, json_data, timeout=timeout)
+        key, ttl, entry = plan
+        if entry is not None and entry.fresh:
+            return self._cache_hit(entry)
+        if entry is not None:
+            headers = {**headers, **entry.validators()}
+        r = await self._request('GET', url, headers, json_data, timeout=timeout)
+        return self._cache_settle(key, ttl, entry, r)
+
+    async def post(self, subpath: str, query_args: Optional[Dict] = None, json_data=None,
+                   timeout: Optional[float] = None) -> requests.Response:
+        url = self._build_url(subpath, query_args)
+        headers = self._build_headers()
+        try:
+            return await self._request('POST', url, headers, json_data if json_data is not None else {}, timeout=timeout)
+        finally:
+            self._cache_invalidate(url)
+
+    async def put(self, subpath: str, query_args: Optional[Dict] = None, json_data=None,
+                  timeout: Optional[float] = None) -> requests.Response:
+        url = self._build_url(subpath, query_args)
+        headers = self._build_headers()
+        try:
+            return await self._request('PUT', url, headers, json_data if json_data is not None else {}, timeout=timeout)
+        finally:
+            self._cache_invalidate(url)
+
+    async def delete(self, subpath: str, query_args: Optional[Dict] = None, json_data=None,
+                     timeout: Optional[float] = None) -> requests.Response:
+        url = self._build_url(subpath, query_args)
+        headers = self._build_headers()
+        try:
+            return await self._request('DELETE', url, headers, json_data if json_data is not None else {}, timeout=timeout)
+        finally:
+            self._cache_invalidate(url)
@@ -0,0 +1,39 @@
+"""Asyncio twin of :mod:`vastai.api.paging`.
+
+Same contract as :func:`vastai.api.paging.iter_cursor_pages`, but
+``fetch_page`` is a coroutine function and the prefetch runs as tasks on the
+caller's event loop instead of a background thread.
+"""
+
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable, Dict
+
+from vastai.api.paging import _DEFAULT_PREFETCH, _next_params
+
+
+async def iter_cursor_pages(fetch_page: Callable[[Dict], Awaitable[Dict]], params: Dict,
+                            token_key: str = "next_token", token_param: str = "after_token",
+                            prefetch: int = _DEFAULT_PREFETCH) -> AsyncIterator[Dict]:
+    """Yield every page of a cursor-paginated endpoint.
+
+    With ``prefetch > 0`` the request for page N+1 is started as soon as page
+    N's token is known, so it overlaps with the caller's handling of page N.
+    Tokens are sequential, so at most one request is ever in flight.
+    """
+    if prefetch <= 0:
+        while params is not None:
+            data = await fetch_page(params)
+            yield data
+            params = _next_params(params, data, token_key, token_param)
+        return
+
+    pending = asyncio.ensure_future(fetch_page(params))
+    try:
+        while pending is not None:
+            data = await pending
+            params = _next_params(params, data, token_key, token_param)
+            pending = asyncio.ensure_future(fetch_page(params)) if params is not None else None
+            yield data
+    finally:
+        if pending is not None and not pending.done():
+            pending.cancel()
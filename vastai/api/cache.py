@@ -0,0 +1,348 @@
+"""HTTP response cache for near-static, read-only Vast.ai routes.
+
+:class:`ResponseCache` plugs into :class:`vastai.api.client.VastClient`
+(``VastClient(cache=...)``) and serves ``GET`` responses for a small set of
+catalog routes -- GPU names, the GPU type catalog, template search -- without
+a network round-trip while they are fresh.
+
+* Each cacheable route has its own TTL (see :data:`DEFAULT_CACHE_ROUTES`).
+  Routes that are not listed are never cached and cost nothing extra.
+* Entries live in a bounded in-memory LRU and, optionally, in an on-disk
+  store under the XDG cache dir so separate CLI processes share them.  The
+  disk store is bounded too; the least recently used files are evicted.  Its
+  directory and files are readable by their owner only.
+* When a stale entry carries ``ETag``/``Last-Modified`` validators the next
+  request is sent conditionally; a ``304 Not Modified`` refreshes the entry
+  instead of re-downloading the body.
+* Entries are keyed on the full URL and the caller's credentials (hashed,
+  never stored), so responses are never shared between API keys.
+* A ``POST``/``PUT``/``DELETE`` through the client to a cacheable route (e.g.
+  creating a template) drops every entry of that route, in memory and on disk.
+
+Set ``VAST_NO_CACHE=1`` (or pass ``--no-cache`` to the CLI) to bypass it.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# (path regex, TTL seconds).  First match wins; paths are matched against the
+# URL path only, so query arguments do not affect which policy applies.
+DEFAULT_CACHE_ROUTES: Tuple[Tuple[str, float], ...] = (
+    (r"^/api/v0/gpu_names/unique/$", 24 * 3600),
+    (r"^/api/v0/gpu_types/$", 24 * 3600),
+    (r"^/api/v0/template/$", 60),
+)
+
+_DEFAULT_MAX_ENTRIES = 128
+_DEFAULT_MAX_DISK_ENTRIES = 256
+
+_NO_CACHE_ENV = "VAST_NO_CACHE"
+
+
+def default_cache_dir() -> str:
+    """``$XDG_CACHE_HOME/vastai/http`` (``~/.cache/vastai/http`` without xdg)."""
+    try:
+        import xdg
+        base = str(xdg.xdg_cache_home())
+    except Exception:
+        base = os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "vastai", "http")
+
+
+@dataclass
+class CacheStats:
+    """Counters for one :class:`ResponseCache`."""
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    def __str__(self) -> str:
+        return (f"hits={self.hits} misses={self.misses} revalidated={self.revalidated} "
+                f"stores={self.stores} evictions={self.evictions}")
+
+
+@dataclass
+class CacheEntry:
+    """A stored response plus its freshness metadata."""
+    url: str
+    status_code: int
+    headers: Dict[str, str]
+    content: bytes
+    expires_at: float
+    stored_at: float = field(default_factory=time.time)
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidating this entry."""
+        result = {}
+        etag = self.headers.get("ETag") or self.headers.get("etag")
+        if etag:
+            result["If-None-Match"] = etag
+        last_modified = self.headers.get("Last-Modified") or self.headers.get("last-modified")
+        if last_modified:
+            result["If-Modified-Since"] = last_modified
+        return result
+
+    def to_response(self) -> requests.Response:
+        r = requests.Response()
+        r.status_code = self.status_code
+        r.url = self.url
+        r.headers = CaseInsensitiveDict(self.headers)
+        r.encoding = requests.utils.get_encoding_from_headers(r.headers)
+        r._content = self.content
+        return r
+
+    def to_json(self) -> Dict:
+        return {
+            "url": self.url,
+            "status_code": self.status_code,
+            "headers": self.headers,
+            "content": base64.b64encode(self.content).decode("ascii"),
+            "expires_at": self.expires_at,
+            "stored_at": self.stored_at,
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict) -> "CacheEntry":
+        return cls(
+            url=data["url"],
+            status_code=data["status_code"],
+            headers=data["headers"],
+            content=base64.b64decode(data["content"]),
+            expires_at=data["expires_at"],
+            stored_at=data["stored_at"],
+        )
+
+
+class ResponseCache:
+    """Two-level (memory + optional disk) LRU cache of GET responses.
+
+    Args:
+        routes: ``(path regex, ttl seconds)`` pairs; defaults to
+            :data:`DEFAULT_CACHE_ROUTES`.
+        max_entries: In-memory LRU bound.
+        cache_dir: Directory for the on-disk store, or None for memory only.
+        max_disk_entries: On-disk LRU bound.
+    """
+
+    def __init__(self, routes: Optional[Iterable[Tuple[str, float]]] = None,
+                 max_entries: int = _DEFAULT_MAX_ENTRIES,
+                 cache_dir: Optional[str] = None,
+                 max_disk_entries: int = _DEFAULT_MAX_DISK_ENTRIES):
+        self.routes = [(re.compile(pattern), ttl)
+                       for pattern, ttl in (DEFAULT_CACHE_ROUTES if routes is None else routes)]
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.max_disk_entries = max_disk_entries
+        self.stats = CacheStats()
+        self._memory: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    # -- policy ------------------------------------------------------------
+
+    def _route_for(self, url: str) -> Optional[Tuple["re.Pattern", float]]:
+        path = urlsplit(url).path
+        for route in self.routes:
+            if route[0].search(path):
+                return route
+        return None
+
+    def ttl_for(self, url: str) -> Optional[float]:
+        """TTL for ``url``'s route, or None when the route is not cacheable."""
+        route = self._route_for(url)
+        return None if route is None else route[1]
+
+    @staticmethod
+    def key_for(url: str, headers: Dict) -> str:
+        auth = headers.get("Authorization", "")
+        return hashlib.sha256(f"GET {url}\n{auth}".encode()).hexdigest()
+
+    # -- lookup / store ----------------------------------------------------
+
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        """Return the entry for ``key`` (fresh or stale), promoting it in the LRU."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry
+        entry = self._read_disk(key)
+        if entry is not None:
+            self._remember(key, entry)
+        return entry
+
+    def store(self, key: str, response: requests.Response, ttl: float) -> None:
+        """Store a 200 response unless the server forbids it."""
+        if response.status_code != 200:
+            return
+        cache_control = response.headers.get("Cache-Control", "").lower()
+        directives = {d.strip() for d in cache_control.split(",")}
+        if "no-store" in directives:
+            return
+        # Entries are keyed on the caller's credentials and stored owner-only, so
+        # ``private`` responses may be kept.  ``max-age=0``/``no-cache`` ones are
+        # stale at once: kept only if they can be revalidated.
+        if "max-age=0" in directives or "no-cache" in directives:
+            ttl = 0
+        entry = CacheEntry(
+            url=response.url,
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            content=response.content,
+            expires_at=time.time() + ttl,
+        )
+        if ttl <= 0 and not entry.validators():
+            return
+        self._remember(key, entry)
+        self._write_disk(key, entry)
+        with self._lock:
+            self.stats.stores += 1
+
+    def refresh(self, key: str, entry: CacheEntry, not_modified: requests.Response, ttl: float) -> None:
+        """Extend ``entry`` after a ``304 Not Modified``, adopting updated validators."""
+        for name in ("ETag", "Last-Modified"):
+            value = not_modified.headers.get(name)
+            if value:
+                entry.headers[name] = value
+        entry.expires_at = time.time() + ttl
+        self._remember(key, entry)
+        self._write_disk(key, entry)
+
+    def invalidate(self, url: str) -> None:
+        """Drop every entry of ``url``'s route (any query, any caller), after a
+        write to that route made them stale."""
+        route = self._route_for(url)
+        if route is None:
+            return
+
+        def stale(entry_url: str) -> bool:
+            return self._route_for(entry_url) is route
+
+        with self._lock:
+            for key in [k for k, e in self._memory.items() if stale(e.url)]:
+                del self._memory[key]
+        for path in self._disk_files():
+            try:
+                with open(path, "r") as f:
+                    entry_url = json.load(f)["url"]
+                if stale(entry_url):
+                    os.unlink(path)
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+
+    def clear(self) -> None:
+        """Drop every entry from memory and disk."""
+        with self._lock:
+            self._memory.clear()
+        for path in self._disk_files():
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+    def record(self, outcome: str) -> None:
+        """Count a lookup outcome: ``"hits"``, ``"misses"`` or ``"revalidated"``."""
+        with self._lock:
+            setattr(self.stats, outcome, getattr(self.stats, outcome) + 1)
+
+    # -- internals ---------------------------------------------------------
+
+    def _remember(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+                self.stats.evictions += 1
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + ".json")
+
+    def _disk_files(self):
+        if not self.cache_dir or not os.path.isdir(self.cache_dir):
+            return []
+        return [os.path.join(self.cache_dir, name)
+                for name in os.listdir(self.cache_dir) if name.endswith(".json")]
+
+    def _read_disk(self, key: str) -> Optional[CacheEntry]:
+        if not self.cache_dir:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "r") as f:
+                entry = CacheEntry.from_json(json.load(f))
+            os.utime(path)  # mtime doubles as the disk LRU clock
+            return entry
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _write_disk(self, key: str, entry: CacheEntry) -> None:
+        if not self.cache_dir:
+            return
+        try:
+            self._make_private_dir()
+            # a unique name per writer, created 0600: entries may hold responses
+            # to authenticated requests
+            fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(entry.to_json(), f)
+                os.replace(tmp, self._path(key))
+            except OSError:
+                os.unlink(tmp)
+                raise
+            self._evict_disk()
+        except OSError:
+            pass
+
+    def _make_private_dir(self) -> None:
+        """Create the store readable by its owner only, and tighten one made
+        with the default umask."""
+        os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+        if os.stat(self.cache_dir).st_mode & 0o077:
+            os.chmod(self.cache_dir, 0o700)
+
+    def _evict_disk(self) -> None:
+        files = self._disk_files()
+        excess = len(files) - self.max_disk_entries
+        if excess <= 0:
+            return
+        files.sort(key=lambda p: os.path.getmtime(p))
+        for path in files[:excess]:
+            try:
+                os.unlink(path)
+                with self._lock:
+                    self.stats.evictions += 1
+            except OSError:
+                pass
+
+
+_default_cache: Optional[ResponseCache] = None
+
+
+def get_default_cache() -> Optional[ResponseCache]:
+    """Process-wide memory + disk cache, or None when ``VAST_NO_CACHE`` is set."""
+    global _default_cache
+    if os.environ.get(_NO_CACHE_ENV, "").lower() in ("1", "true", "yes"):
+        return None
+    if _default_cache is None:
+        _default_cache = ResponseCache(cache_dir=default_cache_dir())
+    return _default_cache
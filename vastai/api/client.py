@@ -4,11 +4,14 @@ import os
 import re
 import json
 import sys
+import threading
 import time
 import requests
+from requests.adapters import HTTPAdapter
 from urllib.parse import quote_plus
 from typing import Dict, Optional
 
+from vastai.api.cache import CacheEntry, ResponseCache
 from vastai.utils import VERSION
 
 try:
@@ -39,18 +42,28 @@ _RETRYABLE_EXC = (
 # log retrieval and instance creation; callers can override per-call.
 _DEFAULT_TIMEOUT_SECONDS = 120
 
+# Default number of keep-alive connections held per host by the client-owned
+# session. One host (console.vast.ai) is the common case; the headroom lets
+# threaded callers share a client without blocking on the pool.
+_DEFAULT_POOL_SIZE = 10
 
-class VastClient:
-    """HTTP client for Vast.ai API requests."""
+
+class _BaseVastClient:
+    """Transport-independent pieces shared by :class:`VastClient` and
+    :class:`vastai.api.async_client.AsyncVastClient`: configuration, URL and
+    header building, and the ``--explain``/``--curl`` diagnostics."""
 
     def __init__(self, api_key=None, server_url=None, retry=3, explain=False, curl=False,
-                 timeout=_DEFAULT_TIMEOUT_SECONDS, client_type="sdk"):
+                 timeout=_DEFAULT_TIMEOUT_SECONDS, client_type="sdk",
+                 pool_size=_DEFAULT_POOL_SIZE, cache: Optional[ResponseCache] = None):
         self.api_key = api_key
         self.server_url = server_url or server_url_default
         self.retry = retry
         self.explain = explain
         self.curl = curl
         self.timeout = timeout
+        self.pool_size = pool_size
+        self.cache = cache
         self.user_agent = f"vastai-{client_type}/{VERSION}"
 
     def _build_url(self, subpath: str, query_args: Optional[Dict] = None) -> str:
@@ -85,6 +98,117 @@ class VastClient:
             result["Authorization"] = "Bearer " + self.api_key
         return result
 
+    def _cache_plan(self, url: str, headers: Dict, json_data):
+        """Return ``(key, ttl, entry)`` when a GET of ``url`` goes through the
+        response cache, else None.  ``entry`` is the stored (possibly stale)
+        response or None."""
+        if self.cache is None or json_data is not None:
+            return None
+        ttl = self.cache.ttl_for(url)
+        if ttl is None:
+            return None
+        key = self.cache.key_for(url, headers)
+        return key, ttl, self.cache.lookup(key)
+
+    def _cache_hit(self, entry: CacheEntry) -> requests.Response:
+        self.cache.record("hits")
+        if self.explain:
+            print(f"{INFO}  cache hit: {entry.url} ({self.cache.stats})")
+        return entry.to_response()
+
+    def _cache_settle(self, key: str, ttl: float, entry: Optional[CacheEntry],
+                      r: requests.Response) -> requests.Response:
+        """Fold a network response into the cache; a 304 answers from ``entry``."""
+        if entry is not None and r.status_code == 304:
+            self.cache.refresh(key, entry, r, ttl)
+            self.cache.record("revalidated")
+            outcome, r = "revalidated", entry.to_response()
+        else:
+            self.cache.store(key, r, ttl)
+            self.cache.record("misses")
+            outcome = "miss"
+        if self.explain:
+            print(f"{INFO}  cache {outcome}: {r.url} ({self.cache.stats})")
+        return r
+
+    def _cache_invalidate(self, url: str) -> None:
+        """A write to ``url`` makes the cached reads of its route stale; drop them."""
+        if self.cache is not None:
+            self.cache.invalidate(url)
+
+    def _show_prepared(self, prep: requests.PreparedRequest, headers: Dict, json_data) -> None:
+        """Print ``--explain`` details and, in ``--curl`` mode, the curl command (then exit)."""
+        if self.explain:
+            print(f"\n{INFO}  Prepared Request:")
+            print(f"{prep.method} {prep.url}")
+            print(f"Headers: {json.dumps(headers, indent=1)}")
+            print(f"Body: {json.dumps(json_data, indent=1)}" + "\n" + "_" * 100 + "\n")
+
+        if self.curl:
+            if curlify is None:
+                print("curlify package is required for --curl mode. Install with: pip install curlify")
+                sys.exit(1)
+            as_curl = curlify.to_curl(prep)
+            simple = re.sub(r" -H '[^']*'", '', as_curl)
+            parts = re.split(r'(?=\s+-\S+)', simple)
+            pp = parts[-1].split("'")
+            pp[-3] += "\n "
+            parts = [*parts[:-1], *[x.rstrip() for x in "'".join(pp).split("\n")]]
+            print("\n" + ' \\\n  '.join(parts).strip() + "\n")
+            sys.exit(0)
+
+
+class VastClient(_BaseVastClient):
+    """HTTP client for Vast.ai API requests.
+
+    The client owns a single ``requests.Session`` (created lazily on the first
+    request) so consecutive calls reuse keep-alive connections instead of
+    paying a fresh TCP+TLS handshake each time.  Call :meth:`close` or use the
+    client as a context manager to release the pooled connections.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._session: Optional[requests.Session] = None
+        # threads sharing the client must not each create (and leak) a session
+        self._session_lock = threading.Lock()
+
+    def _get_session(self) -> requests.Session:
+        """Return the client-owned session, creating it on first use."""
+        session = self._session
+        if session is not None:
+            return session
+        with self._session_lock:
+            if self._session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=self.pool_size,
+                    pool_maxsize=self.pool_size,
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._session = session
+            return self._session
+
+    def close(self) -> None:
+        """Close pooled connections. The client reopens them if used again."""
+        with self._session_lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def fetch(self, url: str, timeout: Optional[float] = None) -> requests.Response:
+        """Plain unauthenticated GET of an absolute URL (e.g. a presigned result
+        URL) over the pooled session. No retries; the caller decides."""
+        effective_timeout = timeout if timeout is not None else self.timeout
+        return self._get_session().get(url, timeout=effective_timeout)
+
     def _request(self, method: str, url: str, headers: Dict, json_data=None,
                  timeout: Optional[float] = None) -> requests.Response:
         """Execute HTTP request with retry/timeout/exception handling.
@@ -96,32 +220,17 @@ class VastClient:
         After exhausting retries, the last response is returned (for status-code
         retries) or the last exception is re-raised (for transport exceptions).
         Non-retryable ``requests`` exceptions propagate immediately.
+        All attempts go through the client-owned session, so retries and
+        subsequent calls reuse pooled keep-alive connections.
         """
         effective_timeout = timeout if timeout is not None else self.timeout
         t = 0.15
         r = None
+        session = self._get_session()
         for i in range(0, self.retry):
             req = requests.Request(method=method, url=url, headers=headers, json=json_data)
-            session = requests.Session()
             prep = session.prepare_request(req)
-            if self.explain:
-                print(f"\n{INFO}  Prepared Request:")
-                print(f"{prep.method} {prep.url}")
-                print(f"Headers: {json.dumps(headers, indent=1)}")
-                print(f"Body: {json.dumps(json_data, indent=1)}" + "\n" + "_" * 100 + "\n")
-
-            if self.curl:
-                if curlify is None:
-                    print("curlify package is required for --curl mode. Install with: pip install curlify")
-                    sys.exit(1)
-                as_curl = curlify.to_curl(prep)
-                simple = re.sub(r" -H '[^']*'", '', as_curl)
-                parts = re.split(r'(?=\s+-\S+)', simple)
-                pp = parts[-1].split("'")
-                pp[-3] += "\n "
-                parts = [*parts[:-1], *[x.rstrip() for x in "'".join(pp).split("\n")]]
-                print("\n" + ' \\\n  '.join(parts).strip() + "\n")
-                sys.exit(0)
+            self._show_prepared(prep, headers, json_data)
 
             try:
                 r = session.send(prep, timeout=effective_timeout)
@@ -143,22 +252,40 @@ class VastClient:
             timeout: Optional[float] = None) -> requests.Response:
         url = self._build_url(subpath, query_args)
         headers = self._build_headers()
-        return self._request('GET', url, headers, json_data, timeout=timeout)
+        plan = self._cache_plan(url, headers, json_data)
+        if plan is None:
+            return self._request('GET', url, headers, json_data, timeout=timeout)
+        key, ttl, entry = plan
+        if entry is not None and entry.fresh:
+            return self._cache_hit(entry)
+        if entry is not None:
+            headers = {**headers, **entry.validators()}
+        r = self._request('GET', url, headers, json_data, timeout=timeout)
+        return self._cache_settle(key, ttl, entry, r)
 
     def post(self, subpath: str, query_args: Optional[Dict] = None, json_data=None,
              timeout: Optional[float] = None) -> requests.Response:
         url = self._build_url(subpath, query_args)
         headers = self._build_headers()
-        return self._request('POST', url, headers, json_data if json_data is not None else {}, timeout=timeout)
+        try:
+            return self._request('POST', url, headers, json_data if json_data is not None else {}, timeout=timeout)
+        finally:
+            self._cache_invalidate(url)
 
     def put(self, subpath: str, query_args: Optional[Dict] = None, json_data=None,
             timeout: Optional[float] = None) -> requests.Response:
         url = self._build_url(subpath, query_args)
         headers = self._build_headers()
-        return self._request('PUT', url, headers, json_data if json_data is not None else {}, timeout=timeout)
+        try:
+            return self._request('PUT', url, headers, json_data if json_data is not None else {}, timeout=timeout)
+        finally:
+            self._cache_invalidate(url)
 
     def delete(self, subpath: str, query_args: Optional[Dict] = None, json_data=None,
                timeout: Optional[float] = None) -> requests.Response:
         url = self._build_url(subpath, query_args)
         headers = self._build_headers()
-        return self._request('DELETE', url, headers, json_data if json_data is not None else {}, timeout=timeout)
+        try:
+            return self._request('DELETE', url, headers, json_data if json_data is not None else {}, timeout=timeout)
+        finally:
+            self._cache_invalidate(url)
@@ -1,15 +1,16 @@
 """Instance CRUD operations."""
+import functools
 import time
-import requests
 from typing import Optional
 from vastai.api.client import VastClient
+from vastai.api.paging import iter_cursor_pages, _DEFAULT_PREFETCH
 
 
-def _poll_result_url(result_url, retries=30, delay=0.3):
+def _poll_result_url(client: VastClient, result_url, retries=30, delay=0.3):
     """Poll a result URL until the content is ready. Total timeout ~9s."""
     for _ in range(retries):
         time.sleep(delay)
-        r = requests.get(result_url, timeout=10)
+        r = client.fetch(result_url, timeout=10)
         if r.status_code == 200:
             return r.text
     raise TimeoutError(f"Result not ready after {retries * delay}s: {result_url}")
@@ -26,34 +27,53 @@ def _strip_strings(value):
     return value
 
 
-def show_instances(client: VastClient, select_filters: Optional[dict] = None, order_by: Optional[list] = None) -> list:
+# Rows per request when walking /api/v1/instances/; matches the CLI --limit cap.
+DEFAULT_INSTANCES_PAGE_SIZE = 25
+
+
+def _format_instance_row(row: dict) -> dict:
+    """Normalise one v1 instance row into the shape show_instances returns."""
+    row = {k: _strip_strings(v) for k, v in row.items()}
+    row['duration'] = time.time() - row['start_date']
+    row['extra_env'] = {env_var[0]: env_var[1] for env_var in row['extra_env']}
+    return row
+
+
+def iter_instances(client: VastClient, select_filters: Optional[dict] = None, order_by: Optional[list] = None,
+                   page_size: int = DEFAULT_INSTANCES_PAGE_SIZE, prefetch: int = _DEFAULT_PREFETCH):
+    """Yield the user's instances one row at a time as pages arrive.
+
+    Walks the v1 ``/api/v1/instances/`` endpoint like :func:`show_instances`,
+    but rows are yielded as soon as their page is decoded, and the request for
+    the next page is issued as soon as its ``next_token`` is known (see
+    :func:`vastai.api.paging.iter_cursor_pages`).  Only a few pages are held
+    in memory at a time regardless of the total instance count.
+    """
+    params = {
+        "select_filters": select_filters or {},
+        "order_by": order_by or [{"col": "id", "dir": "asc"}],
+        "limit": page_size,
+    }
+    fetch_page = functools.partial(show_instances_v1, client)
+    for data in iter_cursor_pages(fetch_page, params, prefetch=prefetch):
+        for row in data.get("instances") or []:
+            yield _format_instance_row(row)
+
+
+def show_instances(client: VastClient, select_filters: Optional[dict] = None, order_by: Optional[list] = None,
+                   page_size: int = DEFAULT_INSTANCES_PAGE_SIZE) -> list:
     """Return all of the user's instances (optionally filtered/sorted) as a flat list.
 
     Pages through the v1 ``/api/v1/instances/`` endpoint, following
     ``next_token`` until it is exhausted, and concatenates every page into one
     flat list. ``select_cols`` is omitted on purpose: the backend then returns
     full instance rows, matching the shape scripts and the SDK have always
-    depended on for this function's output.
+    depended on for this function's output.  Use :func:`iter_instances` to
+    process rows before the last page arrives.
     """
-    rows = []
-    params = {
-        "select_filters": select_filters or {},
-        "order_by": order_by or [{"col": "id", "dir": "asc"}],
-        "limit": 25,
-    }
-    while True:
-        data = show_instances_v1(client, params)
-        page = data.get("instances") or []
-        for row in page:
-            row = {k: _strip_strings(v) for k, v in row.items()}
-            row['duration'] = time.time() - row['start_date']
-            row['extra_env'] = {env_var[0]: env_var[1] for env_var in row['extra_env']}
-            rows.append(row)
-        next_token = data.get("next_token")
-        if not next_token:
-            break
-        params["after_token"] = next_token
-    return rows
+    # A comprehension rather than list() so the generated async twin can
+    # consume the async generator with ``async for``.
+    return [row for row in iter_instances(client, select_filters, order_by, page_size)]
 
 
 def show_instances_v1(client: VastClient, params: dict) -> dict:
@@ -229,7 +249,7 @@ def execute(client: VastClient, id: int, command: str):
     result_url = rj.get("result_url")
     if not result_url:
         return rj
-    return _poll_result_url(result_url)
+    return _poll_result_url(client, result_url)
 
 
 def logs(client: VastClient, instance_id: int, tail=None, filter=None, daemon_logs=False):
@@ -247,7 +267,7 @@ def logs(client: VastClient, instance_id: int, tail=None, filter=None, daemon_lo
     result_url = rj.get("result_url")
     if not result_url:
         return rj
-    return _poll_result_url(result_url)
+    return _poll_result_url(client, result_url)
 
 
 def update_instance(client: VastClient, id: int, template_id=None, template_hash_id=None,
@@ -0,0 +1,93 @@
+"""Cursor pagination helpers for ``next_token``-style list endpoints.
+
+The v1 list endpoints return one page per request plus an opaque
+``next_token``; page N+1 can only be requested once page N has arrived.
+:func:`iter_cursor_pages` pipelines that walk: as soon as a page's token is
+known the next request is issued on a background thread while the caller
+processes the page it already has.  At most ``prefetch + 2`` pages are alive
+at once (the one being consumed, the queued ones, and the one in flight), so
+streaming callers stay memory-bounded however many pages there are.
+
+The asyncio twin lives in :mod:`vastai.api.async_paging`.
+"""
+
+import queue
+import threading
+from typing import Callable, Dict, Iterator
+
+# Pages buffered ahead of the consumer in prefetch mode.
+_DEFAULT_PREFETCH = 1
+
+_DONE = object()
+
+
+def _next_params(params: Dict, data: Dict, token_key: str, token_param: str):
+    """Return params for the page after ``data``, or None when it was the last."""
+    token = data.get(token_key)
+    if not token:
+        return None
+    return {**params, token_param: token}
+
+
+def _iter_serial(fetch_page, params, token_key, token_param) -> Iterator[Dict]:
+    while params is not None:
+        data = fetch_page(params)
+        yield data
+        params = _next_params(params, data, token_key, token_param)
+
+
+def iter_cursor_pages(fetch_page: Callable[[Dict], Dict], params: Dict,
+                      token_key: str = "next_token", token_param: str = "after_token",
+                      prefetch: int = _DEFAULT_PREFETCH) -> Iterator[Dict]:
+    """Yield every page of a cursor-paginated endpoint.
+
+    Args:
+        fetch_page: Called with the request params for one page; returns the
+            decoded response dict.
+        params: Params for the first page.  Never mutated.
+        token_key: Response key holding the cursor for the next page.
+        token_param: Request param the cursor is sent back in.
+        prefetch: Pages to fetch ahead of the consumer on a background
+            thread.  ``0`` fetches strictly on demand in the caller's thread.
+
+    Errors raised by ``fetch_page`` surface from the iterator at the point the
+    failing page would have been yielded.  Abandoning the iterator early stops
+    the background fetcher after its in-flight request.
+    """
+    if prefetch <= 0:
+        yield from _iter_serial(fetch_page, params, token_key, token_param)
+        return
+
+    pages: "queue.Queue" = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+
+    def _put(item) -> bool:
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce():
+        try:
+            for data in _iter_serial(fetch_page, params, token_key, token_param):
+                if not _put(data):
+                    return
+            _put(_DONE)
+        except BaseException as exc:
+            _put(exc)
+
+    fetcher = threading.Thread(target=_produce, name="vastai-pager", daemon=True)
+    fetcher.start()
+    try:
+        while True:
+            item = pages.get()
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
@@ -0,0 +1,1024 @@
+# Generated by scripts/generate_async_api.py from vastai/sdk.py. Do not edit;
+# change the source module and re-run the generator.
+"""Asyncio facade mirroring vastai.sdk.VastAI over the vastai.api.aio modules."""
+
+from __future__ import annotations
+
+import warnings
+from typing import Dict, List, Optional, Union
+
+from vastai._base import _resolve_api_key, _APIKEY_SENTINEL
+from vastai.api.cache import ResponseCache
+from vastai.api.async_client import AsyncVastClient, _DEFAULT_CONNECTION_LIMIT
+from vastai.api.aio import instances, offers, machines, teams, keys, endpoints, billing, storage, clusters, auth, deployments
+
+
+class AsyncVastAI:
+    """Asyncio counterpart of :class:`vastai.sdk.VastAI`.
+
+    Every public method mirrors the ``VastAI`` method of the same name and
+    is a coroutine.  Calls go through an :class:`AsyncVastClient`, so many
+    control-plane operations can be awaited concurrently from one event loop::
+
+        async with AsyncVastAI(api_key=...) as vast:
+            rows = await asyncio.gather(*(vast.show_instance(i) for i in ids))
+
+    Args:
+        api_key: Vast.ai API key, resolved exactly as for ``VastAI``.
+        server_url: Base URL of the Vast.ai API server.
+        retry: Number of retries on transient HTTP errors.
+        raw: If *True*, return raw JSON dicts instead of formatted output.
+        explain: If *True*, print request details for debugging.
+        quiet: If *True*, suppress informational output.
+        curl: If *True*, print equivalent curl commands instead of executing.
+        connection_limit: Maximum number of concurrent connections.
+        cache: Optional :class:`~vastai.api.cache.ResponseCache` for read-only
+            catalog routes.  Off by default.
+    """
+
+    def __init__(self, api_key: Optional[str] = None, server_url: Optional[str] = None, retry: int = 3, raw: bool = False, explain: bool = False, quiet: bool = False, curl: bool = False, connection_limit: int = _DEFAULT_CONNECTION_LIMIT, cache: Optional[ResponseCache] = None):
+        resolved_key = _resolve_api_key(_APIKEY_SENTINEL if api_key is None else api_key)
+        self.client = AsyncVastClient(resolved_key, server_url, retry, explain, curl, connection_limit=connection_limit, cache=cache)
+        self.raw = raw
+        self.quiet = quiet
+
+    async def close(self) -> None:
+        """Release the pooled HTTP connections held by the underlying client."""
+        await self.client.close()
+
+    async def __aenter__(self) -> 'AsyncVastAI':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    # ------------------------------------------------------------------
+    # Instance methods
+    # ------------------------------------------------------------------
+
+    async def show_instances(self) -> list[dict]:
+        """Return all of the authenticated user's instances as a flat list."""
+        return await instances.show_instances(self.client)
+
+    async def iter_instances(
+        self,
+        select_filters: Optional[dict] = None,
+        order_by: Optional[list] = None,
+        page_size: int = instances.DEFAULT_INSTANCES_PAGE_SIZE,
+    ):
+        """Yield the authenticated user's instances as pages arrive.
+
+        Streaming variant of :meth:`show_instances`: rows are yielded as soon
+        as their page is decoded while the next page is already being fetched,
+        and only a few pages are held in memory at a time.
+        """
+        async for row in instances.iter_instances(self.client, select_filters, order_by, page_size):
+            yield row
+
+    async def show_instances_v1(self, params: dict) -> dict:
+        """Return instances using the paginated v1 API; for filtering, sorting, and manual pagination."""
+        return await instances.show_instances_v1(self.client, params)
+
+    async def show_instance_filters(self) -> list:
+        """Return distinct filterable values for instances."""
+        return await instances.show_instance_filters(self.client)
+
+    async def show_instance(self, id: int) -> Optional[dict]:
+        """Return details of a single instance."""
+        return await instances.show_instance(self.client, id)
+
+    async def create_instance(self, id: int, image: Optional[str] = None, disk: float = 10, **kwargs) -> dict:
+        """Create a new instance from a contract offer ID."""
+        return await instances.create_instance(self.client, id, image=image, disk=disk, **kwargs)
+
+    async def destroy_instance(self, id: int) -> dict:
+        """Destroy an instance."""
+        return await instances.destroy_instance(self.client, id)
+
+    async def start_instance(self, id: int) -> dict:
+        """Start a stopped instance."""
+        return await instances.start_instance(self.client, id)
+
+    async def stop_instance(self, id: int) -> dict:
+        """Stop a running instance."""
+        return await instances.stop_instance(self.client, id)
+
+    async def reboot_instance(self, id: int) -> dict:
+        """Reboot an instance."""
+        return await instances.reboot_instance(self.client, id)
+
+    async def recycle_instance(self, id: int) -> dict:
+        """Recycle an instance."""
+        return await instances.recycle_instance(self.client, id)
+
+    async def label_instance(self, id: int, label: str) -> dict:
+        """Set a label on an instance."""
+        return await instances.label_instance(self.client, id, label)
+
+    async def prepay_instance(self, id: int, amount: float) -> dict:
+        """Prepay for an instance."""
+        return await instances.prepay_instance(self.client, id, amount)
+
+    async def change_bid(self, id: int, price: Optional[float] = None) -> dict:
+        """Change the bid price for an instance."""
+        return await instances.change_bid(self.client, id, price=price)
+
+    async def show_pending_price_increases(self) -> dict:
+        """Return the pending-price-increase envelope for the authenticated user.
+
+        See ``vastai.api.price_increase.list_pending`` for the response shape.
+        """
+        from vastai.api.aio import price_increase
+        return await price_increase.list_pending(self.client)
+
+    async def accept_price_increase(self, instance_id: int) -> dict:
+        """Accept the pending price increase on ``instance_id``.
+
+        Resolves the instance's pending row via the pending-list endpoint
+        and PUTs the per-row accept. The new prices and extended end date
+        apply only after the contract's current ``end_date``.
+
+        Raises ``LookupError`` when no pending row matches the instance id.
+        """
+        from vastai.api.aio import price_increase
+        match = await price_increase.resolve_instance_to_pending(self.client, instance_id)
+        return await price_increase.accept(self.client, match["pending_price_increase_id"])
+
+    async def reject_price_increase(self, instance_id: int) -> dict:
+        """Reject the pending price increase on ``instance_id``.
+
+        Tombstones the matching pending row on the backend; no cutover
+        follows. Raises ``LookupError`` when no pending row matches.
+        """
+        from vastai.api.aio import price_increase
+        match = await price_increase.resolve_instance_to_pending(self.client, instance_id)
+        return await price_increase.reject(self.client, match["pending_price_increase_id"])
+
+    async def execute(self, id: int, command: str) -> dict:
+        """Execute a command on an instance."""
+        return await instances.execute(self.client, id, command)
+
+    async def logs(
+        self,
+        instance_id: int,
+        tail: Optional[str] = None,
+        filter: Optional[str] = None,
+        daemon_logs: bool = False,
+    ) -> str:
+        """Retrieve logs for an instance."""
+        return await instances.logs(self.client, instance_id, tail=tail, filter=filter, daemon_logs=daemon_logs)
+
+    async def ssh_url(self, id: int) -> str:
+        """Get the SSH URL for an instance."""
+        inst = await instances.show_instance(self.client, id)
+        if isinstance(inst, list):
+            inst = inst[0] if inst else {}
+        if not isinstance(inst, dict):
+            return ""
+        port = inst.get("ssh_port") or (inst.get("ports") or {}).get("22/tcp", [{}])[0].get("HostPort")
+        ip = inst.get("ssh_host") or inst.get("public_ipaddr")
+        return f"ssh://root@{ip}:{port}" if port and ip else ""
+
+    async def scp_url(self, id: int) -> str:
+        """Get the SCP URL for an instance."""
+        inst = await instances.show_instance(self.client, id)
+        if isinstance(inst, list):
+            inst = inst[0] if inst else {}
+        if not isinstance(inst, dict):
+            return ""
+        port = inst.get("ssh_port") or (inst.get("ports") or {}).get("22/tcp", [{}])[0].get("HostPort")
+        ip = inst.get("ssh_host") or inst.get("public_ipaddr")
+        return f"scp://root@{ip}:{port}" if port and ip else ""
+
+    async def take_snapshot(self, instance_id, **kwargs) -> dict:
+        """Take a container snapshot and push to a registry."""
+        return await instances.take_snapshot(self.client, instance_id, **kwargs)
+
+    # ------------------------------------------------------------------
+    # Deployment methods
+    # ------------------------------------------------------------------
+
+    async def show_deployments(self) -> list[dict]:
+        """Return all deployments for the authenticated user."""
+        return await deployments.show_deployments(self.client)
+
+    async def show_deployment(self, id: int) -> dict:
+        """Return details of a single deployment."""
+        return await deployments.show_deployment(self.client, id)
+
+    async def show_deployment_versions(self, id: int) -> list:
+        """Return version history for a deployment."""
+        return await deployments.show_deployment_versions(self.client, id)
+
+    async def delete_deployment(self, id: int) -> dict:
+        """Delete a deployment."""
+        return await deployments.delete_deployment(self.client, id)
+
+    # ------------------------------------------------------------------
+    # Offer / search methods
+    # ------------------------------------------------------------------
+
+    async def search_offers(
+        self,
+        query=None,
+        type: str = "on-demand",
+        order: str = "score-",
+        limit: Optional[int] = None,
+        storage: float = 5.0,
+        no_default: bool = False,
+        **kwargs,
+    ) -> list:
+        """Search for GPU offers.
+
+        Args:
+            query: Query string (e.g. "num_gpus=1 gpu_name=RTX_4090") or pre-parsed dict.
+            type: One of "on-demand", "reserved", or "bid".
+            order: Comma-separated sort fields, e.g. "score-" or "dph_total".
+            limit: Max results.
+            storage: Allocated storage in GiB for pricing.
+            no_default: Skip default filters (verified, rentable, etc.).
+        """
+        from vastai.api.query import parse_query, offers_fields, offers_alias, offers_mult
+        from vastai.utils import preprocess_search_query, postprocess_search_results
+
+        # Expand georegion/chunked directives before parsing.
+        # Seed defaults before parsing so `field=any` correctly removes them,
+        # matching CLI behavior. Pass no_default=True to the helper afterward
+        # so it does not reapply the same defaults.
+        georegion_active, chunked = False, False
+        defaults_applied = False
+        if isinstance(query, str):
+            georegion_active, chunked, query = preprocess_search_query(query)
+            base = {} if no_default else {
+                "verified": {"eq": True}, "external": {"eq": False},
+                "rentable": {"eq": True},
+            }
+            query = parse_query(query, base, offers_fields, offers_alias, offers_mult)
+            defaults_applied = True
+
+        # Parse order string into list
+        order_list = None
+        if isinstance(order, str):
+            order_list = []
+            for name in order.split(","):
+                name = name.strip()
+                if not name:
+                    continue
+                direction = "asc"
+                field = name
+                if name.strip("-") != name:
+                    direction = "desc"
+                    field = name.strip("-")
+                if name.strip("+") != name:
+                    direction = "asc"
+                    field = name.strip("+")
+                if field in offers_alias:
+                    field = offers_alias[field]
+                order_list.append([field, direction])
+        elif isinstance(order, list):
+            order_list = order
+
+        results = await offers.search_offers(
+            self.client, query=query, offer_type=type, order=order_list,
+            limit=limit, storage=storage,
+            no_default=(no_default or defaults_applied), **kwargs,
+        )
+
+        if isinstance(results, list):
+            results = postprocess_search_results(results, georegion_active=georegion_active, chunked=chunked)
+
+        return results
+
+    async def search_templates(self, query: Optional[str] = None) -> list[dict]:
+        """Search for templates."""
+        return await offers.search_templates(self.client, query=query)
+
+    async def search_benchmarks(self, query: Optional[Union[str, dict]] = None,
+                          order: Optional[list] = None,
+                          limit: Optional[int] = None) -> list[dict]:
+        """Search for benchmarks."""
+        return await offers.search_benchmarks(self.client, query=query, order=order,
+                                        limit=limit)
+
+    async def search_volumes(self, query: Optional[str] = None, **kwargs) -> list[dict]:
+        """Search for volume offers."""
+        return await offers.search_volumes(self.client, query=query, **kwargs)
+
+    async def search_network_volumes(self, query: Optional[str] = None, **kwargs) -> list[dict]:
+        """Search for network volume offers."""
+        return await offers.search_network_volumes(self.client, query=query, **kwargs)
+
+    async def search_invoices(self, query: Optional[str] = None) -> list[dict]:
+        """Search for invoices."""
+        return await offers.search_invoices(self.client, query=query)
+
+    async def search_offers_new(
+        self,
+        query=None,
+        type: str = "on-demand",
+        order: str = "score-",
+        limit: Optional[int] = None,
+        storage: float = 5.0,
+        no_default: bool = False,
+        **kwargs,
+    ) -> list:
+        """Search for GPU offers using the new /search/asks/ endpoint.
+
+        Args:
+            query: Query string (e.g. "num_gpus=1 gpu_name=RTX_4090") or pre-parsed dict.
+            type: One of "on-demand", "reserved", or "bid".
+            order: Comma-separated sort fields, e.g. "score-" or "dph_total".
+            limit: Max results.
+            storage: Allocated storage in GiB for pricing.
+            no_default: Skip default filters (verified, rentable, etc.).
+        """
+        from vastai.api.query import parse_query, offers_fields, offers_alias, offers_mult
+        from vastai.utils import preprocess_search_query, postprocess_search_results
+
+        georegion_active, chunked = False, False
+        defaults_applied = False
+        if isinstance(query, str):
+            georegion_active, chunked, query = preprocess_search_query(query)
+            base = {} if no_default else {
+                "verified": {"eq": True}, "external": {"eq": False},
+                "rentable": {"eq": True},
+            }
+            query = parse_query(query, base, offers_fields, offers_alias, offers_mult)
+            defaults_applied = True
+
+        order_list = None
+        if isinstance(order, str):
+            order_list = []
+            for name in order.split(","):
+                name = name.strip()
+                if not name:
+                    continue
+                direction = "asc"
+                field = name
+                if name.strip("-") != name:
+                    direction = "desc"
+                    field = name.strip("-")
+                if name.strip("+") != name:
+                    direction = "asc"
+                    field = name.strip("+")
+                if field in offers_alias:
+                    field = offers_alias[field]
+                order_list.append([field, direction])
+        elif isinstance(order, list):
+            order_list = order
+
+        results = await offers.search_offers_new(
+            self.client, query=query, offer_type=type, order=order_list,
+            limit=limit, storage=storage,
+            no_default=(no_default or defaults_applied), **kwargs,
+        )
+
+        if isinstance(results, list):
+            results = postprocess_search_results(results, georegion_active=georegion_active, chunked=chunked)
+
+        return results
+
+    async def launch_instance(self, gpu_name: str, num_gpus: str, image: str, **kwargs) -> dict:
+        """Launch the top instance from search offers matching the given criteria."""
+        return await offers.launch_instance(self.client, gpu_name, num_gpus, image, **kwargs)
+
+    # ------------------------------------------------------------------
+    # Machine methods
+    # ------------------------------------------------------------------
+
+    async def show_machines(self) -> list[dict]:
+        """Return all hosted machines."""
+        return await machines.show_machines(self.client)
+
+    async def show_machine(self, id: int) -> dict:
+        """Return details of a single machine.
+
+        The underlying ``GET /machines/{id}`` endpoint returns a one-element
+        list; this wrapper unwraps it so callers get a single machine dict.
+        Raises ``ValueError`` if the backend returns zero or multiple rows.
+        """
+        result = await machines.show_machine(self.client, id)
+        if not isinstance(result, list):
+            return result
+        if not result:
+            raise ValueError(f"Machine {id} not found")
+        if len(result) > 1:
+            raise ValueError(f"Expected 1 machine for id={id}, got {len(result)}")
+        return result[0]
+
+    async def show_maints(self, ids) -> list[dict]:
+        """Show maintenance information for machines."""
+        return await machines.show_maints(self.client, ids)
+
+    async def list_machine(self, id: int, **kwargs) -> dict:
+        """List a machine for rent with optional pricing parameters."""
+        return await machines.list_machine(self.client, id, **kwargs)
+
+    async def list_machines(self, ids, **kwargs) -> list[dict]:
+        """List multiple machines for rent."""
+        results = []
+        for mid in ids:
+            results.append(await machines.list_machine(self.client, mid, **kwargs))
+        return results
+
+    async def unlist_machine(self, id: int) -> dict:
+        """Unlist a machine from being available."""
+        return await machines.unlist_machine(self.client, id)
+
+    async def set_defjob(self, id: int, **kwargs) -> dict:
+        """Set the default job on a machine."""
+        return await machines.set_defjob(self.client, id, **kwargs)
+
+    async def remove_defjob(self, id: int) -> dict:
+        """Remove the default job from a machine."""
+        return await machines.remove_defjob(self.client, id)
+
+    async def set_min_bid(self, id: int, price: Optional[float] = None) -> dict:
+        """Set the minimum bid price for a machine."""
+        return await machines.set_min_bid(self.client, id, price=price)
+
+    async def schedule_maint(self, id: int, sdate, duration, category: str = "not provided") -> dict:
+        """Schedule maintenance for a machine."""
+        return await machines.schedule_maint(self.client, id, sdate, duration, maintenance_category=category)
+
+    async def cancel_maint(self, id: int) -> dict:
+        """Cancel scheduled maintenance for a machine."""
+        return await machines.cancel_maint(self.client, id)
+
+    async def cleanup_machine(self, id: int) -> dict:
+        """Clean up a machine's configuration and resources."""
+        return await machines.cleanup_machine(self.client, id)
+
+    async def defrag_machines(self, ids) -> dict:
+        """Defragment machines."""
+        return await machines.defrag_machines(self.client, ids)
+
+    async def delete_machine(self, id: int) -> dict:
+        """Delete a machine if not being used by clients."""
+        return await machines.delete_machine(self.client, id)
+
+    async def reports(self, id: int) -> list[dict]:
+        """Generate reports for a machine."""
+        return await machines.reports(self.client, id)
+
+    # ------------------------------------------------------------------
+    # Team methods
+    # ------------------------------------------------------------------
+
+    async def create_team(self, team_name: str) -> dict:
+        """Create a new team."""
+        return await teams.create_team(self.client, team_name)
+
+    async def destroy_team(self) -> dict:
+        """Destroy the current team."""
+        return await teams.destroy_team(self.client)
+
+    async def show_members(self) -> list[dict]:
+        """Show all team members."""
+        return await teams.show_members(self.client)
+
+    async def invite_member(self, email: str, role: str) -> dict:
+        """Invite a new member to the team."""
+        return await teams.invite_member(self.client, email, role)
+
+    async def remove_member(self, id: int) -> dict:
+        """Remove a member from the team."""
+        return await teams.remove_member(self.client, id)
+
+    async def show_team_roles(self) -> list[dict]:
+        """Show all team roles."""
+        return await teams.show_team_roles(self.client)
+
+    async def show_team_role(self, name: str) -> dict:
+        """Show details of a specific team role."""
+        return await teams.show_team_role(self.client, name)
+
+    async def create_team_role(self, name: str, permissions) -> dict:
+        """Create a new team role."""
+        return await teams.create_team_role(self.client, name, permissions)
+
+    async def remove_team_role(self, name: str) -> dict:
+        """Remove a team role."""
+        return await teams.remove_team_role(self.client, name)
+
+    # ------------------------------------------------------------------
+    # SSH / API key methods
+    # ------------------------------------------------------------------
+
+    async def show_ssh_keys(self) -> list[dict]:
+        """Show all SSH keys."""
+        return await keys.show_ssh_keys(self.client)
+
+    async def create_ssh_key(self, ssh_key: Optional[str] = None) -> dict:
+        """Create a new SSH key."""
+        return await keys.create_ssh_key(self.client, ssh_key=ssh_key)
+
+    async def delete_ssh_key(self, id: int) -> dict:
+        """Delete an SSH key."""
+        return await keys.delete_ssh_key(self.client, id)
+
+    async def attach_ssh(self, instance_id: int, ssh_key: str) -> dict:
+        """Attach an SSH key to an instance."""
+        return await keys.attach_ssh(self.client, instance_id, ssh_key)
+
+    async def detach_ssh(self, instance_id: int, ssh_key_id: str) -> dict:
+        """Detach an SSH key from an instance."""
+        return await keys.detach_ssh(self.client, instance_id, ssh_key_id)
+
+    async def show_api_keys(self) -> list[dict]:
+        """Return all API keys associated with the account.
+
+        The underlying ``GET /auth/apikeys/`` endpoint returns an envelope dict
+        ``{"apikeys": [...]}``; this wrapper unwraps it so callers get a plain
+        list of API key dicts.
+        """
+        result = await keys.show_api_keys(self.client)
+        if isinstance(result, dict) and "apikeys" in result:
+            return result["apikeys"]
+        return result
+
+    async def show_api_key(self, id: int) -> dict:
+        """Show details of an API key."""
+        return await keys.show_api_key(self.client, id)
+
+    async def create_api_key(self, name, permissions, key_params=None) -> dict:
+        """Create a new API key."""
+        return await keys.create_api_key(self.client, name, permissions, key_params=key_params)
+
+    async def delete_api_key(self, id: int) -> dict:
+        """Delete an API key."""
+        return await keys.delete_api_key(self.client, id)
+
+    async def reset_api_key(self) -> dict:
+        """Reset the API key."""
+        return await keys.reset_api_key(self.client)
+
+    async def update_ssh_key(self, id: int, ssh_key: str) -> dict:
+        """Update an SSH key."""
+        return await keys.update_ssh_key(self.client, id, ssh_key)
+
+    # ------------------------------------------------------------------
+    # Endpoint methods
+    # ------------------------------------------------------------------
+
+    async def show_endpoints(self) -> list[dict]:
+        """Show all serverless endpoints."""
+        return await endpoints.show_endpoints(self.client)
+
+    async def create_endpoint(self, **kwargs) -> dict:
+        """Create a new serverless endpoint."""
+        return await endpoints.create_endpoint(self.client, **kwargs)
+
+    async def delete_endpoint(self, id: int) -> dict:
+        """Delete a serverless endpoint."""
+        return await endpoints.delete_endpoint(self.client, id)
+
+    async def get_endpt_logs(self, id: int, level: int = 1, tail: Optional[int] = None) -> dict:
+        """Fetch logs for a serverless endpoint."""
+        return await endpoints.get_endpt_logs(self.client, id, level=level, tail=tail)
+
+    async def show_workergroups(self) -> list[dict]:
+        """Show all worker groups."""
+        return await endpoints.show_workergroups(self.client)
+
+    async def create_workergroup(self, **kwargs) -> dict:
+        """Create a new autoscale worker group."""
+        return await endpoints.create_workergroup(self.client, **kwargs)
+
+    async def delete_workergroup(self, id: int) -> dict:
+        """Delete a worker group."""
+        return await endpoints.delete_workergroup(self.client, id)
+
+    async def get_wrkgrp_logs(self, id: int, level: int = 1, tail: Optional[int] = None) -> dict:
+        """Fetch logs for a worker group."""
+        return await endpoints.get_wrkgrp_logs(self.client, id, level=level, tail=tail)
+
+    async def get_endpoint_workers(self, id: int):
+        """List workers under a given endpoint, with live status and measured_perf."""
+        return await endpoints.get_endpoint_workers(self.client, id)
+
+    # ------------------------------------------------------------------
+    # Billing methods
+    # ------------------------------------------------------------------
+
+    async def show_invoices(self, **kwargs) -> dict:
+        """Show invoice details (deprecated; use show_invoices_v1).
+
+        Returns dict with 'invoices' list and 'current' charges.
+        """
+        warnings.warn(
+            "VastAI.show_invoices() is deprecated; use VastAI.show_invoices_v1(**params) for the paginated v1 API.",
+            DeprecationWarning, stacklevel=2,
+        )
+        return await billing.show_invoices(self.client, **kwargs)
+
+    async def show_invoices_v1(self, **kwargs) -> dict:
+        """Get billing history reports with advanced filtering and pagination."""
+        return await billing.show_invoices_v1(self.client, kwargs)
+
+    async def show_earnings(self, **kwargs) -> list[dict]:
+        """Show earnings information."""
+        return await billing.show_earnings(self.client, **kwargs)
+
+    async def show_deposit(self, id: int) -> dict:
+        """Show deposit details."""
+        return await billing.show_deposit(self.client, id)
+
+    async def show_user(self) -> dict:
+        """Show current user details."""
+        return await billing.show_user(self.client)
+
+    async def set_user(self, params) -> dict:
+        """Set user parameters."""
+        return await billing.set_user(self.client, params)
+
+    async def show_subaccounts(self) -> list[dict]:
+        """Show all subaccounts."""
+        return await billing.show_subaccounts(self.client)
+
+    async def create_subaccount(
+        self,
+        email: str,
+        username: str,
+        password: str,
+        type: Optional[str] = None,
+    ) -> dict:
+        """Create a new subaccount."""
+        host_only = type is not None and type.lower() == "host"
+        return await billing.create_subaccount(self.client, email, username, password, host_only=host_only)
+
+    async def show_ipaddrs(self) -> list[dict]:
+        """Show IP addresses."""
+        return await billing.show_ipaddrs(self.client)
+
+    async def fetch_contracts(self, label: Optional[str] = None, contract_ids: Optional[list] = None) -> list:
+        """Fetch contracts, optionally filtered by label."""
+        return await billing.fetch_contracts(self.client, label=label, contract_ids=contract_ids)
+
+    # ------------------------------------------------------------------
+    # Storage methods
+    # ------------------------------------------------------------------
+
+    async def copy(self, src: str, dst: str) -> dict:
+        """Copy files between instances, volumes, cloud services, and local.
+
+        Supported location formats:
+
+        - ``[instance_id:]path``        legacy format, still supported
+        - ``C.instance_id:path``        container copy format
+        - ``cloud_service:path``        cloud service format
+        - ``cloud_service.id:path``     cloud service with ID
+        - ``local:path``                explicit local path
+        - ``V.volume_id:path``          volume copy
+
+        Volume copy is currently only supported for copying to other volumes,
+        instances, or cloud services, not local.
+
+        Do not copy to /root or / as a destination directory, as this can mess
+        up the permissions on the instance ssh folder, breaking future copy
+        operations (they use ssh authentication). See
+        https://vast.ai/docs/gpu-instances/data-movement#constraints for more
+        information about constraints.
+
+        Args:
+            src: Source in vast URL format, e.g. "instance_id:/path" or just "/local/path".
+            dst: Destination in vast URL format.
+
+        Examples:
+            vast.copy("6003036:/workspace/", "6003038:/workspace/")
+            vast.copy("C.11824:/data/test", "local:data/test")
+            vast.copy("local:data/test", "C.11824:/data/test")
+            vast.copy("drive:/folder/file.txt", "C.6003036:/workspace/")
+            vast.copy("s3.101:/data/", "C.6003036:/workspace/")
+            vast.copy("V.1234:/file", "C.5678:/workspace/")
+            vast.copy("V.1234:/file", "s3.101:/workspace/")
+        """
+        from vastai.utils import parse_vast_url
+        src_id, src_path = parse_vast_url(src)
+        dst_id, dst_path = parse_vast_url(dst)
+        return await storage.copy(self.client, src_id, dst_id, src_path, dst_path)
+
+    async def cancel_copy(self, dst_id) -> dict:
+        """Cancel a file copy operation."""
+        return await storage.cancel_copy(self.client, dst_id)
+
+    async def cancel_sync(self, dst_id) -> dict:
+        """Cancel a file sync operation."""
+        return await storage.cancel_sync(self.client, dst_id)
+
+    async def cloud_copy(self, **kwargs) -> dict:
+        """Copy files between cloud and instance."""
+        return await storage.cloud_copy(self.client, **kwargs)
+
+    async def clone_volume(self, source: int, dest: int, **kwargs) -> dict:
+        """Clone an existing volume."""
+        return await storage.clone_volume(self.client, source, dest, **kwargs)
+
+    async def show_volumes(self, type: str = "all") -> list[dict]:
+        """Show stats on owned volumes."""
+        return await storage.show_volumes(self.client, type=type)
+
+    async def create_volume(self, id: int, size: float = 15, name: Optional[str] = None) -> dict:
+        """Create a new volume from an offer ID."""
+        return await storage.create_volume(self.client, id, size=size, name=name)
+
+    async def delete_volume(self, id: int) -> dict:
+        """Delete a volume."""
+        return await storage.delete_volume(self.client, id)
+
+    async def list_volume(self, id: int, **kwargs) -> dict:
+        """List disk space for rent as a volume."""
+        return await storage.list_volume(self.client, id, **kwargs)
+
+    async def unlist_volume(self, id: int) -> dict:
+        """Unlist a volume offer."""
+        return await storage.unlist_volume(self.client, id)
+
+    async def create_network_volume(self, id: int, size: float = 15, name: Optional[str] = None) -> dict:
+        """Create a new network volume."""
+        return await storage.create_network_volume(self.client, id, size=size, name=name)
+
+    async def list_network_volume(self, disk_id: int, **kwargs) -> dict:
+        """List disk space for rent as a network volume."""
+        return await storage.list_network_volume(self.client, disk_id, **kwargs)
+
+    async def unlist_network_volume(self, id: int) -> dict:
+        """Unlist a network volume offer."""
+        return await storage.unlist_network_volume(self.client, id)
+
+    async def show_network_disks(self) -> dict:
+        """Show network disks associated with your account."""
+        return await storage.show_network_disks(self.client)
+
+    async def add_network_disk(self, machines: List[int], mount_point: str, disk_id: Optional[int] = None) -> dict:
+        """Add a network disk to a physical cluster."""
+        return await storage.add_network_disk(self.client, machines, mount_point, disk_id=disk_id)
+
+    async def show_connections(self) -> list[dict]:
+        """Show all connections."""
+        return await storage.show_connections(self.client)
+
+    # ------------------------------------------------------------------
+    # Cluster methods
+    # ------------------------------------------------------------------
+
+    async def show_clusters(self) -> dict:
+        """Show clusters associated with your account."""
+        return await clusters.show_clusters(self.client)
+
+    async def create_cluster(self, subnet: str, manager_id: int) -> dict:
+        """Create a Vast cluster."""
+        return await clusters.create_cluster(self.client, subnet, manager_id)
+
+    async def delete_cluster(self, cluster_id: int) -> dict:
+        """Delete a cluster."""
+        return await clusters.delete_cluster(self.client, cluster_id)
+
+    async def join_cluster(self, cluster_id: int, machine_ids: List[int]) -> dict:
+        """Join machines to a cluster."""
+        return await clusters.join_cluster(self.client, cluster_id, machine_ids)
+
+    async def remove_machine_from_cluster(
+        self,
+        cluster_id: int,
+        machine_id: int,
+        new_manager_id: Optional[int] = None,
+    ) -> dict:
+        """Remove a machine from a cluster."""
+        return await clusters.remove_machine_from_cluster(
+            self.client, cluster_id, machine_id, new_manager_id=new_manager_id,
+        )
+
+    async def show_overlays(self) -> list[dict]:
+        """Show overlays associated with your account."""
+        return await clusters.show_overlays(self.client)
+
+    async def create_overlay(self, cluster_id: int, name: str) -> dict:
+        """Create an overlay network on a physical cluster."""
+        return await clusters.create_overlay(self.client, cluster_id, name)
+
+    async def delete_overlay(self, overlay_identifier: Optional[str] = None) -> dict:
+        """Delete an overlay and remove all associated instances."""
+        return await clusters.delete_overlay(self.client, overlay_identifier=overlay_identifier)
+
+    async def join_overlay(self, name: str, instance_id: int) -> dict:
+        """Add an instance to an overlay network."""
+        return await clusters.join_overlay(self.client, name, instance_id)
+
+    # ------------------------------------------------------------------
+    # Auth / account methods
+    # ------------------------------------------------------------------
+
+    async def set_api_key(self, api_key: str) -> None:
+        """Update the API key used by this client."""
+        self.client.api_key = api_key
+
+    async def show_audit_logs(self) -> list[dict]:
+        """Display account audit logs."""
+        return await auth.show_audit_logs(self.client)
+
+    async def show_env_vars(self, show_values: bool = False) -> dict:
+        """Show user environment variables.
+
+        Args:
+            show_values: If True, return actual values. If False, mask them.
+        """
+        secrets = await auth.show_env_vars(self.client)
+        if not show_values and isinstance(secrets, dict):
+            return {k: "****" for k in secrets}
+        return secrets
+
+    async def create_env_var(self, name: str, value: str) -> dict:
+        """Create a new user environment variable."""
+        return await auth.create_env_var(self.client, name, value)
+
+    async def delete_env_var(self, name: str) -> dict:
+        """Delete a user environment variable."""
+        return await auth.delete_env_var(self.client, name)
+
+    async def show_scheduled_jobs(self) -> list[dict]:
+        """Show scheduled jobs for the account."""
+        return await auth.show_scheduled_jobs(self.client)
+
+    async def create_scheduled_job(self, start_time, end_time, api_endpoint, request_method,
+                             request_body, frequency, instance_id, **kwargs) -> dict:
+        """Create a new scheduled job."""
+        return await auth.create_scheduled_job(
+            self.client, start_time, end_time, api_endpoint, request_method,
+            request_body, frequency, instance_id, **kwargs,
+        )
+
+    async def update_scheduled_job(self, id: int, request_body, **kwargs) -> dict:
+        """Update an existing scheduled job."""
+        return await auth.update_scheduled_job(self.client, id, request_body, **kwargs)
+
+    async def delete_scheduled_job(self, id: int) -> dict:
+        """Delete a scheduled job."""
+        return await auth.delete_scheduled_job(self.client, id)
+
+    async def create_template(self, **kwargs) -> dict:
+        """Create a new template.
+
+        Accepts user-friendly kwargs (jupyter, ssh, direct, login, etc.)
+        and translates them to the API parameters.
+        """
+        jupyter = kwargs.pop("jupyter", False)
+        ssh = kwargs.pop("ssh", False)
+        direct = kwargs.pop("direct", False)
+        login = kwargs.pop("login", None)
+        hide_readme = kwargs.pop("hide_readme", False)
+        public = kwargs.pop("public", False)
+        jupyter_lab = kwargs.pop("jupyter_lab", False)
+        # Remove kwargs not accepted by offers.create_template
+        kwargs.pop("search_params", None)
+        kwargs.pop("no_default", None)
+
+        jup_direct = jupyter and direct
+        ssh_direct = ssh and direct
+        use_ssh = ssh or jupyter
+        runtype = "jupyter" if jupyter else ("ssh" if ssh else "args")
+
+        docker_login_repo = None
+        if login:
+            docker_login_repo = login.split(" ")[0]
+
+        return await offers.create_template(
+            self.client,
+            jup_direct=jup_direct,
+            ssh_direct=ssh_direct,
+            use_ssh=use_ssh,
+            use_jupyter_lab=jupyter_lab,
+            runtype=runtype,
+            docker_login_repo=docker_login_repo,
+            readme_visible=not hide_readme,
+            private=not public,
+            **kwargs,
+        )
+
+    async def delete_template(self, template_id: Optional[int] = None, hash_id: Optional[str] = None) -> dict:
+        """Delete a template by ID or hash."""
+        return await offers.delete_template(self.client, template_id=template_id, hash_id=hash_id)
+
+    async def update_template(self, hash_id: str, **kwargs) -> dict:
+        """Update an existing template."""
+        return await offers.update_template(self.client, hash_id=hash_id, **kwargs)
+
+    # ------------------------------------------------------------------
+    # Batch instance methods
+    # ------------------------------------------------------------------
+
+    async def create_instances(self, ids: List[int], **kwargs) -> dict:
+        """Create multiple instances from a list of offer IDs."""
+        return await instances.create_instance(self.client, id=ids, **kwargs)
+
+    async def destroy_instances(self, ids: List[int]) -> dict:
+        """Destroy multiple instances."""
+        return await instances.destroy_instance(self.client, id=ids)
+
+    async def start_instances(self, ids: List[int]) -> dict:
+        """Start multiple instances."""
+        return await instances.start_instance(self.client, id=ids)
+
+    async def stop_instances(self, ids: List[int]) -> dict:
+        """Stop multiple instances."""
+        return await instances.stop_instance(self.client, id=ids)
+
+    # ------------------------------------------------------------------
+    # Update methods
+    # ------------------------------------------------------------------
+
+    async def update_endpoint(self, id: int, **kwargs) -> dict:
+        """Update an existing endpoint."""
+        return await endpoints.update_endpoint(self.client, id=id, **kwargs)
+
+    async def update_env_var(self, name: str, value: str) -> dict:
+        """Update an existing user environment variable."""
+        return await auth.update_env_var(self.client, name, value)
+
+    async def update_instance(self, id: int, **kwargs) -> dict:
+        """Update/recreate an instance from a new/updated template."""
+        return await instances.update_instance(self.client, id=id, **kwargs)
+
+    async def update_workergroup(self, id: int, **kwargs) -> dict:
+        """Update an existing autoscale worker group."""
+        return await endpoints.update_workergroup(self.client, id=id, **kwargs)
+
+    async def update_workers(self, id: int, cancel: bool = False) -> dict:
+        """Trigger a rolling update of all workers in a workergroup, or cancel an in-progress update."""
+        return await endpoints.update_workers(self.client, id=id, cancel=cancel)
+
+    async def update_team_role(self, id: int, **kwargs) -> dict:
+        """Update an existing team role."""
+        return await teams.update_team_role(self.client, id=id, **kwargs)
+
+    # ------------------------------------------------------------------
+    # TFA (Two-Factor Authentication) methods
+    # ------------------------------------------------------------------
+
+    async def tfa_activate(self, **kwargs) -> dict:
+        """Activate a new 2FA method by verifying the code."""
+        return await auth.tfa_activate(self.client, **kwargs)
+
+    async def tfa_delete(self, **kwargs) -> dict:
+        """Remove a 2FA method from your account."""
+        return await auth.tfa_delete(self.client, **kwargs)
+
+    async def tfa_login(self, **kwargs) -> dict:
+        """Complete 2FA login by verifying code."""
+        return await auth.tfa_login(self.client, **kwargs)
+
+    async def tfa_regen_codes(self, **kwargs) -> dict:
+        """Regenerate backup codes for 2FA."""
+        return await auth.tfa_regen_codes(self.client, **kwargs)
+
+    async def tfa_resend_sms(self, **kwargs) -> dict:
+        """Resend SMS 2FA code."""
+        return await auth.tfa_resend_sms(self.client, **kwargs)
+
+    async def tfa_send_sms(self, **kwargs) -> dict:
+        """Request a 2FA SMS verification code."""
+        return await auth.tfa_send_sms(self.client, **kwargs)
+
+    async def tfa_status(self) -> dict:
+        """Show the current 2FA status and configured methods."""
+        return await auth.tfa_status(self.client)
+
+    async def tfa_totp_setup(self) -> dict:
+        """Generate TOTP secret and QR code for Authenticator app setup."""
+        return await auth.tfa_totp_setup(self.client)
+
+    async def tfa_update(self, **kwargs) -> dict:
+        """Update a 2FA method's settings."""
+        return await auth.tfa_update(self.client, **kwargs)
+
+    # ------------------------------------------------------------------
+    # Additional billing methods
+    # ------------------------------------------------------------------
+
+    async def generate_pdf_invoices(self, **kwargs):
+        """Generate PDF invoices based on filters."""
+        raise NotImplementedError("generate_pdf_invoices is not yet implemented")
+
+    async def transfer_credit(self, recipient: str, amount: float) -> dict:
+        """Transfer credit to another account."""
+        return await teams.transfer_credit(self.client, recipient=recipient, amount=amount)
+
+    # ------------------------------------------------------------------
+    # Additional methods
+    # ------------------------------------------------------------------
+
+    async def list_volumes(self, ids, **kwargs) -> dict:
+        """List disk space for rent as volumes on multiple machines."""
+        return await storage.list_volumes(self.client, ids=ids, **kwargs)
+
+    async def self_test_machine(self, machine_id, **kwargs):
+        """Perform a self-test on the specified machine."""
+        raise NotImplementedError("self_test_machine requires CLI")
+
+    # ------------------------------------------------------------------
+    # Backward-compatible aliases
+    # ------------------------------------------------------------------
+
+    invite_team_member = invite_member
+    remove_team_member = remove_member
+    show_team_members = show_members
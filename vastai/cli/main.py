@@ -3,11 +3,12 @@ import sys
 import os
 import json
 import requests
+from argparse import Namespace
 
 from vastai.cli.parser import apwrap, argument, MyWideHelpFormatter, set_completers
 from vastai.cli.util import (
     APIKEY_FILE, TFAKEY_FILE, VERSION, server_url_default, api_key_guard,
-    format_key_suffix,
+    format_key_suffix, set_catalog_args,
 )
 
 try:
@@ -85,6 +86,13 @@ parser = apwrap(
 
 
 def main():
+    # Catalog lookups made while the parser is built (--gpu-name choices) can't
+    # see the parsed args yet; give them the global flags they honor from argv.
+    set_catalog_args(Namespace(
+        no_http_cache="--no-cache" in sys.argv[1:],
+        explain="--explain" in sys.argv[1:],
+    ))
+
     # Import all command modules - the import itself triggers decorator
     # registrations on the global parser via _get_parser().
     from vastai.cli.commands import (  # noqa: F401
@@ -121,6 +129,7 @@ def main():
     parser.add_argument("--api-key", help="API Key to use. defaults to using the one stored in {}".format(APIKEY_FILE), type=str, required=False, default=os.getenv("VAST_API_KEY", api_key_guard))
     parser.add_argument("--version", help="Show CLI version", action="version", version=VERSION)
     parser.add_argument("--no-color", action="store_true", help="Disable colored output for commands that support it")
+    parser.add_argument("--no-cache", dest="no_http_cache", action="store_true", help="Bypass the local cache of catalog API responses (GPU names, templates)")
 
     # Tab completion
     try:
@@ -156,6 +165,7 @@ def main():
         pass
 
     args = parser.parse_args()
+    set_catalog_args(args)
 
     # Passive upgrade nudge: best-effort, ≤1 manifest GET + ≤1 stderr line per
     # 24h, silent when offline/piped/CI. Never raises. Opt out with
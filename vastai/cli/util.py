@@ -89,42 +89,45 @@ for key in DIRS.keys():
     if not os.path.exists(path):
         os.makedirs(path)
 
-CACHE_FILE = os.path.join(DIRS['temp'], "gpu_names_cache.json")
-GPU_TYPES_CACHE_FILE = os.path.join(DIRS['temp'], "gpu_types_cache.json")
-CACHE_DURATION = timedelta(hours=24)
+# Parsed CLI args the catalog lookups honor (--no-cache, --explain), set by main().
+# The --gpu-name choices are looked up while the parser is being built, so main()
+# first sets these from a scan of argv, then from the parsed args.
+_catalog_args: Optional[argparse.Namespace] = None
 
 
-def _get_gpu_names() -> Optional[List[str]]:
-    """Returns a set of GPU names available on Vast.ai, with results cached for 24 hours."""
+def set_catalog_args(args: Optional[argparse.Namespace]) -> None:
+    global _catalog_args
+    _catalog_args = args
 
-    def is_cache_valid() -> bool:
-        """Checks if the cache file exists and is less than 24 hours old."""
-        if not os.path.exists(CACHE_FILE):
-            return False
-        cache_age = datetime.now() - datetime.fromtimestamp(os.path.getmtime(CACHE_FILE))
-        return cache_age < CACHE_DURATION
 
-    if is_cache_valid():
-        try:
-            with open(CACHE_FILE, "r") as file:
-                gpu_names = json.load(file)
-        except (OSError, json.JSONDecodeError):
-            gpu_names = None
-    else:
-        endpoint = "/api/v0/gpu_names/unique/"
-        url = f"{server_url_default}{endpoint}"
-        try:
-            r = requests.get(url, headers={})
-            r.raise_for_status()
-            gpu_names = r.json()
-        except (requests.exceptions.RequestException, ValueError):
-            return None
-        try:
-            with open(CACHE_FILE, "w") as file:
-                json.dump(gpu_names, file)
-        except OSError:
-            pass
+def _catalog_client(args=None):
+    """Unauthenticated client for the public catalog routes, backed by the shared
+    response cache (see :mod:`vastai.api.cache`). ``args`` (default: the ones set
+    by :func:`set_catalog_args`) apply ``--no-cache`` and ``--explain`` as
+    :func:`vastai.cli.utils.get_client` does."""
+    from vastai.api.cache import get_default_cache
+    from vastai.api.client import VastClient
+    if args is None:
+        args = _catalog_args
+    return VastClient(server_url=server_url_default, retry=1, client_type="cli",
+                      explain=getattr(args, 'explain', False),
+                      cache=None if getattr(args, 'no_http_cache', False) else get_default_cache())
+
+
+def _catalog_get(subpath: str, args=None):
+    """GET a catalog route and decode it; None on any HTTP or decode error."""
+    try:
+        with _catalog_client(args) as client:
+            r = client.get(subpath)
+        r.raise_for_status()
+        return r.json()
+    except (requests.exceptions.RequestException, ValueError):
+        return None
 
+
+def _get_gpu_names(args=None) -> Optional[List[str]]:
+    """Returns a set of GPU names available on Vast.ai, with results cached for 24 hours."""
+    gpu_names = _catalog_get("/api/v0/gpu_names/unique/", args)
     try:
         return [
             name.replace(" ", "_").replace("-", "_") for name in gpu_names['gpu_names']
@@ -133,41 +136,13 @@ def _get_gpu_names() -> Optional[List[str]]:
         return None
 
 
-def _get_gpu_types() -> Optional[List[dict]]:
+def _get_gpu_types(args=None) -> Optional[List[dict]]:
     """Returns the GPU type catalog from /api/v0/gpu_types/, cached for 24 hours.
 
     Source of truth for canonical GPU names and per-card VRAM. Returns None on
     any error so callers fall back to the hardcoded constants (never empty).
     """
-
-    def is_cache_valid() -> bool:
-        """Checks if the cache file exists and is less than 24 hours old."""
-        if not os.path.exists(GPU_TYPES_CACHE_FILE):
-            return False
-        cache_age = datetime.now() - datetime.fromtimestamp(os.path.getmtime(GPU_TYPES_CACHE_FILE))
-        return cache_age < CACHE_DURATION
-
-    if is_cache_valid():
-        try:
-            with open(GPU_TYPES_CACHE_FILE, "r") as file:
-                payload = json.load(file)
-        except (OSError, json.JSONDecodeError):
-            payload = None
-    else:
-        endpoint = "/api/v0/gpu_types/"
-        url = f"{server_url_default}{endpoint}"
-        try:
-            r = requests.get(url, headers={})
-            r.raise_for_status()
-            payload = r.json()
-        except (requests.exceptions.RequestException, ValueError):
-            return None
-        try:
-            with open(GPU_TYPES_CACHE_FILE, "w") as file:
-                json.dump(payload, file)
-        except OSError:
-            pass
-
+    payload = _catalog_get("/api/v0/gpu_types/", args)
     try:
         return payload['gpu_types']
     except (TypeError, KeyError):
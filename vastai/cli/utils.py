@@ -8,6 +8,7 @@ def get_parser():
 
 def get_client(args):
     """Create a VastClient from parsed CLI args."""
+    from vastai.api.cache import get_default_cache
     from vastai.api.client import VastClient
     return VastClient(
         api_key=args.api_key,
@@ -16,4 +17,5 @@ def get_client(args):
         explain=getattr(args, 'explain', False),
         curl=getattr(args, 'curl', False),
         client_type="cli",
+        cache=None if getattr(args, 'no_http_cache', False) else get_default_cache(),
     )
@@ -1,6 +1,11 @@
 from .query import Query, Column
 from .offer import Offer
 from .endpoint import EndpointConfig, EndpointData
-from .deployment import DeploymentConfig, DeploymentData, DeploymentPutResponse
+from .deployment import (
+    DeploymentConfig,
+    DeploymentData,
+    DeploymentMultipartUpload,
+    DeploymentPutResponse,
+)
 from .workergroup import WorkergroupConfig
 from .instance import Instance, InstanceConfig, CreateInstanceResponse
@@ -40,6 +40,30 @@ class DeploymentConfig:
         return {k: v for k, v in dataclasses.asdict(self).items() if v is not None}
 
 
+@dataclass
+class DeploymentMultipartUpload:
+    """Presigned S3 multipart upload offered by PUT /api/v0/deployments/.
+
+    part_urls[i] is a presigned UploadPart PUT for part number i + 1, each part
+    (except the last) part_size bytes long. complete_url is a presigned
+    CompleteMultipartUpload POST.
+    """
+
+    part_size: int
+    part_urls: list
+    complete_url: str
+    upload_id: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "DeploymentMultipartUpload":
+        return cls(
+            part_size=d["part_size"],
+            part_urls=d["part_urls"],
+            complete_url=d["complete_url"],
+            upload_id=d.get("upload_id"),
+        )
+
+
 @dataclass
 class DeploymentPutResponse:
     """Response from PUT /api/v0/deployments/."""
@@ -52,6 +76,9 @@ class DeploymentPutResponse:
     upload_url: Optional[str] = None
     upload_fields: Optional[dict] = None
     evicted_versions: Optional[list] = None
+    multipart_upload: Optional[DeploymentMultipartUpload] = None
+    # tarball codecs the server's workers can extract, beyond gzip
+    codecs: Optional[list] = None
 
     @classmethod
     def from_dict(cls, d: dict) -> "DeploymentPutResponse":
@@ -64,6 +91,12 @@ class DeploymentPutResponse:
             upload_url=d.get("upload_url"),
             upload_fields=d.get("upload_fields"),
             evicted_versions=d.get("evicted_versions"),
+            multipart_upload=(
+                DeploymentMultipartUpload.from_dict(d["multipart_upload"])
+                if d.get("multipart_upload")
+                else None
+            ),
+            codecs=d.get("codecs"),
         )
 
 
@@ -6,7 +6,8 @@ import warnings
 from typing import Dict, List, Optional, Union
 
 from vastai._base import _resolve_api_key, _APIKEY_SENTINEL
-from vastai.api.client import VastClient
+from vastai.api.cache import ResponseCache
+from vastai.api.client import VastClient, _DEFAULT_POOL_SIZE
 from vastai.api import instances, offers, machines, teams, keys, endpoints, billing, storage, clusters, auth, deployments
 
 
@@ -29,6 +30,11 @@ class VastAI:
         explain: If *True*, print request details for debugging.
         quiet: If *True*, suppress informational output.
         curl: If *True*, print equivalent curl commands instead of executing.
+        pool_size: Maximum number of keep-alive connections the underlying
+            client keeps open.  Connections are reused across calls until
+            :meth:`close` is called (or the ``with`` block exits).
+        cache: Optional :class:`~vastai.api.cache.ResponseCache` for read-only
+            catalog routes (GPU names/types, template search).  Off by default.
     """
 
     def __init__(
@@ -40,12 +46,25 @@ class VastAI:
         explain: bool = False,
         quiet: bool = False,
         curl: bool = False,
+        pool_size: int = _DEFAULT_POOL_SIZE,
+        cache: Optional[ResponseCache] = None,
     ):
         resolved_key = _resolve_api_key(_APIKEY_SENTINEL if api_key is None else api_key)
-        self.client = VastClient(resolved_key, server_url, retry, explain, curl)
+        self.client = VastClient(resolved_key, server_url, retry, explain, curl, pool_size=pool_size,
+                                 cache=cache)
         self.raw = raw
         self.quiet = quiet
 
+    def close(self) -> None:
+        """Release the pooled HTTP connections held by the underlying client."""
+        self.client.close()
+
+    def __enter__(self) -> "VastAI":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
     # ------------------------------------------------------------------
     # Instance methods
     # ------------------------------------------------------------------
@@ -54,6 +73,21 @@ class VastAI:
         """Return all of the authenticated user's instances as a flat list."""
         return instances.show_instances(self.client)
 
+    def iter_instances(
+        self,
+        select_filters: Optional[dict] = None,
+        order_by: Optional[list] = None,
+        page_size: int = instances.DEFAULT_INSTANCES_PAGE_SIZE,
+    ):
+        """Yield the authenticated user's instances as pages arrive.
+
+        Streaming variant of :meth:`show_instances`: rows are yielded as soon
+        as their page is decoded while the next page is already being fetched,
+        and only a few pages are held in memory at a time.
+        """
+        for row in instances.iter_instances(self.client, select_filters, order_by, page_size):
+            yield row
+
     def show_instances_v1(self, params: dict) -> dict:
         """Return instances using the paginated v1 API; for filtering, sorting, and manual pagination."""
         return instances.show_instances_v1(self.client, params)
@@ -5,6 +5,9 @@ from .managed import ManagedEndpoint, ManagedDeployment
 from .worker import Worker
 from .session import Session
 from .request_status import RequestStatus
+from .route_coalescer import RouteCoalescer
+from .heartbeat import HeartbeatScheduler
+from .route_lease import RouteLease, RouteLeaseTable, RouteStats
 from vastai.data.endpoint import EndpointConfig, EndpointData
 from vastai.data.deployment import (
     DeploymentConfig,
@@ -119,6 +122,9 @@ class _ServerlessBase(Generic[R]):
         connection_limit: int = 500,
         default_request_timeout: float = 600.0,
         max_poll_interval: float = 5.0,
+        route_lease_ttl: Optional[float] = None,
+        route_lease_max_uses: Optional[int] = None,
+        coalesce_routes: bool = False,
     ):
         if api_key is None or api_key == "":
             raise AttributeError(
@@ -145,6 +151,21 @@ class _ServerlessBase(Generic[R]):
         self.debug = debug
         self.default_request_timeout = float(default_request_timeout)
         self.max_poll_interval = float(max_poll_interval)
+        # Opt-in route leasing: a READY /route/ result is reused for
+        # route_lease_ttl seconds (and at most route_lease_max_uses requests) by
+        # later non-stream, non-session requests to the same endpoint, one
+        # request at a time (the worker tracks work by the route's reqnum). A
+        # lease is dropped as soon as its worker fails, so the retry goes back
+        # through /route/.
+        self.route_lease_ttl = route_lease_ttl
+        self.route_lease_max_uses = route_lease_max_uses
+        self.route_stats = RouteStats()
+        # Opt-in shared poll loop for requests waiting on a cold endpoint
+        # (see RouteCoalescer).
+        self.coalesce_routes = coalesce_routes
+        # Worker URLs that have answered in the binary wire format, so they
+        # are sent binary request bodies from then on.
+        self._binary_workers: set[str] = set()
         self.logger = logging.getLogger(self.__class__.__name__)
 
         if not self.logger.handlers:
@@ -173,6 +194,8 @@ class _ServerlessBase(Generic[R]):
         self._transport_owner = (
             None  # if set, delegate _get_session/get_ssl_context and skip close
         )
+        # shared heartbeat task for this client's TTL'd deployments (created on first use)
+        self._heartbeats: HeartbeatScheduler | None = None
 
     async def __aenter__(self):
         await self._get_session()
@@ -197,7 +220,16 @@ class _ServerlessBase(Generic[R]):
             return self._transport_owner.is_open()
         return self._session is not None and not self._session.closed
 
+    @property
+    def heartbeats(self) -> HeartbeatScheduler:
+        """The scheduler sending heartbeats for this client's TTL'd deployments."""
+        if self._heartbeats is None:
+            self._heartbeats = HeartbeatScheduler(self)
+        return self._heartbeats
+
     async def close(self):
+        if self._heartbeats is not None:
+            await self._heartbeats.stop()
         if self._transport_owner is not None:
             return  # transport owned by another client
         if self._session and not self._session.closed:
@@ -635,6 +667,30 @@ class _ServerlessBase(Generic[R]):
             self.logger.error(error_msg)
             raise Exception(error_msg)
 
+    def _route_leases_for(self, endpoint: Endpoint_[R]) -> Optional[RouteLeaseTable]:
+        """Return the endpoint's lease table, or None when leasing is off."""
+        if not self.route_lease_ttl:
+            return None
+        table = getattr(endpoint, "_route_leases", None)
+        if table is None:
+            table = RouteLeaseTable(
+                ttl=self.route_lease_ttl,
+                max_uses=self.route_lease_max_uses,
+                stats=self.route_stats,
+            )
+            endpoint._route_leases = table
+        return table
+
+    def _route_coalescer_for(self, endpoint: Endpoint_[R]) -> Optional[RouteCoalescer]:
+        """Return the endpoint's route coalescer, or None when coalescing is off."""
+        if not self.coalesce_routes:
+            return None
+        coalescer = getattr(endpoint, "_route_coalescer", None)
+        if coalescer is None:
+            coalescer = RouteCoalescer()
+            endpoint._route_coalescer = coalescer
+        return coalescer
+
     async def _do_request(
         self,
         endpoint: Endpoint_[R],
@@ -648,17 +704,33 @@ class _ServerlessBase(Generic[R]):
         retry: bool = True,
         max_retries: Optional[int] = None,
         stream: bool = False,
+        binary: bool = False,
     ) -> dict:
-        """Core request logic: route to a worker, execute, retry on failure. Returns the response dict."""
+        """Core request logic: route to a worker, execute, retry on failure. Returns the response dict.
+
+        ``binary`` marks a payload that may hold raw buffers; it is sent in the binary wire
+        format to workers known to accept it and as JSON (buffers base64-encoded) otherwise.
+        """
         if tracker is None:
             tracker = RequestStatus()
 
         request_idx: int = 0
         total_attempts = 0
         start_time = time.time()
+        # a stream is still running on the worker when it's returned, so it can't
+        # hand its route back; streams always route
+        leases = (
+            self._route_leases_for(endpoint) if session is None and not stream else None
+        )
+        # the lease this request holds; released before any retry and at the end
+        held: Optional[RouteLease] = None
+        coalescer = self._route_coalescer_for(endpoint) if session is None else None
         try:
             while True:
                 total_attempts += 1
+                if held is not None:
+                    leases.release(held)
+                    held = None
                 tracker.status = "Queued"
                 worker_url = ""
                 auth_data = {}
@@ -670,7 +742,14 @@ class _ServerlessBase(Generic[R]):
                         f"Timed out after {time.time() - start_time:.1f}s waiting for worker"
                     )
 
-                if session is None:
+                lease = leases.take(cost) if leases is not None else None
+                if lease is not None:
+                    held = lease
+                    self.logger.debug(f"Reusing route lease for {lease.url}")
+                    worker_url = lease.url
+                    auth_data = lease.reuse_auth_data()
+                    request_idx = 0
+                elif session is None:
                     if request_idx == 0:
                         self.logger.debug(
                             f"Sending initial route call for request_idx {request_idx}"
@@ -683,6 +762,9 @@ class _ServerlessBase(Generic[R]):
                     route = await endpoint._route(
                         cost=cost, req_idx=request_idx, timeout=60.0
                     )
+                    self.route_stats.route_calls += 1
+                    if coalescer is not None:
+                        coalescer.report(route.status == "READY")
 
                     request_idx = route.request_idx
                     if request_idx:
@@ -707,12 +789,23 @@ class _ServerlessBase(Generic[R]):
                                 f"Timed out after {time.time() - start_time:.1f}s waiting for worker to become ready"
                             )
 
-                        await asyncio.sleep(poll_interval)
+                        if coalescer is not None:
+                            await coalescer.wait_turn(
+                                poll_interval,
+                                max_wait=None
+                                if timeout is None
+                                else max(0.0, timeout - (time.time() - start_time)),
+                            )
+                        else:
+                            await asyncio.sleep(poll_interval)
                         poll_elapsed += poll_interval
 
                         route = await endpoint._route(
                             cost=cost, req_idx=request_idx, timeout=60.0
                         )
+                        self.route_stats.route_calls += 1
+                        if coalescer is not None:
+                            coalescer.report(route.status == "READY")
                         request_idx = route.request_idx or request_idx
 
                         attempt += 1
@@ -727,6 +820,8 @@ class _ServerlessBase(Generic[R]):
 
                     worker_url = route.get_url()
                     auth_data = route.body
+                    if leases is not None:
+                        held = leases.grant(cost, worker_url, auth_data, request_idx)
                 else:
                     if session.url is not None:
                         worker_url = session.url
@@ -757,6 +852,7 @@ class _ServerlessBase(Generic[R]):
                         retries=1,  # avoid stacking retries with the outer loop
                         timeout=worker_timeout,
                         stream=stream,
+                        binary=(worker_url in self._binary_workers) if binary else None,
                     )
                 except (
                     aiohttp.ClientConnectorError,
@@ -772,7 +868,11 @@ class _ServerlessBase(Generic[R]):
                         raise ConnectionError(
                             f"Session worker unavailable: {ex}"
                         ) from ex
-                    # No session - reset request_idx to force a fresh route
+                    # No session - drop any lease and force a fresh route
+                    if leases is not None:
+                        leases.invalidate(worker_url)
+                    if lease is not None:
+                        request_idx = 0
                     self.logger.warning(
                         f"Worker unavailable ({type(ex).__name__}), re-routing to new worker"
                     )
@@ -780,10 +880,18 @@ class _ServerlessBase(Generic[R]):
                     continue
                 except Exception as ex:
                     self.logger.error(f"Worker request failed: {ex}")
+                    if leases is not None:
+                        leases.invalidate(worker_url)
+                    if lease is not None:
+                        request_idx = 0
                     tracker.status = "Retrying"
                     continue
 
                 if not result.get("ok"):
+                    if leases is not None and (result.get("status") or 0) >= 500:
+                        leases.invalidate(worker_url)
+                        if lease is not None:
+                            request_idx = 0
                     if (
                         retry
                         and result.get("retryable")
@@ -831,6 +939,11 @@ class _ServerlessBase(Generic[R]):
                     }
 
                 # Success
+                if binary and "binary" in result:
+                    if result["binary"]:
+                        self._binary_workers.add(worker_url)
+                    else:
+                        self._binary_workers.discard(worker_url)
                 worker_response = result.get("stream") if stream else result.get("json")
 
                 tracker.status = "Complete"
@@ -851,11 +964,20 @@ class _ServerlessBase(Generic[R]):
 
         except asyncio.CancelledError:
             tracker.status = "Cancelled"
+            if held is not None:
+                # the worker may still be running it under the lease's reqnum
+                leases.discard(held)
+                held = None
             raise
         except Exception as ex:
             tracker.status = "Errored"
             self.logger.error(f"Request errored: {ex}")
             raise
+        finally:
+            if held is not None:
+                leases.release(held)
+            if coalescer is not None:
+                coalescer.release()
 
     @abstractmethod
     def queue_endpoint_request(
@@ -871,6 +993,7 @@ class _ServerlessBase(Generic[R]):
         retry: bool = True,
         max_retries: Optional[int] = None,
         stream: bool = False,
+        binary: bool = False,
     ) -> R:
         """Dispatch a request to a serverless endpoint. Return type depends on subclass."""
         ...
@@ -892,6 +1015,7 @@ class Serverless(_ServerlessBase[ServerlessRequest]):
         retry: bool = True,
         max_retries: Optional[int] = None,
         stream: bool = False,
+        binary: bool = False,
     ) -> ServerlessRequest:
         """Return a Future that will resolve once the request completes."""
         if serverless_request is None:
@@ -913,6 +1037,7 @@ class Serverless(_ServerlessBase[ServerlessRequest]):
                     retry=retry,
                     max_retries=max_retries,
                     stream=stream,
+                    binary=binary,
                 )
                 request.set_result(result)
             except asyncio.CancelledError:
@@ -947,6 +1072,7 @@ class CoroutineServerless(_ServerlessBase[Coroutine[Any, Any, dict]]):
         retry: bool = True,
         max_retries: Optional[int] = None,
         stream: bool = False,
+        binary: bool = False,
     ) -> Coroutine[Any, Any, dict]:
         """Return a coroutine that resolves to the response dict when awaited."""
         if isinstance(serverless_request, ServerlessRequest):
@@ -967,4 +1093,5 @@ class CoroutineServerless(_ServerlessBase[Coroutine[Any, Any, dict]]):
             retry=retry,
             max_retries=max_retries,
             stream=stream,
+            binary=binary,
         )
@@ -3,9 +3,15 @@ import aiohttp
 import asyncio
 import random
 import json
-from typing import AsyncIterator, Dict, Optional, Any
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, NamedTuple, Optional
 
 from vastai.utils import VERSION
+from .. import wire
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 _JITTER_CAP_SECONDS = 5.0
 
@@ -25,44 +31,209 @@ def _build_kwargs(
     body: Optional[dict],
     method: str,
     stream: bool,
+    binary: Optional[bool] = None,
 ) -> Dict:
+    """
+    binary=None sends body as plain JSON. Otherwise body may hold raw buffers, the worker is
+    told we can read the binary wire format, and the body is sent in it (binary=True) or as
+    JSON with the buffers base64-encoded (binary=False).
+    """
+    if binary is None or method == "GET" or not body:
+        return {
+            "headers": headers,
+            "params": params,
+            "ssl": ssl_context,
+            "timeout": aiohttp.ClientTimeout(total=None if stream else timeout),
+            **({"json": body} if method != "GET" and body else {}),
+        }
+    headers = {**headers, "Accept": f"{wire.CONTENT_TYPE}, application/json;q=0.9"}
+    if binary:
+        headers["Content-Type"] = wire.CONTENT_TYPE
+        data = wire.encode(body)
+    else:
+        headers["Content-Type"] = "application/json"
+        data = wire.dumps_json(body)
     return {
         "headers": headers,
         "params": params,
         "ssl": ssl_context,
         "timeout": aiohttp.ClientTimeout(total=None if stream else timeout),
-        **({"json": body} if method != "GET" and body else {}),
+        "data": data,
     }
 
-async def _iter_sse_json(resp: aiohttp.ClientResponse) -> AsyncIterator[dict]:
-    """
-    Yield JSON objects from an SSE/text stream. Accepts lines starting with 'data:' or raw JSONL.
+class SSEEvent(NamedTuple):
+    """One decoded event from a worker stream."""
+    data: Any
+    event: Optional[str] = None
+    id: Optional[str] = None
+
+
+_DONE_SENTINEL = b"[DONE]"
+_WHITESPACE = b" \t\r"
+
+
+def _default_loads() -> Callable[[Any], Any]:
+    return orjson.loads if orjson is not None else json.loads
+
+
+class _SSEParser:
+    """Incremental SSE/JSONL parser.
+
+    Bytes are appended to one ``bytearray``; complete lines are located with
+    ``find`` and sliced out once, and the consumed prefix is dropped once per
+    chunk, so the work is linear in the stream size however many lines a chunk
+    carries.
+
+    Semantics:
+      - A ``data:`` line that decodes on its own is dispatched at once, so
+        single-line events, the common case, do not wait for the blank line.
+        Otherwise it starts a multi-line event: further ``data:`` lines are
+        collected and the event is joined with ``\n`` and decoded once, on the
+        blank line that ends it.
+      - ``event:`` and ``id:`` set the event name / last event id; the name
+        applies to the next event only. ``retry:`` and ``:`` comment lines
+        (keepalives) are ignored.
+      - ``data: [DONE]`` ends the stream.
+      - Any other non-empty line is treated as a raw JSONL record.
+      - Payloads that fail to decode are skipped.
     """
-    buffer = b""
-    async for chunk in resp.content.iter_any():
-        if not chunk:
-            continue
-        buffer += chunk
-        while b"\n" in buffer:
-            line, buffer = buffer.split(b"\n", 1)
-            line = line.strip()
-            if not line:
-                continue
-            if line.startswith(b"data:"):
-                line = line[5:].strip()
+
+    __slots__ = ("_buf", "_data", "_loads", "event", "last_event_id", "done")
+
+    def __init__(self, loads: Optional[Callable[[Any], Any]] = None):
+        self._buf = bytearray()
+        self._data: List[bytes] = []
+        self._loads = loads or _default_loads()
+        self.event: Optional[str] = None
+        self.last_event_id: Optional[str] = None
+        self.done = False
+
+    def feed(self, chunk: bytes) -> List[SSEEvent]:
+        """Consume ``chunk`` and return the events completed by it."""
+        out: List[SSEEvent] = []
+        buf = self._buf
+        scan = len(buf)
+        buf += chunk
+        pos = 0
+        find = buf.find
+        line = self._line
+        nl = find(b"\n", scan)
+        while nl != -1 and not self.done:
+            line(out, buf, pos, nl)
+            pos = nl + 1
+            nl = find(b"\n", pos)
+        del buf[:pos]
+        return out
+
+    def close(self) -> List[SSEEvent]:
+        """Flush an unterminated last line and any pending multi-line event."""
+        out: List[SSEEvent] = []
+        buf = self._buf
+        if buf and not self.done:
+            self._line(out, buf, 0, len(buf))
+        buf.clear()
+        if self._data and not self.done:
+            self._dispatch(out)
+        return out
+
+    def _line(self, out: List[SSEEvent], buf: bytearray, start: int, end: int) -> None:
+        if start == end:
+            if self._data:
+                self._dispatch(out)
+            return
+        if buf.startswith(b"data:", start, end):
+            start += 5
+            if start < end and buf[start] == 0x20:
+                start += 1
+            if buf[end - 1] == 0x0D:
+                end -= 1
+            value = buf[start:end]
+            if value == _DONE_SENTINEL and not self._data:
+                self.done = True
+                return
+            if self._data:
+                self._data.append(bytes(value))
+                return
             try:
-                yield json.loads(line.decode("utf-8"))
+                data = self._loads(value)
             except Exception:
-                # Ignore keepalives/bad fragments
-                continue
+                self._data.append(bytes(value))
+                return
+            self._emit(out, data)
+            return
+        # Trim surrounding whitespace (including the \r of CRLF) by index.
+        while start < end and buf[start] in _WHITESPACE:
+            start += 1
+        while end > start and buf[end - 1] in _WHITESPACE:
+            end -= 1
+        if start == end:
+            if self._data:
+                self._dispatch(out)
+            return
+        if buf[start] == 0x3A:  # ":" comment / keepalive
+            return
+        if buf.startswith(b"event:", start, end):
+            self.event = bytes(buf[start + 6:end]).strip().decode("utf-8", "replace")
+            return
+        if buf.startswith(b"id:", start, end):
+            self.last_event_id = bytes(buf[start + 3:end]).strip().decode("utf-8", "replace")
+            return
+        if buf.startswith(b"retry:", start, end):
+            return
+        if buf.startswith(b"data:", start, end):  # indented data line
+            self._line(out, buf, start, end)
+            return
+        # Raw JSONL record.
+        if self._data:
+            self._dispatch(out)
+        try:
+            data = self._loads(bytes(buf[start:end]))
+        except Exception:
+            return
+        self._emit(out, data)
 
-    # flush tail if present
-    tail = buffer.strip()
-    if tail:
+    def _dispatch(self, out: List[SSEEvent]) -> None:
+        payload = b"\n".join(self._data)
+        self._data.clear()
         try:
-            yield json.loads(tail.decode("utf-8"))
+            data = self._loads(payload)
         except Exception:
-            pass
+            self.event = None
+            return
+        self._emit(out, data)
+
+    def _emit(self, out: List[SSEEvent], data: Any) -> None:
+        out.append(SSEEvent(data, self.event, self.last_event_id))
+        self.event = None
+
+
+async def _iter_sse_events(
+    resp: aiohttp.ClientResponse, loads: Optional[Callable[[Any], Any]] = None
+) -> AsyncIterator[SSEEvent]:
+    """Yield :class:`SSEEvent` objects from an SSE/JSONL stream."""
+    parser = _SSEParser(loads)
+    async for chunk in resp.content.iter_any():
+        if not chunk:
+            continue
+        for event in parser.feed(chunk):
+            yield event
+        if parser.done:
+            return
+    for event in parser.close():
+        yield event
+
+
+async def _iter_sse_json(
+    resp: aiohttp.ClientResponse, loads: Optional[Callable[[Any], Any]] = None
+) -> AsyncIterator[dict]:
+    """
+    Yield JSON objects from an SSE/text stream. Accepts lines starting with 'data:' or raw JSONL.
+
+    ``loads`` overrides the JSON decoder; by default orjson is used when
+    installed, else the stdlib ``json``.
+    """
+    async for event in _iter_sse_events(resp, loads):
+        yield event.data
 
 async def _open_once(
     *,
@@ -90,10 +261,15 @@ async def _make_request(
     retries: int = 5,
     timeout: float = 30,
     stream: bool = False,
+    binary: Optional[bool] = None,
 ) -> Dict[str, Any]:
     """
     Make an HTTP request with capped exponential backoff + jitter, returning a structured result.
 
+    ``binary`` negotiates the binary wire format for remote-function calls (see _build_kwargs);
+    a response in that format is decoded into "json" and flagged with "binary": True. A
+    worker that rejects a binary body with 415 gets it again as JSON.
+
     - Never raises for HTTP non-2xx responses. Instead returns result with ok=False and status/text/json.
     - Raises only for "mechanical" failures (aiohttp/transport) and invalid JSON on successful (2xx) responses.
 
@@ -223,12 +399,28 @@ async def _make_request(
                 body=body,
                 method=method,
                 stream=False,
+                binary=binary,
             )
 
             request_fn = {"GET": session.get, "POST": session.post, "PUT": session.put, "DELETE": session.delete}.get(method, session.post)
             async with await request_fn(full_url, **kwargs) as resp:
                 status = resp.status
-                text = await resp.text()
+                if binary and status == 415:
+                    # this worker doesn't take the binary format after all
+                    return await _make_request(
+                        client=client,
+                        route=route,
+                        api_key=api_key,
+                        url=url,
+                        body=body,
+                        params=params,
+                        method=method,
+                        retries=retries,
+                        timeout=timeout,
+                        binary=False,
+                    )
+                is_binary = resp.headers.get("Content-Type", "").startswith(wire.CONTENT_TYPE)
+                text = "" if is_binary else await resp.text()
 
                 result: Dict[str, Any] = {
                     "ok": 200 <= status < 300,
@@ -240,6 +432,15 @@ async def _make_request(
                     "retryable": _retryable(status),
                     "attempt": attempt,
                 }
+                if binary is not None:
+                    result["binary"] = is_binary
+
+                if result["ok"] and is_binary:
+                    try:
+                        result["json"] = wire.decode(await resp.read())
+                    except ValueError as ex:
+                        raise Exception(f"Invalid wire message from {full_url}: {ex}")
+                    return result
 
                 if result["ok"]:
                     # Successful responses are expected to be JSON; invalid JSON is a hard failure
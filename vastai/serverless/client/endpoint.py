@@ -60,6 +60,10 @@ class Endpoint_(Generic[R]):
         self.last_refresh = time.time()
         self.soft_refresh_threshold = soft_refresh_threshold
         self.hard_refresh_threshold = hard_refresh_threshold
+        # Route leases and the shared poll loop, created by the client when
+        # route leasing / route coalescing is enabled.
+        self._route_leases = None
+        self._route_coalescer = None
 
     @property
     def name(self):
@@ -114,6 +118,7 @@ class Endpoint_(Generic[R]):
         stream: bool = False,
         timeout: Optional[float] = None,
         session: Optional["Session"] = None,
+        binary: bool = False,
     ) -> R:
         return self.client.queue_endpoint_request(
             endpoint=self,
@@ -125,6 +130,7 @@ class Endpoint_(Generic[R]):
             stream=stream,
             timeout=timeout,
             session=session,
+            binary=binary,
         )
 
     def close_session(self, session: "Session"):
@@ -0,0 +1,244 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+import aiohttp
+
+from vastai.utils import VERSION
+
+logger = logging.getLogger("vastai")
+
+HEARTBEAT_MAX_INTERVAL = 60.0
+HEARTBEAT_JITTER = 0.1
+HEARTBEAT_TIMEOUT = 10.0
+# how soon a failed heartbeat is tried again (capped by its usual interval)
+HEARTBEAT_RETRY = 5.0
+
+
+@dataclass
+class HeartbeatStats:
+    """Heartbeat counters for one deployment. Times are ``time.monotonic()``."""
+
+    ttl: float
+    deadline: float  # the server may expire the deployment after this
+    sent: int = 0
+    failed: int = 0
+    missed: int = 0  # TTLs that ran out without a successful heartbeat
+    last_success: Optional[float] = None
+    last_latency: Optional[float] = None
+
+
+@dataclass
+class _Due:
+    at: float
+    stats: HeartbeatStats = field(repr=False)
+
+
+class HeartbeatScheduler:
+    """Sends the heartbeats of every TTL'd deployment of a client from one asyncio task.
+
+    A deployment is due every ``min(ttl / 2, 60s)``, shortened by up to ``jitter`` so
+    deployments registered together drift apart instead of hitting the API in lockstep.
+    Each time the task wakes it sends every heartbeat that is due, concurrently over the
+    client's aiohttp session, then sleeps until the next one is due. A failed heartbeat is
+    retried after ``HEARTBEAT_RETRY`` seconds; ``missed`` counts TTLs that ran out without a
+    successful one, i.e. times the server may have expired a deployment.
+
+    The task runs on the loop that registers the first deployment, or on a background
+    thread if there is none. Code that leaves its loop after deploying
+    (``Deployment.ensure_ready``) moves it to that thread with :meth:`run_in_background`:
+    one thread for all of the client's deployments, until :meth:`stop`.
+    """
+
+    def __init__(
+        self,
+        client,
+        jitter: float = HEARTBEAT_JITTER,
+        timeout: float = HEARTBEAT_TIMEOUT,
+    ):
+        self._client = client
+        self.jitter = jitter
+        self.timeout = timeout
+        self.stats: Dict[int, HeartbeatStats] = {}
+        self._due: Dict[int, _Due] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._thread: Optional[threading.Thread] = None
+        # set by stop(); the running loop exits when it next wakes
+        self._stopping = False
+
+    @property
+    def sent(self) -> int:
+        return sum(s.sent for s in self.stats.values())
+
+    @property
+    def failed(self) -> int:
+        return sum(s.failed for s in self.stats.values())
+
+    @property
+    def missed(self) -> int:
+        return sum(s.missed for s in self.stats.values())
+
+    @property
+    def running(self) -> bool:
+        if self._thread is not None and self._thread.is_alive():
+            return True
+        return self._task is not None and not self._task.done()
+
+    def interval(self, ttl: float) -> float:
+        return min(ttl / 2, HEARTBEAT_MAX_INTERVAL)
+
+    def _next_interval(self, ttl: float) -> float:
+        return self.interval(ttl) * (1 - self.jitter * random.random())
+
+    def register(self, deployment_id: int, ttl: float) -> None:
+        """Start sending heartbeats for a deployment, the first one right away."""
+        now = time.monotonic()
+        stats = HeartbeatStats(ttl=ttl, deadline=now + ttl)
+        self.stats[deployment_id] = stats
+        self._due[deployment_id] = _Due(now, stats)
+        self._ensure_running()
+
+    def unregister(self, deployment_id: int) -> None:
+        """Stop sending heartbeats for a deployment (its stats are kept)."""
+        self._due.pop(deployment_id, None)
+        self._notify()
+
+    def _ensure_running(self) -> None:
+        if self.running:
+            self._notify()
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # no loop to run on
+            self.run_in_background()
+            return
+        self._stopping = False
+        self._task = loop.create_task(self._run())
+
+    def _notify(self) -> None:
+        loop, wake = self._loop, self._wake
+        if loop is None or wake is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            wake.set()
+        else:
+            loop.call_soon_threadsafe(wake.set)
+
+    def run_in_background(self) -> None:
+        """Keep sending heartbeats from a daemon thread with its own event loop."""
+        if not self._due or (self._thread is not None and self._thread.is_alive()):
+            return
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._stopping = False
+        self._thread = threading.Thread(
+            target=asyncio.run,
+            args=(self._run(own_session=True),),
+            name="vast-heartbeats",
+            daemon=True,
+        )
+        self._thread.start()
+
+    async def stop(self) -> None:
+        """Stop the heartbeat task or background thread (deployments stay registered)."""
+        thread, self._thread = self._thread, None
+        if thread is not None and thread.is_alive():
+            # a heartbeat in flight finishes within its timeout, then the loop exits
+            self._stopping = True
+            self._notify()
+            await asyncio.to_thread(thread.join, self.timeout + 1)
+            if thread.is_alive():
+                logger.warning("Heartbeat thread did not stop")
+        task, self._task = self._task, None
+        if task is None or task.done():
+            return
+        loop = task.get_loop()
+        if loop is not asyncio.get_running_loop():
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(task.cancel)
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _run(self, own_session: bool = False) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        session = aiohttp.ClientSession() if own_session else None
+        try:
+            while self._due and not self._stopping:
+                now = time.monotonic()
+                due = [(d, e) for d, e in list(self._due.items()) if e.at <= now]
+                if due:
+                    if session is None:
+                        active = await self._client._get_session()
+                    else:
+                        active = session
+                    await asyncio.gather(*(self._beat(active, d, e) for d, e in due))
+                    continue
+                next_at = min(e.at for e in self._due.values())
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), next_at - now)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            if session is not None:
+                await session.close()
+
+    async def _beat(
+        self, session: aiohttp.ClientSession, deployment_id: int, due: _Due
+    ) -> None:
+        stats = due.stats
+        start = time.monotonic()
+        if start > stats.deadline:
+            stats.missed += 1
+            stats.deadline = start + stats.ttl
+            logger.warning(
+                f"Deployment {deployment_id} went {stats.ttl:.0f}s without a heartbeat"
+            )
+        url = (
+            self._client.vast_web_url.rstrip("/")
+            + f"/api/v0/deployment/{deployment_id}/heartbeat/"
+        )
+        headers = {
+            "Authorization": f"Bearer {self._client.api_key}",
+            "User-Agent": f"vastai-sdk/{VERSION}",
+        }
+        try:
+            async with session.post(
+                url,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            ) as resp:
+                await resp.read()
+                ok = 200 <= resp.status < 300
+                error = f"HTTP {resp.status}"
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            ok = False
+            error = repr(e)
+        now = time.monotonic()
+        interval = self._next_interval(stats.ttl)
+        if ok:
+            stats.sent += 1
+            stats.last_success = now
+            stats.last_latency = now - start
+            stats.deadline = now + stats.ttl
+            due.at = now + interval
+        else:
+            stats.failed += 1
+            due.at = now + min(interval, HEARTBEAT_RETRY)
+            logger.debug(f"Heartbeat for deployment {deployment_id} failed: {error}")
@@ -5,6 +5,14 @@ from vastai.data.endpoint import EndpointData
 from vastai.data.deployment import DeploymentData, DeploymentPutResponse
 from vastai.data.workergroup import WorkergroupConfig
 from .endpoint import Endpoint_
+from .heartbeat import HEARTBEAT_TIMEOUT
+from .upload import (
+    UPLOAD_CONCURRENCY,
+    MultipartState,
+    ProgressCallback,
+    upload_multipart,
+    upload_presigned_post,
+)
 import requests
 
 if TYPE_CHECKING:
@@ -109,6 +117,8 @@ class ManagedDeployment(Generic[R]):
         self._data = data
         self._put_response = put_response
         self._endpoint: Optional[ManagedEndpoint[R]] = None
+        # acknowledged parts of an interrupted multipart upload, to resume from
+        self._multipart_state: Optional[MultipartState] = None
 
     @property
     def id(self) -> int:
@@ -128,49 +138,77 @@ class ManagedDeployment(Generic[R]):
         """The workergroup ID associated with this deployment, if returned by the server."""
         return self._put_response.workergroup_id if self._put_response else None
 
+    @property
+    def codecs(self) -> list:
+        """Tarball codecs the server advertised its workers can extract, beyond gzip."""
+        if self._put_response is None or not self._put_response.codecs:
+            return []
+        return list(self._put_response.codecs)
+
     @property
     def needs_upload(self) -> bool:
         """True if the deployment requires a blob upload to S3 to complete setup."""
-        return (
-            self._put_response is not None
-            and self._put_response.upload_url is not None
-            and self._put_response.upload_fields is not None
+        return self._put_response is not None and (
+            self._put_response.multipart_upload is not None
+            or (
+                self._put_response.upload_url is not None
+                and self._put_response.upload_fields is not None
+            )
         )
 
-    async def upload(self, file_path: str) -> None:
-        """Upload a tarball to S3 using the presigned POST from put_deployment.
+    async def upload(
+        self,
+        file_path: str,
+        content_type: str = "application/gzip",
+        *,
+        progress: Optional[ProgressCallback] = None,
+        max_bytes_per_second: Optional[float] = None,
+        concurrency: int = UPLOAD_CONCURRENCY,
+    ) -> None:
+        """Upload a tarball to S3 using the presigned upload from put_deployment.
+
+        ``content_type`` labels the blob with the tarball's compression codec.
+        If the server offered a multipart upload, parts go up ``concurrency`` at a
+        time and calling upload() again after a failure resumes after the parts
+        already acknowledged; otherwise the file is sent as a single presigned POST.
+        ``progress`` is called with (bytes sent, total bytes) as the upload goes,
+        and ``max_bytes_per_second`` caps its total bandwidth.
 
         Raises ValueError if no upload is needed, RuntimeError on upload failure.
         """
         if not self.needs_upload:
             raise ValueError("No upload needed for this deployment")
 
-        import aiohttp
-        import os
-
-        upload_url = self._put_response.upload_url
-        upload_fields = self._put_response.upload_fields
-
-        data = aiohttp.FormData()
-        for key, value in upload_fields.items():
-            data.add_field(key, value)
-        data.add_field(
-            "file",
-            open(file_path, "rb"),
-            filename=os.path.basename(file_path),
-            content_type="application/gzip",
-        )
-
         session = await self._client._get_session()
-        async with session.post(upload_url, data=data) as resp:
-            if resp.status not in (200, 201, 204):
-                text = await resp.text()
-                raise RuntimeError(
-                    f"S3 upload failed: HTTP {resp.status} - {text[:512]}"
-                )
+        multipart = self._put_response.multipart_upload
+        if multipart is not None:
+            key = MultipartState.key_for(file_path)
+            if self._multipart_state is None or self._multipart_state.file_key != key:
+                self._multipart_state = MultipartState(key)
+            await upload_multipart(
+                session,
+                multipart,
+                file_path,
+                self._multipart_state,
+                progress=progress,
+                max_bytes_per_second=max_bytes_per_second,
+                concurrency=concurrency,
+            )
+            self._multipart_state = None
+        else:
+            await upload_presigned_post(
+                session,
+                self._put_response.upload_url,
+                self._put_response.upload_fields,
+                file_path,
+                content_type,
+                progress=progress,
+                max_bytes_per_second=max_bytes_per_second,
+            )
 
         self._put_response.upload_url = None
         self._put_response.upload_fields = None
+        self._put_response.multipart_upload = None
 
     @property
     def endpoint(self) -> ManagedEndpoint[R]:
@@ -189,6 +227,15 @@ class ManagedDeployment(Generic[R]):
         """Clear cached data so the next .get() re-fetches from the API."""
         self._data = None
 
+    def start_heartbeat(self, ttl: float) -> None:
+        """Keep this deployment alive by heartbeating it from the client's shared
+        HeartbeatScheduler (every ``min(ttl / 2, 60)`` seconds, jittered). Called
+        without a running event loop, the heartbeats go out from a background thread."""
+        self._client.heartbeats.register(self.id, ttl)
+
+    def stop_heartbeat(self) -> None:
+        self._client.heartbeats.unregister(self.id)
+
     def sync_heartbeat(
         self,
     ):  # for use in background thread outside of main aiohttp connection
@@ -197,6 +244,7 @@ class ManagedDeployment(Generic[R]):
             url=self._client.vast_web_url.rstrip("/")
             + f"/api/v0/deployment/{self.id}/heartbeat/",
             headers=headers,
+            timeout=HEARTBEAT_TIMEOUT,
         )
 
     def __repr__(self) -> str:
@@ -0,0 +1,85 @@
+import asyncio
+import collections
+from typing import Deque, Optional
+
+
+class RouteCoalescer:
+    """Shares one ``/route/`` poll loop among requests waiting on an endpoint.
+
+    Without it every request whose route came back WAITING runs its own
+    backoff-and-poll loop, so a burst of N requests during cold start polls the
+    autoscaler N times per interval.  With it, one waiting request (the
+    leader) polls on the usual backoff while the others park.  Each READY
+    poll wakes parked requests to route for themselves, doubling how many it
+    wakes on every consecutive READY (up to ``max_wake``) and dropping back to
+    one as soon as a poll says WAITING again, so route calls track how fast
+    workers come up rather than how many requests are queued.
+
+    Parked requests still re-route on their own every ``keepalive`` seconds
+    so the autoscaler keeps counting them as pending demand (their
+    ``request_idx`` is held for the route's ``replay_timeout``).
+    """
+
+    def __init__(self, keepalive: float = 30.0, max_wake: int = 64):
+        self.keepalive = keepalive
+        self.max_wake = max_wake
+        self._leader: Optional[asyncio.Task] = None
+        self._waiters: Deque[asyncio.Future] = collections.deque()
+        self._wake = 1
+        self.polls = 0
+        self.wakeups = 0
+        self.keepalives = 0
+
+    @property
+    def parked(self) -> int:
+        return sum(1 for w in self._waiters if not w.done())
+
+    def _is_leader(self) -> bool:
+        return self._leader is not None and self._leader is asyncio.current_task()
+
+    async def wait_turn(self, poll_interval: float, max_wait: Optional[float] = None) -> None:
+        """Return when the calling request should poll ``/route/`` again.
+
+        ``max_wait`` caps how long a parked request waits (its remaining
+        request timeout).
+        """
+        leader = self._leader
+        if leader is None or leader.done() or leader is asyncio.current_task():
+            self._leader = asyncio.current_task()
+            self.polls += 1
+            await asyncio.sleep(poll_interval)
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            wait = self.keepalive if max_wait is None else min(self.keepalive, max_wait)
+            await asyncio.wait_for(waiter, timeout=wait)
+        except asyncio.TimeoutError:
+            self.keepalives += 1
+
+    def report(self, ready: bool) -> None:
+        """Record the outcome of a poll made after :meth:`wait_turn`."""
+        if not ready:
+            if self._is_leader():
+                self._wake = 1
+            return
+        if self._is_leader():
+            self._leader = None
+        self._wake_waiters(self._wake)
+        self._wake = min(self._wake * 2, self.max_wake)
+
+    def release(self) -> None:
+        """Give up leadership (the request finished or failed while polling)."""
+        if self._is_leader():
+            self._leader = None
+            self._wake_waiters(1)
+
+    def _wake_waiters(self, n: int) -> None:
+        while n > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            waiter.set_result(None)
+            self.wakeups += 1
+            n -= 1
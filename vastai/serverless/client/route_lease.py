@@ -0,0 +1,129 @@
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+@dataclass(eq=False)
+class RouteLease:
+    """A READY route result kept for reuse by later requests to the same endpoint.
+
+    The autoscaler signs the worker URL, not the individual request, so the
+    ``auth_data`` of one READY route is accepted by that worker until it goes
+    away.  A lease lets requests skip the ``/route/`` round-trip and go
+    straight to the worker over the session's existing keep-alive connection.
+
+    The worker tracks in-flight work by the route's ``reqnum``, so a lease is
+    used by one request at a time: it is taken for a request and released
+    when that request is done.  Concurrent requests each route, and each
+    route becomes a lease of its own.
+
+    ``request_idx`` is the autoscaler's record of the request that routed,
+    closed when the worker reports that request through /delete_requests/.
+    Later requests on the lease never went through /route/, so they have no
+    record of their own: they are sent with ``request_idx`` 0, as if the
+    route had returned none, rather than reporting the routed request done
+    again under every reuse.
+    """
+    url: str
+    auth_data: dict
+    request_idx: int
+    expires_at: float
+    uses_left: Optional[int] = None
+    in_use: bool = False
+
+    def usable(self, now: float) -> bool:
+        return now < self.expires_at and (self.uses_left is None or self.uses_left > 0)
+
+    def reuse_auth_data(self) -> dict:
+        """``auth_data`` for a later request on the lease (see the class docstring)."""
+        return {**self.auth_data, "request_idx": 0}
+
+
+@dataclass
+class RouteStats:
+    """Routing counters for one client.
+
+    ``route_calls`` counts ``/route/`` round-trips actually made (polls
+    included); ``lease_hits`` counts requests sent on a lease instead.  With
+    leasing off the client would have made ``route_calls + lease_hits`` calls.
+    """
+    route_calls: int = 0
+    lease_hits: int = 0
+    leases_granted: int = 0
+    leases_invalidated: int = 0
+
+    @property
+    def always_route_calls(self) -> int:
+        return self.route_calls + self.lease_hits
+
+    @property
+    def saved_fraction(self) -> float:
+        total = self.always_route_calls
+        return self.lease_hits / total if total else 0.0
+
+
+@dataclass
+class RouteLeaseTable:
+    """Per-endpoint leases, keyed on request cost (the route result depends on it)."""
+    ttl: float
+    max_uses: Optional[int] = None
+    stats: RouteStats = field(default_factory=RouteStats)
+    _leases: Dict[float, List[RouteLease]] = field(default_factory=dict, repr=False)
+
+    def take(self, cost: float) -> Optional[RouteLease]:
+        """Return an idle, usable lease for ``cost`` and consume one use, or None."""
+        leases = self._leases.get(cost)
+        if not leases:
+            return None
+        now = time.time()
+        leases[:] = [lease for lease in leases if lease.in_use or lease.usable(now)]
+        if not leases:
+            del self._leases[cost]
+        lease = next((lease for lease in leases if not lease.in_use), None)
+        if lease is None:
+            return None
+        lease.in_use = True
+        if lease.uses_left is not None:
+            lease.uses_left -= 1
+        self.stats.lease_hits += 1
+        return lease
+
+    def grant(
+        self, cost: float, url: str, auth_data: dict, request_idx: int
+    ) -> Optional[RouteLease]:
+        """Lease a fresh READY route, in use by the request that routed it."""
+        if not url or self.ttl <= 0:
+            return None
+        lease = RouteLease(
+            url=url,
+            auth_data=auth_data,
+            request_idx=request_idx,
+            expires_at=time.time() + self.ttl,
+            uses_left=self.max_uses,
+            in_use=True,
+        )
+        self._leases.setdefault(cost, []).append(lease)
+        self.stats.leases_granted += 1
+        return lease
+
+    def release(self, lease: RouteLease) -> None:
+        """The request holding ``lease`` is done; later requests may take it."""
+        lease.in_use = False
+
+    def discard(self, lease: RouteLease) -> None:
+        """Drop one lease whose request may still be running on the worker."""
+        for cost, leases in list(self._leases.items()):
+            if lease in leases:
+                leases.remove(lease)
+                if not leases:
+                    del self._leases[cost]
+
+    def invalidate(self, url: str) -> None:
+        """Drop every lease pointing at ``url`` (the worker failed or went away)."""
+        for cost, leases in list(self._leases.items()):
+            kept = [lease for lease in leases if lease.url != url]
+            self.stats.leases_invalidated += len(leases) - len(kept)
+            if kept:
+                self._leases[cost] = kept
+            else:
+                del self._leases[cost]
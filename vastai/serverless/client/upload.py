@@ -0,0 +1,279 @@
+# upload.py
+"""
+Uploads of deployment tarballs to S3 presigned URLs.
+
+Two modes, chosen by what put_deployment returned:
+
+* presigned POST (``upload_url`` + ``upload_fields``): the file goes up as one form POST.
+  A failure restarts it from the beginning.
+* presigned multipart (``multipart_upload``): the file is cut into parts that are PUT
+  concurrently, and finished with CompleteMultipartUpload. Each part is retried on its
+  own, and the ETags of acknowledged parts are kept in a ``MultipartState``, so a later
+  upload of the same file resumes after the last acknowledged part instead of starting over.
+
+Both modes stream the file from disk in chunks, report progress after every chunk and can
+be limited to a maximum bandwidth shared by all parts.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional, Tuple
+from xml.sax.saxutils import escape
+
+import aiohttp
+from aiohttp.payload import Payload
+
+from vastai.data.deployment import DeploymentMultipartUpload
+from .connection import _backoff_delay, _retryable
+
+logger = logging.getLogger("vastai")
+
+UPLOAD_CHUNK_SIZE = 256 * 1024
+UPLOAD_CONCURRENCY = 4
+UPLOAD_MAX_ATTEMPTS = 5
+
+# called with (bytes sent, total bytes); sent can go back down when a part is retried
+ProgressCallback = Callable[[int, int], None]
+
+
+class _Throttle:
+    """Bandwidth limit shared by concurrent senders: each chunk reserves the next
+    ``nbytes / rate`` seconds of the link and waits for its slot to start."""
+
+    def __init__(self, bytes_per_second: float):
+        if bytes_per_second <= 0:
+            raise ValueError("max_bytes_per_second must be positive")
+        self.rate = bytes_per_second
+        self._next = time.monotonic()
+
+    async def wait(self, nbytes: int) -> None:
+        now = time.monotonic()
+        start = max(self._next, now)
+        self._next = start + nbytes / self.rate
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+class _Progress:
+    def __init__(self, total: int, callback: Optional[ProgressCallback]):
+        self.total = total
+        self.sent = 0
+        self._callback = callback
+
+    def advance(self, nbytes: int) -> None:
+        self.sent += nbytes
+        if self._callback is not None:
+            self._callback(self.sent, self.total)
+
+
+class _FileRangePayload(Payload):
+    """``length`` bytes of a file from ``offset``, read chunk by chunk as aiohttp sends
+    them. Its size is known up front, so the request gets a Content-Length (S3 rejects
+    chunked transfer encoding)."""
+
+    def __init__(
+        self,
+        path: str,
+        offset: int,
+        length: int,
+        on_chunk: Callable[[int], "asyncio.Future"],
+        **kwargs,
+    ):
+        super().__init__(path, **kwargs)
+        self._offset = offset
+        self._size = length
+        self._on_chunk = on_chunk
+        self.sent = 0
+
+    def decode(self, encoding: str = "utf-8", errors: str = "strict") -> str:
+        raise TypeError("file payloads can't be decoded")
+
+    async def write(self, writer) -> None:
+        with open(self._value, "rb") as f:
+            f.seek(self._offset)
+            remaining = self._size
+            while remaining > 0:
+                chunk = f.read(min(UPLOAD_CHUNK_SIZE, remaining))
+                if not chunk:
+                    raise RuntimeError(f"{self._value} shrank while uploading")
+                await self._on_chunk(len(chunk))
+                self.sent += len(chunk)
+                await writer.write(chunk)
+                remaining -= len(chunk)
+
+
+@dataclass
+class MultipartState:
+    """Acknowledged parts (part number -> ETag) of a multipart upload of one file."""
+
+    file_key: Tuple[str, int, int]
+    etags: Dict[int, str] = field(default_factory=dict)
+
+    @staticmethod
+    def key_for(path: str) -> Tuple[str, int, int]:
+        st = os.stat(path)
+        return (os.path.abspath(path), st.st_size, st.st_mtime_ns)
+
+
+class _Sender:
+    """Shared progress, throttle and retry logic for one upload."""
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        total: int,
+        progress: Optional[ProgressCallback],
+        max_bytes_per_second: Optional[float],
+        max_attempts: int,
+    ):
+        self.session = session
+        self.progress = _Progress(total, progress)
+        self.throttle = (
+            _Throttle(max_bytes_per_second) if max_bytes_per_second else None
+        )
+        self.max_attempts = max_attempts
+
+    async def on_chunk(self, nbytes: int) -> None:
+        if self.throttle is not None:
+            await self.throttle.wait(nbytes)
+        self.progress.advance(nbytes)
+
+    async def send(self, what: str, method: str, url: str, make_request, **kwargs):
+        """Send a request until it succeeds, retrying transient failures with backoff.
+
+        ``make_request()`` returns the request data and the file payload in it (or None),
+        built afresh for every attempt. Returns (response headers, body text).
+        """
+        for attempt in range(self.max_attempts):
+            data, payload = make_request()
+            try:
+                async with self.session.request(method, url, data=data, **kwargs) as resp:
+                    text = await resp.text()
+                    if resp.status in (200, 201, 204):
+                        return resp.headers, text
+                    error = RuntimeError(
+                        f"{what} failed: HTTP {resp.status} - {text[:512]}"
+                    )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = RuntimeError(f"{what} failed: {e!r}")
+                status = None
+            else:
+                status = resp.status
+            if payload is not None and payload.sent:
+                # these bytes will be sent again
+                self.progress.advance(-payload.sent)
+            if status is not None and not _retryable(status):
+                raise error
+            if attempt + 1 < self.max_attempts:
+                logger.warning(f"{error}; retrying")
+                await asyncio.sleep(_backoff_delay(attempt))
+        raise error
+
+
+async def upload_presigned_post(
+    session: aiohttp.ClientSession,
+    url: str,
+    fields: dict,
+    file_path: str,
+    content_type: str,
+    progress: Optional[ProgressCallback] = None,
+    max_bytes_per_second: Optional[float] = None,
+    max_attempts: int = UPLOAD_MAX_ATTEMPTS,
+) -> None:
+    """Upload a file with an S3 presigned POST, restarting it on transient failures."""
+    size = os.path.getsize(file_path)
+    sender = _Sender(session, size, progress, max_bytes_per_second, max_attempts)
+
+    def make_form():
+        payload = _FileRangePayload(
+            file_path, 0, size, sender.on_chunk, content_type=content_type
+        )
+        data = aiohttp.FormData()
+        for key, value in fields.items():
+            data.add_field(key, value)
+        data.add_field(
+            "file",
+            payload,
+            filename=os.path.basename(file_path),
+            content_type=content_type,
+        )
+        return data, payload
+
+    await sender.send("S3 upload", "POST", url, make_form)
+
+
+async def upload_multipart(
+    session: aiohttp.ClientSession,
+    multipart: DeploymentMultipartUpload,
+    file_path: str,
+    state: MultipartState,
+    progress: Optional[ProgressCallback] = None,
+    max_bytes_per_second: Optional[float] = None,
+    concurrency: int = UPLOAD_CONCURRENCY,
+    max_attempts: int = UPLOAD_MAX_ATTEMPTS,
+) -> None:
+    """Upload a file through a presigned S3 multipart upload.
+
+    Parts already in ``state`` are skipped; every part acknowledged here is added to it,
+    even if the upload as a whole fails, so calling this again resumes it.
+    """
+    size = os.path.getsize(file_path)
+    part_size = multipart.part_size
+    count = max(1, -(-size // part_size))
+    if count > len(multipart.part_urls):
+        raise ValueError(
+            f"{file_path} needs {count} parts of {part_size} bytes but the server "
+            f"presigned {len(multipart.part_urls)}"
+        )
+    sender = _Sender(session, size, progress, max_bytes_per_second, max_attempts)
+    done = sum(min(part_size, size - (n - 1) * part_size) for n in state.etags)
+    if done:
+        logger.info(f"Resuming upload: {len(state.etags)}/{count} parts already sent")
+        sender.progress.advance(done)
+    limit = asyncio.Semaphore(concurrency)
+
+    async def put_part(number: int) -> None:
+        offset = (number - 1) * part_size
+        length = min(part_size, size - offset)
+
+        def make_part():
+            payload = _FileRangePayload(file_path, offset, length, sender.on_chunk)
+            return payload, payload
+
+        async with limit:
+            headers, _ = await sender.send(
+                f"Upload of part {number}/{count}",
+                "PUT",
+                multipart.part_urls[number - 1],
+                make_part,
+            )
+        etag = headers.get("ETag")
+        if not etag:
+            raise RuntimeError(f"Upload of part {number}/{count}: no ETag in response")
+        state.etags[number] = etag
+
+    pending = [n for n in range(1, count + 1) if n not in state.etags]
+    results = await asyncio.gather(
+        *(put_part(n) for n in pending), return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+    body = "<CompleteMultipartUpload>" + "".join(
+        f"<Part><PartNumber>{n}</PartNumber><ETag>{escape(state.etags[n])}</ETag></Part>"
+        for n in range(1, count + 1)
+    ) + "</CompleteMultipartUpload>"
+    _, text = await sender.send(
+        "Completing multipart upload",
+        "POST",
+        multipart.complete_url,
+        lambda: (body.encode("utf-8"), None),
+        headers={"Content-Type": "application/xml"},
+    )
+    # S3 can report a failed completion in the body of a 200 response
+    if "<Error>" in text:
+        raise RuntimeError(f"Completing multipart upload failed: {text[:512]}")
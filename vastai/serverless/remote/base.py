@@ -198,6 +198,7 @@ class Deployment_(ABC):
         benchmark_generator: Callable[[], dict] | None = None,
         benchmark_runs: int = 10,
         workload_calculator: Callable[..., float] | None = None,
+        workload_from_metadata: bool = False,
     ) -> (
         Callable[P, Awaitable[Any]]
         | Callable[[Callable[P, Awaitable[Any]]], Callable[P, Awaitable[Any]]]
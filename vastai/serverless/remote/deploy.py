@@ -1,6 +1,4 @@
 import inspect
-import threading
-import time
 import json
 import os
 from typing import Optional, Any, Callable, Awaitable, ParamSpec, BinaryIO
@@ -13,7 +11,13 @@ from vastai.data.deployment import DeploymentConfig
 from vastai.serverless.client import ManagedDeployment
 from . import serialization
 from .base import Deployment_, Config, DockerLogin, Image, Autoscaling
-from .utils import create_deployment_tarball, compute_deployment_hash
+from vastai.serverless.archive import get_codec, negotiate_codec
+from .utils import (
+    build_deployment_tarball,
+    create_deployment_tarball,
+    deployment_manifest,
+    get_deployment_hash_cache,
+)
 from os.path import getsize
 import tempfile
 import asyncio
@@ -129,6 +133,11 @@ class Deployment(Deployment_):  # TODO: Async Context Manager compatible with cl
         self._autoscaling: Autoscaling | None = None
         self._ttl = ttl
         self._inner: _FullDeployment | None = None
+        # whether the last _compute_hash_and_filesize_and_make_tar wrote the tarball
+        self._tar_built = False
+        # tarball compression: $VAST_DEPLOYMENT_CODEC once the server advertises it,
+        # gzip until then
+        self._codec = negotiate_codec()
 
     def _compile_env(self, checked_image: Image) -> str:
         envs = [f"-p {port}:{port}/{type_}" for port, type_ in checked_image._ports]
@@ -162,11 +171,9 @@ class Deployment(Deployment_):  # TODO: Async Context Manager compatible with cl
             raise Exception(
                 "Trying to deploy a deployment without autoscaling configured."
             )
-        logger.debug(f"Building deployment tarball at {tar_path}")
         hash, size = self._compute_hash_and_filesize_and_make_tar(
             tar_path, self.name, self._image
         )
-        logger.info(f"Deployment tarball built: hash={hash}, size={size} bytes")
         return DeploymentConfig(
             name=self.name
             if self.name
@@ -209,21 +216,68 @@ class Deployment(Deployment_):  # TODO: Async Context Manager compatible with cl
     def _compute_hash_and_filesize_and_make_tar(
         self, tar_path: str, checked_name: str, checked_image: Image
     ) -> tuple[str, int]:
+        """Hash and tarball size of the deployment.
+
+        If no file changed since the last build (per the local hash cache) they are
+        known without reading anything and no tarball is made; ensure_ready builds
+        it later only if the server asks for an upload. Otherwise the tarball is
+        built at tar_path, hashing each file as it is archived.
+        """
         if not isinstance(self.file, str):
             raise Exception(
                 "Trying to deploy a deployment not yet bound to a Python module. Have any remote functions been registered?"
             )
         config = self._collate_config(checked_name, checked_image)
-        hash = compute_deployment_hash(config, self.file, checked_image._copies)
-        create_deployment_tarball(tar_path, config, self.file, checked_image._copies)
+        cache = get_deployment_hash_cache()
+        manifest = deployment_manifest(
+            config, self.file, checked_image._copies, self._codec.name
+        )
+        cached = cache.lookup(manifest) if cache is not None else None
+        if cached is not None and not DEBUG_DEPLOYMENT_TAR:
+            logger.info(
+                f"Deployment unchanged since last build: hash={cached[0]}, size={cached[1]} bytes"
+            )
+            self._tar_built = False
+            return cached
+        logger.debug(f"Building deployment tarball at {tar_path}")
+        hash = build_deployment_tarball(
+            tar_path, config, self.file, checked_image._copies, codec=self._codec.name
+        )
         size = getsize(tar_path)
+        logger.info(f"Deployment tarball built: hash={hash}, size={size} bytes")
+        if cache is not None:
+            cache.store(manifest, hash, size)
+        self._tar_built = True
         return (hash, size)
 
-    def _heartbeat_thread(self, deployment: ManagedDeployment, ttl: float):
-        interval = min(ttl / 2, 60)
-        while True:
-            deployment.sync_heartbeat()
-            time.sleep(interval)
+    def _negotiate_codec(self, accepted: list) -> None:
+        """Pick the codec for the next build from the ones the server's workers can
+        extract; the tarball already registered keeps the codec it was built with."""
+        requested = get_codec()
+        codec = negotiate_codec(requested, accepted)
+        if codec.name != requested.name:
+            logger.debug(
+                f"Compressing deployments with {codec.name}: {requested.name} is not "
+                f"advertised by the server or not installed here"
+            )
+        self._codec = codec
+
+    def _make_tar(self, tar_path: str, expected_size: int) -> None:
+        """Build the tarball that _compute_hash_and_filesize_and_make_tar skipped."""
+        if not isinstance(self.name, str) or not isinstance(self._image, Image):
+            raise Exception("Trying to deploy an unbound deployment.")
+        config = self._collate_config(self.name, self._image)
+        logger.debug(f"Building deployment tarball at {tar_path}")
+        create_deployment_tarball(
+            tar_path, config, self.file, self._image._copies, codec=self._codec.name
+        )
+        size = getsize(tar_path)
+        if size != expected_size:
+            # builds are reproducible, so this means a file changed since hashing
+            raise Exception(
+                f"Deployment files changed while deploying (tarball is {size} bytes, "
+                f"registered {expected_size}); run again to redeploy"
+            )
 
     async def async_ensure_ready(self):
         if not isinstance(self.root_module, str):
@@ -241,11 +295,14 @@ class Deployment(Deployment_):  # TODO: Async Context Manager compatible with cl
             logger.debug(f"Registering deployment with server")
             deployment = await self.client.put_deployment(config)
             if deployment.needs_upload:
+                if not self._tar_built:
+                    self._make_tar(tar_path, config.file_size)
                 logger.info(f"Uploading deployment tarball")
-                await deployment.upload(tar_path)
+                await deployment.upload(tar_path, content_type=self._codec.content_type)
                 logger.info(f"Upload complete")
             else:
                 logger.info(f"Deployment tarball already up to date, skipping upload")
+            self._negotiate_codec(deployment.codecs)
             if deployment.action == "soft_update":
                 wg_id = deployment.workergroup_id
                 if not wg_id:
@@ -261,15 +318,13 @@ class Deployment(Deployment_):  # TODO: Async Context Manager compatible with cl
                     )
             self._inner = _FullDeployment(self.root_module, deployment)
             if self._ttl is not None:
-                threading.Thread(
-                    target=self._heartbeat_thread,
-                    args=(deployment, self._ttl),
-                    daemon=True,
-                ).start()
+                deployment.start_heartbeat(self._ttl)
         logger.info(f"Deployment '{self.name}' is ready (id={deployment.id})")
 
     def ensure_ready(self):
         asyncio.run(self.async_ensure_ready())
+        # the loop heartbeats were started on has ended
+        self.client.heartbeats.run_in_background()
 
     def _unwrap_worker_response(self, response: dict[str, Any]) -> serialization.JSON:
         try:
@@ -292,10 +347,13 @@ class Deployment(Deployment_):  # TODO: Async Context Manager compatible with cl
                     route,
                     {
                         "kwargs": {
-                            k: serialization.serialize(v, self._inner.root_module)
+                            k: serialization.serialize(
+                                v, self._inner.root_module, binary=True
+                            )
                             for k, v in bound_args.arguments.items()
                         }
                     },
+                    binary=True,
                 )
             ),
             self._inner.root_module,
@@ -310,6 +368,7 @@ class Deployment(Deployment_):  # TODO: Async Context Manager compatible with cl
         benchmark_generator: Callable[[], dict] | None = None,
         benchmark_runs: int = 10,
         workload_calculator: Callable[..., float] | None = None,
+        workload_from_metadata: bool = False,
     ) -> (
         Callable[P, Awaitable[Any]]
         | Callable[[Callable[P, Awaitable[Any]]], Callable[P, Awaitable[Any]]]
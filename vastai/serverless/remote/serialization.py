@@ -1,4 +1,8 @@
 import base64
+import math
+import sys
+from dataclasses import dataclass
+from types import SimpleNamespace
 from typing import Any, TypeAlias
 from importlib import import_module
 import logging
@@ -29,15 +33,26 @@ def derelativize_module(mod, root_module: str):
 JSON: TypeAlias = int | str | float | list["JSON"] | dict[str, "JSON"]
 
 
-def serialize(obj, root_module: str) -> JSON:
+def serialize(obj, root_module: str, binary: bool = False) -> JSON:
+    """
+    With binary=True, buffer contents are left as the buffer itself rather than base64, for
+    the binary wire format (vastai.serverless.wire). wire.json_default turns such a tree
+    back into exactly what binary=False produces.
+
+    NumPy arrays and scalars are sent as their raw data plus dtype/shape/strides, and any
+    other object supporting the buffer protocol (array.array, mmap, ...) as its raw bytes.
+    """
     if type(obj) in [int, str, float, type(None)]:
         return obj
-    elif type(obj) is bytes:
-        return {"type": "bytes", "contents": base64.b64encode(obj).decode("utf-8")}
+    elif type(obj) in [bytes, bytearray, memoryview]:
+        return {
+            "type": type(obj).__name__,
+            "contents": _buffer_node(obj, binary),
+        }
     elif type(obj) in [list, tuple]:
         return {
             "type": type(obj).__name__,
-            "contents": [serialize(child, root_module) for child in obj],
+            "contents": [serialize(child, root_module, binary) for child in obj],
         }
     elif (
         type(obj) is dict
@@ -45,27 +60,117 @@ def serialize(obj, root_module: str) -> JSON:
         return {
             "type": "dict",
             "contents": [
-                [serialize(k, root_module), serialize(v, root_module)]
+                [serialize(k, root_module, binary), serialize(v, root_module, binary)]
                 for k, v in obj.items()
             ],
         }
-    elif hasattr(obj, "__dict__") and hasattr(
+    np = sys.modules.get("numpy")  # only already-imported numpy can have made obj
+    if np is not None and (type(obj) is np.ndarray or isinstance(obj, np.generic)):
+        return _serialize_ndarray(np, obj, binary)
+    try:
+        view = memoryview(obj)
+    except TypeError:
+        pass
+    else:
+        return {
+            "type": "buffer",
+            "format": view.format,
+            "shape": list(view.shape),
+            "contents": _buffer_node(view, binary),
+        }
+    if hasattr(obj, "__dict__") and hasattr(
         obj, "__class__"
     ):  # is a member of a normal Python class
         return {
             "type": "obj",
             "module": relativize_module(obj.__class__.__module__, root_module),
             "class": obj.__class__.__qualname__,
-            "contents": {k: serialize(v, root_module) for k, v in obj.__dict__.items()},
+            "contents": {
+                k: serialize(v, root_module, binary) for k, v in obj.__dict__.items()
+            },
         }
     raise TypeError(f"Object of type {type(obj)} is not JSON serializable!")
 
 
+def _buffer_node(buf, binary: bool):
+    if binary:
+        return buf
+    if not memoryview(buf).c_contiguous:
+        buf = memoryview(buf).tobytes()
+    return base64.b64encode(buf).decode("utf-8")
+
+
+def _serialize_ndarray(np, obj, binary: bool) -> JSON:
+    scalar = isinstance(obj, np.generic)
+    arr = np.asarray(obj)
+    if arr.dtype.hasobject:
+        raise TypeError(f"Arrays of dtype {arr.dtype} are not serializable!")
+    if arr.flags.c_contiguous:
+        data = arr
+    elif arr.flags.f_contiguous:
+        # the transpose is a C-ordered view of the same memory; strides put it back
+        data = arr.T
+    else:
+        arr = data = np.ascontiguousarray(arr)
+    node = {
+        "type": "ndarray",
+        "dtype": np.lib.format.dtype_to_descr(arr.dtype),
+        "shape": list(arr.shape),
+        "strides": list(arr.strides),
+        # a flat byte view, so the data is one frame whatever the dtype
+        "contents": _buffer_node(memoryview(data.reshape(-1).view(np.uint8)), binary),
+    }
+    if scalar:
+        node["scalar"] = True
+    return node
+
+
+def _deserialize_ndarray(json):
+    try:
+        np = import_module("numpy")
+    except ImportError as e:
+        raise TypeError("Received a NumPy array but numpy is not installed") from e
+    # over the received buffer, no copy; read-only, so .copy() it to write in place
+    arr = np.ndarray(
+        shape=tuple(json["shape"]),
+        dtype=np.lib.format.descr_to_dtype(json["dtype"]),
+        buffer=_buffer_contents(json["contents"]),
+        strides=tuple(json["strides"]),
+    )
+    return arr[()] if json.get("scalar") else arr
+
+
+def _deserialize_buffer(json):
+    view = memoryview(_buffer_contents(json["contents"]))
+    try:
+        return view.cast("B").cast(json["format"], json["shape"])
+    except (TypeError, ValueError):
+        # formats memoryview can't cast to (e.g. ctypes' "<d") stay flat bytes
+        return view
+
+
+def _buffer_contents(contents):
+    # base64 from the JSON format, or a buffer (a frame of the binary wire format)
+    if isinstance(contents, str):
+        return base64.b64decode(contents)
+    return contents
+
+
 def deserialize(json, root_module: str, globals):
     if type(json) in [int, str, float, type(None)]:
         return json
     elif json["type"] == "bytes":
-        return base64.b64decode(json["contents"])
+        contents = _buffer_contents(json["contents"])
+        return contents if type(contents) is bytes else bytes(contents)
+    elif json["type"] == "bytearray":
+        return bytearray(_buffer_contents(json["contents"]))
+    elif json["type"] == "memoryview":
+        # a view straight over the received frame, no copy
+        return memoryview(_buffer_contents(json["contents"]))
+    elif json["type"] == "ndarray":
+        return _deserialize_ndarray(json)
+    elif json["type"] == "buffer":
+        return _deserialize_buffer(json)
     elif json["type"] in ["list", "tuple"]:
         return __builtins__[json["type"]](
             deserialize(child, root_module, globals) for child in json["contents"]
@@ -88,12 +193,84 @@ def deserialize(json, root_module: str, globals):
     )
 
 
-def serialize_ok(obj, root_module: str):
-    return {"ok": serialize(obj, root_module)}
+@dataclass(frozen=True)
+class BufferInfo:
+    """describe()'s stand-in for a bytes/bytearray/memoryview/buffer value: its size only."""
+
+    type: str
+    nbytes: int
+
+    def __len__(self) -> int:
+        return self.nbytes
+
+
+@dataclass(frozen=True)
+class ArrayInfo:
+    """describe()'s stand-in for a NumPy array or scalar: dtype and shape, no data."""
+
+    dtype: Any  # the dtype descr, e.g. "<f4"
+    shape: tuple[int, ...]
+    nbytes: int
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    @property
+    def size(self) -> int:
+        return math.prod(self.shape)
+
+    def __len__(self) -> int:
+        if not self.shape:
+            raise TypeError("len() of unsized object")
+        return self.shape[0]
+
+
+def _contents_nbytes(contents) -> int:
+    if isinstance(contents, str):  # base64
+        return len(contents) * 3 // 4 - contents.endswith("=") - contents.endswith("==")
+    return memoryview(contents).nbytes
+
+
+def describe(json, root_module: str, globals):
+    """
+    Like deserialize, but buffers and arrays become BufferInfo/ArrayInfo (sizes and shapes)
+    and objects become SimpleNamespaces of their described attributes, so nothing large is
+    decoded or copied. Containers and scalars come back as themselves; len() of a buffer is
+    its size in bytes and of an array its first dimension, as for the real values.
+    """
+    if type(json) in [int, str, float, type(None)]:
+        return json
+    elif json["type"] in ["bytes", "bytearray", "memoryview", "buffer"]:
+        return BufferInfo(json["type"], _contents_nbytes(json["contents"]))
+    elif json["type"] == "ndarray":
+        return ArrayInfo(
+            json["dtype"], tuple(json["shape"]), _contents_nbytes(json["contents"])
+        )
+    elif json["type"] in ["list", "tuple"]:
+        return __builtins__[json["type"]](
+            describe(child, root_module, globals) for child in json["contents"]
+        )
+    elif json["type"] == "dict":
+        return dict(
+            (describe(k, root_module, globals), describe(v, root_module, globals))
+            for k, v in json["contents"]
+        )
+    elif json["type"] == "obj":
+        return SimpleNamespace(
+            **{k: describe(v, root_module, globals) for k, v in json["contents"].items()}
+        )
+    raise TypeError(
+        f"JSON does not correspond to known Vast deployment datatype: {json}"
+    )
+
+
+def serialize_ok(obj, root_module: str, binary: bool = False):
+    return {"ok": serialize(obj, root_module, binary)}
 
 
-def serialize_err(err, root_module: str):
-    return {"err": serialize(err, root_module)}
+def serialize_err(err, root_module: str, binary: bool = False):
+    return {"err": serialize(err, root_module, binary)}
 
 
 def deserialize_unwrap_error(json, root_module: str, globals):
@@ -1,6 +1,13 @@
 from .base import Config, Deployment_
 from ..server.worker import Worker, WorkerConfig, HandlerConfig, BenchmarkConfig
-from .serialization import serialize, deserialize, serialize_ok, serialize_err
+from ..server.lib.offload import get_offloader, payload_nbytes
+from .serialization import (
+    serialize,
+    deserialize,
+    describe,
+    serialize_ok,
+    serialize_err,
+)
 from typing import (
     ParamSpec,
     Type,
@@ -30,6 +37,26 @@ class RemoteFunc:
     benchmark_generator: Optional[Callable[[], dict[str, Any]]]
     benchmark_runs: int
     workload_calculator: Optional[Callable[..., float]]
+    workload_from_metadata: bool = False
+
+
+class _DecodedArgs(list):
+    """A request's args, already deserialized by the workload calculator."""
+
+
+class _DecodedKwargs(dict):
+    """A request's kwargs, already deserialized by the workload calculator."""
+
+
+def _decode_payload(
+    args: list, kwargs: dict, root_module: str, func_globals: dict
+) -> tuple[list, dict]:
+    if type(args) is _DecodedArgs and type(kwargs) is _DecodedKwargs:
+        return args, kwargs
+    return (
+        [deserialize(a, root_module, func_globals) for a in args],
+        {k: deserialize(v, root_module, func_globals) for k, v in kwargs.items()},
+    )
 
 
 T = TypeVar("T")
@@ -93,17 +120,28 @@ class Deployment(Deployment_, AsyncContextManager):
         """
 
         async def wrapper(*, args: list = [], kwargs: dict = {}) -> dict:
-            deserialized_args = [
-                deserialize(a, root_module, func_globals) for a in args
-            ]
-            deserialized_kwargs = {
-                k: deserialize(v, root_module, func_globals) for k, v in kwargs.items()
-            }
+            # already decoded if the workload calculator saw this request first;
+            # otherwise large payloads are decoded off the event loop
+            offloader = get_offloader()
+            deserialized_args, deserialized_kwargs = await offloader.run(
+                _decode_payload,
+                args,
+                kwargs,
+                root_module,
+                func_globals,
+                nbytes=(
+                    0
+                    if type(args) is _DecodedArgs
+                    else payload_nbytes((args, kwargs), offloader.min_bytes)
+                ),
+                thread_only=True,
+            )
             try:
                 result = await func(*deserialized_args, **deserialized_kwargs)
-                return serialize_ok(result, root_module)
+                # buffers stay raw; the backend picks binary or base64 on the way out
+                return serialize_ok(result, root_module, binary=True)
             except Exception as e:
-                return serialize_err(e, root_module)
+                return serialize_err(e, root_module, binary=True)
 
         return wrapper
 
@@ -112,22 +150,37 @@ class Deployment(Deployment_, AsyncContextManager):
         root_module: str,
         user_calc: Callable[..., float],
         func_globals: dict,
+        from_metadata: bool = False,
     ) -> Callable[[dict], float]:
         """Deserialize the request payload and score it with the user's calculator.
 
         Runs synchronously inside count_workload and returns a plain float,
         unlike the async, result-serializing remote-function wrapper.
+
+        The decoded args/kwargs replace the serialized ones in the payload, so
+        the remote-function wrapper reuses them instead of decoding the request
+        a second time. With from_metadata the calculator is given describe()'s
+        sizes and shapes instead and nothing is decoded here at all.
         """
 
         def calculator(payload: dict) -> float:
-            deserialized_args = [
-                deserialize(a, root_module, func_globals)
-                for a in payload.get("args", [])
-            ]
-            deserialized_kwargs = {
-                k: deserialize(v, root_module, func_globals)
-                for k, v in payload.get("kwargs", {}).items()
-            }
+            args = payload.get("args", [])
+            kwargs = payload.get("kwargs", {})
+            if from_metadata:
+                return float(
+                    user_calc(
+                        *(describe(a, root_module, func_globals) for a in args),
+                        **{
+                            k: describe(v, root_module, func_globals)
+                            for k, v in kwargs.items()
+                        },
+                    )
+                )
+            deserialized_args, deserialized_kwargs = _decode_payload(
+                args, kwargs, root_module, func_globals
+            )
+            payload["args"] = _DecodedArgs(deserialized_args)
+            payload["kwargs"] = _DecodedKwargs(deserialized_kwargs)
             return float(user_calc(*deserialized_args, **deserialized_kwargs))
 
         return calculator
@@ -182,7 +235,10 @@ class Deployment(Deployment_, AsyncContextManager):
                 workload_calculator = None
                 if entry.workload_calculator is not None:
                     workload_calculator = self._wrap_workload_calculator(
-                        self.root_module, entry.workload_calculator, entry.globals
+                        self.root_module,
+                        entry.workload_calculator,
+                        entry.globals,
+                        from_metadata=entry.workload_from_metadata,
                     )
 
                 handlers.append(
@@ -213,6 +269,7 @@ class Deployment(Deployment_, AsyncContextManager):
         benchmark_generator: Callable[[], dict] | None = None,
         benchmark_runs: int = 10,
         workload_calculator: Callable[..., float] | None = None,
+        workload_from_metadata: bool = False,
     ) -> (
         Callable[P, Awaitable[Any]]
         | Callable[[Callable[P, Awaitable[Any]]], Callable[P, Awaitable[Any]]]
@@ -228,6 +285,7 @@ class Deployment(Deployment_, AsyncContextManager):
                 benchmark_generator=benchmark_generator,
                 benchmark_runs=benchmark_runs,
                 workload_calculator=workload_calculator,
+                workload_from_metadata=workload_from_metadata,
             )
             return f
 
@@ -2,18 +2,28 @@
 """
 Deployment bootstrap script invoked by start_server.sh when IS_DEPLOYMENT=true.
 
-Downloads and extracts the deployment tarball, applies config.json
+Streams the deployment tarball from its download URL straight into the
+extractor (no temporary file), applies config.json
 (env vars, apt packages, pip packages, run scripts), then starts the
 deployment worker.
+
+config.json is the first member of the tarball, so env vars and apt packages
+are applied as soon as it arrives, while the rest is still downloading. Time
+spent in each phase is printed before the worker starts.
 """
 
+import concurrent.futures
+import contextlib
 import json
 import os
 import subprocess
 import sys
 import tarfile
-import tempfile
+import time
 import urllib.request
+from typing import BinaryIO, Callable, Optional, Union
+
+from vastai.serverless.archive import open_decompressed
 
 
 VAST_API_URL = os.environ.get("VAST_API_URL", "https://console.vast.ai")
@@ -44,29 +54,35 @@ def get_download_url(deployment_id: str, api_key: str) -> str:
     return data["download_url"]
 
 
-def download_tarball(download_url: str) -> str:
-    """Download the deployment tarball to a temp file, returning its path."""
-    fd, path = tempfile.mkstemp(suffix=".tar.gz")
-    try:
-        with urllib.request.urlopen(download_url) as resp, os.fdopen(fd, "wb") as f:
-            while True:
-                chunk = resp.read(1 << 20)  # 1 MB
-                if not chunk:
-                    break
-                f.write(chunk)
-    except Exception:
-        os.unlink(path)
-        raise
-    return path
-
-
-def extract_tarball(tarball_path: str):
-    cwd = os.getcwd()
-    with tarfile.open(tarball_path, "r:gz") as tf:
-        for member in tf.getmembers():
+def extract_tarball(
+    source: Union[str, BinaryIO],
+    on_extracted: Optional[Callable[[tarfile.TarInfo], None]] = None,
+):
+    """Extract a deployment tarball from a path or a readable stream.
+
+    The stream is read front to back once, so it can be an HTTP response: files are
+    written out as they arrive. The compression codec is detected from the stream.
+    on_extracted, if given, is called with each member once it is on disk.
+    """
+    if isinstance(source, str):
+        with open(source, "rb") as f:
+            return extract_tarball(f, on_extracted)
+    with tarfile.open(fileobj=open_decompressed(source), mode="r|") as tf:
+        for member in tf:
             tf.extract(
                 member, filter="fully_trusted"
             )  # preserve absolute paths; deployment .tar files are created by client via deployments SDK and are trusted inside the container.
+            if on_extracted is not None:
+                on_extracted(member)
+
+
+def download_and_extract_tarball(
+    download_url: str,
+    on_extracted: Optional[Callable[[tarfile.TarInfo], None]] = None,
+):
+    """Extract the deployment tarball while downloading it."""
+    with urllib.request.urlopen(download_url) as resp:
+        extract_tarball(resp, on_extracted)
 
 
 def get_config(path: str):
@@ -134,54 +150,125 @@ def run_scripts(runs: list):
             raise ValueError(f"Invalid run entry: {entry!r}")
 
 
-def main():
-    deployment_id = os.environ.get("DEPLOYMENT_ID")
-    if not deployment_id:
-        raise RuntimeError("DEPLOYMENT_ID environment variable not set")
+class PhaseTimings:
+    """Wall-clock seconds spent in each cold-start phase. Phases may overlap."""
 
-    debug_deployment_tar = os.environ.get("DEBUG_DEPLOYMENT_TAR")
-    if debug_deployment_tar:
-        tarball_path = debug_deployment_tar
-    else:
-        api_key = get_api_key()
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.phases: dict[str, float] = {}
 
-        # Download deployment tarball
-        print(f"Fetching download URL for deployment {deployment_id}")
-        download_url = get_download_url(deployment_id, api_key)
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = time.perf_counter() - start
 
-        print("Downloading deployment tarball")
-        tarball_path = download_tarball(download_url)
+    def report(self) -> str:
+        total = time.perf_counter() - self.start
+        parts = [f"{name} {seconds:.2f}s" for name, seconds in self.phases.items()]
+        return f"Cold start took {total:.2f}s: " + ", ".join(parts)
 
-    # Extract preserving absolute paths — the deployment runs in a
-    # container owned by the client, and we trust their path choices.
-    print("Extracting deployment tarball")
-    try:
-        extract_tarball(tarball_path)
-    finally:
-        os.unlink(tarball_path)
 
-    # Load config
-    config = get_config("config.json")
-    print(f"Loaded config for deployment: {config.name}")
+def _is_config(member: tarfile.TarInfo) -> bool:
+    return os.path.normpath(member.name) == "config.json"
+
+
+def prepare_deployment(
+    extract: Callable[[Callable[[tarfile.TarInfo], None]], None],
+    timings: PhaseTimings,
+):
+    """Extract the deployment and apply its config.json, returning the Config.
+
+    ``extract(on_extracted)`` extracts the tarball. Once config.json is on disk,
+    env vars are exported and apt packages install on a background thread while
+    extraction continues. pip packages and scripts may use extracted files, so
+    they run after extraction has finished.
+    """
+    state = {}
+    background = concurrent.futures.ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="apt"
+    )
+
+    def start_system_setup():
+        config = get_config("config.json")
+        print(f"Loaded config for deployment: {config.name}")
+        state["config"] = config
+
+        # (1) Export envs
+        if config.envs:
+            print(f"Exporting {len(config.envs)} environment variables")
+            export_envs(config.envs)
 
-    # (1) Export envs
-    if config.envs:
-        print(f"Exporting {len(config.envs)} environment variables")
-        export_envs(config.envs)
+        # (2) Install apt packages, overlapping the rest of the download
+        def apt():
+            if config.apt_gets:
+                print(f"Installing {len(config.apt_gets)} apt packages")
+                with timings.phase("apt"):
+                    run_apt_gets(config.apt_gets)
 
-    # (2) Install packages
-    if config.apt_gets:
-        print(f"Installing {len(config.apt_gets)} apt packages")
-        run_apt_gets(config.apt_gets)
+        state["apt"] = background.submit(apt)
+
+    def on_extracted(member: tarfile.TarInfo):
+        if "config" not in state and _is_config(member):
+            start_system_setup()
+
+    try:
+        # Extract preserving absolute paths — the deployment runs in a
+        # container owned by the client, and we trust their path choices.
+        with timings.phase("download+extract"):
+            extract(on_extracted)
+        if "config" not in state:  # config.json wasn't the first member
+            start_system_setup()
+        with timings.phase("apt wait"):
+            state["apt"].result()
+    finally:
+        background.shutdown(wait=True)
+    config = state["config"]
 
     if config.pip_installs:
         print(f"Installing {len(config.pip_installs)} pip packages")
-        run_pip_installs(config.pip_installs)
+        with timings.phase("pip"):
+            run_pip_installs(config.pip_installs)
 
     # (3) Run scripts
     if config.runs:
         print(f"Running {len(config.runs)} setup scripts")
-        run_scripts(config.runs)
+        with timings.phase("scripts"):
+            run_scripts(config.runs)
+    return config
+
+
+def main():
+    deployment_id = os.environ.get("DEPLOYMENT_ID")
+    if not deployment_id:
+        raise RuntimeError("DEPLOYMENT_ID environment variable not set")
+
+    timings = PhaseTimings()
+    debug_deployment_tar = os.environ.get("DEBUG_DEPLOYMENT_TAR")
+    if debug_deployment_tar:
+        print("Extracting deployment tarball")
+        try:
+            config = prepare_deployment(
+                lambda on_extracted: extract_tarball(debug_deployment_tar, on_extracted),
+                timings,
+            )
+        finally:
+            os.unlink(debug_deployment_tar)
+    else:
+        api_key = get_api_key()
+
+        # Download deployment tarball
+        print(f"Fetching download URL for deployment {deployment_id}")
+        with timings.phase("download url"):
+            download_url = get_download_url(deployment_id, api_key)
+
+        print("Downloading and extracting deployment tarball")
+        config = prepare_deployment(
+            lambda on_extracted: download_and_extract_tarball(download_url, on_extracted),
+            timings,
+        )
 
     # Look up and start deployment
     from vastai.serverless.remote.serve import Deployment
@@ -190,12 +277,14 @@ def main():
     os.environ["IS_DEPLOYMENT"] = "1"
     # deployment module/package is guaranteed from tarball
     sys.path.insert(0, os.getcwd())
-    import deployment  # running this import has the side effect of registering deployments and remote functions with vastai.serverless.remote.serve.Deployment
+    with timings.phase("import"):
+        import deployment  # running this import has the side effect of registering deployments and remote functions with vastai.serverless.remote.serve.Deployment
 
     our_deployment = Deployment.lookup(config.name)
     if our_deployment is None:
         raise RuntimeError(f"Failed to lookup registered deployment: {config.name}")
 
+    print(timings.report())
     print(f"Starting deployment worker: {config.name}")
     worker = our_deployment.into_worker()
     worker.run()
@@ -8,7 +8,10 @@ import os
 import re
 import tarfile
 import tempfile
-from typing import TYPE_CHECKING, Tuple, BinaryIO
+import time
+from typing import TYPE_CHECKING, Iterator, Optional, Tuple, BinaryIO
+
+from vastai.serverless.archive import get_codec
 
 if TYPE_CHECKING:
     from vastai.serverless.remote.base import Config
@@ -199,6 +202,16 @@ def read_file_for_hash(path: str, filter_comments: bool = False) -> bytes:
     return data
 
 
+def hash_update_symlink(hasher: hashlib._Hash, linkname: str, arcname: str) -> None:
+    """Feed a symlink into the hasher: its archive name, a type marker, and its target.
+
+    The tarball stores the link itself, not the file it points to, so that's what
+    is hashed.
+    """
+    hasher.update(arcname.encode("utf-8"))
+    hasher.update(b"\0symlink\0" + os.fsencode(linkname))
+
+
 def hash_update_file(
     hasher: hashlib._Hash,
     src_path: str,
@@ -206,6 +219,9 @@ def hash_update_file(
     filter_comments: bool = False,
 ) -> None:
     """Feed a single file into the hasher: its archive name followed by its content."""
+    if os.path.islink(src_path):
+        hash_update_symlink(hasher, os.readlink(src_path), arcname)
+        return
     hasher.update(arcname.encode("utf-8"))
     hasher.update(read_file_for_hash(src_path, filter_comments=filter_comments))
 
@@ -278,13 +294,120 @@ def compute_deployment_hash(
     return hasher.hexdigest()
 
 
+def _deployment_entries(
+    deployment_path: str,
+    extra_files: list[tuple[str, str]] | None = None,
+) -> Iterator[tuple[str, str, bool, bool]]:
+    """Yield (src_path, arcname, is_dir, filter_comments) for everything in a deployment.
+
+    Files come in the order compute_deployment_hash feeds them to the hasher
+    (directories walked in sorted order), with each directory before its contents.
+    """
+    sources = [(deployment_path, deployment_arcname(deployment_path), True)]
+    sources += [(src, dest, False) for src, dest in extra_files or []]
+    for src_path, arcname, filter_comments in sources:
+        if os.path.isdir(src_path):
+            src_path = os.path.normpath(src_path)
+            for root, dirs, files in os.walk(src_path):
+                dirs.sort()
+                rel = os.path.relpath(root, src_path)
+                arc_root = arcname if rel == "." else os.path.join(arcname, rel)
+                yield root, arc_root, True, filter_comments
+                for fname in sorted(files):
+                    yield (
+                        os.path.join(root, fname),
+                        os.path.join(arc_root, fname),
+                        False,
+                        filter_comments,
+                    )
+        elif os.path.isfile(src_path):
+            yield src_path, arcname, False, filter_comments
+        else:
+            raise FileNotFoundError(f"Source path does not exist: {src_path}")
+
+
+class _HashingReader:
+    """File wrapper that feeds everything tarfile reads from it into a hasher."""
+
+    def __init__(self, f: BinaryIO, hasher: hashlib._Hash):
+        self._f = f
+        self._hasher = hasher
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._f.read(size)
+        self._hasher.update(data)
+        return data
+
+
+def _open_tarball(tar_path: str, codec) -> tuple[tarfile.TarFile, list]:
+    """Open a tarball for writing; returns it and the file objects to close after it.
+
+    Compressed output goes through ``codec`` (see vastai.serverless.archive), whose
+    headers carry no mtime or file name, so the same inputs always give byte-for-byte
+    the same archive (and size).
+    """
+    raw = open(tar_path, "wb")
+    if codec is None:
+        return tarfile.open(fileobj=raw, mode="w"), [raw]
+    writer = codec.writer(raw)
+    # stream mode: codec writers don't support tell()
+    return tarfile.open(fileobj=writer, mode="w|"), [writer, raw]
+
+
+def build_deployment_tarball(
+    tar_path: str,
+    config: Config,
+    deployment_path: str,
+    extra_files: list[tuple[str, str]] | None = None,
+    compress: bool = True,
+    codec: str | None = None,
+) -> str:
+    """Create the deployment tarball and return compute_deployment_hash() of it, reading
+    every file once: file contents are hashed as they stream into the archive.
+
+    ``codec`` names the compression (see get_codec); it does not affect the hash.
+    """
+    hasher = hashlib.sha256()
+    config_json = serialize_config(config)
+    hasher.update(config_json.encode("utf-8"))
+    tf, files = _open_tarball(tar_path, get_codec(codec) if compress else None)
+    try:
+        add_string(tf, config_json, "./config.json")
+        for src_path, arcname, is_dir, filter_comments in _deployment_entries(
+            deployment_path, extra_files
+        ):
+            info = _sanitize_info(tf.gettarinfo(src_path, arcname=arcname), arcname)
+            if is_dir:
+                tf.addfile(info)
+                continue
+            if info.issym():
+                hash_update_symlink(hasher, info.linkname, arcname)
+                tf.addfile(info)
+                continue
+            hasher.update(arcname.encode("utf-8"))
+            with open(src_path, "rb") as f:
+                if filter_comments and src_path.endswith(".py"):
+                    data = f.read()
+                    hasher.update(filter_ignored_lines(data))
+                    tf.addfile(info, io.BytesIO(data))
+                else:
+                    tf.addfile(info, _HashingReader(f, hasher))
+    finally:
+        tf.close()
+        for f in files:
+            f.close()
+    return hasher.hexdigest()
+
+
 def create_deployment_tarball(
     tar_path: str,
     config: Config,
     deployment_path: str,
-    extra_files: list[tuple[str, str]] | None = None
+    extra_files: list[tuple[str, str]] | None = None,
+    compress: bool = True,
+    codec: str | None = None,
 ):
-    """Create a deployment tarball in /tmp and return its path.
+    """Create a deployment tarball at tar_path.
 
     The tarball contains:
       - ./config.json        — JSON-serialized Config
@@ -295,12 +418,139 @@ def create_deployment_tarball(
         config: The deployment Config object.
         deployment_path: Path to the deployment source (a .py file or a package directory).
         extra_files: List of (source_path, dest_path) pairs. dest_path may be absolute.
+        compress: compress the tarball (the default), or write a plain tar.
+        codec: compression codec name, "gzip" or "zstd"; defaults to
+            $VAST_DEPLOYMENT_CODEC, then gzip.
     """
-    tf = tarfile.TarFile.open(tar_path, mode="w:gz")
+    build_deployment_tarball(
+        tar_path, config, deployment_path, extra_files, compress, codec
+    )
+
+
+# ---------------------------------------------------------------------------
+# Local cache of deployment hashes
+# ---------------------------------------------------------------------------
+
+_NO_CACHE_ENV = "VAST_NO_CACHE"
+# files modified this recently may still change within the same mtime tick, so a
+# manifest containing one is not cached (git's "racy clean" problem)
+_RACY_SECONDS = 2.0
+
+
+def default_deployment_cache_dir() -> str:
+    """``$XDG_CACHE_HOME/vastai/deployments`` (``~/.cache/vastai/deployments`` without xdg)."""
     try:
-        add_string(tf, serialize_config(config), "./config.json")
-        add_path(tf, deployment_path, deployment_arcname(deployment_path))
-        for src, dest in extra_files or []:
-            add_path(tf, src, dest)
-    finally:
-        tf.close()
+        import xdg
+
+        base = str(xdg.xdg_cache_home())
+    except Exception:
+        base = os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "vastai", "deployments")
+
+
+def deployment_manifest(
+    config: Config,
+    deployment_path: str,
+    extra_files: list[tuple[str, str]] | None = None,
+    codec: str | None = None,
+) -> list:
+    """Everything the deployment hash and tarball depend on, without reading any file:
+    the config and codec, plus arcname, mode, size, mtime, ctime and inode of every file
+    and directory, and the target of every symlink.
+    """
+    manifest: list = [{"config": serialize_config(config), "codec": get_codec(codec).name}]
+    for src_path, arcname, _, filter_comments in _deployment_entries(
+        deployment_path, extra_files
+    ):
+        st = os.lstat(src_path)
+        manifest.append(
+            [
+                arcname,
+                filter_comments,
+                st.st_mode,
+                st.st_size,
+                st.st_mtime_ns,
+                st.st_ctime_ns,
+                st.st_ino,
+                os.readlink(src_path) if os.path.islink(src_path) else None,
+            ]
+        )
+    return manifest
+
+
+class DeploymentHashCache:
+    """On-disk map from a deployment manifest to its hash and tarball size.
+
+    If no file in the deployment has been touched since the last build (same size,
+    mtime, ctime and inode), the hash and size are known without reading anything.
+    Entries are named by the sha256 of their manifest, and the least recently used
+    are evicted beyond ``max_entries``.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_entries: int = 64):
+        self.cache_dir = cache_dir if cache_dir is not None else default_deployment_cache_dir()
+        self.max_entries = max_entries
+
+    @staticmethod
+    def key_for(manifest: list) -> str:
+        return hashlib.sha256(
+            json.dumps(manifest, separators=(",", ":")).encode("utf-8")
+        ).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + ".json")
+
+    def lookup(self, manifest: list) -> Optional[Tuple[str, int]]:
+        """Return (hash, size) recorded for this manifest, or None."""
+        path = self._path(self.key_for(manifest))
+        try:
+            with open(path, "r") as f:
+                entry = json.load(f)
+            os.utime(path)  # mtime doubles as the LRU clock
+            return entry["hash"], int(entry["size"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def store(self, manifest: list, hash: str, size: int) -> bool:
+        """Record (hash, size) for this manifest. Returns False if it was not cached."""
+        newest = max((entry[4] for entry in manifest[1:]), default=0)
+        if newest >= (time.time() - _RACY_SECONDS) * 1e9:
+            return False
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = self._path(self.key_for(manifest))
+            fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump({"hash": hash, "size": size}, f)
+                os.replace(tmp, path)
+            except OSError:
+                os.unlink(tmp)
+                raise
+            self._evict()
+        except OSError:
+            return False
+        return True
+
+    def _evict(self) -> None:
+        files = [
+            os.path.join(self.cache_dir, name)
+            for name in os.listdir(self.cache_dir)
+            if name.endswith(".json")
+        ]
+        excess = len(files) - self.max_entries
+        if excess <= 0:
+            return
+        files.sort(key=lambda p: os.path.getmtime(p))
+        for path in files[:excess]:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+
+def get_deployment_hash_cache() -> Optional[DeploymentHashCache]:
+    """The on-disk deployment hash cache, or None when ``VAST_NO_CACHE`` is set."""
+    if os.environ.get(_NO_CACHE_ENV, "").lower() in ("1", "true", "yes"):
+        return None
+    return DeploymentHashCache()
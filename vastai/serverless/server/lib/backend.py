@@ -5,6 +5,8 @@ import time
 import base64
 import dataclasses
 import logging
+from collections import OrderedDict
+from types import SimpleNamespace
 from asyncio import sleep, gather, Semaphore, create_task
 from typing import (
     Tuple,
@@ -20,7 +22,6 @@ from typing import (
 )
 from functools import cached_property
 from distutils.util import strtobool
-from collections import deque
 from asyncio import sleep, CancelledError
 
 from anyio import open_file
@@ -29,8 +30,12 @@ from aiohttp import (
     ClientResponse,
     ClientSession,
     ClientConnectorError,
+    ClientOSError,
     ClientTimeout,
+    ServerDisconnectedError,
     TCPConnector,
+    TraceConfig,
+    UnixConnector,
 )
 import asyncio
 import string
@@ -40,7 +45,13 @@ from Crypto.Signature import pkcs1_15
 from Crypto.Hash import SHA256
 from Crypto.PublicKey import RSA
 
+from vastai.serverless import wire
 from .metrics import Metrics
+from .scheduler import RequestScheduler, PRIORITY_DEFAULT, PRIORITY_SESSION
+from .offload import Offloader, LoopLag, get_offloader, payload_nbytes
+from .logtail import LogTailer, LOG_POLL_INTERVAL
+from .logmatch import LogMatcher, LogPattern
+from .benchmark import BenchmarkRunner, BenchmarkSummary, BenchmarkFailed
 from .data_types import (
     AuthData,
     EndpointHandler,
@@ -48,7 +59,6 @@ from .data_types import (
     ApiPayload_T,
     JsonDataException,
     RequestMetrics,
-    BenchmarkResult,
     Session,
 )
 
@@ -56,12 +66,67 @@ VERSION = "1.1.0"
 
 log = logging.getLogger(__file__)
 
-# defines the minimum wait time between sending updates to autoscaler
-LOG_POLL_INTERVAL = 0.1
 # Defines waiting interval for session garbage collection
 SESSION_GC_INTERVAL = 5.0
 BENCHMARK_INDICATOR_FILE = ".has_benchmark"
 MAX_PUBKEY_FETCH_ATTEMPTS = 5
+# verified (url, signature) pairs remembered, and for how long (seconds)
+SIGNATURE_CACHE_SIZE = 4096
+SIGNATURE_CACHE_TTL = 300.0
+# connections kept open to the model server, and how long an idle one is kept (seconds);
+# below the 5s idle timeout of uvicorn/gunicorn so we drop them before the server does
+MODEL_POOL_SIZE = 100
+MODEL_KEEPALIVE_TIMEOUT = 4.0
+# model servers listening on a unix domain socket: unix:///path/to/model.sock
+UNIX_SOCKET_SCHEME = "unix://"
+
+
+class SignatureCache:
+    """
+    Bounded LRU of (url, signature) pairs that passed RSA verification, each trusted for
+    ``ttl`` seconds. The signed message is only the url, so a hit means exactly the bytes
+    that already verified under the current key; nothing new is accepted that the full
+    check would reject. Failures are never cached. Only touched from the event loop.
+    """
+
+    def __init__(
+        self, maxsize: int = SIGNATURE_CACHE_SIZE, ttl: float = SIGNATURE_CACHE_TTL
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Tuple[str, str], float] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def check(self, url: str, signature: str) -> bool:
+        key = (url, signature)
+        expires = self._entries.get(key)
+        if expires is not None and expires > time.monotonic():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True
+        if expires is not None:
+            del self._entries[key]
+        self.misses += 1
+        return False
+
+    def add(self, url: str, signature: str) -> None:
+        if self.maxsize <= 0:
+            return
+        key = (url, signature)
+        self._entries[key] = time.monotonic() + self.ttl
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+async def _mark_connection_reused(session, trace_config_ctx, params) -> None:
+    request = trace_config_ctx.trace_request_ctx
+    if request is not None:
+        request.reused = True
 
 
 @dataclasses.dataclass
@@ -79,14 +144,15 @@ class Backend:
     benchmark_handler: (
         EndpointHandler  # this endpoint handler will be used for benchmarking
     )
-    log_actions: List[Tuple[LogAction, str]]
+    log_actions: List[Tuple[LogAction, LogPattern]]
     reqnum = -1
     version = VERSION
     sem: Semaphore = dataclasses.field(default_factory=Semaphore)
-    queue: deque = dataclasses.field(default_factory=deque, repr=False)
-    _queue_lock: asyncio.Lock = dataclasses.field(
-        default_factory=asyncio.Lock, repr=False
+    scheduler: RequestScheduler = dataclasses.field(
+        default_factory=RequestScheduler, repr=False
     )
+    # run queued session requests ahead of one-off requests
+    prioritize_sessions: bool = False
     unsecured: bool = dataclasses.field(
         default_factory=lambda: bool(strtobool(os.environ.get("UNSECURED", "false"))),
     )
@@ -106,6 +172,40 @@ class Backend:
     session_metrics: Dict[str, RequestMetrics] = dataclasses.field(default_factory=dict)
     max_sessions: int = dataclasses.field(default=-1)
     lifecycle: Optional[AsyncContextManager] = dataclasses.field(default=None)
+    signature_cache_size: int = SIGNATURE_CACHE_SIZE
+    signature_cache_ttl: float = SIGNATURE_CACHE_TTL
+    # decode/verify/encode of large requests runs here instead of on the event loop
+    offloader: Offloader = dataclasses.field(default_factory=get_offloader, repr=False)
+    # opt-in: the monitor wakes the loop every LOOP_LAG_INTERVAL, even on an idle worker
+    loop_lag: Optional[LoopLag] = dataclasses.field(
+        default_factory=lambda: (
+            LoopLag()
+            if strtobool(os.environ.get("LOOP_LAG_MONITOR", "false"))
+            else None
+        ),
+        repr=False,
+    )
+    # reuse connections to the model server; handlers with keepalive=False always get a
+    # new one
+    model_keepalive: bool = dataclasses.field(
+        default_factory=lambda: bool(
+            strtobool(os.environ.get("MODEL_KEEPALIVE", "true"))
+        )
+    )
+    model_pool_size: int = dataclasses.field(
+        default_factory=lambda: int(os.environ.get("MODEL_POOL_SIZE", MODEL_POOL_SIZE))
+    )
+    model_keepalive_timeout: float = dataclasses.field(
+        default_factory=lambda: float(
+            os.environ.get("MODEL_KEEPALIVE_TIMEOUT", MODEL_KEEPALIVE_TIMEOUT)
+        )
+    )
+    # follow the model log with inotify (Linux); polls every LOG_POLL_INTERVAL otherwise
+    log_inotify: bool = dataclasses.field(
+        default_factory=lambda: bool(
+            strtobool(os.environ.get("MODEL_LOG_INOTIFY", "true"))
+        )
+    )
 
     async def pyworker_update_handler(self, request: web.Request) -> web.Response:
         # Verify authorization header matches mtoken
@@ -357,26 +457,76 @@ class Backend:
         self.metrics = Metrics()
         self.metrics._set_version(self.version)
         self.metrics._set_mtoken(self.mtoken)
-        self._pubkey: Optional[RSA.RsaKey] = None
+        self.metrics.loop_lag = self.loop_lag
+        self._pubkey = None
         self.__pubkey_fetch_complete: asyncio.Event = asyncio.Event()
         self.__pubkey_failed: bool = False
         self.__start_healthcheck: asyncio.Event = asyncio.Event()
         self.__healthcheck_ready: asyncio.Event = asyncio.Event()
         self.__healthcheck_succeeded: bool = False
+        # latest values of the named groups captured by regex log actions
+        self.log_fields: Dict[str, str] = {}
 
     @cached_property
-    def session(self):
-        log.debug(f"Starting TCP session with model server at {self.model_server_url}")
-        connector = TCPConnector(
-            force_close=True,  # Required for long running jobs
-            enable_cleanup_closed=True,
+    def log_matcher(self) -> LogMatcher:
+        return LogMatcher(self.log_actions)
+
+    @property
+    def _pubkey(self) -> Optional[RSA.RsaKey]:
+        return self.__pubkey
+
+    @_pubkey.setter
+    def _pubkey(self, key: Optional[RSA.RsaKey]) -> None:
+        # build the verifier once per key, and forget what the old key verified
+        self.__pubkey = key
+        self.__verifier = pkcs1_15.new(key) if key is not None else None
+        self._signature_cache = SignatureCache(
+            self.signature_cache_size, self.signature_cache_ttl
         )
 
+    @property
+    def model_socket_path(self) -> Optional[str]:
+        """Path of the model server's unix domain socket, for ``unix://`` model urls."""
+        if self.model_server_url.startswith(UNIX_SOCKET_SCHEME):
+            return self.model_server_url[len(UNIX_SOCKET_SCHEME) :]
+        return None
+
+    def _model_session(self, keepalive: bool) -> ClientSession:
+        if keepalive:
+            pool = dict(
+                limit=self.model_pool_size,
+                keepalive_timeout=self.model_keepalive_timeout,
+            )
+        else:
+            pool = dict(force_close=True)  # Required for long running jobs
+        socket_path = self.model_socket_path
+        if socket_path is not None:
+            connector = UnixConnector(path=socket_path, **pool)
+            # the host is never resolved, but requests need an http url
+            base_url = "http://localhost"
+        else:
+            connector = TCPConnector(enable_cleanup_closed=True, **pool)
+            base_url = self.model_server_url
+        trace_config = TraceConfig()
+        trace_config.on_connection_reuseconn.append(_mark_connection_reused)
         timeout = ClientTimeout(total=None)
         return ClientSession(
-            self.model_server_url, timeout=timeout, connector=connector
+            base_url,
+            timeout=timeout,
+            connector=connector,
+            trace_configs=[trace_config],
         )
 
+    @cached_property
+    def session(self):
+        log.debug(f"Starting session with model server at {self.model_server_url}")
+        return self._model_session(self.model_keepalive)
+
+    @cached_property
+    def oneshot_session(self):
+        """Session opening a new connection for every request to the model server."""
+        return self._model_session(keepalive=False)
+
     def create_handler(
         self,
         handler: EndpointHandler[ApiPayload_T],
@@ -433,14 +583,33 @@ class Backend:
         request: web.Request,
     ) -> Union[web.Response, web.StreamResponse]:
         """use this function to forward requests to the model endpoint"""
+        body = await request.read()
         try:
-            data = await request.json()
+            if request.content_type == wire.CONTENT_TYPE:
+                try:
+                    # frames are views over body, so this can't leave the process
+                    data = await self.offloader.run(
+                        wire.decode, body, nbytes=len(body), thread_only=True
+                    )
+                except ValueError as e:
+                    return web.json_response(
+                        dict(error=f"invalid wire message: {e}"), status=422
+                    )
+            else:
+                data = await self.offloader.run(json.loads, body, nbytes=len(body))
             auth_data, payload, session_id = handler.get_data_from_request(data)
         except JsonDataException as e:
             return web.json_response(data=e.message, status=422)
-        except json.JSONDecodeError:
+        except (json.JSONDecodeError, UnicodeDecodeError):
             return web.json_response(dict(error="invalid JSON"), status=422)
-        workload = payload.count_workload()
+        # The workload calculator is user code, so it runs on the loop like the rest
+        # of the handler unless the handler declared it safe to run in a thread.
+        if handler.offload_workload_calculator:
+            workload = await self.offloader.run(
+                payload.count_workload, nbytes=len(body), thread_only=True
+            )
+        else:
+            workload = payload.count_workload()
         request_metrics: RequestMetrics = RequestMetrics(
             request_idx=auth_data.request_idx,
             reqnum=auth_data.reqnum,
@@ -449,8 +618,6 @@ class Backend:
             entered_queue_at=time.time(),
         )
 
-        event = asyncio.Event()
-
         session = None
         if session_id is not None:
             async with self._sessions_lock:
@@ -463,21 +630,6 @@ class Backend:
                 request_metrics.session = session
                 request_metrics.session_reqnum = session.session_reqnum
 
-        async def advance_queue_after_completion(event: asyncio.Event):
-            """Pop current head and wake next waiter, if any."""
-            async with self._queue_lock:
-                # If this event is current head, wake next waiter
-                if self.queue and self.queue[0] is event:
-                    self.queue.popleft()
-                    if self.queue:
-                        self.queue[0].set()
-                else:
-                    # Else, remove it from the queue
-                    try:
-                        self.queue.remove(event)
-                    except ValueError:
-                        pass
-
         async def make_request() -> Union[web.Response, web.StreamResponse]:
             request_metrics.work_started_at = time.time()
             try:
@@ -489,7 +641,28 @@ class Backend:
                     result = await handler.call_remote_dispatch_function(
                         params=remote_func_params
                     )
-                    res = web.json_response({"result": result})
+                    # The result may hold raw buffers: answer in the binary wire
+                    # format if the client reads it, else as JSON with base64.
+                    nbytes = payload_nbytes(result, self.offloader.min_bytes)
+                    if wire.CONTENT_TYPE in request.headers.get("Accept", ""):
+                        res = web.Response(
+                            body=await self.offloader.run(
+                                wire.encode,
+                                {"result": result},
+                                nbytes=nbytes,
+                                thread_only=True,
+                            ),
+                            content_type=wire.CONTENT_TYPE,
+                        )
+                    else:
+                        res = web.json_response(
+                            text=await self.offloader.run(
+                                wire.dumps_json,
+                                {"result": result},
+                                nbytes=nbytes,
+                                thread_only=True,
+                            )
+                        )
                 else:
                     response = await self.__call_backend(
                         handler=handler, payload=payload
@@ -505,18 +678,19 @@ class Backend:
 
         ###########
 
-        if self.__check_signature(auth_data) is False:
+        if await self.__check_signature(auth_data) is False:
             self.metrics._request_reject(request_metrics)
             return web.Response(status=401)
 
-        # Check queue time with lock to prevent race conditions on concurrent requests
+        # No await between this check and _request_start, so concurrent
+        # requests cannot both slip under the limit.
         if handler.max_queue_time is not None:
-            async with self._queue_lock:
-                if self.metrics.model_metrics.wait_time > handler.max_queue_time:
-                    self.metrics._request_reject(request_metrics)
-                    return web.Response(status=429)
+            if self.metrics.model_metrics.wait_time > handler.max_queue_time:
+                self.metrics._request_reject(request_metrics)
+                return web.Response(status=429)
 
         work_task = None
+        scheduled = False
 
         self.metrics._request_start(request_metrics)
 
@@ -531,17 +705,18 @@ class Backend:
                 # Handler cancellation will raise CancelledError on client disconnect
                 return await work_task
 
-            # FIFO-queue branch
+            # Scheduled branch
             else:
-                # Insert a Event into the queue for this request (with lock)
-                # Event.set() == our request is up next
-                async with self._queue_lock:
-                    self.queue.append(event)
-                    if self.queue and self.queue[0] is event:
-                        event.set()
-
+                priority = (
+                    PRIORITY_SESSION
+                    if self.prioritize_sessions and session is not None
+                    else PRIORITY_DEFAULT
+                )
                 # Wait for our turn - CancelledError raised if client disconnects
-                await event.wait()
+                await self.scheduler.acquire(
+                    priority=priority, limit=handler.max_concurrent_requests
+                )
+                scheduled = True
 
                 # We are the next-up request in the queue
                 if request_metrics.session is None:
@@ -582,8 +757,8 @@ class Backend:
                             except ValueError:
                                 pass
 
-                if not handler.allow_parallel_requests:
-                    await advance_queue_after_completion(event)
+                if scheduled:
+                    self.scheduler.release()
 
                 self.metrics._request_end(request_metrics)
 
@@ -643,24 +818,24 @@ class Backend:
             await sleep(10)
 
     async def _start_tracking(self) -> None:
-        if self.lifecycle is not None:
-            await gather(
-                self._fetch_pubkey(),
-                self.__lifecycle_startup(),
-                self.metrics._send_metrics_loop(),
-                self.__healthcheck(),
-                self.metrics._send_delete_requests_loop(),
-                self.__session_gc_loop(),
-            )
-        else:
-            await gather(
-                self._fetch_pubkey(),
-                self.__read_logs(),
-                self.metrics._send_metrics_loop(),
-                self.__healthcheck(),
-                self.metrics._send_delete_requests_loop(),
-                self.__session_gc_loop(),
-            )
+        tasks = [
+            self._fetch_pubkey(),
+            (
+                self.__lifecycle_startup()
+                if self.lifecycle is not None
+                else self.__read_logs()
+            ),
+            self.metrics._send_metrics_loop(),
+            self.__healthcheck(),
+            self.metrics._send_delete_requests_loop(),
+            self.__session_gc_loop(),
+        ]
+        if self.loop_lag is not None:
+            tasks.append(self.loop_lag.monitor())
+        try:
+            await gather(*tasks)
+        finally:
+            self.offloader.shutdown()
 
     async def __lifecycle_startup(self) -> None:
         """
@@ -674,7 +849,7 @@ class Backend:
         try:
             await self.lifecycle.__aenter__()
             try:
-                max_throughput = await self.__run_benchmark()
+                benchmark = await self.__run_benchmark()
                 self.__start_healthcheck.set()
 
                 if self.healthcheck_url:
@@ -690,7 +865,10 @@ class Backend:
                 else:
                     log.debug("Lifecycle ready, no healthcheck configured")
 
-                self.metrics._model_loaded(max_throughput=max_throughput)
+                self.metrics._model_loaded(
+                    max_throughput=benchmark.max_throughput,
+                    saturation_concurrency=benchmark.saturation_concurrency,
+                )
                 log.debug("Model marked as loaded via lifecycle")
 
                 # Keep alive — this coroutine lives for the duration of the server
@@ -722,7 +900,23 @@ class Backend:
     ) -> ClientResponse:
         api_payload = payload.generate_payload_json()
         log.debug(f"posting to endpoint: '{handler.endpoint}', payload: {api_payload}")
-        return await self.session.post(url=handler.endpoint, json=api_payload)
+        session = self.session if handler.keepalive else self.oneshot_session
+        request = SimpleNamespace(reused=False)
+        try:
+            return await session.post(
+                url=handler.endpoint, json=api_payload, trace_request_ctx=request
+            )
+        except (ServerDisconnectedError, ClientOSError) as e:
+            if not (request.reused and handler.retry_on_disconnect):
+                raise
+            # The model server dropped the pooled connection we reused. Usually it
+            # closed it as idle while we were writing, but it may have received the
+            # request and failed while running it, so only handlers whose requests
+            # are safe to repeat send it again, once, on a new connection.
+            log.debug(f"Retrying {handler.endpoint} on a new connection: {e!r}")
+            return await self.oneshot_session.post(
+                url=handler.endpoint, json=api_payload
+            )
 
     async def __call_remote_dispatch_function(
         self, handler: EndpointHandler[ApiPayload_T], payload: ApiPayload_T
@@ -738,7 +932,8 @@ class Backend:
         # Wrap the result in a fake ClientResponse-like object
         class RemoteFunctionClientResponse:
             def __init__(self, data: Any, status: int = 200):
-                self._body = json.dumps({"result": data}).encode("utf-8")
+                # raw buffers go out as base64, like serve.py's JSON answers
+                self._body = wire.dumps_json({"result": data}).encode("utf-8")
                 self.status = status
                 self.content_type = "application/json"
                 self.headers = {"Content-Type": self.content_type}
@@ -748,7 +943,7 @@ class Backend:
 
         return RemoteFunctionClientResponse(result)
 
-    def __check_signature(self, auth_data: AuthData) -> bool:
+    async def __check_signature(self, auth_data: AuthData) -> bool:
         if self.unsecured is True:
             return True
 
@@ -757,19 +952,30 @@ class Backend:
             log.error("Rejecting request: pubkey not loaded")
             return False
 
+        cache = self._signature_cache
+        if cache.check(auth_data.url, auth_data.signature):
+            self.reqnum = max(auth_data.reqnum, self.reqnum)
+            return True
+
+        verifier = self.__verifier
+
         def verify_signature(message, signature):
             h = SHA256.new(message.encode())
             try:
-                pkcs1_15.new(self._pubkey).verify(h, base64.b64decode(signature))
+                verifier.verify(h, base64.b64decode(signature))
                 return True
             except (ValueError, TypeError):
                 return False
 
         message = {"url": auth_data.url}
 
-        if verify_signature(
-            json.dumps(message, indent=4, sort_keys=True), auth_data.signature
+        if await self.offloader.verify(
+            verify_signature,
+            json.dumps(message, indent=4, sort_keys=True),
+            auth_data.signature,
         ):
+            # the cache captured above is dropped if the key changed meanwhile
+            cache.add(auth_data.url, auth_data.signature)
             self.reqnum = max(auth_data.reqnum, self.reqnum)
             return True
         else:
@@ -778,85 +984,42 @@ class Backend:
             )
             return False
 
-    async def __run_benchmark(self) -> float:
-        """Run the benchmark against the benchmark handler. Returns max throughput."""
+    async def __run_benchmark(self) -> BenchmarkSummary:
+        """Run (or resume) the benchmark against the benchmark handler."""
         log.debug("Running benchmark")
-        try:
-            with open(BENCHMARK_INDICATOR_FILE, "r") as f:
-                perf = float(f.readline())
-                log.debug(f"Already ran benchmark for perf score of {perf}")
-                return perf
-        except FileNotFoundError:
-            pass
-        if self.benchmark_handler.do_warmup_benchmark:
-            log.debug(
-                f"Performing benchmark on endpoint {self.benchmark_handler.endpoint}"
-            )
-            log.debug("Initial run to trigger model loading...")
-            payload = self.benchmark_handler.make_benchmark_payload()
-            await self.__call_backend(handler=self.benchmark_handler, payload=payload)
-
-        max_throughput = 0
-        sum_throughput = 0
-        concurrent_requests = (
-            self.benchmark_handler.concurrency
-            if self.benchmark_handler.allow_parallel_requests
-            else 1
-        )
-        for run in range(1, self.benchmark_handler.benchmark_runs + 1):
-            start = time.time()
-            benchmark_requests = []
-
-            for i in range(concurrent_requests):
-                payload = self.benchmark_handler.make_benchmark_payload()
-                workload = payload.count_workload()
-                task = self.__call_backend(
-                    handler=self.benchmark_handler, payload=payload
-                )
-                benchmark_requests.append(
-                    BenchmarkResult(request_idx=i, workload=workload, task=task)
-                )
-
-            responses = await gather(*[br.task for br in benchmark_requests])
-            for br, response in zip(benchmark_requests, responses):
-                br.response = response
-
-            total_workload = sum(
-                br.workload for br in benchmark_requests if br.is_successful
-            )
-            time_elapsed = time.time() - start
-            successful_responses = sum(
-                [1 for br in benchmark_requests if br.is_successful]
-            )
-            if successful_responses == 0:
-                self.backend_errored("No successful responses from benchmark")
-                log.error(f"Benchmark Failed: No successful responses")
-                return 0.0
-            throughput = total_workload / time_elapsed
-            sum_throughput += throughput
-            max_throughput = max(max_throughput, throughput)
-
-            # Log results for debugging
-            log.debug(
-                "\n".join(
-                    [
-                        "#" * 60,
-                        f"Run: {run}, concurrent_requests: {concurrent_requests}",
-                        f"Total workload: {total_workload}, time_elapsed: {time_elapsed}s",
-                        f"Throughput: {throughput} workload/s",
-                        f"Successful responses: {successful_responses}/{concurrent_requests}",
-                        "#" * 60,
-                    ]
-                )
-            )
-
-        average_throughput = sum_throughput / self.benchmark_handler.benchmark_runs
-        log.debug(
-            f"Benchmark complete: average perf is {average_throughput}, measured perf is {max_throughput}"
+        handler = self.benchmark_handler
+        concurrency = handler.concurrency if handler.allow_parallel_requests else 1
+        runner = BenchmarkRunner(
+            call=lambda payload: self.__call_backend(handler=handler, payload=payload),
+            make_payload=handler.make_benchmark_payload,
+            key={"endpoint": handler.endpoint},
+            concurrency=concurrency,
+            runs=handler.benchmark_runs,
+            adaptive=handler.benchmark_adaptive and handler.allow_parallel_requests,
+            max_concurrency=handler.benchmark_max_concurrency,
+            max_latency=handler.benchmark_max_latency,
         )
+        if not os.path.exists(runner.path):
+            # benchmarked by a pyworker that only kept max_throughput; once the
+            # structured file exists, a changed benchmark is run again instead
+            try:
+                with open(BENCHMARK_INDICATOR_FILE, "r") as f:
+                    perf = float(f.readline())
+                    log.debug(f"Already ran benchmark for perf score of {perf}")
+                    return BenchmarkSummary(perf, saturation_concurrency=0)
+            except FileNotFoundError:
+                pass
+        if handler.do_warmup_benchmark:
+            log.debug(f"Performing benchmark on endpoint {handler.endpoint}")
+        try:
+            summary = await runner.run(warmup=handler.do_warmup_benchmark)
+        except BenchmarkFailed as e:
+            self.backend_errored(str(e))
+            log.error(f"Benchmark Failed: {e}")
+            return BenchmarkSummary(0.0, saturation_concurrency=0)
         with open(BENCHMARK_INDICATOR_FILE, "w") as f:
-            f.write(str(max_throughput))
-        return max_throughput
+            f.write(str(summary.max_throughput))
+        return summary
 
     async def __read_logs(self) -> Awaitable[NoReturn]:
         async def handle_log_line(log_line: str) -> None:
@@ -864,14 +1027,16 @@ class Backend:
             Implement this function to handle each log line for your model.
             This function should mutate self.system_metrics and self.model_metrics
             """
-            for action, msg in self.log_actions:
-                match action:
-                    case LogAction.ModelLoaded if msg in log_line:
+            for found in self.log_matcher.match(log_line):
+                if found.fields:
+                    self.log_fields.update(found.fields)
+                match found.action:
+                    case LogAction.ModelLoaded:
                         log.debug(
                             f"Got log line indicating model is loaded: {log_line}"
                         )
                         try:
-                            max_throughput = await self.__run_benchmark()
+                            benchmark = await self.__run_benchmark()
                             self.__start_healthcheck.set()
 
                             # Wait for the first successful healthcheck before marking model as loaded
@@ -919,79 +1084,23 @@ class Backend:
 
                             # Mark worker ready!
                             self.metrics._model_loaded(
-                                max_throughput=max_throughput,
+                                max_throughput=benchmark.max_throughput,
+                                saturation_concurrency=benchmark.saturation_concurrency,
                             )
                         except Exception as e:
                             log.debug(f"Benchmark failed with error: {e}")
                             self.backend_errored(f"Benchmark failed with error: {e}")
-                    case LogAction.ModelError if msg in log_line:
+                    case LogAction.ModelError:
                         log.debug(f"Got log line indicating error: {log_line}")
-                        self.backend_errored(msg)
+                        self.backend_errored(found.text)
                         break
-                    case LogAction.Info if msg in log_line:
+                    case LogAction.Info:
                         log.debug(f"Info from model logs: {log_line}")
 
-        async def tail_log():
-            """
-            Tail a log file with proper rotation handling.
-            Tracks inode to detect when file is rotated and reopens accordingly.
-            """
-            log.debug(f"tailing file: {self.model_log_file}")
-
-            current_inode = None
-            f = None
-
-            try:
-                while True:
-                    # Check if file exists and get its inode
-                    try:
-                        stat_info = os.stat(self.model_log_file)
-                        file_inode = stat_info.st_ino
-                    except FileNotFoundError:
-                        # File doesn't exist, wait and retry
-                        if f is not None:
-                            await f.aclose()
-                            f = None
-                            current_inode = None
-                        log.debug(
-                            f"Log file {self.model_log_file} not found, waiting..."
-                        )
-                        await asyncio.sleep(1)
-                        continue
-
-                    # If inode changed (file was rotated) or we don't have a file handle, (re)open
-                    if current_inode != file_inode:
-                        if f is not None:
-                            log.debug(
-                                f"Log file rotation detected (inode changed from {current_inode} to {file_inode}), reopening..."
-                            )
-                            await f.aclose()
-                        else:
-                            log.debug(f"Opening log file (inode: {file_inode})")
-
-                        f = await open_file(
-                            self.model_log_file, encoding="utf-8", errors="ignore"
-                        )
-                        current_inode = file_inode
-
-                    # Read a line
-                    line = await f.readline()
-                    if line:
-                        await handle_log_line(line.rstrip())
-                    else:
-                        # No data available, sleep briefly
-                        await asyncio.sleep(LOG_POLL_INTERVAL)
-
-            finally:
-                if f is not None:
-                    await f.aclose()
-
-        # Wait for log file to exist before starting to tail
-        while True:
-            if os.path.isfile(self.model_log_file):
-                return await tail_log()
-            else:
-                await sleep(1)
+        tailer = LogTailer(self.model_log_file, use_inotify=self.log_inotify)
+        async for lines in tailer:
+            for line in lines:
+                await handle_log_line(line)
 
     async def __session_gc_loop(self) -> NoReturn:
         while True:
@@ -0,0 +1,289 @@
+"""The pyworker's benchmark of the model server: runs, their results, and where they're kept."""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from .data_types import ApiPayload
+
+log = logging.getLogger(__file__)
+
+# per-run results, so a restarted worker resumes the benchmark instead of starting over
+BENCHMARK_FILE = ".benchmark.json"
+BENCHMARK_FILE_VERSION = 1
+# adaptive mode: runs at each concurrency level, and the throughput gain over the best
+# level so far below which throughput counts as saturated
+ADAPTIVE_RUNS_PER_LEVEL = 3
+ADAPTIVE_MIN_GAIN = 0.1
+
+
+class BenchmarkFailed(Exception):
+    pass
+
+
+class BenchmarkRequestFailed(Exception):
+    pass
+
+
+@dataclass
+class BenchmarkRun:
+    """Results of one round of ``concurrency`` simultaneous benchmark requests."""
+
+    concurrency: int
+    successes: int
+    errors: int
+    workload: float  # of the successful requests
+    elapsed: float
+    latency_p50: float
+    latency_p90: float
+    latency_p99: float
+
+    @property
+    def throughput(self) -> float:
+        return self.workload / self.elapsed if self.elapsed > 0 else 0.0
+
+
+@dataclass
+class BenchmarkSummary:
+    """What the benchmark found: ``max_throughput`` is reported to the autoscaler as
+    max_perf, and ``saturation_concurrency`` is the concurrency it was reached at."""
+
+    max_throughput: float
+    saturation_concurrency: int
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+@dataclass
+class BenchmarkFile:
+    """The runs of one benchmark, saved as JSON after each run.
+
+    ``key`` describes the benchmark that produced them; runs recorded under a different
+    key (another endpoint, mode or limit) are discarded rather than resumed.
+    """
+
+    key: Dict[str, Any]
+    runs: List[BenchmarkRun] = field(default_factory=list)
+    result: Optional[BenchmarkSummary] = None
+
+    @classmethod
+    def load(cls, path: str, key: Dict[str, Any]) -> "BenchmarkFile":
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            if data.get("version") != BENCHMARK_FILE_VERSION or data.get("key") != key:
+                log.debug(f"Benchmark in {path} was for {data.get('key')}, starting over")
+                return cls(key)
+            runs = [BenchmarkRun(**run) for run in data.get("runs", [])]
+            result = data.get("result")
+            return cls(key, runs, BenchmarkSummary(**result) if result else None)
+        except FileNotFoundError:
+            return cls(key)
+        except (ValueError, TypeError) as e:
+            log.warning(f"Ignoring unreadable benchmark file {path}: {e}")
+            return cls(key)
+
+    def save(self, path: str) -> None:
+        data = {
+            "version": BENCHMARK_FILE_VERSION,
+            "key": self.key,
+            "runs": [asdict(run) for run in self.runs],
+            "result": asdict(self.result) if self.result else None,
+        }
+        tmp = f"{path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp, path)
+
+
+class BenchmarkRunner:
+    """
+    Benchmarks the model server through ``call(payload)``, which returns its response.
+
+    The fixed mode (the default) does ``runs`` rounds of ``concurrency`` requests and
+    reports the best throughput. The adaptive mode starts at one request at a time and
+    doubles concurrency, ``runs_per_level`` rounds per level, up to ``max_concurrency``.
+    It stops once a level gains less than ``ADAPTIVE_MIN_GAIN`` over the best one so far,
+    or a level goes over ``max_latency`` (p99, seconds) or has errors; levels of the last
+    two kinds don't count. The saturation point is the lowest level within
+    ``ADAPTIVE_MIN_GAIN`` of the best one.
+
+    Every run is appended to ``path`` as it completes. Runs already there are reused,
+    so a benchmark interrupted by a restart picks up where it stopped.
+    """
+
+    def __init__(
+        self,
+        call: Callable[[ApiPayload], Awaitable[Any]],
+        make_payload: Callable[[], ApiPayload],
+        key: Dict[str, Any],
+        concurrency: int,
+        runs: int,
+        adaptive: bool = False,
+        max_concurrency: int = 64,
+        max_latency: Optional[float] = None,
+        runs_per_level: int = ADAPTIVE_RUNS_PER_LEVEL,
+        path: str = BENCHMARK_FILE,
+    ):
+        self.call = call
+        self.make_payload = make_payload
+        self.concurrency = concurrency
+        self.runs = runs
+        self.adaptive = adaptive
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_latency = max_latency
+        self.runs_per_level = max(1, runs_per_level)
+        self.path = path
+        if adaptive:
+            key = dict(
+                key,
+                mode="adaptive",
+                max_concurrency=self.max_concurrency,
+                max_latency=max_latency,
+                runs_per_level=self.runs_per_level,
+            )
+        else:
+            key = dict(key, mode="fixed", concurrency=concurrency, runs=runs)
+        self.file = BenchmarkFile.load(path, key)
+
+    async def run(self, warmup: bool = True) -> BenchmarkSummary:
+        if self.file.result is not None:
+            log.debug(f"Already ran benchmark: {self.file.result}")
+            return self.file.result
+        if self.file.runs:
+            log.debug(f"Resuming benchmark after {len(self.file.runs)} runs")
+        if warmup:
+            log.debug("Initial run to trigger model loading...")
+            response = await self.call(self.make_payload())
+            await response.read()
+        while True:
+            concurrency = self.next_concurrency()
+            if concurrency is None:
+                break
+            run = await self.run_once(concurrency)
+            self.file.runs.append(run)
+            self.file.save(self.path)
+            log.debug(
+                "\n".join(
+                    [
+                        "#" * 60,
+                        f"Run: {len(self.file.runs)}, concurrent_requests: {concurrency}",
+                        f"Total workload: {run.workload}, time_elapsed: {run.elapsed}s",
+                        f"Throughput: {run.throughput} workload/s",
+                        f"Latency p50/p90/p99: {run.latency_p50:.3f}s/"
+                        f"{run.latency_p90:.3f}s/{run.latency_p99:.3f}s",
+                        f"Successful responses: {run.successes}/{concurrency}",
+                        "#" * 60,
+                    ]
+                )
+            )
+            if run.successes == 0:
+                raise BenchmarkFailed("No successful responses from benchmark")
+        self.file.result = self.result()
+        self.file.save(self.path)
+        log.debug(f"Benchmark complete: {self.file.result}")
+        return self.file.result
+
+    async def _timed_call(self, payload: ApiPayload) -> float:
+        start = time.monotonic()
+        response = await self.call(payload)
+        # the whole response, and releases the connection
+        await response.read()
+        if response.status != 200:
+            raise BenchmarkRequestFailed(f"HTTP {response.status}")
+        return time.monotonic() - start
+
+    async def run_once(self, concurrency: int) -> BenchmarkRun:
+        payloads = [self.make_payload() for _ in range(concurrency)]
+        start = time.monotonic()
+        outcomes = await asyncio.gather(
+            *(self._timed_call(p) for p in payloads), return_exceptions=True
+        )
+        elapsed = time.monotonic() - start
+        latencies, workload = [], 0.0
+        for payload, outcome in zip(payloads, outcomes):
+            if isinstance(outcome, BaseException):
+                if isinstance(outcome, asyncio.CancelledError):
+                    raise outcome
+                log.debug(f"Benchmark request failed: {outcome!r}")
+                continue
+            latencies.append(outcome)
+            workload += payload.count_workload()
+        latencies.sort()
+        return BenchmarkRun(
+            concurrency=concurrency,
+            successes=len(latencies),
+            errors=concurrency - len(latencies),
+            workload=workload,
+            elapsed=elapsed,
+            latency_p50=_percentile(latencies, 0.5),
+            latency_p90=_percentile(latencies, 0.9),
+            latency_p99=_percentile(latencies, 0.99),
+        )
+
+    def _levels(self) -> List[List[BenchmarkRun]]:
+        """Recorded adaptive runs, grouped by concurrency level in the order they ran."""
+        levels: List[List[BenchmarkRun]] = []
+        for run in self.file.runs:
+            if levels and levels[-1][0].concurrency == run.concurrency:
+                levels[-1].append(run)
+            else:
+                levels.append([run])
+        return levels
+
+    def _acceptable(self, level: List[BenchmarkRun]) -> bool:
+        if any(run.errors for run in level):
+            return False
+        p99 = max(run.latency_p99 for run in level)
+        return self.max_latency is None or p99 <= self.max_latency
+
+    @staticmethod
+    def _level_throughput(level: List[BenchmarkRun]) -> float:
+        return sum(run.throughput for run in level) / len(level)
+
+    def next_concurrency(self) -> Optional[int]:
+        """Concurrency of the next run, None when the benchmark is complete."""
+        if not self.adaptive:
+            return self.concurrency if len(self.file.runs) < self.runs else None
+        levels = self._levels()
+        if not levels:
+            return 1
+        last = levels[-1]
+        if len(last) < self.runs_per_level:
+            return last[0].concurrency
+        if not self._acceptable(last):
+            return None
+        if len(levels) > 1:
+            best = max(self._level_throughput(level) for level in levels[:-1])
+            if self._level_throughput(last) < best * (1 + ADAPTIVE_MIN_GAIN):
+                return None
+        if last[0].concurrency >= self.max_concurrency:
+            return None
+        return min(last[0].concurrency * 2, self.max_concurrency)
+
+    def result(self) -> BenchmarkSummary:
+        if not self.adaptive:
+            return BenchmarkSummary(
+                max_throughput=max(run.throughput for run in self.file.runs),
+                saturation_concurrency=self.concurrency,
+            )
+        levels = self._levels()
+        accepted = [level for level in levels if self._acceptable(level)] or levels[:1]
+        best = max(self._level_throughput(level) for level in accepted)
+        knee = next(
+            level
+            for level in accepted
+            if self._level_throughput(level) >= best * (1 - ADAPTIVE_MIN_GAIN)
+        )
+        return BenchmarkSummary(
+            max_throughput=max(run.throughput for level in accepted for run in level),
+            saturation_concurrency=knee[0].concurrency,
+        )
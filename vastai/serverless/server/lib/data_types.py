@@ -23,6 +23,7 @@ import json
 import psutil
 import os
 import asyncio
+from collections import deque
 
 """
 type variable representing an incoming payload to pyworker that will used to calculate load and will then
@@ -113,9 +114,25 @@ class EndpointHandler(ABC, Generic[ApiPayload_T]):
     concurrency: int = 10
     benchmark_runs: int = 8
     allow_parallel_requests: bool = False
+    # requests allowed to run at once when allow_parallel_requests is False
+    max_concurrent_requests: int = 1
     max_queue_time: float = None
     remote_function: Callable = None
     do_warmup_benchmark: bool = True
+    # reuse pooled connections to the model server; turn off for long running jobs
+    keepalive: bool = True
+    # resend a request once, on a new connection, when the model server drops the
+    # pooled connection it went out on; only for requests that are safe to repeat
+    retry_on_disconnect: bool = False
+    # count the workload of large requests in the offload executor instead of on the
+    # event loop; only for workload calculators that are safe to run in a thread
+    offload_workload_calculator: bool = False
+    # ramp the benchmark's concurrency up to benchmark_max_concurrency until throughput
+    # stops growing, instead of benchmark_runs runs at `concurrency`
+    benchmark_adaptive: bool = False
+    benchmark_max_concurrency: int = 64
+    # p99 latency (seconds) above which an adaptive benchmark level doesn't count
+    benchmark_max_latency: Optional[float] = None
 
     @property
     @abstractmethod
@@ -222,6 +239,152 @@ class RequestMetrics:
     work_completed_at: float = 0.0
 
 
+class WorkingRequests(dict[int, RequestMetrics]):
+    """
+    requests_working, keyed by reqnum, with its workload sums kept up to date on every
+    insert and removal so that wait_time / cur_load don't walk every in-flight request.
+    Session workload (is_session requests) is summed separately as it doesn't count
+    towards wait time.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self.workload = 0.0
+        self.session_workload = 0.0
+        self.update(*args, **kwargs)
+
+    def _add(self, request: RequestMetrics) -> None:
+        self.workload += request.workload
+        if request.is_session:
+            self.session_workload += request.workload
+
+    def _sub(self, request: RequestMetrics) -> None:
+        if len(self) == 0:
+            # reset rather than subtract so float error can't accumulate over time
+            self.workload = 0.0
+            self.session_workload = 0.0
+            return
+        self.workload -= request.workload
+        if request.is_session:
+            self.session_workload -= request.workload
+
+    def __setitem__(self, key: int, request: RequestMetrics) -> None:
+        old = self.get(key)
+        super().__setitem__(key, request)
+        if old is not None:
+            self._sub(old)
+        self._add(request)
+
+    def __delitem__(self, key: int) -> None:
+        request = self[key]
+        super().__delitem__(key)
+        self._sub(request)
+
+    def pop(self, key: int, *default):
+        if key not in self:
+            return super().pop(key, *default)
+        request = super().pop(key)
+        self._sub(request)
+        return request
+
+    def popitem(self):
+        key, request = super().popitem()
+        self._sub(request)
+        return key, request
+
+    def setdefault(self, key: int, default: RequestMetrics = None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs) -> None:
+        for key, request in dict(*args, **kwargs).items():
+            self[key] = request
+
+    def clear(self) -> None:
+        super().clear()
+        self.workload = 0.0
+        self.session_workload = 0.0
+
+    def check_consistency(self, tolerance: float = 1e-6) -> bool:
+        """
+        recomputes the sums from scratch and compares them to the maintained ones,
+        logging and correcting any drift. Only meant to be used in debug mode, it is O(n)
+        """
+        workload = sum(request.workload for request in self.values())
+        session_workload = sum(
+            request.workload for request in self.values() if request.is_session
+        )
+        if (
+            abs(workload - self.workload) <= tolerance
+            and abs(session_workload - self.session_workload) <= tolerance
+        ):
+            return True
+        log.error(
+            f"requests_working aggregates out of sync: workload {self.workload} != {workload}, "
+            f"session_workload {self.session_workload} != {session_workload}"
+        )
+        self.workload = workload
+        self.session_workload = session_workload
+        return False
+
+
+class CompletedRequests:
+    """
+    requests_deleting: completed requests waiting to be reported to the autoscaler's
+    /delete_requests/ route, as a bounded FIFO ring buffer. When full, the oldest record is
+    dropped to make room (append returns it so the caller can count it) instead of letting
+    the backlog grow without bound while the autoscaler is unreachable.
+
+    Sends take a batch() from the head and consume() it once delivered. Records appended
+    meanwhile go to the tail, and records dropped meanwhile are accounted for, so consume
+    never removes anything that wasn't in the batch.
+    """
+
+    def __init__(self, requests=(), maxlen: int = 10_000):
+        self.maxlen = maxlen
+        self._records: deque[RequestMetrics] = deque()
+        self._removed = 0  # total records ever removed from the head
+        for request in requests:
+            self.append(request)
+
+    def append(self, request: RequestMetrics) -> Optional[RequestMetrics]:
+        dropped = None
+        if len(self._records) >= self.maxlen:
+            dropped = self._records.popleft()
+            self._removed += 1
+        self._records.append(request)
+        return dropped
+
+    def batch(self, limit: int) -> Tuple[int, list[RequestMetrics]]:
+        """returns (position, records) for up to limit records from the head"""
+        records = list(self._records) if limit >= len(self._records) else [
+            self._records[i] for i in range(limit)
+        ]
+        return self._removed, records
+
+    def consume(self, position: int, count: int) -> None:
+        """removes a batch returned by batch(), minus anything dropped since"""
+        count = min(position + count - self._removed, len(self._records))
+        for _ in range(count):
+            self._records.popleft()
+        self._removed += max(count, 0)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, CompletedRequests):
+            other = other._records
+        return list(self._records) == list(other)
+
+    def __repr__(self) -> str:
+        return f"CompletedRequests({list(self._records)!r}, maxlen={self.maxlen})"
+
+
 @dataclass
 class SystemMetrics:
     """General system metrics"""
@@ -285,11 +448,21 @@ class ModelMetrics:
     workload_pending: float
     error_msg: Optional[str]
     max_throughput: float
+    # benchmark concurrency at which max_throughput was reached (0 if unknown)
+    saturation_concurrency: int = 0
     requests_recieved: Set[int] = field(default_factory=set)
-    requests_working: dict[int, RequestMetrics] = field(default_factory=dict)
-    requests_deleting: list[RequestMetrics] = field(default_factory=list)
+    requests_working: WorkingRequests = field(default_factory=WorkingRequests)
+    requests_deleting: CompletedRequests = field(default_factory=CompletedRequests)
     last_update: float = field(default_factory=time.time)
 
+    def __setattr__(self, name, value):
+        # keep the incremental bookkeeping when callers assign plain containers
+        if name == "requests_working" and not isinstance(value, WorkingRequests):
+            value = WorkingRequests(value)
+        elif name == "requests_deleting" and not isinstance(value, CompletedRequests):
+            value = CompletedRequests(value)
+        super().__setattr__(name, value)
+
     @classmethod
     def empty(cls):
         return cls(
@@ -311,17 +484,19 @@ class ModelMetrics:
     def wait_time(self) -> float:
         if len(self.requests_working) == 0:
             return 0.0
-        return sum(
-            [
-                request.workload
-                for request in self.requests_working.values()
-                if not request.is_session
-            ]
-        ) / max(self.max_throughput, 0.00001)
+        return self.non_session_load / max(self.max_throughput, 0.00001)
 
     @property
     def cur_load(self) -> float:
-        return sum([request.workload for request in self.requests_working.values()])
+        return self.requests_working.workload
+
+    @property
+    def session_load(self) -> float:
+        return self.requests_working.session_workload
+
+    @property
+    def non_session_load(self) -> float:
+        return self.requests_working.workload - self.requests_working.session_workload
 
     @property
     def working_request_idxs(self) -> list[int]:
@@ -361,6 +536,9 @@ class WorkerStatusData:
     additional_disk_usage: float
     working_request_idxs: list[int]
     url: str
+    saturation_concurrency: int = 0
+    # longest event-loop stall since the last update, in seconds; 0 unless LOOP_LAG_MONITOR
+    loop_lag: float = 0.0
 
 
 class LogAction(Enum):
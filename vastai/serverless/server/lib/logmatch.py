@@ -0,0 +1,89 @@
+"""Matching model log lines against the configured LogActions."""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Pattern, Sequence, Tuple, Union
+
+from .data_types import LogAction
+
+# a substring to look for, or a compiled regex whose named groups are captured
+LogPattern = Union[str, Pattern[str]]
+
+
+@dataclass
+class LogMatch:
+    action: LogAction
+    pattern: LogPattern
+    # the substring itself, or the text the regex matched
+    text: str
+    fields: Dict[str, str] = field(default_factory=dict)
+
+
+def _trie_regex(words: Sequence[str]) -> str:
+    """One regex matching any of ``words``, with common prefixes factored out so the
+    regex engine checks each position of a line once per prefix, not once per word."""
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        alternatives = [re.escape(ch) + build(sub) for ch, sub in sorted(node.items()) if ch]
+        if not alternatives:
+            return ""
+        body = (
+            alternatives[0]
+            if len(alternatives) == 1
+            else "(?:" + "|".join(alternatives) + ")"
+        )
+        # a word ends here, and longer ones continue: the continuation is optional
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+class LogMatcher:
+    """
+    Finds every LogAction a log line triggers, compiled once from ``(action, pattern)``
+    pairs.
+
+    Substring patterns are compiled together into a single regex, which rejects the vast
+    majority of lines (those matching nothing) in one search; only lines it accepts are
+    checked pattern by pattern. Regex patterns are searched one by one, and their named
+    groups are returned as ``fields``: ``re.compile(r"Loading weights: (?P<percent>\\d+)%")``.
+    Matches come back in the configured order.
+    """
+
+    def __init__(self, log_actions: Sequence[Tuple[LogAction, LogPattern]]):
+        self.log_actions = list(log_actions)
+        self._substrings: List[Tuple[int, LogAction, str]] = []
+        self._regexes: List[Tuple[int, LogAction, Pattern[str]]] = []
+        for i, (action, pattern) in enumerate(self.log_actions):
+            if isinstance(pattern, str):
+                self._substrings.append((i, action, pattern))
+            else:
+                self._regexes.append((i, action, pattern))
+        words = sorted({pattern for _, _, pattern in self._substrings})
+        self._any_substring: Optional[Pattern[str]] = None
+        if "" in words:
+            # "" is in every line, like the substring check it replaces
+            self._any_substring = re.compile("")
+        elif words:
+            self._any_substring = re.compile(_trie_regex(words))
+
+    def match(self, line: str) -> List[LogMatch]:
+        found: List[Tuple[int, LogMatch]] = []
+        if self._any_substring is not None and self._any_substring.search(line):
+            for i, action, pattern in self._substrings:
+                if pattern in line:
+                    found.append((i, LogMatch(action, pattern, pattern)))
+        for i, action, pattern in self._regexes:
+            m = pattern.search(line)
+            if m is not None:
+                fields = {k: v for k, v in m.groupdict().items() if v is not None}
+                found.append((i, LogMatch(action, pattern, m.group(0), fields)))
+        if len(found) > 1 and self._regexes:
+            found.sort(key=lambda item: item[0])
+        return [match for _, match in found]
@@ -0,0 +1,231 @@
+"""Follows the model server's log file, woken by inotify where available."""
+
+import asyncio
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import struct
+import sys
+from typing import AsyncIterator, List, Optional
+
+log = logging.getLogger(__file__)
+
+# how often to check the log file when inotify isn't available
+LOG_POLL_INTERVAL = 0.1
+# with inotify, how long to sleep without events before checking the file anyway
+LOG_IDLE_RECHECK = 5.0
+# bytes read from the log at a time; every complete line in them is handled as one batch
+LOG_READ_SIZE = 256 * 1024
+# how often to look for a log file that doesn't exist yet
+LOG_MISSING_INTERVAL = 1.0
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_IGNORED = 0x00008000
+_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len (then the name)
+
+# events on the file itself, and on its directory for entries with the file's name
+FILE_EVENTS = IN_MODIFY | IN_ATTRIB | IN_MOVE_SELF | IN_DELETE_SELF
+DIR_EVENTS = IN_CREATE | IN_MOVED_TO | IN_MOVED_FROM | IN_DELETE
+
+
+class Inotify:
+    """Minimal inotify binding over libc: watches one file and its directory, and wakes
+    waiters when either changes. ``create`` returns None where inotify isn't available."""
+
+    def __init__(self, libc, fd: int, path: str):
+        self._libc = libc
+        self.fd = fd
+        self.path = path
+        self.name = os.fsencode(os.path.basename(path))
+        self._file_wd: Optional[int] = None
+        self._dir_wd = self._add_watch(os.path.dirname(path) or ".", DIR_EVENTS)
+        self._ready = asyncio.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    def create(cls, path: str) -> Optional["Inotify"]:
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd < 0:
+                raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        except (OSError, AttributeError) as e:
+            log.debug(f"inotify unavailable, polling {path}: {e}")
+            return None
+        try:
+            return cls(libc, fd, path)
+        except OSError as e:
+            os.close(fd)
+            log.debug(f"Can't watch {path} with inotify, polling: {e}")
+            return None
+
+    def _add_watch(self, path: str, mask: int) -> int:
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_add_watch({path}): {os.strerror(err)}")
+        return wd
+
+    def watch_file(self) -> None:
+        """(Re)watch the file at ``path``, e.g. after it was rotated."""
+        if self._file_wd is not None:
+            self._libc.inotify_rm_watch(self.fd, self._file_wd)
+            self._file_wd = None
+        try:
+            self._file_wd = self._add_watch(self.path, FILE_EVENTS)
+        except OSError as e:
+            if e.errno != errno.ENOENT:
+                raise
+
+    def _on_readable(self) -> None:
+        wake = False
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = _EVENT.unpack_from(data, offset)
+                name = data[offset + _EVENT.size : offset + _EVENT.size + length]
+                offset += _EVENT.size + length
+                if wd == self._file_wd:
+                    if mask & IN_IGNORED:
+                        self._file_wd = None
+                    wake = True
+                elif wd == self._dir_wd and name.rstrip(b"\0") == self.name:
+                    wake = True
+        if wake:
+            self._ready.set()
+
+    async def wait(self, timeout: float) -> None:
+        """Wait until the file or its directory entry changes, or ``timeout`` passes."""
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+            self._loop.add_reader(self.fd, self._on_readable)
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._ready.clear()
+
+    def close(self) -> None:
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.remove_reader(self.fd)
+        os.close(self.fd)
+
+
+class LogTailer:
+    """
+    Yields the lines appended to a log file, in batches: every complete line of each
+    block read is handed over at once, without the trailing newline.
+
+    The file is followed across rotation (renamed or deleted and recreated: a new inode
+    at ``path``) and truncation; lines still in the old file are read before switching.
+    On Linux it sleeps until inotify reports a change; elsewhere, or if inotify can't be
+    set up, it checks every ``poll_interval`` seconds. Starts at the beginning of the file
+    and waits for it to exist.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        poll_interval: float = LOG_POLL_INTERVAL,
+        read_size: int = LOG_READ_SIZE,
+        use_inotify: bool = True,
+    ):
+        self.path = path
+        self.poll_interval = poll_interval
+        self.read_size = read_size
+        self.use_inotify = use_inotify
+        self._f = None
+        self._inode: Optional[int] = None
+        self._pending = b""
+        self._inotify: Optional[Inotify] = None
+
+    @property
+    def uses_inotify(self) -> bool:
+        return self._inotify is not None
+
+    def _open(self) -> bool:
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            return False
+        if self._f is not None:
+            log.debug(
+                f"Log file rotation detected (inode changed from {self._inode} to "
+                f"{os.fstat(f.fileno()).st_ino}), reopening..."
+            )
+            self._f.close()
+        self._f = f
+        self._inode = os.fstat(f.fileno()).st_ino
+        self._pending = b""
+        if self._inotify is not None:
+            self._inotify.watch_file()
+        return True
+
+    def _rotated(self) -> bool:
+        try:
+            return os.stat(self.path).st_ino != self._inode
+        except FileNotFoundError:
+            return False  # keep reading the old file until a new one appears
+
+    def _read(self) -> Optional[List[str]]:
+        """Read what's there, up to ``read_size`` bytes, and split it into lines.
+
+        None if there was nothing to read; an empty list if no line was completed.
+        """
+        f = self._f
+        if os.fstat(f.fileno()).st_size < f.tell():
+            log.debug(f"Log file {self.path} was truncated, reading from the start")
+            f.seek(0)
+            self._pending = b""
+        data = f.read(self.read_size)
+        if not data:
+            return None
+        *lines, self._pending = (self._pending + data).split(b"\n")
+        return [line.decode("utf-8", errors="ignore").rstrip() for line in lines]
+
+    async def _wait(self, timeout: Optional[float] = None) -> None:
+        if self._inotify is not None:
+            await self._inotify.wait(timeout or LOG_IDLE_RECHECK)
+        else:
+            await asyncio.sleep(timeout or self.poll_interval)
+
+    async def __aiter__(self) -> AsyncIterator[List[str]]:
+        if self.use_inotify:
+            self._inotify = Inotify.create(self.path)
+        log.debug(
+            f"tailing file: {self.path} "
+            f"({'inotify' if self._inotify is not None else 'polling'})"
+        )
+        try:
+            while not self._open():
+                log.debug(f"Log file {self.path} not found, waiting...")
+                await self._wait(LOG_MISSING_INTERVAL)
+            while True:
+                lines = await asyncio.to_thread(self._read)
+                if lines is not None:
+                    if lines:
+                        yield lines
+                    continue
+                if self._rotated() and self._open():
+                    continue
+                await self._wait()
+        finally:
+            if self._f is not None:
+                self._f.close()
+            if self._inotify is not None:
+                self._inotify.close()
@@ -1,5 +1,6 @@
 import os
 import time
+import gzip
 import logging
 import json
 from asyncio import sleep
@@ -9,10 +10,16 @@ import asyncio
 from aiohttp import ClientSession, ClientTimeout, TCPConnector, ClientResponseError
 
 from .data_types import WorkerStatusData, SystemMetrics, ModelMetrics, RequestMetrics
+from .offload import LoopLag
 from typing import Awaitable, NoReturn, List
 
 METRICS_UPDATE_INTERVAL = 1
 DELETE_REQUESTS_INTERVAL = 1
+# completed requests per /delete_requests/ POST; reaching it also flushes before the next tick
+DELETE_REQUESTS_BATCH_SIZE = 500
+# with DELETE_REQUESTS_GZIP=true, bodies at least this large are gzipped
+DELETE_REQUESTS_GZIP_MIN_BYTES = 16 * 1024
+DELETE_REQUESTS_RETRY_DELAY = 0.25
 
 log = logging.getLogger(__file__)
 
@@ -25,6 +32,15 @@ def get_url() -> str:
     return f"http{'s' if use_ssl else ''}://{public_ip}:{worker_port}"
 
 
+@dataclass
+class DeleteRequestsStats:
+    """counts of completed request records reported through /delete_requests/"""
+
+    sent: int = 0
+    retried: int = 0  # records in a POST that had to be retried
+    dropped: int = 0  # records evicted from a full requests_deleting buffer
+
+
 @dataclass
 class Metrics:
     version: str = "0"
@@ -32,6 +48,10 @@ class Metrics:
     last_metric_update: float = 0.0
     last_request_served: float = 0.0
     update_pending: bool = False
+    # recheck the incrementally maintained load sums on every request start/end
+    debug_metrics: bool = field(
+        default_factory=lambda: os.environ.get("DEBUG_METRICS", "false") == "true"
+    )
     id: int = field(default_factory=lambda: int(os.environ["CONTAINER_ID"]))
     report_addr: List[str] = field(
         default_factory=lambda: os.environ["REPORT_ADDR"].split(",")
@@ -39,7 +59,18 @@ class Metrics:
     url: str = field(default_factory=get_url)
     system_metrics: SystemMetrics = field(default_factory=SystemMetrics.empty)
     model_metrics: ModelMetrics = field(default_factory=ModelMetrics.empty)
+    delete_stats: DeleteRequestsStats = field(default_factory=DeleteRequestsStats)
+    # gzip large /delete_requests/ bodies; opt-in, since not every autoscaler reads
+    # them. Cleared once a batch the autoscaler refused gzipped goes through as JSON.
+    delete_requests_gzip: bool = field(
+        default_factory=lambda: os.environ.get("DELETE_REQUESTS_GZIP", "false")
+        == "true"
+    )
+    # set by the Backend when LOOP_LAG_MONITOR is on; its peak goes out with each update
+    loop_lag: LoopLag | None = field(default=None, repr=False)
     _session: ClientSession | None = field(default=None, init=False, repr=False)
+    _delete_sending: bool = field(default=False, init=False, repr=False)
+    _delete_flush_task: asyncio.Task | None = field(default=None, init=False, repr=False)
 
     async def http(self) -> ClientSession:
         if self._session is None:
@@ -79,6 +110,8 @@ class Metrics:
         if not request.session:
             self.model_metrics.requests_recieved.add(request.reqnum)
             self.model_metrics.requests_working[request.reqnum] = request
+            if self.debug_metrics:
+                self.model_metrics.requests_working.check_consistency()
         self.update_pending = True
 
     def _request_end(self, request: RequestMetrics) -> None:
@@ -88,8 +121,14 @@ class Metrics:
         log.debug(f"Ending {self._request_id(request)}")
         self.model_metrics.workload_pending -= request.workload
         if not request.session:
-            self.model_metrics.requests_working.pop(request.reqnum, None)
-            self.model_metrics.requests_deleting.append(request)
+            working = self.model_metrics.requests_working
+            # requests on one client route lease share its reqnum, and the next one
+            # can start before this one ends; leave its entry in place
+            if working.get(request.reqnum) is request:
+                working.pop(request.reqnum)
+            self.__queue_delete(request)
+            if self.debug_metrics:
+                self.model_metrics.requests_working.check_consistency()
         self.last_request_served = time.time()
 
     def _request_success(self, request: RequestMetrics) -> None:
@@ -131,7 +170,7 @@ class Metrics:
         self.model_metrics.workload_rejected += request.workload
         if not request.session:
             self.model_metrics.requests_recieved.add(request.reqnum)
-            self.model_metrics.requests_deleting.append(request)
+            self.__queue_delete(request)
         request.success = False
         request.status = "Rejected"
         self.update_pending = True
@@ -151,12 +190,15 @@ class Metrics:
             elif self.update_pending or elapsed > 10:
                 await self.__send_metrics_and_reset()
 
-    def _model_loaded(self, max_throughput: float) -> None:
+    def _model_loaded(
+        self, max_throughput: float, saturation_concurrency: int = 0
+    ) -> None:
         self.system_metrics.model_loading_time = (
             time.time() - self.system_metrics.model_loading_start
         )
         self.system_metrics.model_is_loaded = True
         self.model_metrics.max_throughput = max_throughput
+        self.model_metrics.saturation_concurrency = saturation_concurrency
 
     def _model_errored(self, error_msg: str) -> None:
         self.model_metrics.set_errored(error_msg)
@@ -170,68 +212,116 @@ class Metrics:
 
     #######################################Private#######################################
 
-    async def __send_delete_requests_and_reset(self):
-        async def post(report_addr: str, requests: list[dict]) -> bool:
-            data = {
-                "worker_id": self.id,
-                "mtoken": self.mtoken,
-                "requests": requests,
-            }
-            log.debug(
-                f"Deleting requests: {[r['request_idx'] for r in requests]}"
-            )
-            full_path = report_addr.rstrip("/") + "/delete_requests/"
-            for attempt in range(1, 4):
-                try:
-                    session = await self.http()
-                    async with session.post(full_path, json=data) as res:
-                        log.debug(f"delete_requests response: {res.status}")
-                        res.raise_for_status()
-                    return True
-                except asyncio.TimeoutError:
-                    log.debug("delete_requests timed out")
-                except (ClientResponseError, Exception) as e:
-                    log.debug(f"delete_requests failed with error: {e}")
-                await asyncio.sleep(2)
+    def __queue_delete(self, request: RequestMetrics) -> None:
+        dropped = self.model_metrics.requests_deleting.append(request)
+        if dropped is not None:
+            self.delete_stats.dropped += 1
+            log.debug(f"requests_deleting full, dropped request {dropped.request_idx}")
+        if (
+            len(self.model_metrics.requests_deleting) >= DELETE_REQUESTS_BATCH_SIZE
+            and not self._delete_sending
+            and (self._delete_flush_task is None or self._delete_flush_task.done())
+        ):
+            # a full batch is waiting, don't hold it until the next tick
+            try:
+                self._delete_flush_task = asyncio.get_running_loop().create_task(
+                    self.__send_delete_requests_and_reset()
+                )
+            except RuntimeError:  # no running loop, the next tick will send it
+                pass
+
+    async def __post_delete_requests(self, report_addr: str, requests: list[dict]) -> bool:
+        data = {
+            "worker_id": self.id,
+            "mtoken": self.mtoken,
+            "requests": requests,
+        }
+        log.debug(f"Deleting requests: {[r['request_idx'] for r in requests]}")
+        full_path = report_addr.rstrip("/") + "/delete_requests/"
+        attempt = 1
+        compress = self.delete_requests_gzip
+        gzip_refused = False
+        while attempt <= 3:
+            kwargs = {"json": data}
+            if compress:
+                body = json.dumps(data).encode()
+                if len(body) >= DELETE_REQUESTS_GZIP_MIN_BYTES:
+                    kwargs = {
+                        "data": gzip.compress(body, compresslevel=5),
+                        "headers": {
+                            "Content-Type": "application/json",
+                            "Content-Encoding": "gzip",
+                        },
+                    }
+            try:
+                session = await self.http()
+                async with session.post(full_path, **kwargs) as res:
+                    log.debug(f"delete_requests response: {res.status}")
+                    res.raise_for_status()
+                if gzip_refused:
+                    log.debug("delete_requests took plain JSON after refusing gzip")
+                    self.delete_requests_gzip = False
+                return True
+            except asyncio.TimeoutError:
+                log.debug("delete_requests timed out")
+            except ClientResponseError as e:
+                if "data" in kwargs:
+                    # An autoscaler that can't read gzip bodies may answer with any
+                    # error, so resend this batch as plain JSON before counting a
+                    # failed attempt.
+                    log.debug(f"delete_requests failed for a gzip body ({e.status})")
+                    compress = False
+                    gzip_refused = True
+                    continue
+                log.debug(f"delete_requests failed with error: {e}")
+            except Exception as e:
+                log.debug(f"delete_requests failed with error: {e}")
+            if attempt < 3:
+                self.delete_stats.retried += len(requests)
                 log.debug(f"Retrying delete_request, attempt: {attempt}")
-            return False
-
-        # Take a snapshot of what we plan to send this tick.
-        # New arrivals after this snapshot will remain in the queue for the next tick.
-        snapshot = list(self.model_metrics.requests_deleting)
-
-        if not snapshot:
-            return  # nothing to do
-
-        requests_payload = [
-            {
-                "request_idx": r.request_idx,
-                "success": r.success,
-                "status": r.status,
-                "entered_queue_at": r.entered_queue_at,
-                "work_started_at": r.work_started_at,
-                "work_completed_at": r.work_completed_at,
-            }
-            for r in snapshot
-        ]
+                await asyncio.sleep(DELETE_REQUESTS_RETRY_DELAY * 2 ** (attempt - 1))
+            attempt += 1
+        return False
 
-        for report_addr in self.report_addr:
-            # TODO: Add a Redis subscriber queue for delete_requests
-            if report_addr == "https://cloud.vast.ai/api/v0":
-                # Patch: ignore the Redis API report_addr
-                continue
-
-            sent = await post(report_addr, requests_payload)
-
-            if sent:
-                # Remove only the items we actually sent from the live queue.
-                sent_set = {r.request_idx for r in snapshot}
-                self.model_metrics.requests_deleting[:] = [
-                    r for r in self.model_metrics.requests_deleting
-                    if r.request_idx not in sent_set
+    async def __send_delete_requests_and_reset(self):
+        if self._delete_sending:
+            return  # the send in progress will pick up anything new
+        self._delete_sending = True
+        try:
+            queue = self.model_metrics.requests_deleting
+            while len(queue) > 0:
+                # Take a batch from the head; new arrivals stay queued behind it.
+                position, snapshot = queue.batch(DELETE_REQUESTS_BATCH_SIZE)
+                requests_payload = [
+                    {
+                        "request_idx": r.request_idx,
+                        "success": r.success,
+                        "status": r.status,
+                        "entered_queue_at": r.entered_queue_at,
+                        "work_started_at": r.work_started_at,
+                        "work_completed_at": r.work_completed_at,
+                    }
+                    for r in snapshot
                 ]
-                break
 
+                sent = False
+                for report_addr in self.report_addr:
+                    # TODO: Add a Redis subscriber queue for delete_requests
+                    if report_addr == "https://cloud.vast.ai/api/v0":
+                        # Patch: ignore the Redis API report_addr
+                        continue
+                    if await self.__post_delete_requests(report_addr, requests_payload):
+                        sent = True
+                        break
+                if not sent:
+                    return  # keep them queued for the next tick
+
+                queue.consume(position, len(snapshot))
+                self.delete_stats.sent += len(snapshot)
+                if len(queue) < DELETE_REQUESTS_BATCH_SIZE:
+                    break  # a partial batch waits for the next tick
+        finally:
+            self._delete_sending = False
 
     async def __send_metrics_and_reset(self):
 
@@ -247,6 +337,7 @@ class Metrics:
                 cur_load=self.model_metrics.cur_load,
                 rej_load=self.model_metrics.workload_rejected,
                 max_perf=self.model_metrics.max_throughput,
+                saturation_concurrency=self.model_metrics.saturation_concurrency,
                 cur_perf=self.model_metrics.workload_served,
                 error_msg=self.model_metrics.error_msg or "",
                 num_requests_working=len(self.model_metrics.requests_working),
@@ -256,6 +347,7 @@ class Metrics:
                 cur_capacity=0,
                 max_capacity=0,
                 url=self.url,
+                loop_lag=self.loop_lag.peak if self.loop_lag is not None else 0.0,
             )
 
         async def send_data(report_addr: str) -> bool:
@@ -306,4 +398,6 @@ class Metrics:
         if sent:
             self.update_pending = False
             self.model_metrics.reset()
+            if self.loop_lag is not None:
+                self.loop_lag.reset_peak()
             self.last_metric_update = time.time()
@@ -0,0 +1,198 @@
+"""Executor stage for CPU-heavy request work, and event-loop lag measurement."""
+
+import asyncio
+import concurrent.futures
+import functools
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, TypeVar
+
+log = logging.getLogger(__file__)
+
+T = TypeVar("T")
+
+# requests/results at least this big are decoded/encoded off the event loop
+OFFLOAD_MIN_BYTES = 256 * 1024
+# how often the loop-lag monitor wakes up, and how late it must be to warn. The monitor
+# only runs if LOOP_LAG_MONITOR is set, so an idle worker isn't woken up for it.
+LOOP_LAG_INTERVAL = 0.1
+LOOP_LAG_WARN = 0.1
+
+EXECUTOR_KINDS = ("thread", "process", "none")
+
+
+@dataclass
+class Offloader:
+    """
+    Runs decode/verify/encode work either inline on the event loop or in an executor.
+
+    ``executor`` is "thread" (default), "process" or "none" (always inline). Only work of at
+    least ``min_bytes`` is offloaded: below that, the hop to another thread costs more than
+    the work. Signature checks are small and fixed-size, so they are offloaded only if
+    ``offload_verify`` is set.
+
+    A thread pool keeps the loop responsive for work that releases the GIL (hashing, RSA,
+    zlib) and lets it run between bytecodes of the rest; json parsing of one large document
+    still holds the GIL while it runs. A process pool avoids that, but only for work whose
+    inputs and results pickle: callers pass ``thread_only=True`` for anything else (buffers
+    viewed in place, user callbacks), which then goes to a thread pool.
+    """
+
+    executor: str = field(
+        default_factory=lambda: os.environ.get("OFFLOAD_EXECUTOR", "thread")
+    )
+    min_bytes: int = field(
+        default_factory=lambda: int(
+            os.environ.get("OFFLOAD_MIN_BYTES", OFFLOAD_MIN_BYTES)
+        )
+    )
+    max_workers: int = field(
+        default_factory=lambda: int(
+            os.environ.get("OFFLOAD_MAX_WORKERS", min(4, os.cpu_count() or 1))
+        )
+    )
+    offload_verify: bool = field(
+        default_factory=lambda: os.environ.get("OFFLOAD_VERIFY", "false") == "true"
+    )
+    offloaded: int = 0
+    inline: int = 0
+    _threads: Optional[concurrent.futures.ThreadPoolExecutor] = field(
+        default=None, repr=False
+    )
+    _processes: Optional[concurrent.futures.ProcessPoolExecutor] = field(
+        default=None, repr=False
+    )
+
+    def __post_init__(self):
+        if self.executor not in EXECUTOR_KINDS:
+            log.warning(
+                f"Unknown OFFLOAD_EXECUTOR {self.executor!r}, expected one of "
+                f"{EXECUTOR_KINDS}; running inline"
+            )
+            self.executor = "none"
+
+    def should_offload(self, nbytes: int) -> bool:
+        return self.executor != "none" and nbytes >= self.min_bytes
+
+    def _pool(self, thread_only: bool) -> concurrent.futures.Executor:
+        if self.executor == "process" and not thread_only:
+            if self._processes is None:
+                self._processes = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.max_workers
+                )
+            return self._processes
+        if self._threads is None:
+            self._threads = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="offload"
+            )
+        return self._threads
+
+    async def run(
+        self,
+        fn: Callable[..., T],
+        *args: Any,
+        nbytes: int,
+        thread_only: bool = False,
+    ) -> T:
+        """Call ``fn(*args)``, in the executor if ``nbytes`` is over the threshold."""
+        if not self.should_offload(nbytes):
+            self.inline += 1
+            return fn(*args)
+        self.offloaded += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._pool(thread_only), functools.partial(fn, *args)
+        )
+
+    async def verify(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Run a signature check, offloaded only if ``offload_verify`` is set. Always to a
+        thread: the RSA arithmetic releases the GIL, and the key doesn't pickle.
+        """
+        return await self.run(
+            fn,
+            *args,
+            nbytes=self.min_bytes if self.offload_verify else 0,
+            thread_only=True,
+        )
+
+    def shutdown(self) -> None:
+        for pool in (self._threads, self._processes):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+        self._threads = self._processes = None
+
+
+def payload_nbytes(obj: Any, limit: int) -> int:
+    """
+    Rough size of a decoded JSON/wire tree: string and buffer lengths plus a few bytes per
+    node. Stops counting once ``limit`` is reached, so it is cheap to ask whether a large
+    tree is over a threshold.
+    """
+    total = 0
+    stack = [obj]
+    while stack and total < limit:
+        value = stack.pop()
+        if isinstance(value, (str, bytes, bytearray)):
+            total += len(value)
+        elif isinstance(value, memoryview):
+            total += value.nbytes
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+            total += 8 * len(value)
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+            total += 8 * len(value)
+        else:
+            total += 8
+    return total
+
+
+_default: Optional[Offloader] = None
+
+
+def get_offloader() -> Offloader:
+    """The process-wide Offloader, shared by the Backend and remote-function wrappers."""
+    global _default
+    if _default is None:
+        _default = Offloader()
+    return _default
+
+
+@dataclass
+class LoopLag:
+    """
+    Measures how late the event loop runs a timer: a task sleeps ``interval`` and records
+    how much longer than that it actually took. Anything blocking the loop (inline decoding,
+    signature checks) shows up as lag for every other request and the metrics loops.
+
+    The Backend reports ``peak`` with each worker status update and then resets it.
+    """
+
+    interval: float = LOOP_LAG_INTERVAL
+    warn_after: float = LOOP_LAG_WARN
+    last: float = 0.0
+    peak: float = 0.0
+    mean: float = 0.0  # exponentially weighted
+    samples: int = 0
+
+    def record(self, lag: float) -> None:
+        lag = max(lag, 0.0)
+        self.last = lag
+        self.peak = max(self.peak, lag)
+        self.mean = lag if self.samples == 0 else 0.9 * self.mean + 0.1 * lag
+        self.samples += 1
+        if lag >= self.warn_after:
+            log.warning(f"Event loop was blocked for {lag * 1000:.0f}ms")
+
+    def reset_peak(self) -> float:
+        peak, self.peak = self.peak, 0.0
+        return peak
+
+    async def monitor(self) -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.record(time.perf_counter() - start - self.interval)
@@ -0,0 +1,95 @@
+"""Admission scheduler for requests to handlers that do not run in parallel."""
+
+import asyncio
+from collections import deque
+from typing import Deque, Dict, List
+
+# Priority classes; lower runs first.  Within a class requests run FIFO.
+PRIORITY_SESSION = 0
+PRIORITY_DEFAULT = 1
+
+
+class _Ticket:
+    __slots__ = ("future", "limit")
+
+    def __init__(self, future: asyncio.Future, limit: int):
+        self.future = future
+        self.limit = limit
+
+
+class RequestScheduler:
+    """
+    Hands out turns to run a request against the model server.
+
+    Waiters sit in one FIFO deque per priority class.  A request that gives
+    up while waiting (client disconnect) just cancels its future; the dead
+    ticket is skipped when it reaches the head of its deque, so cancellation
+    is O(1) instead of an O(n) ``deque.remove``.  Everything runs on the
+    event loop thread without awaiting inside a critical section, so no lock
+    is needed.
+
+    Each request carries a concurrency ``limit``: it is admitted only while
+    fewer than ``limit`` requests are running.  ``limit=1`` is the classic
+    one-at-a-time FIFO; handlers that can batch pass a larger limit.
+    """
+
+    def __init__(self) -> None:
+        self._queues: Dict[int, Deque[_Ticket]] = {}
+        self._order: List[int] = []  # priority classes, sorted
+        self.running = 0
+        self.waiting = 0
+
+    def __len__(self) -> int:
+        """Requests running or waiting."""
+        return self.running + self.waiting
+
+    async def acquire(self, priority: int = PRIORITY_DEFAULT, limit: int = 1) -> None:
+        """Wait for a turn.  Pair every successful call with :meth:`release`."""
+        limit = max(1, limit)
+        if self.waiting == 0 and self.running < limit:
+            self.running += 1
+            return
+
+        ticket = _Ticket(asyncio.get_running_loop().create_future(), limit)
+        queue = self._queues.get(priority)
+        if queue is None:
+            queue = self._queues[priority] = deque()
+            self._order.append(priority)
+            self._order.sort()
+        queue.append(ticket)
+        self.waiting += 1
+        try:
+            await ticket.future
+        except asyncio.CancelledError:
+            if ticket.future.done() and not ticket.future.cancelled():
+                # Granted just as we were cancelled: pass the turn on.
+                self.release()
+            else:
+                ticket.future.cancel()  # tombstone; skipped by _grant
+                self.waiting -= 1
+                self._grant()  # a blocked head may have been holding others back
+            raise
+
+    def release(self) -> None:
+        """Finish a turn and admit whoever is next."""
+        self.running -= 1
+        self._grant()
+
+    def _head(self):
+        for priority in self._order:
+            queue = self._queues[priority]
+            while queue and queue[0].future.done():
+                queue.popleft()
+            if queue:
+                return queue
+        return None
+
+    def _grant(self) -> None:
+        while True:
+            queue = self._head()
+            if queue is None or self.running >= queue[0].limit:
+                return
+            ticket = queue.popleft()
+            self.waiting -= 1
+            self.running += 1
+            ticket.future.set_result(None)
@@ -1,4 +1,5 @@
 from vastai.serverless.server.lib import backend, server
+from vastai.serverless.server.lib.logmatch import LogPattern
 from vastai.serverless.server.lib.data_types import (
     ApiPayload,
     EndpointHandler,
@@ -38,14 +39,19 @@ DEFAULT_WORKLOAD = 100.0
 
 @dataclass
 class LogActionConfig:
-    """Configuration for defining log actions"""
+    """Configuration for defining log actions
 
-    on_load: list[str] = field(default_factory=list)
-    on_error: list[str] = field(default_factory=list)
-    on_info: list[str] = field(default_factory=list)
+    Each pattern is a substring to look for in model log lines, or a compiled regex
+    (``re.compile(r"Loading weights: (?P<percent>\\d+)%")``) whose named groups are kept
+    in ``Backend.log_fields``.
+    """
+
+    on_load: list[LogPattern] = field(default_factory=list)
+    on_error: list[LogPattern] = field(default_factory=list)
+    on_info: list[LogPattern] = field(default_factory=list)
 
     @property
-    def log_actions(self) -> list[LogAction]:
+    def log_actions(self) -> list[tuple[LogAction, LogPattern]]:
         log_actions_ = []
         log_actions_.extend([(LogAction.ModelLoaded, log) for log in self.on_load])
         log_actions_.extend([(LogAction.ModelError, log) for log in self.on_error])
@@ -62,6 +68,11 @@ class BenchmarkConfig:
     runs: int = 8
     concurrency: int | None = 10
     do_warmup: bool = True
+    # ramp concurrency up to max_concurrency until throughput stops growing (or p99
+    # latency goes over max_latency seconds), instead of `runs` runs at `concurrency`
+    adaptive: bool = False
+    max_concurrency: int = 64
+    max_latency: float | None = None
 
 
 @dataclass
@@ -71,6 +82,7 @@ class HandlerConfig:
     route: str
     healthcheck: Optional[str] = None
     allow_parallel_requests: bool = False
+    max_concurrent_requests: int = 1
     max_queue_time: Optional[float] = 30.0
     benchmark_config: Optional[BenchmarkConfig] = None
     handler_class: Optional[Type[EndpointHandler]] = None
@@ -80,6 +92,9 @@ class HandlerConfig:
     workload_calculator: Optional[WorkloadCalculator] = None
     is_remote_dispatch: bool = False
     remote_function: Optional[Callable] = None
+    keepalive: bool = True
+    retry_on_disconnect: bool = False
+    offload_workload_calculator: bool = False
 
 
 @dataclass
@@ -93,8 +108,17 @@ class WorkerConfig:
     benchmark_route: Optional[str] = None
     log_action_config: LogActionConfig = field(default_factory=LogActionConfig)
     max_sessions: Optional[int] = 10
+    prioritize_sessions: bool = False
     lifecycle: Optional[AsyncContextManager] = None
 
+    @property
+    def model_server_base_url(self) -> str:
+        """Model server URL with its port, or a ``unix:///path.sock`` URL as given"""
+        url = self.model_server_url
+        if url is not None and url.startswith(backend.UNIX_SOCKET_SCHEME):
+            return url
+        return f"{url}:{self.model_server_port}"
+
 
 class EndpointHandlerFactory:
     """Factory for creating endpoint handlers from WorkerConfig"""
@@ -229,7 +253,17 @@ class EndpointHandlerFactory:
             allow_parallel_requests: bool = field(
                 default=handler_config.allow_parallel_requests
             )
+            max_concurrent_requests: int = field(
+                default=handler_config.max_concurrent_requests
+            )
             max_queue_time: float = field(default=handler_config.max_queue_time)
+            keepalive: bool = field(default=handler_config.keepalive)
+            retry_on_disconnect: bool = field(
+                default=handler_config.retry_on_disconnect
+            )
+            offload_workload_calculator: bool = field(
+                default=handler_config.offload_workload_calculator
+            )
             benchmark_runs: int = field(
                 default=(
                     handler_config.benchmark_config.runs
@@ -253,6 +287,27 @@ class EndpointHandlerFactory:
                     else True
                 )
             )
+            benchmark_adaptive: bool = field(
+                default=(
+                    handler_config.benchmark_config.adaptive
+                    if handler_config.benchmark_config
+                    else False
+                )
+            )
+            benchmark_max_concurrency: int = field(
+                default=(
+                    handler_config.benchmark_config.max_concurrency
+                    if handler_config.benchmark_config
+                    else 64
+                )
+            )
+            benchmark_max_latency: Optional[float] = field(
+                default=(
+                    handler_config.benchmark_config.max_latency
+                    if handler_config.benchmark_config
+                    else None
+                )
+            )
             remote_function: Callable = field(
                 default=(
                     handler_config.remote_function
@@ -387,7 +442,7 @@ class EndpointHandlerFactory:
     @property
     def model_server_base_url(self) -> str:
         """Get the full model server base URL"""
-        return f"{self.config.model_server_url}:{self.config.model_server_port}"
+        return self.config.model_server_base_url
 
 
 class Worker:
@@ -424,12 +479,13 @@ class Worker:
 
         # Create backend
         self.backend = backend.Backend(
-            model_server_url=f"{config.model_server_url}:{config.model_server_port}",
+            model_server_url=config.model_server_base_url,
             model_log_file=config.model_log_file,
             benchmark_handler=benchmark_handler,
             log_actions=config.log_action_config.log_actions,
             healthcheck_url=config.model_healthcheck_url,
             max_sessions=config.max_sessions,
+            prioritize_sessions=config.prioritize_sessions,
             lifecycle=config.lifecycle,
         )
 
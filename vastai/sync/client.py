@@ -1,8 +1,10 @@
 import json
 import requests
-from typing import Any, Optional, Union
+from typing import Any, Iterator, Optional, Union
 
 from vastai._base import _BaseClient, _APIKEY_SENTINEL
+from vastai.api.instances import DEFAULT_INSTANCES_PAGE_SIZE
+from vastai.api.paging import iter_cursor_pages
 from vastai.data.query import Query
 from vastai.data.offer import Offer
 from vastai.data.instance import Instance, InstanceConfig, CreateInstanceResponse
@@ -96,34 +98,41 @@ class SyncClient(_BaseClient):
         # Fallback: return a minimal instance
         return SyncInstance(Instance.from_dict({"id": resp.new_contract}), self)
 
-    def show_instances(self) -> list[SyncInstance]:
-        """Return all instances owned by the authenticated user.
+    def iter_instances(self, page_size: int = DEFAULT_INSTANCES_PAGE_SIZE) -> Iterator[SyncInstance]:
+        """Yield the authenticated user's instances as pages arrive.
 
-        The legacy v0 ``/instances`` list endpoint is deprecated; this pages
-        through the v1 ``/api/v1/instances/`` endpoint (omitting ``select_cols``
-        so the backend returns full instance rows) and accumulates every page.
+        Pages through the v1 ``/api/v1/instances/`` endpoint (omitting
+        ``select_cols`` so the backend returns full instance rows).  The next
+        page is requested as soon as its ``next_token`` is known, overlapping
+        with the caller's processing of the current page; only a few pages are
+        held in memory at a time.
         """
-        instances = []
         params = {
             "select_filters": json.dumps({}),
             "order_by": json.dumps([{"col": "id", "dir": "asc"}]),
-            "limit": 25,
+            "limit": page_size,
         }
-        while True:
-            response = requests.get(
-                self._url("/api/v1/instances/"),
-                params=params,
-                headers=self._headers(),
-            )
-            response.raise_for_status()
-            data = response.json()
-            instances.extend(data.get("instances") or [])
-            next_token = data.get("next_token")
-            if not next_token:
-                break
-            params["after_token"] = next_token
-
-        return [SyncInstance(Instance.from_dict(i), self) for i in instances]
+        for data in iter_cursor_pages(self._fetch_instances_page, params):
+            for i in data.get("instances") or []:
+                yield SyncInstance(Instance.from_dict(i), self)
+
+    def _fetch_instances_page(self, params: dict) -> dict:
+        response = requests.get(
+            self._url("/api/v1/instances/"),
+            params=params,
+            headers=self._headers(),
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def show_instances(self, page_size: int = DEFAULT_INSTANCES_PAGE_SIZE) -> list[SyncInstance]:
+        """Return all instances owned by the authenticated user.
+
+        The legacy v0 ``/instances`` list endpoint is deprecated; this pages
+        through the v1 ``/api/v1/instances/`` endpoint via
+        :meth:`iter_instances` and accumulates every page.
+        """
+        return list(self.iter_instances(page_size=page_size))
 
     def destroy_instance(self, instance_or_id: Union[SyncInstance, int]) -> None:
         """Destroy a running or stopped instance."""